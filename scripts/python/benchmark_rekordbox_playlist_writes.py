@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Benchmark per-track vs. batched playlist writes against a copy of a Rekordbox master.db.
+
+The database is copied to a temporary directory first, so the real Rekordbox
+library is never modified. Usage:
+
+    python scripts/python/benchmark_rekordbox_playlist_writes.py /path/to/master.db --tracks 500
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# Add the project root to sys.path for imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from selecta.core.data.database import get_session
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.platform.rekordbox.auth import RekordboxAuthManager
+from selecta.core.platform.rekordbox.client import PatchedRekordbox6Database
+from selecta.core.platform.rekordbox.playlist_writer import RekordboxPlaylistWriter
+from selecta.core.platform.rekordbox.queries import rb_tables
+
+
+def copy_database(source: Path, target_dir: Path) -> Path:
+    """Copy master.db and its SQLite side files to a directory.
+
+    Args:
+        source: Path of the master.db to copy
+        target_dir: Directory to copy to
+
+    Returns:
+        Path of the copied master.db
+    """
+    for suffix in ("", "-wal", "-shm"):
+        side_file = source.with_name(source.name + suffix)
+        if side_file.exists():
+            shutil.copy2(side_file, target_dir / side_file.name)
+    return target_dir / source.name
+
+
+def write_per_track(db: PatchedRekordbox6Database, content_ids: list[str]) -> float:
+    """Add tracks one at a time with a commit per track, like the old client code.
+
+    Returns:
+        Elapsed seconds
+    """
+    start = time.perf_counter()
+    playlist = db.create_playlist("Selecta benchmark (per track)")
+    db.commit()
+    for content_id in content_ids:
+        db.add_to_playlist(playlist, content_id)
+        db.commit()
+    for song in list(playlist.Songs)[: len(content_ids) // 2]:
+        db.remove_from_playlist(playlist, song)
+        db.commit()
+    return time.perf_counter() - start
+
+
+def write_batched(db: PatchedRekordbox6Database, content_ids: list[str]) -> float:
+    """Add and remove the same tracks through RekordboxPlaylistWriter with one commit per step.
+
+    Returns:
+        Elapsed seconds
+    """
+    start = time.perf_counter()
+    playlist = db.create_playlist("Selecta benchmark (batched)")
+    writer = RekordboxPlaylistWriter(db, str(playlist.ID))
+    writer.add(content_ids)
+    writer.apply()
+    db.commit()
+
+    writer = RekordboxPlaylistWriter(db, str(playlist.ID))
+    writer.remove(content_ids[: len(content_ids) // 2])
+    writer.apply()
+    db.commit()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("master_db", type=Path, help="Path to a Rekordbox master.db")
+    parser.add_argument("--tracks", type=int, default=500, help="Number of tracks to write")
+    parser.add_argument("--key", default="", help="Database key (defaults to the stored key)")
+    args = parser.parse_args()
+
+    key = args.key
+    if not key:
+        db_session = get_session()
+        key = RekordboxAuthManager(settings_repo=SettingsRepository(db_session)).get_stored_key() or ""
+        db_session.close()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = copy_database(args.master_db, Path(tmp_dir))
+        db = PatchedRekordbox6Database(path=db_path, key=key)
+        try:
+            content_ids = [str(content_id) for (content_id,) in db.query(rb_tables.DjmdContent.ID).limit(args.tracks)]
+            logger.info(f"Writing {len(content_ids)} tracks to a copy of {args.master_db}")
+
+            per_track = write_per_track(db, content_ids)
+            logger.info(f"Per-track writes: {per_track:.2f}s")
+
+            batched = write_batched(db, content_ids)
+            logger.info(f"Batched writes:   {batched:.2f}s ({per_track / max(batched, 1e-9):.1f}x faster)")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Benchmark a full-table repaint of the tracks table model.
+
+Fills a TracksTableModel with synthetic library tracks and measures setting
+the tracks, fetching all rows, and requesting every cell with the roles a
+table view asks for when painting it, as a full-table repaint does. With
+--view, the rows are also painted by a QTableView, one screen at a time.
+Usage:
+
+    QT_QPA_PLATFORM=offscreen python scripts/python/benchmark_tracks_table_model.py --tracks 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtWidgets import QApplication, QTableView
+
+# Add the project root to sys.path for imports
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from selecta.ui.components.playlist.library.library_track_item import LibraryTrackItem
+from selecta.ui.components.playlist.model.tracks_table_model import TracksTableModel
+
+# Roles a table view requests per cell when painting it
+PAINT_ROLES = [
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.DecorationRole,
+    Qt.ItemDataRole.FontRole,
+    Qt.ItemDataRole.TextAlignmentRole,
+    Qt.ItemDataRole.ForegroundRole,
+    Qt.ItemDataRole.BackgroundRole,
+    Qt.ItemDataRole.CheckStateRole,
+    Qt.ItemDataRole.UserRole,
+]
+
+WORDS = [
+    "love",
+    "night",
+    "dance",
+    "dream",
+    "light",
+    "fire",
+    "heart",
+    "sound",
+    "deep",
+    "house",
+    "city",
+    "summer",
+    "acid",
+    "dub",
+    "techno",
+]
+
+
+def build_tracks(size: int, seed: int) -> list[LibraryTrackItem]:
+    """Build synthetic library tracks."""
+    rng = random.Random(seed)
+    return [
+        LibraryTrackItem(
+            track_id=track_id,
+            title=" ".join(rng.sample(WORDS, rng.randint(1, 4))).title(),
+            artist=" ".join(rng.sample(WORDS, 2)).title(),
+            duration_ms=rng.randint(120, 480) * 1000,
+            genre=rng.choice(["House", "Techno", "Dub", None]),
+            bpm=rng.uniform(90, 140),
+            tags=rng.sample(WORDS, rng.randint(0, 3)),
+            quality=rng.choice([-1, 1, 2, 3, 4, 5]),
+            platforms=rng.sample(["spotify", "rekordbox", "discogs", "youtube"], rng.randint(0, 3)),
+        )
+        for track_id in range(size)
+    ]
+
+
+def repaint(model: TracksTableModel) -> int:
+    """Request every cell of the model with the painting roles."""
+    requests = 0
+    for row in range(model.rowCount()):
+        for column in range(model.columnCount()):
+            index = model.index(row, column)
+            for role in PAINT_ROLES:
+                model.data(index, role)
+                requests += 1
+    return requests
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=20000, help="Number of tracks")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--view", action="store_true", help="Also paint the rows with a QTableView")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    tracks = build_tracks(args.tracks, args.seed)
+    model = TracksTableModel()
+
+    start = time.perf_counter()
+    model.set_tracks(tracks)
+    logger.info(f"set_tracks:    {time.perf_counter() - start:.3f}s ({model.rowCount()} rows fetched)")
+
+    start = time.perf_counter()
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    logger.info(f"fetch all:     {time.perf_counter() - start:.3f}s ({model.rowCount()} rows)")
+
+    for attempt in range(3):
+        start = time.perf_counter()
+        requests = repaint(model)
+        elapsed = time.perf_counter() - start
+        logger.info(f"full repaint {attempt + 1}: {elapsed:.3f}s ({requests / elapsed / 1e6:.2f}M data() calls/s)")
+
+    start = time.perf_counter()
+    for track_id in range(0, args.tracks, max(1, args.tracks // 1000)):
+        model.update_track_field(track_id, "quality", 5)
+    logger.info(f"1000 cell updates: {time.perf_counter() - start:.3f}s")
+
+    if args.view:
+        view = QTableView()
+        view.setModel(model)
+        view.resize(1200, 800)
+        view.show()
+        app.processEvents()
+        scroll_bar = view.verticalScrollBar()
+        start = time.perf_counter()
+        screens = 0
+        for value in range(0, scroll_bar.maximum() + 1, max(1, scroll_bar.pageStep())):
+            scroll_bar.setValue(value)
+            view.viewport().repaint()
+            screens += 1
+        elapsed = time.perf_counter() - start
+        per_screen_ms = elapsed / screens * 1000
+        logger.info(f"view repaint:  {elapsed:.3f}s for {screens} screens ({per_screen_ms:.2f}ms per screen)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Platform link CLI commands."""
+
+import click
+
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.platform.auto_linker import PlatformAutoLinker
+from selecta.core.platform.platform_factory import PlatformFactory
+
+LINK_PLATFORMS = ["spotify", "youtube", "discogs"]
+
+
+@click.group(name="link")
+def link():
+    """Commands for linking library tracks to platforms."""
+    pass
+
+
+def _create_linker(platform: str, dry_run: bool = False) -> PlatformAutoLinker:
+    """Create an auto-linker for a platform.
+
+    Args:
+        platform: Name of the platform to link to
+        dry_run: Whether to only replay recorded search results
+
+    Returns:
+        Auto-linker for the platform
+
+    Raises:
+        click.ClickException: If the platform client can't be used
+    """
+    client = PlatformFactory.create(platform, SettingsRepository())
+    if client is None:
+        raise click.ClickException(f"Could not create the {platform} client")
+    if not dry_run and not client.is_authenticated():
+        raise click.ClickException(f"Not authenticated with {platform}; run 'selecta {platform} auth' first")
+    return PlatformAutoLinker(client, dry_run=dry_run)
+
+
+@link.command(name="auto", help="Link unlinked library tracks to their best platform match")
+@click.argument("platform", type=click.Choice(LINK_PLATFORMS))
+@click.option("--max-tracks", type=int, help="Maximum number of tracks to process in this run")
+@click.option(
+    "--dry-run/--no-dry-run",
+    default=False,
+    help="Only replay recorded search results, without writing links",
+)
+@click.option("--restart", is_flag=True, help="Discard saved progress and review items before running")
+def auto_link(platform: str, max_tracks: int | None, dry_run: bool, restart: bool) -> None:
+    """Auto-link the library to a platform, resuming after the last run.
+
+    Args:
+        platform: Name of the platform to link to
+        max_tracks: Maximum number of tracks to process
+        dry_run: Whether to only replay recorded search results
+        restart: Whether to discard saved progress first
+    """
+    linker = _create_linker(platform, dry_run)
+    if restart and not dry_run:
+        linker.state.reset()
+
+    result = linker.run(
+        max_tracks=max_tracks,
+        progress_callback=lambda processed, total: click.echo(f"Processed {processed}/{total} tracks"),
+    )
+
+    verb = "Would link" if dry_run else "Linked"
+    click.secho(f"{verb} {len(result.linked)} of {result.processed} tracks to {platform}", fg="green")
+    if result.review:
+        click.echo(f"{len(result.review)} tracks queued for review; see 'selecta link review {platform}'")
+    if result.unmatched:
+        click.echo(f"{len(result.unmatched)} tracks had no match")
+    if result.failed:
+        click.secho(f"{len(result.failed)} tracks could not be linked", fg="yellow")
+    if not result.complete:
+        click.secho("Stopped before all tracks were processed; run again to continue", fg="yellow")
+
+
+@link.command(name="review", help="List tracks queued for link review")
+@click.argument("platform", type=click.Choice(LINK_PLATFORMS))
+def review_links(platform: str) -> None:
+    """List the tracks whose matches need confirmation.
+
+    Args:
+        platform: Name of the platform
+    """
+    items = _create_linker(platform, dry_run=True).state.review_items()
+    if not items:
+        click.echo(f"No tracks queued for {platform} review")
+        return
+
+    for item in items:
+        click.secho(f"{item.track_id}: {item.artist} - {item.title}", bold=True)
+        for candidate in item.candidates:
+            click.echo(f"  {candidate.platform_id}  {candidate.artist} - {candidate.title} ({candidate.score:.2f})")
+
+
+@link.command(name="accept", help="Link a queued track to one of its review candidates")
+@click.argument("platform", type=click.Choice(LINK_PLATFORMS))
+@click.argument("track_id", type=int)
+@click.argument("platform_id")
+def accept_link(platform: str, track_id: int, platform_id: str) -> None:
+    """Link a track queued for review to the chosen candidate.
+
+    Args:
+        platform: Name of the platform
+        track_id: Library track ID
+        platform_id: Platform ID of the chosen candidate
+    """
+    try:
+        _create_linker(platform).accept_review(track_id, platform_id)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    click.secho(f"Linked track {track_id} to {platform} {platform_id}", fg="green")
@@ -6,6 +6,7 @@ from selecta.cli.database import database
 from selecta.cli.discogs import discogs
 from selecta.cli.env import env
 from selecta.cli.integration_test import integration_test
+from selecta.cli.link import link
 from selecta.cli.rekordbox import rekordbox
 from selecta.cli.spotify import spotify
 from selecta.cli.test import test
@@ -24,6 +25,7 @@ cli.add_command(spotify)
 cli.add_command(discogs)
 cli.add_command(rekordbox)
 cli.add_command(database)
+cli.add_command(link)
 cli.add_command(test)
 cli.add_command(integration_test)
 
@@ -102,7 +102,7 @@ def check_rekordbox_status() -> None:
 
         # Show some database info
         try:
-            track_count = len(rekordbox_client.get_all_tracks())
+            track_count = rekordbox_client.count_tracks()
             playlist_count = len(rekordbox_client.get_all_playlists())
             click.echo(
                 f"Rekordbox database contains {track_count} tracks "
@@ -161,7 +161,7 @@ def list_rekordbox_playlists() -> None:
 
             for pl in sorted(children[parent_id], key=lambda x: x.position):
                 prefix = "📁 " if pl.is_folder else "📄 "
-                track_count = f" ({len(pl.tracks)} tracks)" if not pl.is_folder else ""
+                track_count = f" ({pl.track_count} tracks)" if not pl.is_folder else ""
                 click.echo(f"{'  ' * indent}{prefix}{pl.name}{track_count}")
 
                 if pl.is_folder and pl.id in children:
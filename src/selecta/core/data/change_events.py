@@ -0,0 +1,172 @@
+"""Change events published by the repositories once their changes are committed.
+
+Repositories queue an event on their session with queue_change() when they
+change a track or a playlist. The events of a session are published on the
+change_bus after the session commits, and dropped if it rolls back, so
+subscribers only hear about changes that made it to the database.
+Subscribers are called in the committing thread.
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+# Key of the events waiting for the commit in Session.info
+PENDING_EVENTS_KEY = "selecta_pending_change_events"
+
+
+@dataclass(frozen=True)
+class TrackUpdated:
+    """Fields of a track changed.
+
+    The changes map Track column names to their new values; "tags" and
+    "genres" map to the names of all tags or genres of the track, and
+    "has_image" to whether the track has images after images were stored
+    or deleted.
+    """
+
+    track_id: int
+    changes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PlaylistTracksChanged:
+    """Tracks were added to or removed from a playlist, or the tracks were reordered."""
+
+    playlist_id: int
+    added: tuple[int, ...] = ()
+    removed: tuple[int, ...] = ()
+    reordered: bool = False
+
+
+@dataclass(frozen=True)
+class PlatformLinkAdded:
+    """A track was linked to a platform, or its link was updated."""
+
+    track_id: int
+    platform: str
+
+
+ChangeEvent = TrackUpdated | PlaylistTracksChanged | PlatformLinkAdded
+
+
+class ChangeEventBus:
+    """Publishes the committed change events to the subscribers."""
+
+    def __init__(self) -> None:
+        """Initialize the bus without subscribers."""
+        self._subscribers: list[Callable[[list[ChangeEvent]], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[list[ChangeEvent]], None]) -> None:
+        """Subscribe to the events.
+
+        Args:
+            callback: Called with the events of each commit, in the committing thread
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[list[ChangeEvent]], None]) -> None:
+        """Unsubscribe from the events.
+
+        Args:
+            callback: Callback passed to subscribe()
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, events: list[ChangeEvent]) -> None:
+        """Publish events to all subscribers.
+
+        Args:
+            events: Change events
+        """
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(events)
+            except Exception as e:
+                logger.exception(f"Error handling {len(events)} change events: {e}")
+
+
+# Bus the events of all sessions are published on
+change_bus = ChangeEventBus()
+
+
+def queue_change(session: Session, change: ChangeEvent) -> None:
+    """Queue a change event, to be published when the session commits.
+
+    Args:
+        session: Session the change is made in
+        change: Change event
+    """
+    session.info.setdefault(PENDING_EVENTS_KEY, []).append(change)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_changes(session: Session) -> None:
+    """Publish the events queued on a session once it committed."""
+    change_bus.publish(session.info.pop(PENDING_EVENTS_KEY, []))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted_changes(session: Session, transaction: SessionTransaction) -> None:
+    """Drop the events of a transaction that ended without a commit."""
+    if transaction.parent is None:
+        session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+def coalesce_changes(changes: list[ChangeEvent]) -> list[ChangeEvent]:
+    """Merge change events, e.g. the events of many commits handled at once.
+
+    The updates of a track are merged into one event, later values winning,
+    and so are the membership changes of a playlist, a track added and then
+    removed again cancelling out (a track removed and then added again moves
+    to the end, so both are kept). Repeated platform links are dropped.
+
+    Args:
+        changes: Change events in the order they were published
+
+    Returns:
+        Merged events, in the order their first event was published
+    """
+    merged: dict[tuple[Any, ...], Any] = {}
+    reordered: set[int] = set()
+    for change in changes:
+        if isinstance(change, TrackUpdated):
+            merged.setdefault(("track", change.track_id), {}).update(change.changes)
+        elif isinstance(change, PlaylistTracksChanged):
+            added, removed = merged.setdefault(("playlist", change.playlist_id), ([], []))
+            added.extend(change.added)
+            for track_id in change.removed:
+                if track_id in added:
+                    added.remove(track_id)
+                else:
+                    removed.append(track_id)
+            if change.reordered:
+                reordered.add(change.playlist_id)
+        else:
+            merged.setdefault(("link", change.track_id, change.platform), change)
+
+    result: list[ChangeEvent] = []
+    for (kind, item_id, *_), value in merged.items():
+        if kind == "track":
+            result.append(TrackUpdated(item_id, value))
+        elif kind == "playlist":
+            added, removed = value
+            if added or removed or item_id in reordered:
+                result.append(PlaylistTracksChanged(item_id, tuple(added), tuple(removed), item_id in reordered))
+        else:
+            result.append(value)
+    return result
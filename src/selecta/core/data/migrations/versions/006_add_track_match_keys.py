@@ -0,0 +1,84 @@
+"""Add normalized matching keys to tracks.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+This migration adds the normalized title, artist and combined matching keys
+that duplicate detection and track lookups compare, and fills them for the
+existing tracks.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from selecta.core.utils.track_matching import normalize_artist, normalize_title, track_match_key
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+# Tracks updated per statement during the backfill
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Add and backfill the matching key columns."""
+    op.add_column("tracks", sa.Column("title_key", sa.String(255), nullable=True))
+    op.add_column("tracks", sa.Column("artist_key", sa.String(255), nullable=True))
+    op.add_column("tracks", sa.Column("match_key", sa.String(512), nullable=True))
+
+    # Backfill the keys with the same normalization the Track model applies
+    connection = op.get_bind()
+    tracks = sa.table(
+        "tracks",
+        sa.column("id", sa.Integer),
+        sa.column("title", sa.String),
+        sa.column("artist", sa.String),
+        sa.column("title_key", sa.String),
+        sa.column("artist_key", sa.String),
+        sa.column("match_key", sa.String),
+    )
+    update = (
+        tracks.update()
+        .where(tracks.c.id == sa.bindparam("track_id"))
+        .values(
+            title_key=sa.bindparam("new_title_key"),
+            artist_key=sa.bindparam("new_artist_key"),
+            match_key=sa.bindparam("new_match_key"),
+        )
+    )
+
+    rows = connection.execute(sa.select(tracks.c.id, tracks.c.title, tracks.c.artist)).fetchall()
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        params = []
+        for track_id, title, artist in rows[start : start + BACKFILL_BATCH_SIZE]:
+            title_key = normalize_title(title)
+            artist_key = normalize_artist(artist)
+            params.append(
+                {
+                    "track_id": track_id,
+                    "new_title_key": title_key,
+                    "new_artist_key": artist_key,
+                    "new_match_key": track_match_key(title_key, artist_key),
+                }
+            )
+        connection.execute(update, params)
+
+    # Create indexes after the backfill so they're built once
+    op.create_index("ix_tracks_title_key", "tracks", ["title_key"])
+    op.create_index("ix_tracks_artist_key", "tracks", ["artist_key"])
+    op.create_index("ix_tracks_match_key", "tracks", ["match_key"])
+
+
+def downgrade() -> None:
+    """Revert database changes."""
+    op.drop_index("ix_tracks_match_key", "tracks")
+    op.drop_index("ix_tracks_artist_key", "tracks")
+    op.drop_index("ix_tracks_title_key", "tracks")
+
+    op.drop_column("tracks", "match_key")
+    op.drop_column("tracks", "artist_key")
+    op.drop_column("tracks", "title_key")
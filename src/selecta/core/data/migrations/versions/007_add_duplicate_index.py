@@ -0,0 +1,44 @@
+"""Add the duplicate index tables.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+This migration adds the tables of the persistent duplicate index: a signature
+per scored track and the pairs of tracks scored as potential duplicates. The
+index starts empty and is filled on the first duplicate scan.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the duplicate index tables."""
+    op.create_table(
+        "duplicate_signatures",
+        sa.Column("track_id", sa.Integer(), sa.ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("signature", sa.String(40), nullable=False),
+        sa.PrimaryKeyConstraint("track_id"),
+    )
+    op.create_table(
+        "duplicate_pairs",
+        sa.Column("track_id", sa.Integer(), sa.ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("other_track_id", sa.Integer(), sa.ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("similarity", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("track_id", "other_track_id"),
+    )
+    op.create_index("ix_duplicate_pairs_other_track_id", "duplicate_pairs", ["other_track_id"])
+
+
+def downgrade() -> None:
+    """Remove the duplicate index tables."""
+    op.drop_index("ix_duplicate_pairs_other_track_id", "duplicate_pairs")
+    op.drop_table("duplicate_pairs")
+    op.drop_table("duplicate_signatures")
@@ -0,0 +1,31 @@
+"""Add the audio content hash to tracks.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+This migration adds the tag-independent hash of a track's local audio file,
+used to detect exact duplicates and moved files. The hashes are computed by a
+background pass over the local files rather than during the migration.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the content hash column."""
+    op.add_column("tracks", sa.Column("content_hash", sa.String(40), nullable=True))
+    op.create_index("ix_tracks_content_hash", "tracks", ["content_hash"])
+
+
+def downgrade() -> None:
+    """Remove the content hash column."""
+    op.drop_index("ix_tracks_content_hash", "tracks")
+    op.drop_column("tracks", "content_hash")
@@ -0,0 +1,30 @@
+"""Index the playlist and track columns of playlist_tracks.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+Loading a playlist's tracks filters playlist_tracks by playlist, and the
+orphaned track query probes it by track for every Collection entry. Neither
+column was indexed.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the playlist_tracks indexes."""
+    op.create_index("ix_playlist_tracks_playlist_id", "playlist_tracks", ["playlist_id"])
+    op.create_index("ix_playlist_tracks_track_id", "playlist_tracks", ["track_id"])
+
+
+def downgrade() -> None:
+    """Drop the playlist_tracks indexes."""
+    op.drop_index("ix_playlist_tracks_track_id", "playlist_tracks")
+    op.drop_index("ix_playlist_tracks_playlist_id", "playlist_tracks")
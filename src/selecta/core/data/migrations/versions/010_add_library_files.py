@@ -0,0 +1,39 @@
+"""Add the library file manifest.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+This migration adds the manifest of the files in the local database folder:
+the size, modification time and inode of each audio file at the last scan.
+Rescans compare the folder with it to report only new, changed, deleted and
+moved files. The manifest starts empty and is filled on the first scan.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the library file manifest table."""
+    op.create_table(
+        "library_files",
+        sa.Column("path", sa.String(1024), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("inode", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("path"),
+    )
+    op.create_index("ix_library_files_inode", "library_files", ["inode"])
+
+
+def downgrade() -> None:
+    """Remove the library file manifest table."""
+    op.drop_index("ix_library_files_inode", "library_files")
+    op.drop_table("library_files")
@@ -0,0 +1,37 @@
+"""Add the tag cache.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+This migration adds the cache of parsed audio file tags, keyed by path and
+valid while the file's size and modification time are unchanged. The cache
+starts empty and is filled as files are read.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the tag cache table."""
+    op.create_table(
+        "file_tags",
+        sa.Column("path", sa.String(1024), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("tags", sa.Text(), nullable=False),
+        sa.Column("art_digest", sa.String(40), nullable=True),
+        sa.PrimaryKeyConstraint("path"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the tag cache table."""
+    op.drop_table("file_tags")
@@ -6,6 +6,7 @@ from enum import Enum, auto
 from typing import Any, ClassVar, Optional, cast
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -20,9 +21,10 @@ from sqlalchemy import (
 from sqlalchemy import (
     Enum as SQLEnum,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from selecta.core.data.database import Base
+from selecta.core.utils.track_matching import normalize_artist, normalize_title, track_match_key
 from selecta.core.utils.type_helpers import is_column_truthy
 
 
@@ -69,12 +71,20 @@ class Track(Base):
     year: Mapped[int | None] = mapped_column(Integer, nullable=True)
     bpm: Mapped[float | None] = mapped_column(Float, nullable=True)
 
+    # Normalized matching keys, maintained from title and artist (see utils.track_matching)
+    title_key: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    artist_key: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    match_key: Mapped[str | None] = mapped_column(String(512), nullable=True, index=True)
+
     # User-assigned quality rating: -1 (not rated), 1-5 (stars)
     quality: Mapped[int] = mapped_column(Integer, default=NOT_RATED, nullable=False)
 
     # Path to local file if available
     local_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
 
+    # Hash of the local file's audio payload, independent of tags (see utils.audio_hash)
+    content_hash: Mapped[str | None] = mapped_column(String(40), nullable=True, index=True)
+
     # Cover art URL or path (kept for backward compatibility)
     artwork_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
 
@@ -129,6 +139,39 @@ class Track(Base):
         """
         return f"<Track {self.id}: {self.artist} - {self.title}>"
 
+    @validates("title", "artist")
+    def _update_match_keys(self, key: str, value: str) -> str:
+        """Keep the normalized matching keys in sync with title and artist.
+
+        Args:
+            key: Name of the attribute being set
+            value: New value
+
+        Returns:
+            The value, unchanged
+        """
+        if key == "title":
+            self.title_key = normalize_title(value)
+        else:
+            self.artist_key = normalize_artist(value)
+        self.match_key = track_match_key(self.title_key or "", self.artist_key or "")
+        return value
+
+    @validates("local_path")
+    def _reset_content_hash(self, key: str, value: str | None) -> str | None:
+        """Drop the content hash when the track points at another file.
+
+        Args:
+            key: Name of the attribute being set
+            value: New local path
+
+        Returns:
+            The value, unchanged
+        """
+        if value != self.local_path:
+            self.content_hash = None
+        return value
+
     def get_artwork(self, size: ImageSize = ImageSize.MEDIUM) -> "Image | None":
         """Get track artwork of the requested size.
 
@@ -656,8 +699,8 @@ class PlaylistTrack(Base):
     __tablename__ = "playlist_tracks"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    playlist_id: Mapped[int] = mapped_column(ForeignKey("playlists.id"), nullable=False)
-    track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id"), nullable=False)
+    playlist_id: Mapped[int] = mapped_column(ForeignKey("playlists.id"), nullable=False, index=True)
+    track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id"), nullable=False, index=True)
     position: Mapped[int] = mapped_column(nullable=False)  # Track position in playlist
 
     # When the track was added to the playlist
@@ -785,6 +828,79 @@ class PlaylistSyncState(Base):
         self.last_synced = datetime.now(UTC)
 
 
+class DuplicateSignature(Base):
+    """Signature of a track in the duplicate index.
+
+    The signature covers the fields the duplicate score compares, so a changed
+    signature tells that the track's duplicate pairs need to be scored again.
+    """
+
+    __tablename__ = "duplicate_signatures"
+
+    track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True)
+    signature: Mapped[str] = mapped_column(String(40), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of DuplicateSignature."""
+        return f"<DuplicateSignature track {self.track_id}: {self.signature}>"
+
+
+class DuplicatePair(Base):
+    """Pair of tracks in the duplicate index with their similarity.
+
+    The lower track ID is always stored as track_id.
+    """
+
+    __tablename__ = "duplicate_pairs"
+
+    track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True)
+    other_track_id: Mapped[int] = mapped_column(
+        ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    similarity: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of DuplicatePair."""
+        return f"<DuplicatePair {self.track_id}/{self.other_track_id}: {self.similarity:.2f}>"
+
+
+class LibraryFile(Base):
+    """Manifest entry of an audio file in the local database folder.
+
+    Stores the file's stat signature from the last scan, so rescans can tell
+    new, changed, deleted and moved files apart without reading tags.
+    """
+
+    __tablename__ = "library_files"
+
+    path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    inode: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        """String representation of LibraryFile."""
+        return f"<LibraryFile {self.path}: {self.size} bytes>"
+
+
+class FileTags(Base):
+    """Cached tags of an audio file, valid while its size and modification time are unchanged."""
+
+    __tablename__ = "file_tags"
+
+    path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Parsed tags as JSON
+    tags: Mapped[str] = mapped_column(Text, nullable=False)
+    # SHA-1 of the embedded cover art, None if the file has none
+    art_digest: Mapped[str | None] = mapped_column(String(40), nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation of FileTags."""
+        return f"<FileTags {self.path}>"
+
+
 class UserSettings(Base):
     """User preferences and application settings."""
 
@@ -1,11 +1,13 @@
 """Repository package for database access."""
 
+from selecta.core.data.repositories.library_file_repository import LibraryFileRepository
 from selecta.core.data.repositories.playlist_repository import PlaylistRepository
 from selecta.core.data.repositories.settings_repository import SettingsRepository
 from selecta.core.data.repositories.track_repository import TrackRepository
 from selecta.core.data.repositories.vinyl_repository import VinylRepository
 
 __all__ = [
+    "LibraryFileRepository",
     "PlaylistRepository",
     "TrackRepository",
     "VinylRepository",
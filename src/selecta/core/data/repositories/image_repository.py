@@ -1,15 +1,69 @@
 """Repository for image storage and retrieval."""
 
 import io
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
 from PIL import Image as PILImage
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, joinedload
 
+from selecta.core.data.change_events import TrackUpdated, queue_change
 from selecta.core.data.database import get_session
 from selecta.core.data.models.db import Image, ImageSize, Track
+from selecta.core.data.repositories.track_repository import KEY_CHUNK_SIZE
 from selecta.core.data.types import BaseRepository
 
+# Dimensions in pixels that each image size is scaled down to fit
+IMAGE_SIZE_PIXELS = {
+    ImageSize.THUMBNAIL: (64, 64),
+    ImageSize.SMALL: (150, 150),
+    ImageSize.MEDIUM: (300, 300),
+    ImageSize.LARGE: (640, 640),
+}
+
+# Resized version of an image: size, data, MIME type, width and height (None if unknown)
+ResizedImage = tuple[ImageSize, bytes, str, int | None, int | None]
+
+
+def resize_image(original_data: bytes) -> list[ResizedImage]:
+    """Resize an image to all standard sizes.
+
+    Args:
+        original_data: Original image data
+
+    Returns:
+        Resized versions of the image, one per size
+
+    Raises:
+        Exception: If the image can't be decoded or encoded
+    """
+    pil_image = PILImage.open(io.BytesIO(original_data))
+    image_format = pil_image.format or "JPEG"
+    mime_type = f"image/{image_format.lower()}"
+
+    resized_images = []
+    for size_enum, dimensions in IMAGE_SIZE_PIXELS.items():
+        resized = pil_image.copy()
+        resized.thumbnail(dimensions, PILImage.Resampling.LANCZOS)
+
+        output = io.BytesIO()
+        resized.save(output, format=image_format)
+        resized_images.append((size_enum, output.getvalue(), mime_type, resized.width, resized.height))
+    return resized_images
+
+
+def _add_first(found: dict[int, bytes], rows: Iterable[tuple[int, bytes]]) -> None:
+    """Add the first image data per ID of query rows, keeping data already found.
+
+    Args:
+        found: Image data by ID, updated in place
+        rows: (ID, image data) rows
+    """
+    for key, data in rows:
+        if data:
+            found.setdefault(key, data)
+
 
 class ImageRepository(BaseRepository[Image]):
     """Repository for image-related database operations."""
@@ -100,6 +154,74 @@ class ImageRepository(BaseRepository[Image]):
         # If not found, return any album image
         return self.session.query(Image).filter(Image.album_id == album_id).first()
 
+    def get_track_image_data(
+        self, track_ids: Iterable[int], size: ImageSize = ImageSize.THUMBNAIL
+    ) -> dict[int, bytes]:
+        """Get the image data of many tracks, with the same fallbacks as get_track_image.
+
+        Args:
+            track_ids: The track IDs
+            size: The desired image size
+
+        Returns:
+            Dictionary mapping the IDs of the tracks with an image to its data
+        """
+        if self.session is None:
+            return {}
+
+        track_ids = list(dict.fromkeys(track_ids))
+        found: dict[int, bytes] = {}
+        for start in range(0, len(track_ids), KEY_CHUNK_SIZE):
+            chunk = track_ids[start : start + KEY_CHUNK_SIZE]
+            _add_first(
+                found,
+                self.session.query(Image.track_id, Image.data).filter(Image.track_id.in_(chunk), Image.size == size),
+            )
+
+            # Fall back to the album image, then to a track image of any size
+            remaining = [track_id for track_id in chunk if track_id not in found]
+            if remaining:
+                _add_first(
+                    found,
+                    self.session.query(Track.id, Image.data)
+                    .join(Image, Image.album_id == Track.album_id)
+                    .filter(Track.id.in_(remaining), Image.size == size),
+                )
+                remaining = [track_id for track_id in remaining if track_id not in found]
+            if remaining:
+                _add_first(found, self.session.query(Image.track_id, Image.data).filter(Image.track_id.in_(remaining)))
+        return found
+
+    def get_album_image_data(
+        self, album_ids: Iterable[int], size: ImageSize = ImageSize.THUMBNAIL
+    ) -> dict[int, bytes]:
+        """Get the image data of many albums, with the same fallback as get_album_image.
+
+        Args:
+            album_ids: The album IDs
+            size: The desired image size
+
+        Returns:
+            Dictionary mapping the IDs of the albums with an image to its data
+        """
+        if self.session is None:
+            return {}
+
+        album_ids = list(dict.fromkeys(album_ids))
+        found: dict[int, bytes] = {}
+        for start in range(0, len(album_ids), KEY_CHUNK_SIZE):
+            chunk = album_ids[start : start + KEY_CHUNK_SIZE]
+            _add_first(
+                found,
+                self.session.query(Image.album_id, Image.data).filter(Image.album_id.in_(chunk), Image.size == size),
+            )
+
+            # Fall back to an album image of any size
+            remaining = [album_id for album_id in chunk if album_id not in found]
+            if remaining:
+                _add_first(found, self.session.query(Image.album_id, Image.data).filter(Image.album_id.in_(remaining)))
+        return found
+
     def add_track_image(
         self,
         track_id: int,
@@ -152,6 +274,7 @@ class ImageRepository(BaseRepository[Image]):
         )
 
         self.session.add(image)
+        queue_change(self.session, TrackUpdated(track_id, {"has_image": True}))
         self.session.commit()
         return image
 
@@ -240,38 +363,17 @@ class ImageRepository(BaseRepository[Image]):
         if track_id is None and album_id is None:
             raise ValueError("Either track_id or album_id must be provided")
 
-        # Target sizes in pixels
-        size_pixels = {
-            ImageSize.THUMBNAIL: (64, 64),
-            ImageSize.SMALL: (150, 150),
-            ImageSize.MEDIUM: (300, 300),
-            ImageSize.LARGE: (640, 640),
-        }
-
         created_images = {}
 
         try:
-            # Open the original image
-            pil_image = PILImage.open(io.BytesIO(original_data))
-
-            # Resize to each target size
-            for size_enum, dimensions in size_pixels.items():
-                # Resize to target dimensions
-                resized = pil_image.copy()
-                resized.thumbnail(dimensions, PILImage.Resampling.LANCZOS)
-
-                # Convert to bytes
-                output = io.BytesIO()
-                resized.save(output, format=pil_image.format or "JPEG")
-                image_data = output.getvalue()
-
+            for size_enum, image_data, mime_type, _, _ in resize_image(original_data):
                 # Store the image
                 if track_id is not None:
                     image = self.add_track_image(
                         track_id=track_id,
                         image_data=image_data,
                         size=size_enum,
-                        mime_type=f"image/{pil_image.format.lower() if pil_image.format else 'jpeg'}",  # noqa: E501
+                        mime_type=mime_type,
                         source=source,
                         source_url=source_url,
                     )
@@ -280,7 +382,7 @@ class ImageRepository(BaseRepository[Image]):
                         album_id=album_id,
                         image_data=image_data,
                         size=size_enum,
-                        mime_type=f"image/{pil_image.format.lower() if pil_image.format else 'jpeg'}",  # noqa: E501
+                        mime_type=mime_type,
                         source=source,
                         source_url=source_url,
                     )
@@ -310,6 +412,44 @@ class ImageRepository(BaseRepository[Image]):
 
         return created_images
 
+    def add_track_images(
+        self, track_images: list[tuple[int, list[ResizedImage]]], source: str | None = None
+    ) -> None:
+        """Add the images of many tracks in one transaction.
+
+        Args:
+            track_images: (track ID, resized versions of its image) per track
+            source: Source of the images (e.g., 'audio_metadata')
+
+        Raises:
+            ValueError: If the session is None
+        """
+        if self.session is None:
+            raise ValueError("Session is required for adding images")
+
+        created_at = datetime.now(UTC)
+        rows = [
+            {
+                "data": image_data,
+                "mime_type": mime_type,
+                "size": size,
+                "width": width,
+                "height": height,
+                "file_size": len(image_data),
+                "track_id": track_id,
+                "source": source,
+                "created_at": created_at,
+            }
+            for track_id, resized_images in track_images
+            for size, image_data, mime_type, width, height in resized_images
+        ]
+        if rows:
+            self.session.execute(insert(Image), rows)
+        for track_id, resized_images in track_images:
+            if resized_images:
+                queue_change(self.session, TrackUpdated(track_id, {"has_image": True}))
+        self.session.commit()
+
     def delete_track_images(self, track_id: int) -> bool:
         """Delete all images for a track.
 
@@ -325,6 +465,8 @@ class ImageRepository(BaseRepository[Image]):
         images = self.session.query(Image).filter(Image.track_id == track_id).all()
         for image in images:
             self.session.delete(image)
+        if images:
+            queue_change(self.session, TrackUpdated(track_id, {"has_image": False}))
 
         self.session.commit()
         return bool(images)
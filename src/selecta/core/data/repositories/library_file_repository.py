@@ -0,0 +1,84 @@
+"""Library file manifest repository for database operations."""
+
+import os
+from collections.abc import Iterable
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from selecta.core.data.database import get_session
+from selecta.core.data.models.db import LibraryFile
+from selecta.core.data.repositories.track_repository import KEY_CHUNK_SIZE, key_prefix_filter
+
+# Stat signature of a file: (size, mtime_ns, inode)
+FileStat = tuple[int, int, int]
+
+
+class LibraryFileRepository:
+    """Repository for the manifest of files in the local database folder."""
+
+    def __init__(self, session: Session | None = None) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy session (creates a new one if not provided)
+        """
+        self.session = session or get_session()
+
+    def get_manifest(self, root: str) -> dict[str, FileStat]:
+        """Get the manifest entries of the files below a folder.
+
+        Args:
+            root: Folder path
+
+        Returns:
+            Dictionary mapping file paths to their (size, mtime_ns, inode) from the last scan
+        """
+        rows = (
+            self.session.query(LibraryFile.path, LibraryFile.size, LibraryFile.mtime_ns, LibraryFile.inode)
+            .filter(key_prefix_filter(LibraryFile.path, os.path.join(root, "")))
+            .all()
+        )
+        return {path: (size, mtime_ns, inode) for path, size, mtime_ns, inode in rows}
+
+    def get_entries(self, paths: Iterable[str]) -> dict[str, FileStat]:
+        """Get the manifest entries of single files.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Dictionary mapping the paths found in the manifest to their (size, mtime_ns, inode)
+        """
+        paths = list(paths)
+        manifest = {}
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            rows = (
+                self.session.query(LibraryFile.path, LibraryFile.size, LibraryFile.mtime_ns, LibraryFile.inode)
+                .filter(LibraryFile.path.in_(chunk))
+                .all()
+            )
+            manifest.update((path, (size, mtime_ns, inode)) for path, size, mtime_ns, inode in rows)
+        return manifest
+
+    def apply_changes(self, upserts: dict[str, FileStat], deleted: Iterable[str]) -> None:
+        """Update the manifest in one transaction.
+
+        Args:
+            upserts: New or changed files mapped to their (size, mtime_ns, inode)
+            deleted: Paths of files that no longer exist
+        """
+        paths = [*upserts, *deleted]
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            self.session.execute(delete(LibraryFile).where(LibraryFile.path.in_(chunk)))
+        if upserts:
+            self.session.execute(
+                insert(LibraryFile),
+                [
+                    {"path": path, "size": size, "mtime_ns": mtime_ns, "inode": inode}
+                    for path, (size, mtime_ns, inode) in upserts.items()
+                ],
+            )
+        self.session.commit()
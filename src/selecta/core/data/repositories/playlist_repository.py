@@ -4,12 +4,16 @@ import json
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 
+from selecta.core.data.change_events import PlaylistTracksChanged, queue_change
 from selecta.core.data.database import get_session
 from selecta.core.data.models.db import Playlist, PlaylistPlatformInfo, PlaylistTrack, Track
 
+# The Collection's own rows, distinct from the rows of other playlists in anti-joins
+_CollectionEntry = aliased(PlaylistTrack)
+
 
 class PlaylistRepository:
     """Repository for playlist-related database operations."""
@@ -224,6 +228,9 @@ class PlaylistRepository:
         Returns:
             The created playlist track association
         """
+        # Tracks placed between others are announced as a reorder
+        reordered = position is not None
+
         # If position not specified, place at end of playlist
         if position is None:
             # Get highest current position
@@ -244,9 +251,39 @@ class PlaylistRepository:
         )
 
         self.session.add(playlist_track)
+        queue_change(self.session, PlaylistTracksChanged(playlist_id, added=(track_id,), reordered=reordered))
         self.session.commit()
         return playlist_track
 
+    def append_tracks(self, playlist_id: int, track_ids: list[int]) -> int:
+        """Append tracks to the end of a playlist in one transaction.
+
+        Args:
+            playlist_id: The playlist ID
+            track_ids: IDs of the tracks to append, in order
+
+        Returns:
+            Number of tracks appended
+        """
+        if not track_ids:
+            return 0
+
+        last_position = (
+            self.session.query(func.max(PlaylistTrack.position))
+            .filter(PlaylistTrack.playlist_id == playlist_id)
+            .scalar()
+        )
+        position = last_position + 1 if last_position is not None else 0
+
+        added_at = datetime.now(UTC)
+        self.session.add_all(
+            PlaylistTrack(playlist_id=playlist_id, track_id=track_id, position=position + offset, added_at=added_at)
+            for offset, track_id in enumerate(track_ids)
+        )
+        queue_change(self.session, PlaylistTracksChanged(playlist_id, added=tuple(track_ids)))
+        self.session.commit()
+        return len(track_ids)
+
     def remove_track(self, playlist_id: int, track_id: int) -> bool:
         """Remove a track from a playlist.
 
@@ -284,6 +321,7 @@ class PlaylistRepository:
             synchronize_session=False,
         )
 
+        queue_change(self.session, PlaylistTracksChanged(playlist_id, removed=(track_id,)))
         self.session.commit()
         return True
 
@@ -343,6 +381,7 @@ class PlaylistRepository:
         # Update the track's position using setattr
         playlist_track.position = new_position  # type: ignore
 
+        queue_change(self.session, PlaylistTracksChanged(playlist_id, reordered=True))
         self.session.commit()
         return True
 
@@ -393,15 +432,76 @@ class PlaylistRepository:
             .count()
         )
 
+    def _orphaned_rows(self, collection_id: int) -> Any:
+        """Build the query of Collection entries whose track is in no other playlist.
+
+        Args:
+            collection_id: ID of the Collection playlist
+
+        Returns:
+            Query of PlaylistTrack rows of the Collection
+        """
+        in_other_playlist = (
+            self.session.query(PlaylistTrack.id)
+            .join(Playlist, Playlist.id == PlaylistTrack.playlist_id)
+            .filter(
+                PlaylistTrack.track_id == _CollectionEntry.track_id,
+                PlaylistTrack.playlist_id != collection_id,
+                Playlist.is_folder.is_not(True),
+            )
+            .exists()
+        )
+        return self.session.query(_CollectionEntry).filter(
+            _CollectionEntry.playlist_id == collection_id, ~in_other_playlist
+        )
+
+    def get_orphaned_tracks(self, collection_id: int, limit: int | None = None, offset: int = 0) -> list[Track]:
+        """Get the Collection tracks that aren't in any other playlist, in Collection order.
+
+        Uses a single anti-join query instead of loading every playlist's tracks.
+
+        Args:
+            collection_id: ID of the Collection playlist
+            limit: Maximum number of tracks to return (None for all)
+            offset: Number of orphaned tracks to skip
+
+        Returns:
+            Page of orphaned tracks, with their platform info loaded
+        """
+        query = (
+            self._orphaned_rows(collection_id)
+            .join(Track, Track.id == _CollectionEntry.track_id)
+            .with_entities(Track)
+            .options(selectinload(Track.platform_info))
+            .order_by(_CollectionEntry.position, _CollectionEntry.id)
+            .offset(offset)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def count_orphaned_tracks(self, collection_id: int) -> int:
+        """Count the Collection tracks that aren't in any other playlist.
+
+        Args:
+            collection_id: ID of the Collection playlist
+
+        Returns:
+            Number of orphaned tracks
+        """
+        return self._orphaned_rows(collection_id).count()
+
     def clear_tracks(self, playlist_id: int) -> None:
         """Remove all tracks from a playlist.
 
         Args:
             playlist_id: The playlist ID
         """
+        track_ids = self.session.query(PlaylistTrack.track_id).filter(PlaylistTrack.playlist_id == playlist_id).all()
         self.session.query(PlaylistTrack).filter(PlaylistTrack.playlist_id == playlist_id).delete(
             synchronize_session=False
         )
+        queue_change(self.session, PlaylistTracksChanged(playlist_id, removed=tuple(row[0] for row in track_ids)))
         self.session.commit()
 
     def add_platform_info(
@@ -48,6 +48,24 @@ class SettingsRepository:
             return default
         return setting.typed_value
 
+    def get_current_setting_value(self, key: str, default: Any = None) -> Any:
+        """Get a user setting value as currently stored in the database.
+
+        Unlike get_setting_value, this re-reads a setting the session has
+        already loaded, picking up writes made through other sessions.
+
+        Args:
+            key: The settings key
+            default: Default value if setting not found
+
+        Returns:
+            The setting value, or default if not found
+        """
+        setting = self.session.query(UserSettings).filter(UserSettings.key == key).populate_existing().first()
+        if not setting:
+            return default
+        return setting.typed_value
+
     def set_setting(
         self,
         key: str,
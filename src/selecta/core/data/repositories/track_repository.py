@@ -4,12 +4,34 @@ import json
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, select
+from sqlalchemy import update as sql_update
+from sqlalchemy.orm import InstrumentedAttribute, Session, joinedload, selectinload
 
+from selecta.core.data.change_events import PlatformLinkAdded, TrackUpdated, queue_change
 from selecta.core.data.database import get_session
-from selecta.core.data.models.db import Genre, Tag, Track, TrackAttribute, TrackPlatformInfo
+from selecta.core.data.models.db import Genre, Image, Tag, Track, TrackAttribute, TrackPlatformInfo
 from selecta.core.data.types import BaseRepository
+from selecta.core.utils.track_matching import normalize_artist, normalize_text, normalize_title, track_match_key
+
+# Maximum number of keys bound into one IN clause
+KEY_CHUNK_SIZE = 500
+
+
+def key_prefix_filter(column: InstrumentedAttribute, prefix: str) -> Any:
+    """Build an index-friendly prefix filter on a normalized key column.
+
+    Uses a range comparison instead of LIKE, which SQLite can't serve from an index
+    on a case-sensitive column.
+
+    Args:
+        column: Normalized key column (Track.title_key, Track.artist_key or Track.match_key)
+        prefix: Normalized prefix
+
+    Returns:
+        SQLAlchemy filter clause
+    """
+    return and_(column >= prefix, column < prefix + "\uffff")
 
 
 class TrackRepository(BaseRepository[Track]):
@@ -46,6 +68,39 @@ class TrackRepository(BaseRepository[Track]):
             .first()
         )
 
+    def get_by_ids(self, track_ids: list[int]) -> list[Track]:
+        """Get tracks by their IDs, with their platform info, genres, tags, album and images.
+
+        Only the IDs of the images are loaded, enough to tell whether a track has one.
+
+        Args:
+            track_ids: The track IDs
+
+        Returns:
+            The tracks found, in the order of the IDs
+        """
+        if self.session is None:
+            return []
+
+        unique_ids = list(dict.fromkeys(track_ids))
+        found: dict[int, Track] = {}
+        for start in range(0, len(unique_ids), KEY_CHUNK_SIZE):
+            chunk = unique_ids[start : start + KEY_CHUNK_SIZE]
+            tracks = (
+                self.session.query(Track)
+                .options(
+                    selectinload(Track.platform_info),
+                    selectinload(Track.genres),
+                    selectinload(Track.tags),
+                    selectinload(Track.album),
+                    selectinload(Track.images).load_only(Image.id),
+                )
+                .filter(Track.id.in_(chunk))
+                .all()
+            )
+            found.update((track.id, track) for track in tracks)
+        return [found[track_id] for track_id in unique_ids if track_id in found]
+
     def get_by_platform_id(self, platform: str, platform_id: str) -> Track | None:
         """Get a track by its platform-specific ID.
 
@@ -89,11 +144,14 @@ class TrackRepository(BaseRepository[Track]):
 
         # Prepare search terms
         search_term = f"%{query}%"
+        key_prefix = normalize_text(query)
 
-        # Build the query
-        base_query = self.session.query(Track).filter(
-            or_(Track.title.ilike(search_term), Track.artist.ilike(search_term))
-        )
+        # Build the query; the key prefixes also match spellings without diacritics or punctuation
+        conditions = [Track.title.ilike(search_term), Track.artist.ilike(search_term)]
+        if key_prefix:
+            conditions.append(key_prefix_filter(Track.title_key, key_prefix))
+            conditions.append(key_prefix_filter(Track.artist_key, key_prefix))
+        base_query = self.session.query(Track).filter(or_(*conditions))
 
         # Get total count
         total = base_query.count()
@@ -109,6 +167,42 @@ class TrackRepository(BaseRepository[Track]):
 
         return tracks, total
 
+    def find_by_title_artist(self, title: str, artist: str) -> Track | None:
+        """Find a track with the same normalized title and artist.
+
+        Args:
+            title: Track title
+            artist: Track artist
+
+        Returns:
+            The track with the lowest ID among the matches, or None
+        """
+        if self.session is None:
+            return None
+        match_key = track_match_key(normalize_title(title), normalize_artist(artist))
+        return self.session.query(Track).filter(Track.match_key == match_key).order_by(Track.id).first()
+
+    def get_by_match_keys(self, match_keys: list[str]) -> dict[str, Track]:
+        """Get tracks by their combined matching keys.
+
+        Args:
+            match_keys: Keys as built by track_matching.track_match_key
+
+        Returns:
+            Dictionary mapping each found key to the track with the lowest ID
+        """
+        if self.session is None:
+            return {}
+
+        unique_keys = list(dict.fromkeys(match_keys))
+        found: dict[str, Track] = {}
+        for start in range(0, len(unique_keys), KEY_CHUNK_SIZE):
+            chunk = unique_keys[start : start + KEY_CHUNK_SIZE]
+            tracks = self.session.query(Track).filter(Track.match_key.in_(chunk)).order_by(Track.id).all()
+            for track in tracks:
+                found.setdefault(track.match_key, track)
+        return found
+
     def create(self, track_data: dict[str, Any]) -> Track:
         """Create a new track.
 
@@ -144,6 +238,30 @@ class TrackRepository(BaseRepository[Track]):
         if not track:
             return None
 
+        changes = self.apply_track_data(track, track_data, preserve_existing)
+
+        if self.session:
+            if changes:
+                queue_change(self.session, TrackUpdated(track_id, changes))
+            self.session.commit()
+        return track
+
+    @staticmethod
+    def apply_track_data(
+        track: Track, track_data: dict[str, Any], preserve_existing: bool = True
+    ) -> dict[str, Any]:
+        """Set track fields from a dictionary without committing.
+
+        Args:
+            track: The track to modify
+            track_data: Dictionary with updated track data
+            preserve_existing: If True, only update fields that are
+                empty or None in the existing track
+
+        Returns:
+            The fields that were set, with their values
+        """
+        changes = {}
         # Update track attributes
         for key, value in track_data.items():
             # Skip None values always
@@ -167,10 +285,8 @@ class TrackRepository(BaseRepository[Track]):
 
             # Set the value if we didn't skip it
             setattr(track, key, value)
-
-        if self.session:
-            self.session.commit()
-        return track
+            changes[key] = value
+        return changes
 
     def delete(self, track_id: int) -> bool:
         """Delete a track by its ID.
@@ -257,6 +373,7 @@ class TrackRepository(BaseRepository[Track]):
             existing.last_linked = datetime.now(UTC)
             existing.needs_update = False
 
+            queue_change(self.session, PlatformLinkAdded(track_id, platform))
             self.session.commit()
             return existing
 
@@ -269,9 +386,55 @@ class TrackRepository(BaseRepository[Track]):
             metadata=metadata,
         )
         self.session.add(info)
+        queue_change(self.session, PlatformLinkAdded(track_id, platform))
         self.session.commit()
         return info
 
+    def get_platform_id_map(self, platform: str) -> dict[str, int]:
+        """Get the local track ID of every track linked to a platform.
+
+        Args:
+            platform: The platform name
+
+        Returns:
+            Dictionary mapping platform IDs to local track IDs
+        """
+        if self.session is None:
+            return {}
+
+        rows = (
+            self.session.query(TrackPlatformInfo.platform_id, TrackPlatformInfo.track_id)
+            .filter(TrackPlatformInfo.platform == platform)
+            .all()
+        )
+        return dict(rows)
+
+    def remove_platform_info(self, platform: str, platform_ids: list[str]) -> int:
+        """Remove the platform links of tracks that no longer exist on a platform.
+
+        The local tracks themselves are kept.
+
+        Args:
+            platform: The platform name
+            platform_ids: IDs in the platform's system
+
+        Returns:
+            Number of removed platform links
+        """
+        if self.session is None or not platform_ids:
+            return 0
+
+        deleted = (
+            self.session.query(TrackPlatformInfo)
+            .filter(
+                TrackPlatformInfo.platform == platform,
+                TrackPlatformInfo.platform_id.in_(platform_ids),
+            )
+            .delete(synchronize_session=False)
+        )
+        self.session.commit()
+        return deleted
+
     def mark_platform_info_for_update(self, track_id: int, platform: str) -> bool:
         """Mark platform info as needing an update.
 
@@ -465,6 +628,7 @@ class TrackRepository(BaseRepository[Track]):
         updated = track.update_from_platform(platform, fields)
 
         if updated and self.session:
+            queue_change(self.session, TrackUpdated(track_id, {name: getattr(track, name, None) for name in fields}))
             self.session.commit()
 
         return updated
@@ -517,6 +681,7 @@ class TrackRepository(BaseRepository[Track]):
 
         # Add the tag to the track
         track.tags.append(tag)
+        queue_change(self.session, TrackUpdated(track_id, {"tags": [tag.name for tag in track.tags]}))
         self.session.commit()
         return True
 
@@ -544,6 +709,7 @@ class TrackRepository(BaseRepository[Track]):
 
         # Remove the tag from the track
         track.tags.remove(tag)
+        queue_change(self.session, TrackUpdated(track_id, {"tags": [tag.name for tag in track.tags]}))
         self.session.commit()
         return True
 
@@ -602,6 +768,7 @@ class TrackRepository(BaseRepository[Track]):
             if genre not in track.genres:
                 track.genres.append(genre)
 
+        queue_change(self.session, TrackUpdated(track_id, {"genres": [genre.name for genre in track.genres]}))
         self.session.commit()
         return True
 
@@ -729,6 +896,7 @@ class TrackRepository(BaseRepository[Track]):
             f"Setting quality for track {track_id} ({track.artist} - {track.title}) to {quality}"
         )
         track.quality = quality
+        queue_change(self.session, TrackUpdated(track_id, {"quality": quality}))
         self.session.commit()
         logger.info(f"Track quality updated: Track ID {track_id} quality={quality}")
         return True
@@ -780,6 +948,98 @@ class TrackRepository(BaseRepository[Track]):
             .all()
         )
 
+    def get_tracks_without_content_hash(self) -> list[tuple[int, str]]:
+        """Get the tracks with a local file that has no content hash yet.
+
+        Returns:
+            List of (track ID, local path) tuples
+        """
+        if self.session is None:
+            return []
+
+        rows = (
+            self.session.query(Track.id, Track.local_path)
+            .filter(Track.local_path.isnot(None), Track.local_path != "", Track.content_hash.is_(None))
+            .order_by(Track.id)
+            .all()
+        )
+        return [(track_id, local_path) for track_id, local_path in rows]
+
+    def get_local_tracks_without_images(self) -> list[tuple[int, str]]:
+        """Get the tracks with a local file that have no image, neither their own nor their album's.
+
+        As in get_track_image, an album image counts as the image of its tracks,
+        so tracks of an album with an image of any size are skipped too.
+
+        Returns:
+            List of (track ID, local path) tuples, ordered by path so tracks of an album are adjacent
+        """
+        if self.session is None:
+            return []
+
+        track_images = select(Image.track_id).where(Image.track_id.isnot(None))
+        album_images = select(Image.album_id).where(Image.album_id.isnot(None))
+        rows = (
+            self.session.query(Track.id, Track.local_path)
+            .filter(
+                Track.local_path.isnot(None),
+                Track.local_path != "",
+                Track.id.not_in(track_images),
+                or_(Track.album_id.is_(None), Track.album_id.not_in(album_images)),
+            )
+            .order_by(Track.local_path)
+            .all()
+        )
+        return [(track_id, local_path) for track_id, local_path in rows]
+
+    def set_content_hashes(self, hashes: dict[int, str]) -> None:
+        """Store the content hashes of tracks' local files.
+
+        Args:
+            hashes: Dictionary mapping track IDs to content hashes
+        """
+        if self.session is None or not hashes:
+            return
+
+        # ORM bulk update by primary key
+        rows = [{"id": track_id, "content_hash": content_hash} for track_id, content_hash in hashes.items()]
+        self.session.execute(sql_update(Track), rows)
+        for track_id, content_hash in hashes.items():
+            queue_change(self.session, TrackUpdated(track_id, {"content_hash": content_hash}))
+        self.session.commit()
+
+    def relocate_many(self, moves: list[tuple[int, str, str | None]]) -> int:
+        """Point tracks at their files' new locations in one transaction.
+
+        Args:
+            moves: (track ID, new path, content hash) per track; a None hash keeps the track's hash
+
+        Returns:
+            Number of relocated tracks
+        """
+        if self.session is None or not moves:
+            return 0
+
+        relocated = 0
+        for start in range(0, len(moves), KEY_CHUNK_SIZE):
+            chunk = moves[start : start + KEY_CHUNK_SIZE]
+            tracks = {
+                track.id: track
+                for track in self.session.query(Track).filter(Track.id.in_([track_id for track_id, _, _ in chunk]))
+            }
+            for track_id, local_path, content_hash in chunk:
+                track = tracks.get(track_id)
+                if track:
+                    content_hash = content_hash or track.content_hash
+                    track.local_path = local_path
+                    track.content_hash = content_hash
+                    queue_change(
+                        self.session, TrackUpdated(track_id, {"local_path": local_path, "content_hash": content_hash})
+                    )
+                    relocated += 1
+        self.session.commit()
+        return relocated
+
     def refresh_track(self, track_id: int) -> Track | None:
         """Refresh a track from the database.
 
@@ -364,6 +364,9 @@ class SyncResult:
     library_additions_applied: int = 0
     library_removals_applied: int = 0
 
+    # Selected changes postponed to a later sync (e.g. platform quota exhausted)
+    deferred_changes: list[TrackChange] = field(default_factory=list)
+
     # Errors or warnings
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
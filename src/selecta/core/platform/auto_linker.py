@@ -0,0 +1,647 @@
+"""Batch linking of library tracks to platform catalogs.
+
+PlatformAutoLinker walks the library tracks that have no link to a platform
+yet, searches the platform for each of them and scores the results by title,
+artist and duration. Confident matches are linked right away, the rest is
+queued for review. Searches run concurrently (within the client's own rate
+limiting) and their results are kept in a persistent SearchResponseStore, so
+reruns and dry runs don't repeat them. Progress is stored per platform in the
+settings table, so an interrupted run continues where it stopped.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from selecta.core.data.database import get_session
+from selecta.core.data.models.db import Track, TrackPlatformInfo
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.platform.abstract_platform import AbstractPlatform
+from selecta.core.platform.link_manager import PlatformLinkManager
+from selecta.core.platform.youtube.models import YouTubeVideo
+from selecta.core.platform.youtube.quota import method_cost
+from selecta.core.utils.path_helper import get_app_cache_path
+from selecta.core.utils.track_matching import match_score, normalize_artist, normalize_title
+
+# Score from which a candidate is linked without review
+AUTO_LINK_THRESHOLD = 0.9
+
+# Score from which a candidate is queued for review
+REVIEW_THRESHOLD = 0.6
+
+# Search results requested per track
+SEARCH_LIMIT = 5
+
+# Library tracks processed between two progress checkpoints
+BATCH_SIZE = 50
+
+# Concurrent searches per platform; the clients space their requests themselves
+MAX_WORKERS = {"spotify": 4, "discogs": 2, "youtube": 1}
+
+# Maximum number of candidates kept per review item
+MAX_REVIEW_CANDIDATES = 3
+
+# Age (seconds) after which stored search results are fetched again
+SEARCH_CACHE_TTL = 30 * 24 * 3600
+
+
+@dataclass
+class LinkCandidate:
+    """A platform search result considered as a link target."""
+
+    platform_id: str
+    title: str
+    artist: str
+    duration_ms: int | None = None
+
+    # Data passed to PlatformLinkManager.link_tracks
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    score: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the candidate to a dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the candidate
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LinkCandidate":
+        """Create a candidate from its dictionary representation.
+
+        Args:
+            data: Dictionary as returned by to_dict
+
+        Returns:
+            LinkCandidate instance
+        """
+        return cls(**data)
+
+
+@dataclass
+class ReviewItem:
+    """A library track whose best candidates were not confident enough to link."""
+
+    track_id: int
+    title: str
+    artist: str
+    candidates: list[LinkCandidate] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the review item to a dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the review item
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ReviewItem":
+        """Create a review item from its dictionary representation.
+
+        Args:
+            data: Dictionary as returned by to_dict
+
+        Returns:
+            ReviewItem instance
+        """
+        candidates = [LinkCandidate.from_dict(candidate) for candidate in data.get("candidates", [])]
+        return cls(track_id=data["track_id"], title=data["title"], artist=data["artist"], candidates=candidates)
+
+
+@dataclass
+class AutoLinkResult:
+    """Outcome of an auto-link run."""
+
+    processed: int = 0
+
+    # (library track ID, candidate) pairs that were linked, or would be in a dry run
+    linked: list[tuple[int, LinkCandidate]] = field(default_factory=list)
+
+    review: list[ReviewItem] = field(default_factory=list)
+    unmatched: list[int] = field(default_factory=list)
+
+    # Tracks whose best match could not be linked
+    failed: list[int] = field(default_factory=list)
+
+    # False if the run stopped before all unlinked tracks were processed
+    complete: bool = True
+
+
+def candidate_from_result(platform: str, result: Any) -> LinkCandidate | None:
+    """Convert a platform search result to a link candidate.
+
+    Args:
+        platform: Platform name
+        result: Item returned by the platform client's search_tracks
+
+    Returns:
+        The candidate, or None if the result has no ID
+    """
+    if platform == "spotify":
+        if not result.get("id"):
+            return None
+        artists = ", ".join(artist.get("name", "") for artist in result.get("artists", []))
+        album = result.get("album") or {}
+        return LinkCandidate(
+            platform_id=result["id"],
+            title=result.get("name", ""),
+            artist=artists,
+            duration_ms=result.get("duration_ms"),
+            payload={
+                "id": result["id"],
+                "uri": result.get("uri"),
+                "popularity": result.get("popularity", 0),
+                "explicit": result.get("explicit", False),
+                "album": {"images": album.get("images", [])},
+            },
+        )
+
+    if platform == "youtube":
+        video = YouTubeVideo.from_youtube_dict(result)
+        if not video.id:
+            return None
+        # Music uploads are usually titled "Artist - Title"; fall back to the channel as artist
+        artist, _, title = video.title.partition(" - ")
+        if not title:
+            artist, title = video.channel_title, video.title
+        return LinkCandidate(
+            platform_id=video.id,
+            title=title,
+            artist=artist,
+            duration_ms=video.duration_seconds * 1000 if video.duration_seconds else None,
+            payload={
+                "video_id": video.id,
+                "url": f"https://www.youtube.com/watch?v={video.id}",
+                "view_count": video.view_count or 0,
+                "like_count": video.like_count or 0,
+                "channel_id": video.channel_id,
+                "channel_title": video.channel_title,
+                "thumbnail_url": video.thumbnail_url or "",
+            },
+        )
+
+    if platform == "discogs":
+        # Search results carry the artist in the title ("Artist - Title") instead of an artists list
+        artist, title = result.artist, result.title
+        if artist == "Unknown Artist" and " - " in title:
+            artist, _, title = title.partition(" - ")
+        return LinkCandidate(
+            platform_id=str(result.id),
+            title=title,
+            artist=artist,
+            payload={"id": result.id, "genres": result.genre or [], "format": result.format or []},
+        )
+
+    raise ValueError(f"Unsupported platform for auto-linking: {platform}")
+
+
+class SearchResponseStore:
+    """Persistent store of search candidates per platform and query.
+
+    Doubles as the recording that dry runs are replayed against.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = SEARCH_CACHE_TTL) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file to persist to (defaults to the application cache directory)
+            ttl: Age in seconds after which entries are considered stale
+        """
+        self.path = path or get_app_cache_path() / "auto_link_searches.json"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read search cache {self.path}: {e}")
+
+    def get(self, platform: str, query: str, ignore_expiry: bool = False) -> list[LinkCandidate] | None:
+        """Get the stored candidates of a search.
+
+        Args:
+            platform: Platform name
+            query: Search query
+            ignore_expiry: If True, return stale entries too
+
+        Returns:
+            Stored candidates, or None if the search isn't stored
+        """
+        with self._lock:
+            entry = self._entries.get(platform, {}).get(query)
+        if entry is None or (not ignore_expiry and time.time() - entry["stored_at"] > self.ttl):
+            return None
+        return [LinkCandidate.from_dict(candidate) for candidate in entry["candidates"]]
+
+    def put(self, platform: str, query: str, candidates: list[LinkCandidate]) -> None:
+        """Store the candidates of a search.
+
+        Args:
+            platform: Platform name
+            query: Search query
+            candidates: Candidates returned by the search
+        """
+        entry = {"stored_at": time.time(), "candidates": [candidate.to_dict() for candidate in candidates]}
+        with self._lock:
+            self._entries.setdefault(platform, {})[query] = entry
+
+    def save(self) -> None:
+        """Write the store to its file."""
+        with self._lock:
+            data = json.dumps(self._entries)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(data, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write search cache {self.path}: {e}")
+
+
+class AutoLinkState:
+    """Auto-link progress and review queue per platform, persisted in the settings table."""
+
+    SETTINGS_KEY = "auto_link_state"
+
+    def __init__(self, settings_repo: SettingsRepository, platform: str) -> None:
+        """Initialize the state.
+
+        Args:
+            settings_repo: Repository used to persist the state
+            platform: Platform name
+        """
+        self.settings_repo = settings_repo
+        self.platform = platform
+
+    def _load_all(self) -> dict[str, Any]:
+        """Load the state of all platforms.
+
+        Returns:
+            Dictionary mapping platform names to their state
+        """
+        try:
+            state = self.settings_repo.get_setting_value(self.SETTINGS_KEY)
+        except Exception as e:
+            logger.warning(f"Could not load auto-link state: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save(self, data: dict[str, Any]) -> None:
+        """Persist the state of this platform.
+
+        Args:
+            data: State of this platform
+        """
+        state = self._load_all()
+        state[self.platform] = data
+        self.settings_repo.set_setting(
+            self.SETTINGS_KEY,
+            state,
+            data_type="json",
+            description="Auto-link progress and review queue per platform",
+        )
+
+    @property
+    def last_track_id(self) -> int:
+        """ID of the last library track processed by auto-linking."""
+        return int(self._load_all().get(self.platform, {}).get("last_track_id", 0))
+
+    def review_items(self) -> list[ReviewItem]:
+        """Get the queued review items.
+
+        Returns:
+            Review items in queue order
+        """
+        items = self._load_all().get(self.platform, {}).get("review", [])
+        return [ReviewItem.from_dict(item) for item in items]
+
+    def checkpoint(self, last_track_id: int, new_review_items: list[ReviewItem]) -> None:
+        """Record processed tracks and queue their review items.
+
+        Args:
+            last_track_id: ID of the last processed library track
+            new_review_items: Review items to append to the queue
+        """
+        data = self._load_all().get(self.platform, {})
+        data["last_track_id"] = last_track_id
+        data["review"] = data.get("review", []) + [item.to_dict() for item in new_review_items]
+        self._save(data)
+
+    def dismiss(self, track_id: int) -> None:
+        """Remove a track from the review queue.
+
+        Args:
+            track_id: Library track ID
+        """
+        data = self._load_all().get(self.platform, {})
+        data["review"] = [item for item in data.get("review", []) if item.get("track_id") != track_id]
+        self._save(data)
+
+    def reset(self) -> None:
+        """Forget progress and review queue, so the next run starts from the first track."""
+        self._save({})
+
+
+class PlatformAutoLinker:
+    """Links unlinked library tracks to their best match on a platform."""
+
+    def __init__(
+        self,
+        platform_client: AbstractPlatform,
+        session: Session | None = None,
+        store: SearchResponseStore | None = None,
+        dry_run: bool = False,
+        auto_link_threshold: float = AUTO_LINK_THRESHOLD,
+        review_threshold: float = REVIEW_THRESHOLD,
+    ) -> None:
+        """Initialize the auto-linker.
+
+        Args:
+            platform_client: Client of the platform to link to
+            session: Optional SQLAlchemy session
+            store: Store of search results (defaults to the application cache file)
+            dry_run: If True, only replay stored search results and don't write links or progress
+            auto_link_threshold: Score from which candidates are linked without review
+            review_threshold: Score from which candidates are queued for review
+        """
+        self.platform_client = platform_client
+        self.session = session or get_session()
+        self.link_manager = PlatformLinkManager(platform_client, TrackRepository(self.session), self.session)
+        self.platform_name = self.link_manager.platform_name
+        self.store = store or SearchResponseStore()
+        self.state = AutoLinkState(SettingsRepository(self.session), self.platform_name)
+        self.dry_run = dry_run
+        self.auto_link_threshold = auto_link_threshold
+        self.review_threshold = review_threshold
+
+    def _unlinked_filter(self, after_track_id: int) -> list[Any]:
+        """Build the filter selecting unlinked tracks after a track ID.
+
+        Args:
+            after_track_id: Only select tracks with a higher ID
+
+        Returns:
+            List of SQLAlchemy filter clauses
+        """
+        linked_ids = select(TrackPlatformInfo.track_id).where(TrackPlatformInfo.platform == self.platform_name)
+        return [Track.id > after_track_id, Track.id.not_in(linked_ids)]
+
+    def count_unlinked(self, after_track_id: int = 0) -> int:
+        """Count the library tracks without a link to the platform.
+
+        Args:
+            after_track_id: Only count tracks with a higher ID
+
+        Returns:
+            Number of unlinked tracks
+        """
+        return self.session.scalar(select(func.count(Track.id)).where(*self._unlinked_filter(after_track_id))) or 0
+
+    def unlinked_tracks(self, after_track_id: int = 0, limit: int = BATCH_SIZE) -> list[Track]:
+        """Get library tracks without a link to the platform, by ascending ID.
+
+        Args:
+            after_track_id: Only return tracks with a higher ID
+            limit: Maximum number of tracks
+
+        Returns:
+            List of tracks
+        """
+        return (
+            self.session.query(Track)
+            .filter(*self._unlinked_filter(after_track_id))
+            .order_by(Track.id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def build_query(track: Track) -> str:
+        """Build the search query for a library track.
+
+        Args:
+            track: Library track
+
+        Returns:
+            Normalized "artist title" query
+        """
+        return f"{normalize_artist(track.artist)} {normalize_title(track.title)}".strip()
+
+    def search(self, query: str) -> list[LinkCandidate]:
+        """Search the platform, using stored results where available.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Candidates found for the query
+
+        Raises:
+            ValueError: If the search fails
+        """
+        stored = self.store.get(self.platform_name, query, ignore_expiry=self.dry_run)
+        if stored is not None or self.dry_run:
+            return stored or []
+
+        results = self.platform_client.search_tracks(query, limit=SEARCH_LIMIT)
+        candidates = [
+            candidate
+            for candidate in (candidate_from_result(self.platform_name, result) for result in results)
+            if candidate is not None
+        ]
+        self.store.put(self.platform_name, query, candidates)
+        return candidates
+
+    def score(self, track: Track, candidates: list[LinkCandidate]) -> list[LinkCandidate]:
+        """Score candidates against a library track.
+
+        Args:
+            track: Library track
+            candidates: Candidates to score
+
+        Returns:
+            The candidates with their score set, best first
+        """
+        title = normalize_title(track.title)
+        artist = normalize_artist(track.artist)
+        for candidate in candidates:
+            candidate.score = match_score(
+                title,
+                artist,
+                track.duration_ms,
+                normalize_title(candidate.title),
+                normalize_artist(candidate.artist),
+                candidate.duration_ms,
+            )
+        return sorted(candidates, key=lambda candidate: candidate.score, reverse=True)
+
+    def _can_search(self) -> bool:
+        """Check whether the platform allows another search today.
+
+        Returns:
+            False if the platform's daily quota can't pay for a search
+        """
+        quota = getattr(self.platform_client, "quota", None)
+        if quota is None or self.dry_run:
+            return True
+        # A YouTube search is followed by a videos.list call for the durations
+        return quota.can_afford(method_cost("search.list") + method_cost("videos.list"))
+
+    def _search_batch(self, tracks: list[Track]) -> dict[int, list[LinkCandidate] | None]:
+        """Search the platform for a batch of tracks concurrently.
+
+        Args:
+            tracks: Library tracks
+
+        Returns:
+            Dictionary mapping track IDs to candidates, or None where the search failed
+        """
+        queries = {track.id: self.build_query(track) for track in tracks}
+        unique_queries = list(dict.fromkeys(query for query in queries.values() if query))
+
+        def run_search(query: str) -> list[LinkCandidate] | None:
+            try:
+                return self.search(query)
+            except Exception as e:
+                logger.warning(f"{self.platform_name} search for '{query}' failed: {e}")
+                return None
+
+        workers = MAX_WORKERS.get(self.platform_name, 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(unique_queries, executor.map(run_search, unique_queries), strict=True))
+
+        return {track_id: results.get(query, []) if query else [] for track_id, query in queries.items()}
+
+    def run(
+        self,
+        max_tracks: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AutoLinkResult:
+        """Auto-link the unlinked library tracks, continuing after the last checkpoint.
+
+        Args:
+            max_tracks: Maximum number of tracks to process in this run
+            progress_callback: Called with (processed, total) after each batch
+            should_stop: Polled between batches; returning True ends the run early
+
+        Returns:
+            Summary of the run
+        """
+        result = AutoLinkResult()
+        last_track_id = 0 if self.dry_run else self.state.last_track_id
+        total = self.count_unlinked(last_track_id)
+        if max_tracks is not None:
+            total = min(total, max_tracks)
+        logger.info(f"Auto-linking {total} tracks to {self.platform_name} (dry run: {self.dry_run})")
+
+        while result.processed < total:
+            if (should_stop and should_stop()) or not self._can_search():
+                result.complete = False
+                break
+
+            tracks = self.unlinked_tracks(last_track_id, min(BATCH_SIZE, total - result.processed))
+            if not tracks:
+                break
+
+            candidates_by_track = self._search_batch(tracks)
+            batch_review: list[ReviewItem] = []
+            search_failed = False
+            for track in tracks:
+                candidates = candidates_by_track[track.id]
+                if candidates is None:
+                    # Searches are failing (network, rate limit or quota); retry from this track next run
+                    search_failed = True
+                    break
+                self._apply_candidates(track, self.score(track, candidates), result, batch_review)
+                result.processed += 1
+                last_track_id = track.id
+
+            if not self.dry_run:
+                self.store.save()
+                self.state.checkpoint(last_track_id, batch_review)
+            if progress_callback:
+                progress_callback(result.processed, total)
+
+            if search_failed:
+                result.complete = False
+                break
+
+        logger.info(
+            f"Auto-linked {len(result.linked)} of {result.processed} tracks to {self.platform_name}, "
+            f"{len(result.review)} queued for review"
+        )
+        return result
+
+    def _apply_candidates(
+        self, track: Track, candidates: list[LinkCandidate], result: AutoLinkResult, review: list[ReviewItem]
+    ) -> None:
+        """Link a track to its best candidate or queue it for review.
+
+        Args:
+            track: Library track
+            candidates: Scored candidates, best first
+            result: Run summary to update
+            review: Review items of the current batch
+        """
+        best = candidates[0] if candidates else None
+        if best is not None and best.score >= self.auto_link_threshold:
+            if not self.dry_run:
+                try:
+                    self.link_manager.link_tracks(track.id, best.payload)
+                except ValueError as e:
+                    logger.warning(f"Could not link track {track.id} to {self.platform_name}: {e}")
+                    result.failed.append(track.id)
+                    return
+            result.linked.append((track.id, best))
+            return
+
+        reviewable = [candidate for candidate in candidates if candidate.score >= self.review_threshold]
+        if reviewable:
+            item = ReviewItem(
+                track_id=track.id,
+                title=track.title,
+                artist=track.artist,
+                candidates=reviewable[:MAX_REVIEW_CANDIDATES],
+            )
+            review.append(item)
+            result.review.append(item)
+        else:
+            result.unmatched.append(track.id)
+
+    def accept_review(self, track_id: int, platform_id: str) -> bool:
+        """Link a queued track to one of its review candidates.
+
+        Args:
+            track_id: Library track ID
+            platform_id: Platform ID of the chosen candidate
+
+        Returns:
+            True if the track was linked
+
+        Raises:
+            ValueError: If the track isn't queued or the candidate isn't one of its candidates
+        """
+        item = next((item for item in self.state.review_items() if item.track_id == track_id), None)
+        if item is None:
+            raise ValueError(f"Track {track_id} is not queued for {self.platform_name} review")
+        candidate = next((c for c in item.candidates if c.platform_id == platform_id), None)
+        if candidate is None:
+            raise ValueError(f"{platform_id} is not a review candidate of track {track_id}")
+
+        self.link_manager.link_tracks(track_id, candidate.payload)
+        self.state.dismiss(track_id)
+        return True
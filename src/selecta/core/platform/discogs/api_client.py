@@ -1,6 +1,10 @@
 """Direct Discogs API client implementation."""
 
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Any
 
 import requests
@@ -20,10 +24,14 @@ class DiscogsApiClient:
     # Rate limiting settings
     MIN_REQUEST_INTERVAL = 1.0  # Minimum seconds between requests to avoid rate limiting
 
+    # Pagination settings
+    PAGE_SIZE = 100  # Discogs maximum for collection and wantlist endpoints
+    MAX_CONCURRENT_PAGES = 4  # Pages fetched in parallel once the page count is known
+
     _cache = {
         "identity": {"data": None, "timestamp": 0, "valid": False},
-        "collection": {"data": None, "timestamp": 0},
-        "wantlist": {"data": None, "timestamp": 0},
+        "collection": {},  # request key -> {"data": ..., "timestamp": ...}
+        "wantlist": {},  # request key -> {"data": ..., "timestamp": ...}
     }
     _cache_timeout = 300  # 5 minutes
 
@@ -47,8 +55,9 @@ class DiscogsApiClient:
         self.access_token = access_token
         self.access_secret = access_secret
 
-        # For rate limiting
+        # For rate limiting (shared by concurrent page fetches)
         self._last_request_time: float = 0.0
+        self._rate_lock = threading.Lock()
 
         # Add a caching mechanism
         self._identity_cache = None
@@ -89,16 +98,19 @@ class DiscogsApiClient:
         return headers
 
     def _respect_rate_limit(self) -> None:
-        """Ensure we don't exceed rate limits by waiting if necessary."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
+        """Ensure we don't exceed rate limits by waiting if necessary.
 
-        # If we've made a request recently, wait to avoid rate limiting
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
+        Request slots are reserved under a lock, so concurrent page fetches are
+        spaced by MIN_REQUEST_INTERVAL while their network round trips overlap.
+        """
+        with self._rate_lock:
+            current_time = time.time()
+            next_slot = max(current_time, self._last_request_time + self.MIN_REQUEST_INTERVAL)
+            self._last_request_time = next_slot
 
-        # Update the last request time
-        self._last_request_time = time.time()
+        # If we've made a request recently, wait to avoid rate limiting
+        if next_slot > current_time:
+            time.sleep(next_slot - current_time)
 
     def _request(
         self, method: str, endpoint: str, params: dict | None = None, data: dict | None = None
@@ -144,18 +156,18 @@ class DiscogsApiClient:
                     self._request_in_progress.pop(cache_key, None)
                     return cache["valid"], cache["data"]
 
-            # Handle collection endpoint caching
+            # Handle collection endpoint caching (keyed by page and sort parameters)
             elif "collection/folders" in endpoint and method == "GET":
-                cache = self._cache["collection"]
-                if cache["data"] and (current_time - cache["timestamp"]) < self._cache_timeout:
+                cache = self._cache["collection"].get(cache_key)
+                if cache and (current_time - cache["timestamp"]) < self._cache_timeout:
                     logger.debug("Using cached collection data")
                     self._request_in_progress.pop(cache_key, None)
                     return True, cache["data"]
 
-            # Handle wantlist endpoint caching
+            # Handle wantlist endpoint caching (keyed by page and sort parameters)
             elif "/wants" in endpoint and method == "GET":
-                cache = self._cache["wantlist"]
-                if cache["data"] and (current_time - cache["timestamp"]) < self._cache_timeout:
+                cache = self._cache["wantlist"].get(cache_key)
+                if cache and (current_time - cache["timestamp"]) < self._cache_timeout:
                     logger.debug("Using cached wantlist data")
                     self._request_in_progress.pop(cache_key, None)
                     return True, cache["data"]
@@ -208,9 +220,9 @@ class DiscogsApiClient:
                     and method == "GET"
                     and response.status_code == 200
                 ):
-                    self._cache["collection"] = {"data": response.json(), "timestamp": time.time()}
+                    self._cache["collection"][cache_key] = {"data": response.json(), "timestamp": time.time()}
                 elif "/wants" in endpoint and method == "GET" and response.status_code == 200:
-                    self._cache["wantlist"] = {"data": response.json(), "timestamp": time.time()}
+                    self._cache["wantlist"][cache_key] = {"data": response.json(), "timestamp": time.time()}
 
                 if response.status_code == 204:
                     # Clear the in-progress flag
@@ -338,7 +350,12 @@ class DiscogsApiClient:
         return self._request("GET", f"/users/{username}/collection/folders")
 
     def get_collection_items(
-        self, folder_id: int = 0, page: int = 1, per_page: int = 100
+        self,
+        folder_id: int = 0,
+        page: int = 1,
+        per_page: int = 100,
+        sort: str | None = None,
+        sort_order: str | None = None,
     ) -> tuple[bool, dict]:
         """Get items in a user's collection folder.
 
@@ -346,6 +363,8 @@ class DiscogsApiClient:
             folder_id: Collection folder ID (0 = all)
             page: Page number for pagination
             per_page: Number of items per page
+            sort: Optional sort field (e.g. "added")
+            sort_order: Optional sort order ("asc" or "desc")
 
         Returns:
             Tuple of (success, collection_data)
@@ -355,48 +374,96 @@ class DiscogsApiClient:
             return False, identity
 
         username = identity["username"]
+        params: dict[str, Any] = {"page": page, "per_page": per_page}
+        if sort:
+            params["sort"] = sort
+        if sort_order:
+            params["sort_order"] = sort_order
+
         return self._request(
             "GET",
             f"/users/{username}/collection/folders/{folder_id}/releases",
-            params={"page": page, "per_page": per_page},
+            params=params,
         )
 
-    def get_all_collection_items(self, folder_id: int = 0) -> tuple[bool, list[dict]]:
-        """Get all items in a user's collection folder with automatic pagination.
+    def get_collection_count(self, folder_id: int = 0) -> tuple[bool, int]:
+        """Get the number of items in a user's collection folder.
 
         Args:
             folder_id: Collection folder ID (0 = all)
 
         Returns:
-            Tuple of (success, all_collection_items)
+            Tuple of (success, item_count)
         """
-        all_items = []
-        page = 1
-        has_more = True
+        success, response = self.get_collection_items(folder_id, page=1, per_page=1)
+        if not success:
+            return False, 0
+        return True, response.get("pagination", {}).get("items", 0)
 
-        while has_more:
-            success, response = self.get_collection_items(folder_id, page)
-            if not success:
-                return False, all_items
+    def iter_collection_items(self, folder_id: int = 0, since: datetime | None = None) -> Iterator[dict]:
+        """Stream all items in a user's collection folder.
 
-            items = response.get("releases", [])
-            all_items.extend(items)
+        Without ``since`` the page count is read from the first response and the
+        remaining pages are fetched concurrently. With ``since`` the collection is
+        read newest first and iteration stops at the first item added at or before
+        that time, so only new items are downloaded.
 
-            # Check if there are more pages
-            pagination = response.get("pagination", {})
-            pages = pagination.get("pages", 0)
-            if page >= pages:
-                has_more = False
-            page += 1
+        Args:
+            folder_id: Collection folder ID (0 = all)
+            since: Optional timestamp of the newest item already known locally
+
+        Yields:
+            Raw collection item dictionaries
+
+        Raises:
+            ValueError: If a page could not be fetched
+        """
+        if since is None:
+            yield from self._iter_pages(
+                lambda page: self.get_collection_items(folder_id, page, self.PAGE_SIZE), "releases"
+            )
+            return
+
+        yield from self._iter_pages_since(
+            lambda page: self.get_collection_items(
+                folder_id, page, self.PAGE_SIZE, sort="added", sort_order="desc"
+            ),
+            "releases",
+            since,
+        )
+
+    def get_all_collection_items(self, folder_id: int = 0) -> tuple[bool, list[dict]]:
+        """Get all items in a user's collection folder with automatic pagination.
+
+        Args:
+            folder_id: Collection folder ID (0 = all)
+
+        Returns:
+            Tuple of (success, all_collection_items)
+        """
+        all_items: list[dict] = []
+        try:
+            all_items.extend(self.iter_collection_items(folder_id))
+        except ValueError as e:
+            logger.error(f"Error fetching Discogs collection: {e}")
+            return False, all_items
 
         return True, all_items
 
-    def get_wantlist(self, page: int = 1, per_page: int = 100) -> tuple[bool, dict]:
+    def get_wantlist(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        sort: str | None = None,
+        sort_order: str | None = None,
+    ) -> tuple[bool, dict]:
         """Get the user's wantlist.
 
         Args:
             page: Page number for pagination
             per_page: Number of items per page
+            sort: Optional sort field (e.g. "added")
+            sort_order: Optional sort order ("asc" or "desc")
 
         Returns:
             Tuple of (success, wantlist_data)
@@ -406,10 +473,52 @@ class DiscogsApiClient:
             return False, identity
 
         username = identity["username"]
+        params: dict[str, Any] = {"page": page, "per_page": per_page}
+        if sort:
+            params["sort"] = sort
+        if sort_order:
+            params["sort_order"] = sort_order
+
         return self._request(
             "GET",
             f"/users/{username}/wants",
-            params={"page": page, "per_page": per_page},
+            params=params,
+        )
+
+    def get_wantlist_count(self) -> tuple[bool, int]:
+        """Get the number of items in the user's wantlist.
+
+        Returns:
+            Tuple of (success, item_count)
+        """
+        success, response = self.get_wantlist(page=1, per_page=1)
+        if not success:
+            return False, 0
+        return True, response.get("pagination", {}).get("items", 0)
+
+    def iter_wantlist_items(self, since: datetime | None = None) -> Iterator[dict]:
+        """Stream all items in the user's wantlist.
+
+        Behaves like iter_collection_items: concurrent page fetches for a full
+        download, newest-first early stopping when ``since`` is given.
+
+        Args:
+            since: Optional timestamp of the newest item already known locally
+
+        Yields:
+            Raw wantlist item dictionaries
+
+        Raises:
+            ValueError: If a page could not be fetched
+        """
+        if since is None:
+            yield from self._iter_pages(lambda page: self.get_wantlist(page, self.PAGE_SIZE), "wants")
+            return
+
+        yield from self._iter_pages_since(
+            lambda page: self.get_wantlist(page, self.PAGE_SIZE, sort="added", sort_order="desc"),
+            "wants",
+            since,
         )
 
     def get_all_wantlist_items(self) -> tuple[bool, list[dict]]:
@@ -418,23 +527,100 @@ class DiscogsApiClient:
         Returns:
             Tuple of (success, all_wantlist_items)
         """
-        all_items = []
-        page = 1
-        has_more = True
+        all_items: list[dict] = []
+        try:
+            all_items.extend(self.iter_wantlist_items())
+        except ValueError as e:
+            logger.error(f"Error fetching Discogs wantlist: {e}")
+            return False, all_items
+
+        return True, all_items
+
+    def _iter_pages(self, fetch_page: Callable[[int], tuple[bool, dict]], items_key: str) -> Iterator[dict]:
+        """Fetch every page of a paginated endpoint and yield its items in order.
+
+        The first page is fetched on its own to learn the page count. The
+        remaining pages are then requested concurrently; the shared rate limiter
+        keeps the request rate within the Discogs budget.
+
+        Args:
+            fetch_page: Callable fetching a single page by number
+            items_key: Key of the item list in the page response
+
+        Yields:
+            Items from all pages, in page order
+
+        Raises:
+            ValueError: If a page could not be fetched
+        """
+        success, response = fetch_page(1)
+        if not success:
+            raise ValueError(f"Failed to fetch page 1: {response.get('error') if response else ''}")
+
+        yield from response.get(items_key, [])
+
+        pages = response.get("pagination", {}).get("pages", 1)
+        if pages <= 1:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PAGES) as executor:
+            futures = [executor.submit(fetch_page, page) for page in range(2, pages + 1)]
+            try:
+                for page, future in enumerate(futures, start=2):
+                    success, response = future.result()
+                    if not success:
+                        raise ValueError(f"Failed to fetch page {page}: {response.get('error') if response else ''}")
+                    yield from response.get(items_key, [])
+            finally:
+                # Don't keep downloading if the consumer stopped early
+                for future in futures:
+                    future.cancel()
+
+    def _iter_pages_since(
+        self, fetch_page: Callable[[int], tuple[bool, dict]], items_key: str, since: datetime
+    ) -> Iterator[dict]:
+        """Yield items from a newest-first endpoint until reaching ``since``.
+
+        Args:
+            fetch_page: Callable fetching a single page sorted by date added, descending
+            items_key: Key of the item list in the page response
+            since: Items added at or before this time are considered known
+
+        Yields:
+            Items added after ``since``, newest first
 
-        while has_more:
-            success, response = self.get_wantlist(page)
+        Raises:
+            ValueError: If a page could not be fetched
+        """
+        page = 1
+        while True:
+            success, response = fetch_page(page)
             if not success:
-                return False, all_items
+                raise ValueError(f"Failed to fetch page {page}: {response.get('error') if response else ''}")
 
-            items = response.get("wants", [])
-            all_items.extend(items)
+            for item in response.get(items_key, []):
+                date_added = _parse_date_added(item.get("date_added"))
+                if date_added is not None and date_added <= since:
+                    return
+                yield item
 
-            # Check if there are more pages
-            pagination = response.get("pagination", {})
-            pages = pagination.get("pages", 0)
-            if page >= pages:
-                has_more = False
+            if page >= response.get("pagination", {}).get("pages", 0):
+                return
             page += 1
 
-        return True, all_items
+
+def _parse_date_added(value: str | None) -> datetime | None:
+    """Parse a Discogs ``date_added`` timestamp.
+
+    Args:
+        value: ISO 8601 timestamp as returned by the API
+
+    Returns:
+        Parsed datetime or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
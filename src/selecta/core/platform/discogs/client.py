@@ -1,5 +1,7 @@
 """Discogs API client for accessing Discogs data."""
 
+from collections.abc import Callable, Iterator
+from datetime import datetime
 from typing import Any
 
 from loguru import logger
@@ -105,48 +107,60 @@ class DiscogsClient(AbstractPlatform):
         Raises:
             ValueError: If the client is not authenticated
         """
+        try:
+            return list(self.iter_collection())
+        except ValueError as e:
+            raise ValueError(f"Failed to fetch Discogs collection: {e}") from e
+
+    def iter_collection(self, since: datetime | None = None) -> Iterator[DiscogsVinyl]:
+        """Stream the user's collection from Discogs.
+
+        Pages are downloaded concurrently and converted as they arrive, so
+        callers can start processing before the whole collection is loaded.
+
+        Args:
+            since: Only yield items added after this time (newest first)
+
+        Yields:
+            DiscogsVinyl objects
+
+        Raises:
+            ValueError: If the client is not authenticated or a page fails to load
+        """
         if not self.client:
             raise ValueError("Discogs client not authenticated")
 
-        # If no username is provided, get the authenticated user's username
-        if not username:
-            success, identity = self.client.get_identity()
-            if not success:
-                raise ValueError("Could not get user identity")
-            username = identity.get("username", "")
+        for item in self.client.iter_collection_items(since=since):
+            yield self._vinyl_from_item(item, is_owned=True)
 
-        # Get the user's collection
-        success, collection_items = self.client.get_all_collection_items()
-        if not success:
-            raise ValueError("Failed to fetch Discogs collection")
-
-        # Convert to our model
-        vinyl_records = []
-        for item in collection_items:
-            # Extract basic release info
-            basic_info = item.get("basic_information", {})
-
-            # Combine with additional fields from the collection item
-            release_data = {
-                "id": basic_info.get("id", 0),
-                "title": basic_info.get("title", ""),
-                "year": basic_info.get("year"),
-                "thumb": basic_info.get("thumb", ""),
-                "cover_image": basic_info.get("cover_image", ""),
-                "resource_url": basic_info.get("resource_url", ""),
-                "artists": basic_info.get("artists", []),
-                "labels": basic_info.get("labels", []),
-                "formats": basic_info.get("formats", []),
-                "date_added": item.get("date_added"),
-                "rating": item.get("rating"),
-                "notes": item.get("notes", ""),
-            }
-
-            # Create vinyl object
-            vinyl = DiscogsVinyl.from_discogs_dict(release_data, is_owned=True)
-            vinyl_records.append(vinyl)
-
-        return vinyl_records
+    def refresh_collection(self, known: list[DiscogsVinyl]) -> list[DiscogsVinyl]:
+        """Refresh a previously loaded collection, downloading only new items.
+
+        Falls back to a full download when the merged result doesn't match the
+        item count reported by Discogs (e.g. after records were removed).
+
+        Args:
+            known: Collection as returned by an earlier get_collection call
+
+        Returns:
+            Up-to-date list of DiscogsVinyl objects, newest additions first
+
+        Raises:
+            ValueError: If the client is not authenticated or the API request fails
+        """
+        if not self.client:
+            raise ValueError("Discogs client not authenticated")
+
+        try:
+            merged = self._merge_incremental(known, self.iter_collection)
+            success, total = self.client.get_collection_count()
+        except ValueError as e:
+            raise ValueError(f"Failed to refresh Discogs collection: {e}") from e
+
+        if merged is None or not success or total != len(merged):
+            logger.info("Discogs collection changed beyond new additions, reloading fully")
+            return self.get_collection()
+        return merged
 
     def get_wantlist(self, username: str | None = None) -> list[DiscogsVinyl]:
         """Get user's wantlist from Discogs.
@@ -160,47 +174,109 @@ class DiscogsClient(AbstractPlatform):
         Raises:
             ValueError: If the client is not authenticated
         """
+        try:
+            return list(self.iter_wantlist())
+        except ValueError as e:
+            raise ValueError(f"Failed to fetch Discogs wantlist: {e}") from e
+
+    def iter_wantlist(self, since: datetime | None = None) -> Iterator[DiscogsVinyl]:
+        """Stream the user's wantlist from Discogs.
+
+        Args:
+            since: Only yield items added after this time (newest first)
+
+        Yields:
+            DiscogsVinyl objects
+
+        Raises:
+            ValueError: If the client is not authenticated or a page fails to load
+        """
         if not self.client:
             raise ValueError("Discogs client not authenticated")
 
-        # If no username is provided, get the authenticated user's username
-        if not username:
-            success, identity = self.client.get_identity()
-            if not success:
-                raise ValueError("Could not get user identity")
-            username = identity.get("username", "")
+        for item in self.client.iter_wantlist_items(since=since):
+            yield self._vinyl_from_item(item, is_wanted=True)
 
-        # Get the user's wantlist
-        success, wantlist_items = self.client.get_all_wantlist_items()
-        if not success:
-            raise ValueError("Failed to fetch Discogs wantlist")
-
-        # Convert to our model
-        vinyl_records = []
-        for item in wantlist_items:
-            # Extract basic release info
-            basic_info = item.get("basic_information", {})
-
-            # Combine with additional fields from the wantlist item
-            release_data = {
-                "id": basic_info.get("id", 0),
-                "title": basic_info.get("title", ""),
-                "year": basic_info.get("year"),
-                "thumb": basic_info.get("thumb", ""),
-                "cover_image": basic_info.get("cover_image", ""),
-                "resource_url": basic_info.get("resource_url", ""),
-                "artists": basic_info.get("artists", []),
-                "labels": basic_info.get("labels", []),
-                "formats": basic_info.get("formats", []),
-                "date_added": item.get("date_added"),
-                "notes": item.get("notes", ""),
-            }
-
-            # Create vinyl object
-            vinyl = DiscogsVinyl.from_discogs_dict(release_data, is_wanted=True)
-            vinyl_records.append(vinyl)
-
-        return vinyl_records
+    def refresh_wantlist(self, known: list[DiscogsVinyl]) -> list[DiscogsVinyl]:
+        """Refresh a previously loaded wantlist, downloading only new items.
+
+        Args:
+            known: Wantlist as returned by an earlier get_wantlist call
+
+        Returns:
+            Up-to-date list of DiscogsVinyl objects, newest additions first
+
+        Raises:
+            ValueError: If the client is not authenticated or the API request fails
+        """
+        if not self.client:
+            raise ValueError("Discogs client not authenticated")
+
+        try:
+            merged = self._merge_incremental(known, self.iter_wantlist)
+            success, total = self.client.get_wantlist_count()
+        except ValueError as e:
+            raise ValueError(f"Failed to refresh Discogs wantlist: {e}") from e
+
+        if merged is None or not success or total != len(merged):
+            logger.info("Discogs wantlist changed beyond new additions, reloading fully")
+            return self.get_wantlist()
+        return merged
+
+    @staticmethod
+    def _merge_incremental(
+        known: list[DiscogsVinyl], fetch: Callable[[datetime | None], Iterator[DiscogsVinyl]]
+    ) -> list[DiscogsVinyl] | None:
+        """Merge newly added items into a known list.
+
+        Args:
+            known: Previously loaded items
+            fetch: Iterator factory taking the newest known ``date_added``
+
+        Returns:
+            Merged list, or None if the known list has no usable timestamps
+        """
+        dates = [vinyl.date_added for vinyl in known if vinyl.date_added is not None]
+        if not known or not dates:
+            return None
+
+        new_items = list(fetch(max(dates)))
+        new_ids = {vinyl.release.id for vinyl in new_items}
+        return new_items + [vinyl for vinyl in known if vinyl.release.id not in new_ids]
+
+    @staticmethod
+    def _vinyl_from_item(item: dict[str, Any], is_owned: bool = False, is_wanted: bool = False) -> DiscogsVinyl:
+        """Convert a raw collection or wantlist item to a DiscogsVinyl.
+
+        Args:
+            item: Collection or wantlist item from the API
+            is_owned: Whether the item comes from the collection
+            is_wanted: Whether the item comes from the wantlist
+
+        Returns:
+            DiscogsVinyl object
+        """
+        # Extract basic release info
+        basic_info = item.get("basic_information", {})
+
+        # Combine with additional fields from the collection/wantlist item
+        release_data = {
+            "id": basic_info.get("id", 0),
+            "title": basic_info.get("title", ""),
+            "year": basic_info.get("year"),
+            "thumb": basic_info.get("thumb", ""),
+            "cover_image": basic_info.get("cover_image", ""),
+            "resource_url": basic_info.get("resource_url", ""),
+            "artists": basic_info.get("artists", []),
+            "labels": basic_info.get("labels", []),
+            "formats": basic_info.get("formats", []),
+            "date_added": item.get("date_added"),
+            "notes": item.get("notes", ""),
+        }
+        if is_owned:
+            release_data["rating"] = item.get("rating")
+
+        return DiscogsVinyl.from_discogs_dict(release_data, is_owned=is_owned, is_wanted=is_wanted)
 
     def search_release(
         self, query: str, artist: str | None = None, limit: int = 10
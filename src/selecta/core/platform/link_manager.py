@@ -5,15 +5,40 @@ operations for linking tracks between platforms and the local library database.
 """
 
 import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Any
 
 from loguru import logger
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
+from selecta.core.data.change_events import PlatformLinkAdded, TrackUpdated, queue_change
 from selecta.core.data.database import get_session
-from selecta.core.data.models.db import Album, Track
+from selecta.core.data.models.db import Album, Track, TrackPlatformInfo
 from selecta.core.data.repositories.track_repository import TrackRepository
 from selecta.core.platform.abstract_platform import AbstractPlatform
+from selecta.core.utils.track_matching import normalize_artist, normalize_title, track_match_key
+
+# Maximum number of values bound into one IN clause
+LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass
+class NormalizedTrack:
+    """A platform track converted to library fields, before any database access."""
+
+    track_data: dict[str, Any]
+    platform_id: str
+    uri: str | None = None
+    platform_metadata: dict[str, Any] = field(default_factory=dict)
+    album_name: str | None = None
+    album_year: int | None = None
+
+
+def _chunks(values: list, size: int = LOOKUP_CHUNK_SIZE) -> list[list]:
+    """Split a list into chunks for IN queries."""
+    return [values[start : start + size] for start in range(0, len(values), size)]
 
 
 class PlatformLinkManager:
@@ -121,41 +146,28 @@ class PlatformLinkManager:
 
         return album
 
-    def import_track(self, platform_track: Any) -> Track:
-        """Import a track from platform to local database.
+    def _normalize_track(self, platform_track: Any) -> NormalizedTrack:
+        """Convert a platform track object to library track fields.
 
-        This method handles the import of platform-specific track objects to the
-        library database, creating or updating Track objects and storing platform
-        metadata in TrackPlatformInfo records.
+        Doesn't touch the database, albums are only recorded by name and year.
 
         Args:
             platform_track: The platform-specific track object
-                Could be a SpotifyTrack, RekordboxTrack, YouTubeVideo, etc.
 
         Returns:
-            The local Track object (either newly created or existing)
+            The normalized track
 
         Raises:
-            ValueError: If track cannot be imported
+            ValueError: If the platform is unsupported or title or artist are missing
         """
-        # Log the track type we're importing
-        track_type = type(platform_track).__name__
-        logger.info(f"Importing {self.platform_name} track of type {track_type}")
-
-        # For debug purposes, dump the platform_track data
-        if hasattr(platform_track, "__dict__"):
-            logger.info(f"Platform track data: {platform_track.__dict__}")
-        elif isinstance(platform_track, dict):
-            logger.info(f"Platform track data (dict): {platform_track}")
-        else:
-            logger.info(f"Platform track attributes: {dir(platform_track)}")
+        logger.debug(f"Normalizing {self.platform_name} track of type {type(platform_track).__name__}")
+        album: tuple[str, int | None] | None = None
 
         # Extract common attributes based on the platform
         if self.platform_name == "spotify":
             # Handle Spotify track format - with detailed debug
             if hasattr(platform_track, "__class__") and platform_track.__class__.__name__ == "SpotifyTrack":
-                # Detailed logging for SpotifyTrack instances
-                logger.info(
+                logger.debug(
                     f"Importing SpotifyTrack: {platform_track.name} " f"by {', '.join(platform_track.artist_names)}"
                 )
 
@@ -190,19 +202,15 @@ class PlatformLinkManager:
                     except ValueError:
                         logger.warning(f"Could not parse year from date {album_release_date}")
 
-                # If we have album info, get or create the album object
+                # Remember the album, it is resolved against the database later
                 if album_name and artist_names:
-                    album = self._get_or_create_album(album_name, track_data["artist"], year)
-                    if album:
-                        track_data["album_id"] = album.id
+                    album = (album_name, year)
 
                 # Get required IDs with safe access
                 platform_id = getattr(platform_track, "id", "")
                 uri = getattr(platform_track, "uri", "")
 
-                # Debug logging for track data
-                logger.info(f"Extracted track data: {track_data}")
-                logger.info(f"Platform ID: {platform_id}, URI: {uri}")
+                logger.debug(f"Extracted track data: {track_data}, platform ID: {platform_id}, URI: {uri}")
 
             else:
                 # Dictionary or other object type
@@ -281,8 +289,7 @@ class PlatformLinkManager:
                 if preview_url:
                     platform_metadata["preview_url"] = preview_url
 
-                # Log metadata
-                logger.info(f"Extracted Spotify metadata: {platform_metadata}")
+                logger.debug(f"Extracted Spotify metadata: {platform_metadata}")
             else:
                 # Handle dictionary objects with safe access
                 platform_metadata = {}
@@ -330,11 +337,9 @@ class PlatformLinkManager:
                         except ValueError:
                             logger.warning(f"Could not parse year from date {release_date}")
 
-                    # Create album object if we have name and artist
+                    # Remember the album if we have name and artist
                     if album_name and track_data.get("artist"):
-                        album = self._get_or_create_album(album_name, track_data["artist"], year)
-                        if album:
-                            track_data["album_id"] = album.id
+                        album = (album_name, year)
 
         elif self.platform_name == "rekordbox":
             # Handle Rekordbox track format
@@ -374,9 +379,7 @@ class PlatformLinkManager:
             )
 
             if album_name and track_data["artist"]:
-                album = self._get_or_create_album(album_name, track_data["artist"], year)
-                if album:
-                    track_data["album_id"] = album.id
+                album = (album_name, year)
 
             platform_id = str(
                 getattr(
@@ -447,9 +450,7 @@ class PlatformLinkManager:
                 )
 
             if album_name and track_data["artist"]:
-                album = self._get_or_create_album(album_name, track_data["artist"], year)
-                if album:
-                    track_data["album_id"] = album.id
+                album = (album_name, year)
 
             platform_id = str(
                 getattr(
@@ -559,8 +560,7 @@ class PlatformLinkManager:
 
         # Validate essential track data - if missing title or artist, raise exception
         if not track_data.get("title") or not track_data.get("artist"):
-            logger.error("Cannot import track with missing title or artist")
-            logger.error(f"Track data: {track_data}")
+            logger.error(f"Cannot import track with missing title or artist: {track_data}")
 
             # Gather platform information for better error reporting
             platform_description = f"{self.platform_name} track"
@@ -577,8 +577,45 @@ class PlatformLinkManager:
 
             raise ValueError(error_message)
 
+        return NormalizedTrack(
+            track_data=track_data,
+            platform_id=str(platform_id) if platform_id else "",
+            uri=uri or None,
+            platform_metadata=platform_metadata,
+            album_name=album[0] if album else None,
+            album_year=album[1] if album else None,
+        )
+
+    def import_track(self, platform_track: Any) -> Track:
+        """Import a track from platform to local database.
+
+        This method handles the import of platform-specific track objects to the
+        library database, creating or updating Track objects and storing platform
+        metadata in TrackPlatformInfo records.
+
+        Args:
+            platform_track: The platform-specific track object
+                Could be a SpotifyTrack, RekordboxTrack, YouTubeVideo, etc.
+
+        Returns:
+            The local Track object (either newly created or existing)
+
+        Raises:
+            ValueError: If track cannot be imported
+        """
+        normalized = self._normalize_track(platform_track)
+        track_data = normalized.track_data
+        platform_id = normalized.platform_id
+        uri = normalized.uri
+        platform_metadata = normalized.platform_metadata
+
+        if normalized.album_name:
+            album = self._get_or_create_album(normalized.album_name, track_data["artist"], normalized.album_year)
+            if album:
+                track_data["album_id"] = album.id
+
         # Log the final track data we'll use to create/update the track
-        logger.info(f"Final track data for database: {track_data}")
+        logger.debug(f"Final track data for database: {track_data}")
 
         # Check if this track already exists in our database
         existing_track = None
@@ -587,18 +624,14 @@ class PlatformLinkManager:
         if platform_id:
             existing_track = self.track_repo.get_by_platform_id(self.platform_name, platform_id)
 
-        # If not found by ID, try by title and artist
+        # If not found by ID, try by normalized title and artist
         if not existing_track and track_data.get("title") and track_data.get("artist"):
-            # Find by title + artist
-            query = f"{track_data['title']} {track_data['artist']}"
-            matches, _ = self.track_repo.search(query, limit=1)
-            if matches:
-                existing_track = matches[0]
+            existing_track = self.track_repo.find_by_title_artist(track_data["title"], track_data["artist"])
 
         if existing_track:
             # Update the existing track with any new information
             # Use preserve_existing=True to avoid overwriting existing fields
-            logger.info(f"Updating existing track: {existing_track.id} - {existing_track.title}")
+            logger.debug(f"Updating existing track: {existing_track.id} - {existing_track.title}")
 
             # If we're trying to update with a new album and the track already has one,
             # don't overwrite
@@ -613,20 +646,20 @@ class PlatformLinkManager:
             track = existing_track
         else:
             # Create a new track
-            logger.info(f"Creating new track with data: {track_data}")
+            logger.debug(f"Creating new track with data: {track_data}")
             # Commit any pending album creations to ensure album_id references are valid
             if self.session.new:
                 logger.debug("Committing pending objects (e.g. albums) before track creation")
                 self.session.commit()
 
             track = self.track_repo.create(track_data)
-            logger.info(f"Created new track: {track.id} - {track.title} by {track.artist}")
+            logger.debug(f"Created new track: {track.id} - {track.title} by {track.artist}")
 
         # Add or update platform info
         if platform_id:
             # Convert platform metadata to JSON string
             metadata_json = json.dumps(platform_metadata)
-            logger.info(
+            logger.debug(
                 f"Adding platform info for track {track.id}: platform={self.platform_name}, "
                 f"platform_id={platform_id}"
             )
@@ -638,10 +671,201 @@ class PlatformLinkManager:
                 uri=uri,
                 metadata=metadata_json,
             )
-            logger.info(f"Successfully added platform info for track {track.id}")
+            logger.debug(f"Successfully added platform info for track {track.id}")
 
         return track
 
+    def import_tracks(self, platform_tracks: list[Any]) -> dict[str, int]:
+        """Import many tracks from the platform in one transaction.
+
+        All tracks are normalized first. Existing platform links, title/artist
+        matches and albums are then fetched with a few set queries, so the cost
+        grows linearly with the number of tracks. Tracks that can't be
+        normalized (e.g. missing title or artist) are skipped and logged.
+
+        Args:
+            platform_tracks: The platform-specific track objects
+
+        Returns:
+            Dictionary mapping platform IDs to local track IDs
+        """
+        normalized_by_id: dict[str, NormalizedTrack] = {}
+        for platform_track in platform_tracks:
+            try:
+                normalized = self._normalize_track(platform_track)
+            except ValueError as e:
+                logger.warning(f"Skipping {self.platform_name} track: {e}")
+                continue
+            if not normalized.platform_id:
+                logger.warning(f"Skipping {self.platform_name} track without ID: {normalized.track_data['title']}")
+                continue
+            normalized_by_id[normalized.platform_id] = normalized
+
+        if not normalized_by_id:
+            return {}
+
+        normalized_tracks = list(normalized_by_id.values())
+        try:
+            tracks_by_platform_id = self._find_existing_tracks(normalized_tracks)
+            albums = self._resolve_albums(normalized_tracks)
+            infos_by_track_id = self._find_platform_infos([track.id for track in tracks_by_platform_id.values()])
+
+            # Links created in this batch, by track object since new tracks have no ID yet
+            new_infos: dict[int, TrackPlatformInfo] = {}
+
+            now = datetime.now(UTC)
+            for normalized in normalized_tracks:
+                track_data = dict(normalized.track_data)
+                if normalized.album_name:
+                    album = albums.get((normalized.album_name, track_data["artist"]))
+                    if album is not None:
+                        track_data["album_id"] = album.id
+
+                track = tracks_by_platform_id.get(normalized.platform_id)
+                if track is not None:
+                    # Keep the album of existing tracks, like import_track
+                    if track.album_id is not None:
+                        track_data.pop("album_id", None)
+                    changes = TrackRepository.apply_track_data(track, track_data, preserve_existing=True)
+                    if changes:
+                        queue_change(self.session, TrackUpdated(track.id, changes))
+                else:
+                    track = Track(**track_data)
+                    self.session.add(track)
+                    tracks_by_platform_id[normalized.platform_id] = track
+
+                info = infos_by_track_id.get(track.id) or new_infos.get(id(track))
+                if info is None:
+                    info = TrackPlatformInfo(platform=self.platform_name)
+                    track.platform_info.append(info)
+                    new_infos[id(track)] = info
+                info.platform_id = normalized.platform_id
+                if normalized.uri is not None:
+                    info.uri = normalized.uri
+                info.platform_data = json.dumps(normalized.platform_metadata)
+                info.last_linked = now
+                info.needs_update = False
+
+            # Assign the IDs of the new tracks for the change events
+            self.session.flush()
+            for track_id in dict.fromkeys(track.id for track in tracks_by_platform_id.values()):
+                queue_change(self.session, PlatformLinkAdded(track_id, self.platform_name))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        logger.info(f"Imported {len(normalized_tracks)} {self.platform_name} tracks")
+        return {platform_id: track.id for platform_id, track in tracks_by_platform_id.items()}
+
+    def _find_existing_tracks(self, normalized_tracks: list[NormalizedTrack]) -> dict[str, Track]:
+        """Find library tracks for normalized tracks by platform link, then by title and artist.
+
+        Args:
+            normalized_tracks: Normalized tracks with platform IDs
+
+        Returns:
+            Dictionary mapping platform IDs to existing tracks
+        """
+        found: dict[str, Track] = {}
+        platform_ids = [normalized.platform_id for normalized in normalized_tracks]
+        for chunk in _chunks(platform_ids):
+            rows = (
+                self.session.query(TrackPlatformInfo.platform_id, Track)
+                .join(Track, Track.id == TrackPlatformInfo.track_id)
+                .filter(
+                    TrackPlatformInfo.platform == self.platform_name,
+                    TrackPlatformInfo.platform_id.in_(chunk),
+                )
+                .all()
+            )
+            found.update(rows)
+
+        # Fall back to the normalized title and artist for unlinked tracks
+        unmatched = [normalized for normalized in normalized_tracks if normalized.platform_id not in found]
+        tracks_by_key = self.track_repo.get_by_match_keys([self._match_key(normalized) for normalized in unmatched])
+        for normalized in unmatched:
+            track = tracks_by_key.get(self._match_key(normalized))
+            if track is not None:
+                found[normalized.platform_id] = track
+
+        return found
+
+    @staticmethod
+    def _match_key(normalized: NormalizedTrack) -> str:
+        """Get the combined matching key of a normalized track."""
+        return track_match_key(
+            normalize_title(normalized.track_data["title"]), normalize_artist(normalized.track_data["artist"])
+        )
+
+    def _resolve_albums(self, normalized_tracks: list[NormalizedTrack]) -> dict[tuple[str, str], Album]:
+        """Get or create the albums of normalized tracks without committing.
+
+        Args:
+            normalized_tracks: Normalized tracks, some with album names
+
+        Returns:
+            Dictionary mapping (album title, artist) to albums
+        """
+        wanted: dict[tuple[str, str], int | None] = {}
+        for normalized in normalized_tracks:
+            if normalized.album_name:
+                key = (normalized.album_name, normalized.track_data["artist"])
+                wanted.setdefault(key, normalized.album_year)
+
+        albums: dict[tuple[str, str], Album] = {}
+        for chunk in _chunks(list(wanted)):
+            for album in self.session.query(Album).filter(tuple_(Album.title, Album.artist).in_(chunk)):
+                albums.setdefault((album.title, album.artist), album)
+
+        for (title, artist), year in wanted.items():
+            if (title, artist) not in albums:
+                album = Album(title=title, artist=artist)
+                if year:
+                    album.release_year = year
+                self.session.add(album)
+                albums[(title, artist)] = album
+
+        # Assign IDs to the new albums so tracks can reference them
+        self.session.flush()
+        return albums
+
+    def _find_platform_infos(self, track_ids: list[int]) -> dict[int, TrackPlatformInfo]:
+        """Get this platform's link records of existing tracks.
+
+        Args:
+            track_ids: Local track IDs
+
+        Returns:
+            Dictionary mapping track IDs to their platform info
+        """
+        infos: dict[int, TrackPlatformInfo] = {}
+        for chunk in _chunks(track_ids):
+            rows = (
+                self.session.query(TrackPlatformInfo)
+                .filter(
+                    TrackPlatformInfo.platform == self.platform_name,
+                    TrackPlatformInfo.track_id.in_(chunk),
+                )
+                .all()
+            )
+            infos.update((info.track_id, info) for info in rows)
+        return infos
+
+    def get_platform_id(self, platform_track: Any) -> str:
+        """Get the platform ID a track would be imported under.
+
+        Args:
+            platform_track: The platform-specific track object
+
+        Returns:
+            The platform ID, or an empty string if the track can't be imported
+        """
+        try:
+            return self._normalize_track(platform_track).platform_id
+        except ValueError:
+            return ""
+
     def link_tracks(self, local_track_id: int, platform_track: Any) -> bool:
         """Link a local track with platform-specific metadata.
 
@@ -1,6 +1,8 @@
 """Rekordbox client for accessing Rekordbox data."""
 
 import os
+from collections.abc import Collection, Iterable, Iterator
+from typing import Any
 
 from loguru import logger
 from pyrekordbox import Rekordbox6Database
@@ -8,7 +10,20 @@ from pyrekordbox import Rekordbox6Database
 from selecta.core.data.repositories.settings_repository import SettingsRepository
 from selecta.core.platform.abstract_platform import AbstractPlatform
 from selecta.core.platform.rekordbox.auth import RekordboxAuthManager
+from selecta.core.platform.rekordbox.incremental import RekordboxContentChanges, RekordboxWatermark
 from selecta.core.platform.rekordbox.models import RekordboxPlaylist, RekordboxTrack
+from selecta.core.platform.rekordbox.playlist_writer import PlaylistWriteResult, RekordboxPlaylistWriter
+from selecta.core.platform.rekordbox.queries import (
+    CONTENT_CHUNK_SIZE,
+    changed_content_select,
+    content_watermark,
+    count_content,
+    iter_content_rows,
+    live_content_ids,
+    playlist_content_select,
+    playlist_tree_rows,
+    search_content_select,
+)
 
 
 class PatchedRekordbox6Database(Rekordbox6Database):
@@ -168,6 +183,10 @@ class RekordboxClient(AbstractPlatform):
             self.auth_manager = RekordboxAuthManager(settings_repo=self.settings_repo)
             self.db: Rekordbox6Database | None = None
 
+            # Tracks per playlist ID, valid while the database files are unchanged
+            self._playlist_tracks_cache: dict[str, list[RekordboxTrack]] = {}
+            self._cache_signature: tuple | None = None
+
             # Try to initialize the client if we have valid credentials
             self._initialize_client()
             self._is_initialized = True
@@ -189,6 +208,7 @@ class RekordboxClient(AbstractPlatform):
 
     def close(self) -> None:
         """Close the database connection and clean up resources."""
+        self.invalidate_playlist_cache()
         if self.db is not None:
             try:
                 logger.debug("Closing Rekordbox database connection")
@@ -414,22 +434,115 @@ class RekordboxClient(AbstractPlatform):
         Returns:
             List of RekordboxTrack objects
 
+        Raises:
+            ValueError: If the client is not authenticated
+        """
+        tracks = [track for chunk in self.iter_tracks() for track in chunk]
+        if not tracks:
+            raise ValueError("No content available")
+
+        return tracks
+
+    def iter_tracks(self, chunk_size: int = CONTENT_CHUNK_SIZE) -> Iterator[list[RekordboxTrack]]:
+        """Stream all tracks in the Rekordbox database in chunks.
+
+        Uses a single joined select over djmdContent and its lookup tables, so
+        large collections are read without per-track relationship queries.
+
+        Args:
+            chunk_size: Number of tracks per chunk
+
+        Yields:
+            Lists of at most chunk_size RekordboxTrack objects
+
         Raises:
             ValueError: If the client is not authenticated
         """
         if not self.db:
             raise ValueError("Rekordbox client not authenticated")
 
-        tracks = []
-        contents = self.db.get_content()
-        if contents:
-            for content in contents:
-                track = RekordboxTrack.from_rekordbox_content(content)
-                tracks.append(track)
-        else:
-            raise ValueError("No content available")
+        for rows in iter_content_rows(self.db.session, chunk_size=chunk_size):
+            yield [RekordboxTrack.from_content_row(row) for row in rows]
 
-        return tracks
+    def count_tracks(self) -> int:
+        """Get the number of tracks in the Rekordbox database.
+
+        Returns:
+            Number of tracks
+
+        Raises:
+            ValueError: If the client is not authenticated
+        """
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        return count_content(self.db.session)
+
+    def database_key(self) -> str:
+        """Get an identifier of the connected Rekordbox database.
+
+        Returns:
+            Path of the database directory, used to key per-database state
+
+        Raises:
+            ValueError: If the client is not authenticated
+        """
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        return str(getattr(self.db, "db_directory", "") or "default")
+
+    def get_content_watermark(self) -> RekordboxWatermark:
+        """Get the current high-water mark of the Rekordbox tracks.
+
+        Returns:
+            Watermark with the highest local update sequence number and timestamp
+
+        Raises:
+            ValueError: If the client is not authenticated
+        """
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        usn, updated_at = content_watermark(self.db.session)
+        return RekordboxWatermark(usn=usn, updated_at=updated_at)
+
+    def get_content_changes(
+        self, since: RekordboxWatermark, known_ids: Iterable[str], retry_ids: Collection[str] = ()
+    ) -> RekordboxContentChanges:
+        """Get the tracks changed since a previous import.
+
+        Only the rows changed after the watermark are read in full, together
+        with the rows to retry. Deletions are found by comparing the known IDs
+        with a scan of the ID column.
+
+        Args:
+            since: Watermark stored by the previous import
+            known_ids: Rekordbox IDs of the tracks imported so far
+            retry_ids: Rekordbox IDs of tracks that failed to import last time
+
+        Returns:
+            Changed tracks, deleted IDs and the watermark to store afterwards
+
+        Raises:
+            ValueError: If the client is not authenticated
+        """
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        # Take the new watermark first so rows changing during the read are picked up next time
+        watermark = self.get_content_watermark()
+
+        changed = []
+        stmt = changed_content_select(since.usn, since.updated_at, retry_ids)
+        for rows in iter_content_rows(self.db.session, stmt):
+            changed.extend(RekordboxTrack.from_content_row(row) for row in rows)
+
+        live_ids = live_content_ids(self.db.session)
+        deleted_ids = sorted(str(known_id) for known_id in known_ids if str(known_id) not in live_ids)
+
+        logger.info(f"Rekordbox changes since usn {since.usn}: {len(changed)} changed, {len(deleted_ids)} deleted")
+        return RekordboxContentChanges(changed=changed, deleted_ids=deleted_ids, watermark=watermark)
 
     def get_track_by_id(self, track_id: int) -> RekordboxTrack | None:
         """Get a track by its ID.
@@ -468,13 +581,19 @@ class RekordboxClient(AbstractPlatform):
         if not self.db:
             raise ValueError("Rekordbox client not authenticated")
 
-        results = self.db.search_content(query)
-        tracks = [RekordboxTrack.from_rekordbox_content(content) for content in results]
-        return tracks[:limit]  # Apply limit to results
+        rows = self.db.session.execute(search_content_select(query, limit))
+        return [RekordboxTrack.from_content_row(row) for row in rows]
 
-    def get_all_playlists(self) -> list[RekordboxPlaylist]:
+    def get_all_playlists(self, include_tracks: bool = False) -> list[RekordboxPlaylist]:
         """Get all playlists in the Rekordbox database.
 
+        By default only the playlist tree is loaded: playlist metadata and track
+        counts come from a single aggregated query and the tracks list is left
+        empty. Use get_playlist_tracks to load the contents of a playlist.
+
+        Args:
+            include_tracks: Whether to also load the tracks of every playlist
+
         Returns:
             List of RekordboxPlaylist objects
 
@@ -484,29 +603,17 @@ class RekordboxClient(AbstractPlatform):
         if not self.db:
             raise ValueError("Rekordbox client not authenticated")
 
-        playlists = []
-        playlist_response = self.db.get_playlist()
-        if playlist_response:
-            for playlist_obj in playlist_response:
-                # Skip smart playlists for now
-                if playlist_obj.is_smart_playlist:
-                    continue
-
-                # Get tracks if it's not a folder
-                tracks = []
-                if not playlist_obj.is_folder:
-                    try:
-                        for content in self.db.get_playlist_contents(playlist_obj):
-                            track = RekordboxTrack.from_rekordbox_content(content)
-                            tracks.append(track)
-                    except Exception as e:
-                        logger.warning(f"Error getting tracks for playlist {playlist_obj.ID}: {e}")
-
-                playlist = RekordboxPlaylist.from_rekordbox_playlist(playlist_obj, tracks)
-                playlists.append(playlist)
-        else:
+        rows = playlist_tree_rows(self.db.session)
+        if not rows:
             raise ValueError("No playlist available")
 
+        playlists = []
+        for row in rows:
+            tracks = []
+            if include_tracks and row.Attribute != 1:
+                tracks = self._load_playlist_tracks(row.ID)
+            playlists.append(RekordboxPlaylist.from_rekordbox_playlist(row, tracks, track_count=row.TrackCount))
+
         return playlists
 
     def get_playlist_by_id(self, playlist_id: str) -> RekordboxPlaylist | None:
@@ -532,16 +639,71 @@ class RekordboxClient(AbstractPlatform):
         tracks = []
 
         if hasattr(playlist_obj, "is_folder") and not playlist_obj.is_folder:  # type:ignore
-            try:
-                for content in self.db.get_playlist_contents(playlist_obj):
-                    track = RekordboxTrack.from_rekordbox_content(content)
-                    tracks.append(track)
-            except Exception as e:
-                logger.warning(f"Error getting tracks for playlist {playlist_id}: {e}")
+            tracks = self._load_playlist_tracks(playlist_obj)
 
         # Convert the DjmdPlaylist to our RekordboxPlaylist model
         return RekordboxPlaylist.from_rekordbox_playlist(playlist_obj, tracks)
 
+    def _database_signature(self) -> tuple | None:
+        """Get a signature of the Rekordbox database files on disk.
+
+        Rekordbox writes through SQLite's write-ahead log, so both master.db and
+        master.db-wal are checked.
+
+        Returns:
+            Tuple of (mtime_ns, size) per file, or None if the files can't be located
+        """
+        db_dir = getattr(self.db, "db_directory", None)
+        if not db_dir:
+            return None
+
+        signature = []
+        for name in ("master.db", "master.db-wal"):
+            try:
+                stat = os.stat(os.path.join(db_dir, name))
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def invalidate_playlist_cache(self) -> None:
+        """Drop all cached playlist contents."""
+        self._playlist_tracks_cache.clear()
+        self._cache_signature = None
+
+    def _load_playlist_tracks(self, playlist: Any) -> list[RekordboxTrack]:
+        """Load the tracks of a playlist, using the per-session cache.
+
+        The cache is dropped whenever the database files change on disk, e.g.
+        because Rekordbox itself modified the collection.
+
+        Args:
+            playlist: DjmdPlaylist object or playlist ID
+
+        Returns:
+            List of tracks in the playlist in playlist order (a copy of the cached list)
+        """
+        signature = self._database_signature()
+        if signature is None or signature != self._cache_signature:
+            self._playlist_tracks_cache.clear()
+            self._cache_signature = signature
+
+        playlist_id = str(getattr(playlist, "ID", playlist))
+        cached = self._playlist_tracks_cache.get(playlist_id)
+        if cached is not None:
+            return list(cached)
+
+        tracks = []
+        try:
+            for rows in iter_content_rows(self.db.session, playlist_content_select(playlist_id)):  # type: ignore
+                tracks.extend(RekordboxTrack.from_content_row(row) for row in rows)
+        except Exception as e:
+            logger.warning(f"Error getting tracks for playlist {playlist_id}: {e}")
+            return tracks
+
+        self._playlist_tracks_cache[playlist_id] = tracks
+        return list(tracks)
+
     def create_playlist(self, name: str, parent_id: str | None = None, force: bool = False) -> RekordboxPlaylist:
         """Create a new playlist in Rekordbox.
 
@@ -627,6 +789,7 @@ class RekordboxClient(AbstractPlatform):
 
         # Since we're using PatchedRekordbox6Database, this will bypass the check automatically
         self.db.commit()
+        self.invalidate_playlist_cache()
         logger.info("Forced commit successful")
 
     def custom_commit(self, force: bool = False) -> bool:
@@ -651,6 +814,7 @@ class RekordboxClient(AbstractPlatform):
             logger.info(f"Committing changes to Rekordbox database (force={force})")
             # Our PatchedRekordbox6Database commit method automatically bypasses the check
             self.db.commit()
+            self.invalidate_playlist_cache()
             return True
         except Exception as e:
             logger.exception(f"Error during commit: {e}")
@@ -668,14 +832,21 @@ class RekordboxClient(AbstractPlatform):
         Raises:
             ValueError: If not authenticated or API error occurs
         """
-        playlist = self.get_playlist_by_id(playlist_id)
-        if not playlist:
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        playlist_obj = self.db.get_playlist(ID=playlist_id)
+        if not playlist_obj:
             raise ValueError(f"Playlist with ID {playlist_id} not found")
-        return playlist.tracks
+        if playlist_obj.is_folder:
+            return []
+        return self._load_playlist_tracks(playlist_obj)
 
     def add_tracks_to_playlist(self, playlist_id: str, track_ids: list[str]) -> bool:
         """Add tracks to a playlist on this platform.
 
+        All tracks are written in one batch with a single commit.
+
         Args:
             playlist_id: The platform-specific playlist ID
             track_ids: List of track IDs to add
@@ -686,20 +857,21 @@ class RekordboxClient(AbstractPlatform):
         Raises:
             ValueError: If not authenticated or API error occurs
         """
-        success = True
-        for track_id in track_ids:
-            try:
-                # Convert string ID to integer for Rekordbox
-                track_id_int = int(track_id)
-                if not self.add_track_to_playlist(playlist_id, track_id_int):
-                    success = False
-            except (ValueError, TypeError):
-                success = False
-        return success
+        valid_ids = self._valid_track_ids(track_ids)
+        try:
+            result = self.write_playlist_changes(playlist_id, add_track_ids=valid_ids)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error adding tracks to playlist: {e}")
+            return False
+        return len(valid_ids) == len(track_ids) and not result.missing_ids
 
     def remove_tracks_from_playlist(self, playlist_id: str, track_ids: list[str]) -> bool:
         """Remove tracks from a playlist on this platform.
 
+        All tracks are removed in one batch with a single commit.
+
         Args:
             playlist_id: The platform-specific playlist ID
             track_ids: List of track IDs to remove
@@ -710,16 +882,77 @@ class RekordboxClient(AbstractPlatform):
         Raises:
             ValueError: If not authenticated or API error occurs
         """
-        success = True
+        valid_ids = self._valid_track_ids(track_ids)
+        try:
+            result = self.write_playlist_changes(playlist_id, remove_track_ids=valid_ids)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error removing tracks from playlist: {e}")
+            return False
+        return len(valid_ids) == len(track_ids) and not result.missing_ids
+
+    @staticmethod
+    def _valid_track_ids(track_ids: list[str]) -> list[str]:
+        """Filter out track IDs that aren't Rekordbox content IDs.
+
+        Args:
+            track_ids: Track IDs as strings
+
+        Returns:
+            The IDs that are integers, in their original order
+        """
+        valid_ids = []
         for track_id in track_ids:
             try:
-                # Convert string ID to integer for Rekordbox
-                track_id_int = int(track_id)
-                if not self.remove_track_from_playlist(playlist_id, track_id_int):
-                    success = False
+                valid_ids.append(str(int(track_id)))
             except (ValueError, TypeError):
-                success = False
-        return success
+                logger.warning(f"Invalid track ID (non-integer): {track_id}")
+        return valid_ids
+
+    def write_playlist_changes(
+        self,
+        playlist_id: str,
+        add_track_ids: list[str] | None = None,
+        remove_track_ids: list[str] | None = None,
+        force: bool = False,
+    ) -> PlaylistWriteResult:
+        """Add and remove playlist tracks in one transaction.
+
+        Removals are applied first, the remaining tracks are renumbered and the
+        additions are appended, then everything is committed once.
+
+        Args:
+            playlist_id: The playlist ID
+            add_track_ids: Track IDs to append to the playlist
+            remove_track_ids: Track IDs to remove from the playlist
+            force: If True, attempts to commit even if Rekordbox is running
+
+        Returns:
+            Counts of the applied changes
+
+        Raises:
+            ValueError: If the client is not authenticated or the playlist is invalid
+            RuntimeError: If Rekordbox is running and force=False
+        """
+        if not self.db:
+            raise ValueError("Rekordbox client not authenticated")
+
+        writer = RekordboxPlaylistWriter(self.db, playlist_id)
+        writer.remove(remove_track_ids or [])
+        writer.add(add_track_ids or [])
+
+        try:
+            result = writer.apply()
+            if result.added or result.removed:
+                self.custom_commit(force=force)
+        except Exception:
+            # Don't leave half-applied changes in the session for the next commit
+            self.db.session.rollback()
+            self.db.registry.clear_buffer()
+            raise
+
+        return result
 
     def add_track_to_playlist(self, playlist_id: str, track_id: int, force: bool = False) -> bool:
         """Add a track to a playlist.
@@ -808,6 +1041,7 @@ class RekordboxClient(AbstractPlatform):
             # Commit changes to the database
             try:
                 self.db.commit()
+                self.invalidate_playlist_cache()
             except RuntimeError as e:
                 error_msg = str(e)
                 # Only re-raise for Rekordbox running error, allowing caller to handle with
@@ -878,45 +1112,32 @@ class RekordboxClient(AbstractPlatform):
         if not self.db:
             raise ValueError("Rekordbox client not authenticated")
 
-        # Convert string IDs to integers
-        int_track_ids = []
-        for track_id in track_ids:
-            try:
-                int_track_ids.append(int(track_id))
-            except ValueError:
-                logger.warning(f"Invalid track ID (non-integer): {track_id}")
+        track_ids = self._valid_track_ids(track_ids)
 
         if existing_playlist_id:
             # Update existing playlist
             try:
                 # Verify the playlist exists
-                existing_playlist = self.get_playlist_by_id(existing_playlist_id)
+                existing_playlist = self.db.get_playlist(ID=existing_playlist_id)
                 if not existing_playlist:
                     raise ValueError(f"Playlist with ID {existing_playlist_id} not found")
 
-                # Add tracks to the existing playlist
-                for track_id in int_track_ids:
-                    try:
-                        self.add_track_to_playlist(existing_playlist_id, track_id, force=force)
-                    except Exception as e:
-                        logger.warning(f"Failed to add track {track_id} to playlist: {e}")
-
+                # Add all tracks to the existing playlist with one commit
+                self.write_playlist_changes(existing_playlist_id, add_track_ids=track_ids, force=force)
                 return existing_playlist_id
+            except RuntimeError:
+                raise
             except Exception as e:
                 logger.error(f"Error updating existing playlist: {e}")
                 raise ValueError(f"Could not update playlist: {str(e)}") from e
         else:
-            # Create a new playlist
-            playlist = self.create_playlist(name=playlist_name, parent_id=parent_folder_id, force=force)
-
-            # Add tracks to the playlist
-            for track_id in int_track_ids:
-                try:
-                    self.add_track_to_playlist(playlist.id, track_id, force=force)
-                except Exception as e:
-                    logger.warning(f"Failed to add track {track_id} to playlist: {e}")
-
-            return playlist.id
+            # Create the playlist and add its tracks, committing both at once
+            playlist_obj = self.db.create_playlist(playlist_name, parent=parent_folder_id or None)
+            result = self.write_playlist_changes(str(playlist_obj.ID), add_track_ids=track_ids, force=force)
+            if not result.added:
+                # Nothing was written to the playlist, commit the playlist itself
+                self.custom_commit(force=force)
+            return str(playlist_obj.ID)
 
     def get_all_folders(self) -> list[tuple[str, str]]:
         """Get all playlist folders in the Rekordbox database.
@@ -0,0 +1,166 @@
+"""Incremental import state for Rekordbox collections.
+
+Every row in a Rekordbox 6 master.db carries a local update sequence number
+(rb_local_usn) and an updated_at timestamp that Rekordbox bumps on each
+change. After an import the highest of both values is stored as a watermark
+per database, so the next import only has to read the rows changed since,
+together with the tracks that failed to import and are retried.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.platform.rekordbox.models import RekordboxTrack
+
+
+@dataclass
+class RekordboxWatermark:
+    """High-water mark of the Rekordbox content seen by the last import."""
+
+    usn: int = 0
+    updated_at: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the watermark to a dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the watermark
+        """
+        return {
+            "usn": self.usn,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RekordboxWatermark":
+        """Create a watermark from its dictionary representation.
+
+        Args:
+            data: Dictionary as returned by to_dict
+
+        Returns:
+            RekordboxWatermark instance
+        """
+        updated_at = data.get("updated_at")
+        return cls(
+            usn=int(data.get("usn") or 0),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        )
+
+
+@dataclass
+class RekordboxContentChanges:
+    """Tracks changed in Rekordbox since a watermark."""
+
+    # Tracks added or modified since the watermark
+    changed: list[RekordboxTrack] = field(default_factory=list)
+
+    # IDs of previously imported tracks that no longer exist in Rekordbox
+    deleted_ids: list[str] = field(default_factory=list)
+
+    # Watermark to store once the changes have been imported
+    watermark: RekordboxWatermark = field(default_factory=RekordboxWatermark)
+
+
+class RekordboxImportState:
+    """Import watermarks per Rekordbox database, persisted in the settings table."""
+
+    SETTINGS_KEY = "rekordbox_import_state"
+
+    def __init__(self, settings_repo: SettingsRepository, database_key: str) -> None:
+        """Initialize the import state.
+
+        Args:
+            settings_repo: Repository used to persist the state
+            database_key: Identifier of the Rekordbox database (e.g. its master.db path)
+        """
+        self.settings_repo = settings_repo
+        self.database_key = database_key
+
+    def _load_all(self) -> dict[str, Any]:
+        """Load the state of all databases.
+
+        Returns:
+            Dictionary mapping database keys to their state
+        """
+        try:
+            state = self.settings_repo.get_setting_value(self.SETTINGS_KEY)
+        except Exception as e:
+            logger.warning(f"Could not load Rekordbox import state: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_all(self, state: dict[str, Any]) -> None:
+        """Persist the state of all databases.
+
+        Args:
+            state: Dictionary mapping database keys to their state
+        """
+        self.settings_repo.set_setting(
+            self.SETTINGS_KEY,
+            state,
+            data_type="json",
+            description="Watermarks of the last Rekordbox import per database",
+        )
+
+    def load(self) -> RekordboxWatermark | None:
+        """Load the watermark of the last import.
+
+        Returns:
+            The watermark, or None if this database was never imported
+        """
+        data = self._load_all().get(self.database_key)
+        if not isinstance(data, dict) or "watermark" not in data:
+            return None
+        return RekordboxWatermark.from_dict(data["watermark"])
+
+    @property
+    def collection_playlist_id(self) -> int | None:
+        """ID of the local playlist holding the imported collection, if any."""
+        data = self._load_all().get(self.database_key) or {}
+        return data.get("collection_playlist_id")
+
+    @property
+    def failed_ids(self) -> list[str]:
+        """Rekordbox IDs of the tracks that failed to import last time, to retry on the next import."""
+        data = self._load_all().get(self.database_key) or {}
+        return [str(track_id) for track_id in data.get("failed_ids") or []]
+
+    def save(
+        self,
+        watermark: RekordboxWatermark | None,
+        collection_playlist_id: int | None = None,
+        failed_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Store the watermark of a completed import.
+
+        Args:
+            watermark: Watermark taken before the import started, or None to keep the stored one
+                (e.g. when the import was cancelled and must be read again next time)
+            collection_playlist_id: ID of the local collection playlist, if one was filled
+            failed_ids: Rekordbox IDs of the tracks that failed to import, or None to keep the stored ones
+        """
+        if watermark is None and collection_playlist_id is None and failed_ids is None:
+            return
+
+        state = self._load_all()
+        data = state.get(self.database_key) or {}
+        if watermark is not None:
+            data["watermark"] = watermark.to_dict()
+        if collection_playlist_id is not None:
+            data["collection_playlist_id"] = collection_playlist_id
+        if failed_ids is not None:
+            data["failed_ids"] = sorted({str(track_id) for track_id in failed_ids})
+        state[self.database_key] = data
+        self._save_all(state)
+
+    def reset(self) -> None:
+        """Forget the state of this database, forcing a full import next time."""
+        state = self._load_all()
+        if state.pop(self.database_key, None) is not None:
+            self._save_all(state)
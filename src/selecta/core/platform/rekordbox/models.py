@@ -144,7 +144,7 @@ def is_rekordbox_playlist(obj: Any) -> TypeGuard[RekordboxPlaylistItem]:
     return isinstance(obj, object) and hasattr(obj, "ID") and hasattr(obj, "Name") and hasattr(obj, "Attribute")
 
 
-@dataclass
+@dataclass(slots=True)
 class RekordboxTrack:
     """Representation of a Rekordbox track."""
 
@@ -259,6 +259,47 @@ class RekordboxTrack:
             created_at=created_at,
         )
 
+    @classmethod
+    def from_content_row(cls, row: Any) -> "RekordboxTrack":
+        """Create a RekordboxTrack from a row of queries.content_select.
+
+        Unlike from_rekordbox_content this doesn't touch any ORM relationships,
+        the lookup names are already part of the row.
+
+        Args:
+            row: Row with ID, Title, ArtistName, AlbumName, GenreName, KeyName,
+                Length, BPM, FolderPath, Rating and DateCreated
+
+        Returns:
+            RekordboxTrack instance
+        """
+        # Rekordbox stores the length in seconds and BPM multiplied by 100
+        duration_ms = row.Length * 1000 if row.Length else None
+        bpm = row.BPM / 100.0 if row.BPM is not None else None
+
+        created_at: datetime | None = None
+        if isinstance(row.DateCreated, datetime):
+            created_at = row.DateCreated
+        elif isinstance(row.DateCreated, str):
+            try:
+                created_at = datetime.fromisoformat(row.DateCreated)
+            except ValueError:
+                created_at = None
+
+        return cls(
+            id=row.ID,
+            title=row.Title or "",
+            artist_name=row.ArtistName or "Unknown Artist",
+            album_name=row.AlbumName,
+            genre=row.GenreName,
+            duration_ms=duration_ms,
+            bpm=bpm,
+            key=row.KeyName,
+            folder_path=row.FolderPath,
+            rating=row.Rating,
+            created_at=created_at,
+        )
+
 
 @dataclass
 class RekordboxPlaylist:
@@ -272,14 +313,19 @@ class RekordboxPlaylist:
     position: int
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    track_count: int = 0
 
     @classmethod
-    def from_rekordbox_playlist(cls, playlist: Any, tracks: list[RekordboxTrack]) -> "RekordboxPlaylist":
+    def from_rekordbox_playlist(
+        cls, playlist: Any, tracks: list[RekordboxTrack], track_count: int | None = None
+    ) -> "RekordboxPlaylist":
         """Create a RekordboxPlaylist from a DjmdPlaylist object.
 
         Args:
-            playlist: DjmdPlaylist object from pyrekordbox
+            playlist: DjmdPlaylist object (or playlist row) from pyrekordbox
             tracks: List of RekordboxTrack instances in the playlist
+            track_count: Number of tracks in the playlist when the tracks are not loaded
+                (defaults to the length of tracks)
 
         Returns:
             RekordboxPlaylist instance
@@ -317,4 +363,5 @@ class RekordboxPlaylist:
             position=position,
             created_at=created_at,
             updated_at=updated_at,
+            track_count=len(track_list) if track_count is None else track_count,
         )
@@ -0,0 +1,165 @@
+"""Batched song-playlist writes for the Rekordbox master.db.
+
+pyrekordbox's add_to_playlist counts the playlist songs on every call and
+remove_from_playlist commits and renumbers the playlist for every single song.
+RekordboxPlaylistWriter stages the changes for a playlist instead and applies
+all inserts, removals and the position renumbering in one pass, leaving the
+single commit to the caller.
+"""
+
+import datetime
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from loguru import logger
+from sqlalchemy import select
+
+from selecta.core.platform.rekordbox.queries import rb_tables
+
+# Maximum number of IDs bound into one IN clause
+ID_CHUNK_SIZE = 500
+
+
+@dataclass
+class PlaylistWriteResult:
+    """Outcome of applying staged playlist changes."""
+
+    added: int = 0
+    removed: int = 0
+    renumbered: int = 0
+
+    # Requested content IDs that don't exist in the collection or the playlist
+    missing_ids: list[str] = field(default_factory=list)
+
+
+class RekordboxPlaylistWriter:
+    """Stages song-playlist changes of one playlist and applies them at once."""
+
+    def __init__(self, db: Any, playlist_id: str) -> None:
+        """Initialize the writer.
+
+        Args:
+            db: pyrekordbox database (Rekordbox6Database)
+            playlist_id: ID of the playlist to modify
+        """
+        self.db = db
+        self.playlist_id = str(playlist_id)
+        self._additions: list[str] = []
+        self._removals: list[str] = []
+
+    def add(self, content_ids: list[str] | list[int]) -> None:
+        """Stage tracks to append to the end of the playlist.
+
+        Args:
+            content_ids: DjmdContent IDs in the order they should be added
+        """
+        self._additions.extend(str(content_id) for content_id in content_ids)
+
+    def remove(self, content_ids: list[str] | list[int]) -> None:
+        """Stage tracks to remove from the playlist.
+
+        Each ID removes one occurrence of the track from the playlist.
+
+        Args:
+            content_ids: DjmdContent IDs to remove
+        """
+        self._removals.extend(str(content_id) for content_id in content_ids)
+
+    def apply(self) -> PlaylistWriteResult:
+        """Apply the staged changes to the database session without committing.
+
+        Returns:
+            Counts of the applied changes
+
+        Raises:
+            ValueError: If the playlist doesn't exist or isn't a regular playlist
+        """
+        playlist = self.db.get_playlist(ID=self.playlist_id)
+        if not playlist:
+            raise ValueError(f"Playlist with ID {self.playlist_id} not found")
+        if playlist.Attribute != 0:
+            raise ValueError(f"Playlist {self.playlist_id} is not a regular playlist")
+
+        song_table = rb_tables.DjmdSongPlaylist
+        songs = (
+            self.db.session.query(song_table)
+            .filter(song_table.PlaylistID == self.playlist_id)
+            .order_by(song_table.TrackNo)
+            .all()
+        )
+
+        result = PlaylistWriteResult()
+        now = datetime.datetime.now()
+
+        # Remove one occurrence per requested ID
+        pending_removals = Counter(self._removals)
+        remaining = []
+        for song in songs:
+            if pending_removals[song.ContentID] > 0:
+                pending_removals[song.ContentID] -= 1
+                self.db.delete(song)
+                result.removed += 1
+            else:
+                remaining.append(song)
+        result.missing_ids.extend(pending_removals.elements())
+
+        # Close the gaps left by the removals in one pass
+        moved = []
+        with self.db.registry.disabled():
+            for track_no, song in enumerate(remaining, start=1):
+                if song.TrackNo != track_no:
+                    song.TrackNo = track_no
+                    song.updated_at = now
+                    moved.append(song)
+        if moved:
+            self.db.registry.on_move(moved)
+        result.renumbered = len(moved)
+
+        # Append the additions that exist in the collection
+        existing = self._existing_content_ids(self._additions)
+        track_no = len(remaining)
+        for content_id in self._additions:
+            if content_id not in existing:
+                result.missing_ids.append(content_id)
+                continue
+
+            track_no += 1
+            song = song_table.create(
+                ID=str(uuid4()),
+                PlaylistID=self.playlist_id,
+                ContentID=content_id,
+                TrackNo=track_no,
+                UUID=str(uuid4()),
+                created_at=now,
+                updated_at=now,
+            )
+            self.db.add(song)
+            result.added += 1
+
+        if result.missing_ids:
+            logger.warning(f"Skipped {len(result.missing_ids)} unknown track IDs for playlist {self.playlist_id}")
+
+        logger.debug(
+            f"Staged playlist {self.playlist_id} changes: {result.added} added, "
+            f"{result.removed} removed, {result.renumbered} renumbered"
+        )
+        return result
+
+    def _existing_content_ids(self, content_ids: list[str]) -> set[str]:
+        """Look up which content IDs exist in the collection.
+
+        Args:
+            content_ids: DjmdContent IDs to check
+
+        Returns:
+            Set of the IDs that exist
+        """
+        unique_ids = list(dict.fromkeys(content_ids))
+        existing: set[str] = set()
+        for start in range(0, len(unique_ids), ID_CHUNK_SIZE):
+            chunk = unique_ids[start : start + ID_CHUNK_SIZE]
+            stmt = select(rb_tables.DjmdContent.ID).where(rb_tables.DjmdContent.ID.in_(chunk))
+            existing.update(str(content_id) for content_id in self.db.session.scalars(stmt))
+        return existing
@@ -0,0 +1,246 @@
+"""Aggregated read queries against the Rekordbox master.db.
+
+The pyrekordbox ORM objects resolve their relationships lazily, which costs
+one or more queries per row. The helpers in this module run set-based selects
+through the pyrekordbox session instead, so listing a large library touches
+the database a handful of times rather than once per playlist or track.
+"""
+
+from collections.abc import Collection, Iterator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, or_, select
+from sqlalchemy.orm import Session, aliased
+
+try:
+    from pyrekordbox.db6 import tables as rb_tables
+except ImportError:  # pyrekordbox >= 0.5 renamed the db6 package
+    from pyrekordbox.masterdb import models as rb_tables  # type: ignore[no-redef]
+
+# DjmdPlaylist.Attribute value of smart playlists
+SMART_PLAYLIST_ATTRIBUTE = 4
+
+# Number of content rows fetched from the database at a time
+CONTENT_CHUNK_SIZE = 1000
+
+
+def playlist_tree_rows(session: Session) -> list[Any]:
+    """Get all regular playlists and folders with their track counts.
+
+    Runs a single grouped query instead of loading the songs of each playlist.
+    Smart playlists are skipped since their contents are computed by Rekordbox.
+
+    Args:
+        session: SQLAlchemy session of the Rekordbox database
+
+    Returns:
+        Rows with the DjmdPlaylist columns used by RekordboxPlaylist
+        (ID, Name, Attribute, ParentID, Seq, created_at, updated_at) plus TrackCount
+    """
+    playlist = rb_tables.DjmdPlaylist
+    song = rb_tables.DjmdSongPlaylist
+
+    stmt = (
+        select(
+            playlist.ID,
+            playlist.Name,
+            playlist.Attribute,
+            playlist.ParentID,
+            playlist.Seq,
+            playlist.created_at,
+            playlist.updated_at,
+            func.count(song.ID).label("TrackCount"),
+        )
+        .outerjoin(song, song.PlaylistID == playlist.ID)
+        .where(playlist.Attribute != SMART_PLAYLIST_ATTRIBUTE)
+        .group_by(playlist.ID)
+        .order_by(playlist.Seq)
+    )
+    return list(session.execute(stmt))
+
+
+def not_deleted() -> ColumnElement[bool]:
+    """Build the condition excluding tracks Rekordbox marked as locally deleted.
+
+    Returns:
+        Condition over djmdContent
+    """
+    return func.coalesce(rb_tables.DjmdContent.rb_local_deleted, 0) == 0
+
+
+def content_select() -> Select:
+    """Build a select of track rows joined with their lookup tables.
+
+    The artist, album, genre and key names are resolved by outer joins, so each
+    row carries everything RekordboxTrack.from_content_row needs. Tracks marked
+    as locally deleted are left out.
+
+    Returns:
+        Select over djmdContent yielding rows with ID, Title, ArtistName, AlbumName,
+        GenreName, KeyName, Length, BPM, FolderPath, Rating, DateCreated, usn and updated_at
+    """
+    content = rb_tables.DjmdContent
+    artist = aliased(rb_tables.DjmdArtist)
+    album = aliased(rb_tables.DjmdAlbum)
+    genre = aliased(rb_tables.DjmdGenre)
+    key = aliased(rb_tables.DjmdKey)
+
+    return (
+        select(
+            content.ID,
+            content.Title,
+            artist.Name.label("ArtistName"),
+            album.Name.label("AlbumName"),
+            genre.Name.label("GenreName"),
+            key.ScaleName.label("KeyName"),
+            content.Length,
+            content.BPM,
+            content.FolderPath,
+            content.Rating,
+            content.DateCreated,
+            content.usn,
+            content.updated_at,
+        )
+        .outerjoin(artist, content.ArtistID == artist.ID)
+        .outerjoin(album, content.AlbumID == album.ID)
+        .outerjoin(genre, content.GenreID == genre.ID)
+        .outerjoin(key, content.KeyID == key.ID)
+        .where(not_deleted())
+    )
+
+
+def iter_content_rows(
+    session: Session, stmt: Select | None = None, chunk_size: int = CONTENT_CHUNK_SIZE
+) -> Iterator[list[Any]]:
+    """Stream track rows from the database in chunks.
+
+    Args:
+        session: SQLAlchemy session of the Rekordbox database
+        stmt: Select built from content_select (defaults to all tracks by ID)
+        chunk_size: Number of rows per chunk
+
+    Yields:
+        Lists of at most chunk_size rows
+    """
+    if stmt is None:
+        stmt = content_select().order_by(rb_tables.DjmdContent.ID)
+
+    result = session.execute(stmt.execution_options(yield_per=chunk_size))
+    for partition in result.partitions(chunk_size):
+        yield list(partition)
+
+
+def count_content(session: Session) -> int:
+    """Count the tracks in the database that are not marked as deleted.
+
+    Args:
+        session: SQLAlchemy session of the Rekordbox database
+
+    Returns:
+        Number of djmdContent rows
+    """
+    return session.scalar(select(func.count(rb_tables.DjmdContent.ID)).where(not_deleted())) or 0
+
+
+def search_content_select(query: str, limit: int) -> Select:
+    """Build a select of tracks matching a search text.
+
+    Matches the title, comment and search string of the track as well as the
+    artist, album, genre and key names, case-insensitively.
+
+    Args:
+        query: Search text
+        limit: Maximum number of rows
+
+    Returns:
+        Select built from content_select, ordered by track ID
+    """
+    stmt = content_select()
+    content = rb_tables.DjmdContent
+    columns = stmt.selected_columns
+    return (
+        stmt.where(
+            or_(
+                content.Title.contains(query),
+                content.Commnt.contains(query),
+                content.SearchStr.contains(query),
+                columns.ArtistName.contains(query),
+                columns.AlbumName.contains(query),
+                columns.GenreName.contains(query),
+                columns.KeyName.contains(query),
+            )
+        )
+        .order_by(content.ID)
+        .limit(limit)
+    )
+
+
+def playlist_content_select(playlist_id: str) -> Select:
+    """Build a select of the tracks in a playlist, in playlist order.
+
+    Args:
+        playlist_id: DjmdPlaylist ID
+
+    Returns:
+        Select built from content_select
+    """
+    song = rb_tables.DjmdSongPlaylist
+    return (
+        content_select()
+        .join(song, song.ContentID == rb_tables.DjmdContent.ID)
+        .where(song.PlaylistID == str(playlist_id))
+        .order_by(song.TrackNo)
+    )
+
+
+def content_watermark(session: Session) -> tuple[int, datetime | None]:
+    """Get the newest local update sequence number and timestamp of the tracks.
+
+    Rekordbox bumps rb_local_usn and updated_at of a row whenever it changes.
+
+    Args:
+        session: SQLAlchemy session of the Rekordbox database
+
+    Returns:
+        Tuple of (highest rb_local_usn, latest updated_at)
+    """
+    content = rb_tables.DjmdContent
+    usn, updated_at = session.execute(select(func.max(content.rb_local_usn), func.max(content.updated_at))).one()
+    return usn or 0, updated_at
+
+
+def changed_content_select(
+    since_usn: int, since_updated_at: datetime | None, retry_ids: Collection[str] = ()
+) -> Select:
+    """Build a select of the tracks changed after a watermark.
+
+    Args:
+        since_usn: rb_local_usn of the last import
+        since_updated_at: updated_at of the last import
+        retry_ids: IDs of tracks to read even if unchanged, e.g. failed in the last import
+
+    Returns:
+        Select built from content_select, ordered by track ID
+    """
+    content = rb_tables.DjmdContent
+    changed = func.coalesce(content.rb_local_usn, 0) > since_usn
+    if since_updated_at is not None:
+        changed = or_(changed, content.updated_at > since_updated_at)
+    if retry_ids:
+        changed = or_(changed, content.ID.in_([str(retry_id) for retry_id in retry_ids]))
+
+    return content_select().where(changed).order_by(content.ID)
+
+
+def live_content_ids(session: Session) -> set[str]:
+    """Get the IDs of all tracks that are not marked as deleted.
+
+    Args:
+        session: SQLAlchemy session of the Rekordbox database
+
+    Returns:
+        Set of djmdContent IDs
+    """
+    stmt = select(rb_tables.DjmdContent.ID).where(not_deleted())
+    return {str(content_id) for content_id in session.scalars(stmt)}
@@ -505,6 +505,9 @@ class PlatformSyncManager:
                 logger.exception(f"Error applying platform removal: {e}")
                 result.errors.append(f"Error removing {change.track_artist} - {change.track_title}: {str(e)}")
 
+        # Platforms with a daily quota only get as many writes as fit today
+        write_budget = self._get_write_budget(changes, selected_changes)
+
         # 3. Apply library additions (export library tracks to platform)
         if changes.is_personal_playlist:  # Only for personal playlists
             platform_track_ids_to_add = []
@@ -529,6 +532,12 @@ class PlatformSyncManager:
                                 platform_id = platform_info.uri
                                 break
 
+                if write_budget is not None:
+                    if write_budget <= 0:
+                        result.deferred_changes.append(change)
+                        continue
+                    write_budget -= 1
+
                 platform_track_ids_to_add.append(platform_id)
 
             # Batch add tracks to platform playlist
@@ -555,6 +564,12 @@ class PlatformSyncManager:
                     logger.warning("Cannot remove track without platform ID")
                     continue
 
+                if write_budget is not None:
+                    if write_budget <= 0:
+                        result.deferred_changes.append(change)
+                        continue
+                    write_budget -= 1
+
                 # Add to list for batch operation
                 platform_track_ids_to_remove.append(change.platform_track_id)
 
@@ -570,21 +585,61 @@ class PlatformSyncManager:
                     logger.exception(f"Error removing tracks from platform playlist: {e}")
                     result.errors.append(f"Error removing tracks from platform: {str(e)}")
 
+        if result.deferred_changes:
+            result.warnings.append(
+                f"{len(result.deferred_changes)} changes exceed today's {self.platform_name} quota "
+                "and were deferred to the next sync"
+            )
+
         # 5. Update sync snapshot
-        if result.total_changes_applied > 0:
+        if result.total_changes_applied > 0 or result.deferred_changes:
             try:
-                self.save_sync_snapshot(local_playlist_id)
+                self.save_sync_snapshot(local_playlist_id, deferred_changes=result.deferred_changes)
             except Exception as e:
                 logger.exception(f"Error saving sync snapshot: {e}")
                 result.warnings.append(f"Could not save sync state: {str(e)}")
 
         return result
 
-    def save_sync_snapshot(self, local_playlist_id: int) -> None:
+    def _get_write_budget(self, changes: SyncChanges, selected_changes: dict[str, bool]) -> int | None:
+        """Get how many platform playlist writes can be applied in this sync.
+
+        Only platforms that expose quota planning (currently YouTube) are limited.
+
+        Args:
+            changes: The detected sync changes
+            selected_changes: Dictionary mapping change IDs to selection status
+
+        Returns:
+            Number of playlist writes that fit, or None if the platform has no quota
+        """
+        if not hasattr(self.platform_client, "estimate_sync_cost"):
+            return None
+
+        playlist_size = len(self.playlist_repo.get_playlist_tracks(changes.library_playlist_id))
+        estimate = self.platform_client.estimate_sync_cost(changes, selected_changes, playlist_size)
+        if estimate.fits:
+            return None
+
+        # Keep enough quota for the reads around the writes (imports, snapshot)
+        write_methods = ("playlistItems.insert", "playlistItems.delete")
+        reserve = sum(cost for method, cost in estimate.cost_by_method.items() if method not in write_methods)
+        budget = self.platform_client.get_write_budget(reserve=reserve)
+        logger.warning(
+            f"Sync needs {estimate.total} {self.platform_name} quota units but only "
+            f"{estimate.remaining} remain, limiting to {budget} playlist writes"
+        )
+        return budget
+
+    def save_sync_snapshot(self, local_playlist_id: int, deferred_changes: list[TrackChange] | None = None) -> None:
         """Save current state of both playlists for future change detection.
 
+        Deferred library changes are kept out of the snapshot (additions) or kept
+        in it (removals), so the next sync detects them again.
+
         Args:
             local_playlist_id: Library playlist ID
+            deferred_changes: Selected library changes that were not applied
 
         Raises:
             ValueError: If the playlist doesn't exist or isn't linked to this platform
@@ -660,6 +715,18 @@ class PlatformSyncManager:
                     "added_at": added_at.isoformat() if isinstance(added_at, datetime) else added_at,
                 }
 
+        # Make deferred library changes show up again in the next sync
+        for change in deferred_changes or []:
+            if change.library_track_id is None:
+                continue
+            if change.change_type == ChangeType.LIBRARY_ADDITION:
+                snapshot["library_tracks"].pop(str(change.library_track_id), None)
+            elif change.change_type == ChangeType.LIBRARY_REMOVAL:
+                snapshot["library_tracks"][str(change.library_track_id)] = {
+                    "platform_id": change.platform_track_id,
+                    "added_at": None,
+                }
+
         # Get or create sync state
         sync_state = self._get_sync_state(platform_info)
         if not sync_state:
@@ -1003,27 +1070,14 @@ class PlatformSyncManager:
         if not collection_playlist_id:
             logger.warning("Collection playlist not found, tracks will not be added to Collection")
 
-        for i, platform_track in enumerate(platform_tracks):
-            try:
-                track_type = type(platform_track).__name__
-                logger.info(f"Processing track {i + 1}/{len(platform_tracks)} of type {track_type}")
-
-                # Import the track using link manager with error handling
-                try:
-                    local_track = self.link_manager.import_track(platform_track)
-
-                    if not local_track:
-                        logger.error(f"Failed to import track {i + 1}: link_manager.import_track returned None")
-                        continue
-                except ValueError as e:
-                    # Log the error but don't crash the entire import process
-                    logger.error(f"Failed to import track {i + 1}: {str(e)}")
-                    continue
-                except Exception as e:
-                    # Log unexpected errors
-                    logger.exception(f"Unexpected error importing track {i + 1}: {str(e)}")
-                    continue
+        # Import all tracks in one transaction, then add them to the playlist in platform order
+        imported_tracks = self._import_platform_tracks(platform_tracks)
+        for i, local_track in enumerate(imported_tracks):
+            if local_track is None:
+                logger.error(f"Failed to import track {i + 1}/{len(platform_tracks)}")
+                continue
 
+            try:
                 local_tracks.append(local_track)
 
                 # Add to playlist with correct position
@@ -1033,13 +1087,8 @@ class PlatformSyncManager:
                 if collection_playlist_id and not self._track_in_playlist(local_track.id, collection_playlist_id):
                     self.playlist_repo.add_track(collection_playlist_id, local_track.id)
                     logger.debug(f"Added track {local_track.id} to Collection")
-
-                logger.info(
-                    f"Successfully imported and added track {i + 1}/{len(platform_tracks)}: "
-                    f"{local_track.title} by {local_track.artist}"
-                )
             except Exception:
-                logger.exception(f"Error importing track {i + 1}:")
+                logger.exception(f"Error adding track {i + 1} to playlist:")
                 # Continue with next track
 
         logger.info(
@@ -1049,6 +1098,38 @@ class PlatformSyncManager:
 
         return local_playlist, local_tracks
 
+    def _import_platform_tracks(self, platform_tracks: list[Any]) -> list[Track | None]:
+        """Import platform tracks in bulk and return the library tracks in the same order.
+
+        Args:
+            platform_tracks: Platform-specific track objects
+
+        Returns:
+            Library track per platform track, None where the import failed
+        """
+        track_ids: dict[str, int] = {}
+        try:
+            track_ids = self.link_manager.import_tracks(platform_tracks)
+        except Exception as e:
+            logger.exception(f"Error importing {self.platform_name} tracks: {e}")
+
+        tracks_by_id = {}
+        if track_ids:
+            tracks = self.track_repo.session.query(Track).filter(Track.id.in_(set(track_ids.values()))).all()
+            tracks_by_id = {track.id: track for track in tracks}
+
+        local_tracks: list[Track | None] = []
+        for platform_track in platform_tracks:
+            local_track = tracks_by_id.get(track_ids.get(self.link_manager.get_platform_id(platform_track), -1))
+            if local_track is None:
+                # Fall back to the single-track import, which reports why a track can't be imported
+                try:
+                    local_track = self.link_manager.import_track(platform_track)
+                except Exception as e:
+                    logger.warning(f"Could not import {self.platform_name} track: {e}")
+            local_tracks.append(local_track)
+        return local_tracks
+
     def _import_to_existing_playlist(
         self, platform_playlist_id: str, target_playlist_id: int
     ) -> tuple[Playlist, list[Track]]:
@@ -1085,20 +1166,13 @@ class PlatformSyncManager:
 
         # Import platform tracks and add to target playlist
         new_tracks = []
-        for i, platform_track in enumerate(platform_tracks):
-            try:
-                track_type = type(platform_track).__name__
-                logger.info(
-                    f"Processing track {i + 1}/{len(platform_tracks)} " f"for existing playlist - type {track_type}"
-                )
-
-                # Import track
-                local_track = self.link_manager.import_track(platform_track)
-
-                if not local_track:
-                    logger.error(f"Failed to import track {i + 1}: link_manager.import_track returned None")
-                    continue
+        imported_tracks = self._import_platform_tracks(platform_tracks)
+        for i, local_track in enumerate(imported_tracks):
+            if local_track is None:
+                logger.error(f"Failed to import track {i + 1}/{len(platform_tracks)}")
+                continue
 
+            try:
                 # Skip if already in playlist
                 if local_track.id in existing_track_ids:
                     logger.debug(f"Track already in playlist: {local_track.title}")
@@ -1114,7 +1188,6 @@ class PlatformSyncManager:
                     logger.debug(f"Added track {local_track.id} to Collection")
 
                 new_tracks.append(local_track)
-                logger.info(f"Added track to existing playlist: {local_track.title} by {local_track.artist}")
             except Exception:
                 logger.exception(f"Error importing track {i + 1} to existing playlist:")
 
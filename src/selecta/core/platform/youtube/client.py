@@ -3,7 +3,9 @@
 import contextlib
 import random
 import time
+from collections import Counter
 from collections.abc import Callable
+from datetime import datetime
 from ssl import SSLError
 from typing import Any
 
@@ -11,14 +13,32 @@ from googleapiclient.errors import HttpError
 from loguru import logger
 
 from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.data.types import SyncChanges
 from selecta.core.platform.abstract_platform import AbstractPlatform
 from selecta.core.platform.youtube.auth import YouTubeAuthManager
 from selecta.core.platform.youtube.models import YouTubePlaylist, YouTubeVideo
+from selecta.core.platform.youtube.quota import (
+    QuotaEstimate,
+    QuotaExceededError,
+    YouTubeQuotaTracker,
+    estimate_export_cost,
+    estimate_sync_cost,
+    method_cost,
+)
 
 
 class YouTubeClient(AbstractPlatform):
     """Client for interacting with the YouTube API with improved error handling."""
 
+    # Maximum number of IDs accepted by videos.list in a single call
+    VIDEO_DETAILS_CHUNK_SIZE = 50
+
+    # Number of playlistItems writes sent in one batch HTTP request
+    WRITE_BATCH_SIZE = 50
+
+    # HTTP status codes worth retrying for individual requests inside a batch
+    RETRYABLE_STATUSES = (409, 429, 500, 502, 503, 504)
+
     def __init__(self, settings_repo: SettingsRepository | None = None) -> None:
         """Initialize the YouTube client.
 
@@ -38,6 +58,9 @@ class YouTubeClient(AbstractPlatform):
         self._request_count = 0
         self._max_requests_per_minute = 60  # YouTube API typically allows ~60 requests per minute
 
+        # Daily quota accounting (units per API method, persisted per day)
+        self.quota = YouTubeQuotaTracker(self.settings_repo)
+
         # Try to initialize the client if we have valid credentials
         self._initialize_client()
 
@@ -111,6 +134,9 @@ class YouTubeClient(AbstractPlatform):
         # Execute the request
         try:
             request = request_func()
+            # Batch requests are charged per contained request in _execute_batch
+            if hasattr(request, "methodId"):
+                self._charge_quota([request.methodId])
             response = request.execute()
 
             # Update rate limiting state
@@ -173,7 +199,14 @@ class YouTubeClient(AbstractPlatform):
                     logger.warning("Max SSL retries reached, reinitializing client")
                     self._initialize_client()
 
+            except QuotaExceededError:
+                raise
+
             except HttpError as e:
+                if self._is_quota_error(e):
+                    self.quota.mark_exhausted()
+                    raise QuotaExceededError(f"YouTube daily quota exceeded: {e}") from e
+
                 # Only retry certain HTTP errors
                 if e.resp.status in (429, 500, 502, 503, 504):
                     last_error = e
@@ -196,6 +229,168 @@ class YouTubeClient(AbstractPlatform):
         logger.error(error_msg)
         raise ValueError(error_msg)
 
+    def _execute_batch(self, request_funcs: list[Callable], max_retries: int = 3) -> list[Any]:
+        """Execute many YouTube API requests through batch HTTP requests.
+
+        Requests are grouped into batches of WRITE_BATCH_SIZE. Each batch is sent
+        as a single HTTP round trip, so it pays the rate-limit delay only once.
+        Individual requests that fail with a transient error are re-sent in a
+        later batch with exponential backoff.
+
+        Args:
+            request_funcs: Functions that each return a YouTube request object
+            max_retries: Maximum number of retries for failed requests
+
+        Returns:
+            Responses in the same order as request_funcs
+
+        Raises:
+            ValueError: If a request fails with a non-retryable error or keeps failing
+        """
+        responses: list[Any] = [None] * len(request_funcs)
+        pending = list(range(len(request_funcs)))
+
+        for retry in range(max_retries + 1):
+            if retry > 0:
+                sleep_time = (2**retry) + (random.random() * 0.5)
+                logger.debug(f"Retrying {len(pending)} batched requests in {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+
+            failed: dict[int, Exception] = {}
+            for start in range(0, len(pending), self.WRITE_BATCH_SIZE):
+                chunk = pending[start : start + self.WRITE_BATCH_SIZE]
+
+                def callback(
+                    request_id: str, response: Any, exception: Exception | None, failed: dict = failed
+                ) -> None:
+                    index = int(request_id)
+                    if exception is not None:
+                        failed[index] = exception
+                    else:
+                        responses[index] = response
+
+                def batch_request(chunk=chunk, callback=callback):
+                    batch = self.client.new_batch_http_request(callback=callback)
+                    requests = [request_funcs[index]() for index in chunk]
+                    self._charge_quota([getattr(request, "methodId", "") for request in requests])
+                    for index, request in zip(chunk, requests, strict=True):
+                        batch.add(request, request_id=str(index))
+                    return batch
+
+                self._execute_with_retries(batch_request)
+
+            # Fail fast on errors that won't go away by retrying
+            for exception in failed.values():
+                if isinstance(exception, HttpError) and self._is_quota_error(exception):
+                    self.quota.mark_exhausted()
+                    raise QuotaExceededError(f"YouTube daily quota exceeded: {exception}") from exception
+                if not (isinstance(exception, HttpError) and exception.resp.status in self.RETRYABLE_STATUSES):
+                    raise ValueError(f"YouTube API error: {exception}") from exception
+
+            pending = sorted(failed)
+            if not pending:
+                return responses
+            logger.warning(f"{len(pending)} batched YouTube requests failed, retry {retry + 1}/{max_retries}")
+
+        raise ValueError(f"{len(pending)} batched YouTube requests failed after {max_retries} retries")
+
+    def _charge_quota(self, methods: list[str]) -> None:
+        """Check and record the quota cost of requests about to be sent.
+
+        Args:
+            methods: API method IDs of the requests, e.g. "youtube.search.list"
+
+        Raises:
+            QuotaExceededError: If the requests don't fit into the remaining daily quota
+        """
+        methods = [method for method in methods if method]
+        cost = sum(method_cost(method) for method in methods)
+        if not self.quota.can_afford(cost):
+            raise QuotaExceededError(
+                f"YouTube request needs {cost} quota units but only {self.quota.remaining} remain today"
+            )
+        for method, calls in Counter(methods).items():
+            self.quota.record(method, calls)
+
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        """Check whether an HTTP error reports an exhausted daily quota.
+
+        Args:
+            error: The HTTP error
+
+        Returns:
+            True for quotaExceeded/dailyLimitExceeded errors
+        """
+        content = error.content.decode("utf-8", "ignore") if isinstance(error.content, bytes) else str(error.content)
+        return error.resp.status == 403 and ("quotaExceeded" in content or "dailyLimitExceeded" in content)
+
+    def estimate_sync_cost(
+        self,
+        changes: SyncChanges,
+        selected_changes: dict[str, bool] | None = None,
+        playlist_size: int = 0,
+    ) -> QuotaEstimate:
+        """Estimate the quota cost of applying sync changes.
+
+        Args:
+            changes: Changes as returned by PlatformSyncManager.get_sync_changes
+            selected_changes: Optional mapping of change IDs to selection status
+            playlist_size: Number of videos currently in the YouTube playlist
+
+        Returns:
+            QuotaEstimate against the remaining daily quota
+        """
+        return estimate_sync_cost(self.quota.new_estimate(), changes, selected_changes, playlist_size)
+
+    def estimate_export_cost(self, track_count: int, existing_playlist_id: str | None = None) -> QuotaEstimate:
+        """Estimate the quota cost of exporting videos to a playlist.
+
+        Args:
+            track_count: Number of videos to add
+            existing_playlist_id: ID of an existing playlist to update, if any
+
+        Returns:
+            QuotaEstimate against the remaining daily quota
+        """
+        return estimate_export_cost(self.quota.new_estimate(), track_count, existing_playlist_id)
+
+    def get_write_budget(self, reserve: int = 0) -> int:
+        """Get the number of playlist item writes that fit into today's quota.
+
+        Args:
+            reserve: Quota units to keep free for other calls
+
+        Returns:
+            Number of playlistItems inserts or deletes that can still be sent
+        """
+        return max(0, self.quota.remaining - reserve) // method_cost("playlistItems.insert")
+
+    def _get_video_details(self, video_ids: list[str], part: str) -> dict[str, dict[str, Any]]:
+        """Look up video resources in full chunks of VIDEO_DETAILS_CHUNK_SIZE IDs.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates are ignored)
+            part: Resource parts to request
+
+        Returns:
+            Dictionary mapping video ID to its video resource
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        details: dict[str, dict[str, Any]] = {}
+
+        for start in range(0, len(unique_ids), self.VIDEO_DETAILS_CHUNK_SIZE):
+            chunk = unique_ids[start : start + self.VIDEO_DETAILS_CHUNK_SIZE]
+
+            def videos_request(ids=chunk):
+                return self.client.videos().list(part=part, id=",".join(ids))
+
+            response = self._execute_with_retries(videos_request)
+            for item in response.get("items", []):
+                details[item.get("id")] = item
+
+        return details
+
     def is_authenticated(self) -> bool:
         """Check if the client is authenticated with valid credentials.
 
@@ -329,10 +524,11 @@ class YouTubeClient(AbstractPlatform):
             raise ValueError("YouTube client not authenticated")
 
         videos = []
+        playlist_items = []
         next_page_token = None
 
         try:
-            # First, get the playlist items
+            # First, get all playlist items
             while True:
 
                 def playlist_items_request(token=next_page_token):
@@ -345,52 +541,40 @@ class YouTubeClient(AbstractPlatform):
 
                 playlist_items_response = self._execute_with_retries(playlist_items_request)
 
-                # Extract video IDs
-                video_ids = []
-                playlist_items = []
                 for item in playlist_items_response.get("items", []):
-                    video_id = item.get("contentDetails", {}).get("videoId")
-                    if video_id:
-                        video_ids.append(video_id)
+                    if item.get("contentDetails", {}).get("videoId"):
                         playlist_items.append(item)
 
-                # Get detailed video information in batches of 50
-                if video_ids:
-
-                    def videos_request(ids=video_ids):
-                        return self.client.videos().list(part="snippet,contentDetails,statistics", id=",".join(ids))
-
-                    videos_response = self._execute_with_retries(videos_request)
-
-                    # Create YouTubeVideo objects with added_at information
-                    for video_item in videos_response.get("items", []):
-                        video_id = video_item.get("id")
-
-                        # Find the matching playlist item to get added_at and playlist_item_id
-                        added_at = None
-                        playlist_item_id = None
-                        for playlist_item in playlist_items:
-                            if playlist_item.get("contentDetails", {}).get("videoId") == video_id:
-                                playlist_item_id = playlist_item.get(
-                                    "id"
-                                )  # This is the playlist item ID we need for removal
-                                snippet = playlist_item.get("snippet", {})
-                                if "publishedAt" in snippet:
-                                    from datetime import datetime
-
-                                    with contextlib.suppress(ValueError, TypeError):
-                                        added_at = datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00"))
-                                break
-
-                        video = YouTubeVideo.from_youtube_dict(
-                            video_item, added_at=added_at, playlist_item_id=playlist_item_id
-                        )
-                        videos.append(video)
-
                 next_page_token = playlist_items_response.get("nextPageToken")
                 if not next_page_token:
                     break
 
+            # Then get detailed video information in full batches of 50, independent
+            # of how many items each playlist page contained
+            video_details = self._get_video_details(
+                [item["contentDetails"]["videoId"] for item in playlist_items],
+                part="snippet,contentDetails,statistics",
+            )
+
+            # Create YouTubeVideo objects with added_at information, in playlist order
+            for playlist_item in playlist_items:
+                video_item = video_details.get(playlist_item["contentDetails"]["videoId"])
+                if not video_item:
+                    # Deleted or private videos have no details
+                    continue
+
+                added_at = None
+                snippet = playlist_item.get("snippet", {})
+                if "publishedAt" in snippet:
+                    with contextlib.suppress(ValueError, TypeError):
+                        added_at = datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00"))
+
+                # The playlist item ID is what we need for removal
+                video = YouTubeVideo.from_youtube_dict(
+                    video_item, added_at=added_at, playlist_item_id=playlist_item.get("id")
+                )
+                videos.append(video)
+
             return videos
         except HttpError as e:
             logger.error(f"Error fetching YouTube playlist videos: {e}")
@@ -473,6 +657,8 @@ class YouTubeClient(AbstractPlatform):
                 raise ValueError("Playlist creation failed.")
 
             return YouTubePlaylist.from_youtube_dict(response)
+        except QuotaExceededError:
+            raise
         except HttpError as e:
             logger.error(f"Error creating YouTube playlist: {e}")
             raise ValueError(f"Error creating YouTube playlist: {str(e)}") from e
@@ -483,6 +669,10 @@ class YouTubeClient(AbstractPlatform):
     def add_tracks_to_playlist(self, playlist_id: str, video_ids: list[str]) -> bool:
         """Add videos to a playlist.
 
+        Inserts are sent as batch HTTP requests of up to WRITE_BATCH_SIZE items.
+        YouTube does not guarantee the order in which items of one batch are
+        applied, so the resulting playlist order may differ from video_ids.
+
         Args:
             playlist_id: The YouTube playlist ID
             video_ids: List of YouTube video IDs to add
@@ -500,22 +690,24 @@ class YouTubeClient(AbstractPlatform):
             return True  # Nothing to add
 
         try:
-            for video_id in video_ids:
-
-                def add_video_request(vid=video_id):
-                    return self.client.playlistItems().insert(
-                        part="snippet",
-                        body={
-                            "snippet": {
-                                "playlistId": playlist_id,
-                                "resourceId": {"kind": "youtube#video", "videoId": vid},
-                            }
-                        },
-                    )
+            request_funcs = [
+                lambda vid=video_id: self.client.playlistItems().insert(
+                    part="snippet",
+                    body={
+                        "snippet": {
+                            "playlistId": playlist_id,
+                            "resourceId": {"kind": "youtube#video", "videoId": vid},
+                        }
+                    },
+                )
+                for video_id in video_ids
+            ]
 
-                self._execute_with_retries(add_video_request)
+            self._execute_batch(request_funcs)
 
             return True
+        except QuotaExceededError:
+            raise
         except HttpError as e:
             logger.error(f"Error adding videos to YouTube playlist: {e}")
             raise ValueError(f"Error adding videos to YouTube playlist: {str(e)}") from e
@@ -526,6 +718,8 @@ class YouTubeClient(AbstractPlatform):
     def remove_tracks_from_playlist(self, playlist_id: str, playlist_item_ids: list[str]) -> bool:
         """Remove videos from a playlist.
 
+        Deletes are sent as batch HTTP requests of up to WRITE_BATCH_SIZE items.
+
         Args:
             playlist_id: The YouTube playlist ID
             playlist_item_ids: List of YouTube playlist item IDs to remove
@@ -543,14 +737,15 @@ class YouTubeClient(AbstractPlatform):
             return True  # Nothing to remove
 
         try:
-            for item_id in playlist_item_ids:
-
-                def remove_item_request(item=item_id):
-                    return self.client.playlistItems().delete(id=item)
+            request_funcs = [
+                lambda item=item_id: self.client.playlistItems().delete(id=item) for item_id in playlist_item_ids
+            ]
 
-                self._execute_with_retries(remove_item_request)
+            self._execute_batch(request_funcs)
 
             return True
+        except QuotaExceededError:
+            raise
         except HttpError as e:
             logger.error(f"Error removing videos from YouTube playlist: {e}")
             raise ValueError(f"Error removing videos from YouTube playlist: {str(e)}") from e
@@ -647,20 +842,14 @@ class YouTubeClient(AbstractPlatform):
 
             # If we have video IDs, get additional details
             if video_ids:
-
-                def details_request():
-                    return self.client.videos().list(part="contentDetails,statistics", id=",".join(video_ids))
-
-                details_response = self._execute_with_retries(details_request)
+                details = self._get_video_details(video_ids, part="contentDetails,statistics")
 
                 # Merge the detailed data with search results
                 for item in videos:
-                    video_id = item.get("id", {}).get("videoId")
-                    for detail_item in details_response.get("items", []):
-                        if detail_item.get("id") == video_id:
-                            item["contentDetails"] = detail_item.get("contentDetails", {})
-                            item["statistics"] = detail_item.get("statistics", {})
-                            break
+                    detail_item = details.get(item.get("id", {}).get("videoId"))
+                    if detail_item:
+                        item["contentDetails"] = detail_item.get("contentDetails", {})
+                        item["statistics"] = detail_item.get("statistics", {})
 
             return videos
         except HttpError as e:
@@ -712,6 +901,22 @@ class YouTubeClient(AbstractPlatform):
         if not self.client:
             raise ValueError("YouTube client not authenticated")
 
+        # Only send what fits into today's quota; the remaining videos are picked
+        # up as library additions by the next sync of this playlist
+        estimate = self.estimate_export_cost(len(video_ids), existing_playlist_id)
+        if not estimate.fits:
+            # Reserve the units of everything but the inserts, which are cut down to the budget
+            reserve = estimate.total - estimate.cost_by_method.get("playlistItems.insert", 0)
+            budget = self.get_write_budget(reserve=reserve)
+            if budget == 0:
+                raise QuotaExceededError(
+                    f"Exporting needs {estimate.total} YouTube quota units but only {estimate.remaining} remain today"
+                )
+            logger.warning(
+                f"YouTube quota allows {budget} of {len(video_ids)} videos today, deferring the rest to the next sync"
+            )
+            video_ids = video_ids[:budget]
+
         if existing_playlist_id:
             # Update existing playlist
             try:
@@ -721,6 +926,8 @@ class YouTubeClient(AbstractPlatform):
                 if video_ids:
                     self.add_tracks_to_playlist(existing_playlist_id, video_ids)
                 return existing_playlist_id
+            except QuotaExceededError:
+                raise
             except Exception as e:
                 logger.error(f"Error updating existing playlist: {e}")
                 raise ValueError(f"Could not update playlist: {str(e)}") from e
@@ -0,0 +1,387 @@
+"""YouTube Data API quota accounting.
+
+YouTube charges every API call against a daily quota (10,000 units by default)
+that resets at midnight Pacific Time. Costs differ widely per method: a search
+costs 100 units, a list call 1 unit and a write 50 units. This module keeps a
+per-day tally of the units spent, persisted in the settings table, and
+estimates the cost of pending work so callers can defer what doesn't fit.
+"""
+
+import atexit
+import math
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from loguru import logger
+
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.data.types import SyncChanges
+
+# Quota cost per API method, see https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS: dict[str, int] = {
+    "channels.list": 1,
+    "playlists.list": 1,
+    "playlists.insert": 50,
+    "playlists.update": 50,
+    "playlists.delete": 50,
+    "playlistItems.list": 1,
+    "playlistItems.insert": 50,
+    "playlistItems.update": 50,
+    "playlistItems.delete": 50,
+    "search.list": 100,
+    "videos.list": 1,
+}
+
+# Cost assumed for methods missing from QUOTA_COSTS
+DEFAULT_METHOD_COST = 1
+
+# Default daily quota of a YouTube Data API project
+DEFAULT_DAILY_QUOTA = 10_000
+
+# Items returned per page by list endpoints and IDs accepted by videos.list
+PAGE_SIZE = 50
+
+# Unsaved units after which a tracker writes its usage back to the settings table
+SAVE_THRESHOLD_UNITS = 100
+
+# Seconds after which a tracker writes unsaved units back with its next record
+SAVE_INTERVAL_SECONDS = 30.0
+
+# Serializes the read-merge-write of the stored usage between the trackers of this process
+_SAVE_LOCK = threading.Lock()
+
+# Live trackers, flushed when the process exits
+_TRACKERS: "weakref.WeakSet[YouTubeQuotaTracker]" = weakref.WeakSet()
+
+try:
+    _QUOTA_TIMEZONE: timezone | ZoneInfo = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:
+    # No tz database available, approximate Pacific Standard Time
+    _QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+class QuotaExceededError(ValueError):
+    """Raised when a YouTube request would exceed the remaining daily quota."""
+
+
+def method_cost(method: str) -> int:
+    """Get the quota cost of a YouTube API method.
+
+    Args:
+        method: Method name such as "search.list", optionally prefixed with "youtube."
+
+    Returns:
+        Quota units charged for one call
+    """
+    return QUOTA_COSTS.get(method.removeprefix("youtube."), DEFAULT_METHOD_COST)
+
+
+def quota_day(now: datetime | None = None) -> str:
+    """Get the quota day (Pacific Time date) for a point in time.
+
+    Args:
+        now: Point in time (defaults to the current time)
+
+    Returns:
+        ISO date string of the quota day
+    """
+    now = now or datetime.now(_QUOTA_TIMEZONE)
+    return now.astimezone(_QUOTA_TIMEZONE).date().isoformat()
+
+
+@dataclass
+class QuotaEstimate:
+    """Estimated quota cost of a pending operation."""
+
+    # Units per API method
+    cost_by_method: dict[str, int] = field(default_factory=dict)
+
+    # Units left today when the estimate was made
+    remaining: int = DEFAULT_DAILY_QUOTA
+
+    def add(self, method: str, calls: int = 1) -> None:
+        """Add calls of an API method to the estimate.
+
+        Args:
+            method: Method name such as "playlistItems.insert"
+            calls: Number of calls
+        """
+        if calls > 0:
+            self.cost_by_method[method] = self.cost_by_method.get(method, 0) + calls * method_cost(method)
+
+    @property
+    def total(self) -> int:
+        """Total estimated units."""
+        return sum(self.cost_by_method.values())
+
+    @property
+    def fits(self) -> bool:
+        """Whether the operation fits into the remaining daily quota."""
+        return self.total <= self.remaining
+
+
+class YouTubeQuotaTracker:
+    """Per-day tally of YouTube quota units, persisted in the settings table.
+
+    Every client has its own tracker, and several clients may spend quota at
+    the same time. Recorded units are therefore kept as pending deltas and
+    added to the stored usage, re-read right before writing, rather than
+    overwriting it. The deltas are written once SAVE_THRESHOLD_UNITS have
+    accumulated or SAVE_INTERVAL_SECONDS have passed, so a run of cheap calls
+    doesn't commit the settings table on every request. Call flush() to write
+    them right away; units still pending when the process exits are flushed
+    then.
+    """
+
+    SETTINGS_KEY = "youtube_quota_usage"
+    LIMIT_SETTINGS_KEY = "youtube_daily_quota"
+
+    def __init__(self, settings_repo: SettingsRepository, daily_limit: int | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            settings_repo: Repository used to persist the usage
+            daily_limit: Daily quota (defaults to the stored setting or DEFAULT_DAILY_QUOTA)
+        """
+        self.settings_repo = settings_repo
+        self.daily_limit = daily_limit or self._load_limit()
+        self._usage = self._load(quota_day())
+        self._pending = self._empty_pending()
+        self._last_save = time.monotonic()
+        _TRACKERS.add(self)
+
+    def _load_limit(self) -> int:
+        """Load the configured daily quota from the settings table.
+
+        Returns:
+            Daily quota in units
+        """
+        try:
+            return int(self.settings_repo.get_setting_value(self.LIMIT_SETTINGS_KEY, DEFAULT_DAILY_QUOTA))
+        except Exception as e:
+            logger.warning(f"Could not load YouTube daily quota setting: {e}")
+            return DEFAULT_DAILY_QUOTA
+
+    @staticmethod
+    def _empty_pending() -> dict:
+        """Create an empty set of unsaved usage deltas.
+
+        Returns:
+            Pending dictionary with "used", "by_method" and "exhausted" keys
+        """
+        return {"used": 0, "by_method": {}, "exhausted": False}
+
+    def _load(self, day: str) -> dict:
+        """Load a day's usage from the settings table, as last written by any tracker.
+
+        Args:
+            day: Quota day
+
+        Returns:
+            Usage dictionary with "day", "used" and "by_method" keys
+        """
+        try:
+            # Another tracker may have written the usage since this repository loaded it
+            usage = self.settings_repo.get_current_setting_value(self.SETTINGS_KEY)
+        except Exception as e:
+            logger.warning(f"Could not load YouTube quota usage: {e}")
+            usage = None
+
+        if not isinstance(usage, dict) or usage.get("day") != day:
+            return {"day": day, "used": 0, "by_method": {}}
+        return {"day": day, "used": usage.get("used", 0), "by_method": dict(usage.get("by_method", {}))}
+
+    def flush(self) -> None:
+        """Add the unsaved units to the stored usage."""
+        pending = self._pending
+        if not pending["used"] and not pending["exhausted"]:
+            return
+
+        day = self._usage["day"]
+        with _SAVE_LOCK:
+            usage = self._load(day)
+            for method, units in pending["by_method"].items():
+                usage["by_method"][method] = usage["by_method"].get(method, 0) + units
+            usage["used"] += pending["used"]
+            if pending["exhausted"]:
+                usage["used"] = max(usage["used"], self.daily_limit)
+
+            try:
+                self.settings_repo.set_setting(
+                    self.SETTINGS_KEY,
+                    {"day": day, "used": usage["used"], "by_method": dict(usage["by_method"])},
+                    data_type="json",
+                    description="YouTube API quota units used on the current quota day",
+                )
+            except Exception as e:
+                # Keep the units pending to add them with the next save
+                logger.warning(f"Could not save YouTube quota usage: {e}")
+                return
+
+        self._usage = usage
+        self._pending = self._empty_pending()
+        self._last_save = time.monotonic()
+
+    def _roll_over(self) -> None:
+        """Start a new tally when the quota day has changed."""
+        today = quota_day()
+        if self._usage["day"] != today:
+            self.flush()
+            self._usage = {"day": today, "used": 0, "by_method": {}}
+            self._pending = self._empty_pending()
+
+    @property
+    def used(self) -> int:
+        """Units used on the current quota day."""
+        self._roll_over()
+        return self._usage["used"]
+
+    @property
+    def remaining(self) -> int:
+        """Units left on the current quota day."""
+        return max(0, self.daily_limit - self.used)
+
+    def usage_by_method(self) -> dict[str, int]:
+        """Get units used today per API method.
+
+        Returns:
+            Dictionary mapping method name to units used
+        """
+        self._roll_over()
+        return dict(self._usage["by_method"])
+
+    def can_afford(self, units: int) -> bool:
+        """Check whether a cost fits into the remaining daily quota.
+
+        Args:
+            units: Quota units
+
+        Returns:
+            True if the units are available
+        """
+        return units <= self.remaining
+
+    def record(self, method: str, calls: int = 1) -> None:
+        """Record calls of an API method.
+
+        Args:
+            method: Method name, e.g. "youtube.playlistItems.insert"
+            calls: Number of calls
+        """
+        self._roll_over()
+        method = method.removeprefix("youtube.")
+        units = method_cost(method) * calls
+        for usage in (self._usage, self._pending):
+            usage["used"] += units
+            usage["by_method"][method] = usage["by_method"].get(method, 0) + units
+
+        if self._pending["used"] >= SAVE_THRESHOLD_UNITS or time.monotonic() - self._last_save >= SAVE_INTERVAL_SECONDS:
+            self.flush()
+
+    def mark_exhausted(self) -> None:
+        """Mark the daily quota as used up, e.g. after a quotaExceeded error."""
+        self._roll_over()
+        self._usage["used"] = max(self._usage["used"], self.daily_limit)
+        self._pending["exhausted"] = True
+        self.flush()
+
+    def new_estimate(self) -> QuotaEstimate:
+        """Create an empty estimate against the remaining quota.
+
+        Returns:
+            QuotaEstimate with no costs
+        """
+        return QuotaEstimate(remaining=self.remaining)
+
+
+@atexit.register
+def _flush_trackers() -> None:
+    """Write the units still pending in the live trackers."""
+    for tracker in list(_TRACKERS):
+        tracker.flush()
+
+
+def pages(item_count: int) -> int:
+    """Get the number of list pages or videos.list chunks for a number of items.
+
+    Args:
+        item_count: Number of items
+
+    Returns:
+        Number of calls needed (at least one)
+    """
+    return max(1, math.ceil(item_count / PAGE_SIZE))
+
+
+def add_playlist_read(estimate: QuotaEstimate, track_count: int) -> None:
+    """Add the cost of reading a playlist with its video details to an estimate.
+
+    Args:
+        estimate: Estimate to extend
+        track_count: Number of videos in the playlist
+    """
+    estimate.add("playlists.list")
+    estimate.add("playlistItems.list", pages(track_count))
+    estimate.add("videos.list", pages(track_count))
+
+
+def estimate_sync_cost(
+    estimate: QuotaEstimate,
+    changes: SyncChanges,
+    selected_changes: dict[str, bool] | None = None,
+    playlist_size: int = 0,
+) -> QuotaEstimate:
+    """Estimate the cost of applying sync changes to a YouTube playlist.
+
+    Args:
+        estimate: Estimate to extend
+        changes: Changes as returned by PlatformSyncManager.get_sync_changes
+        selected_changes: Optional mapping of change IDs to selection status
+        playlist_size: Number of videos currently in the YouTube playlist
+
+    Returns:
+        The extended estimate
+    """
+
+    def selected(change_list: list) -> int:
+        if selected_changes is None:
+            return len(change_list)
+        return sum(1 for change in change_list if selected_changes.get(change.change_id, False))
+
+    # Importing platform additions looks up the added videos
+    platform_additions = selected(changes.platform_additions)
+    if platform_additions:
+        estimate.add("videos.list", pages(platform_additions))
+
+    if changes.is_personal_playlist:
+        estimate.add("playlistItems.insert", selected(changes.library_additions))
+        estimate.add("playlistItems.delete", selected(changes.library_removals))
+
+    # Saving the sync snapshot reads the playlist once more
+    add_playlist_read(estimate, playlist_size + selected(changes.library_additions))
+    return estimate
+
+
+def estimate_export_cost(
+    estimate: QuotaEstimate, track_count: int, existing_playlist_id: str | None = None
+) -> QuotaEstimate:
+    """Estimate the cost of exporting tracks to a YouTube playlist.
+
+    Args:
+        estimate: Estimate to extend
+        track_count: Number of videos to add
+        existing_playlist_id: ID of an existing playlist to update, if any
+
+    Returns:
+        The extended estimate
+    """
+    if existing_playlist_id:
+        estimate.add("playlists.list")
+    else:
+        estimate.add("playlists.insert")
+    estimate.add("playlistItems.insert", track_count)
+    return estimate
@@ -0,0 +1,325 @@
+"""Tag-independent content hashes of local audio files.
+
+Two files with the same audio but different tags (or the same file after a
+rename) have different bytes overall, but the same audio payload. The hash
+covers only the payload: the regions of the file holding the audio frames,
+without ID3/APE tags, FLAC metadata blocks, MP4 metadata atoms, RIFF/AIFF
+info chunks or Ogg header packets.
+"""
+
+import hashlib
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import BinaryIO
+
+from loguru import logger
+from mutagen import MutagenError
+from mutagen.id3 import ID3
+from mutagen.mp4 import AtomError, Atoms
+from mutagen.ogg import OggPage
+
+from selecta.core.data.repositories.track_repository import TrackRepository
+
+# Bytes read at once while hashing
+READ_CHUNK_SIZE = 1 << 20
+
+# Number of header packets at the start of Ogg Vorbis and Opus streams
+VORBIS_HEADER_PACKETS = 3
+OPUS_HEADER_PACKETS = 2
+
+# Number of files hashed in parallel; hashing mostly waits on disk reads and releases the GIL
+MAX_HASH_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+
+# Tracks hashed and committed per batch by the background pass
+HASH_BATCH_SIZE = 200
+
+# Size of an ID3v1 tag at the end of a file
+_ID3V1_SIZE = 128
+
+# Size of an APEv2 tag header or footer
+_APE_HEADER_SIZE = 32
+
+# Byte ranges (start, end) of a file
+_Ranges = list[tuple[int, int]]
+
+
+def _id3v2_size(path: Path) -> int:
+    """Get the size of the ID3v2 tag at the start of a file.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        Tag size in bytes including its header, 0 without a readable tag
+    """
+    try:
+        return ID3(path).size
+    except MutagenError:
+        return 0
+
+
+def _trailing_tags_start(fileobj: BinaryIO, start: int, end: int) -> int:
+    """Find where the ID3v1 and APEv2 tags at the end of a file begin.
+
+    Args:
+        fileobj: Open audio file
+        start: Start of the audio payload
+        end: File size
+
+    Returns:
+        Offset at which the trailing tags begin, end if there are none
+    """
+    if end - start >= _ID3V1_SIZE:
+        fileobj.seek(end - _ID3V1_SIZE)
+        if fileobj.read(3) == b"TAG":
+            end -= _ID3V1_SIZE
+
+    if end - start >= _APE_HEADER_SIZE:
+        fileobj.seek(end - _APE_HEADER_SIZE)
+        footer = fileobj.read(_APE_HEADER_SIZE)
+        if footer.startswith(b"APETAGEX"):
+            # The size covers the items and the footer; bit 31 of the flags marks an extra header
+            size = int.from_bytes(footer[12:16], "little")
+            has_header = int.from_bytes(footer[20:24], "little") & (1 << 31)
+            end -= size + (_APE_HEADER_SIZE if has_header else 0)
+
+    return max(start, end)
+
+
+def _mpeg_ranges(path: Path, fileobj: BinaryIO, size: int) -> _Ranges:
+    """Locate the audio frames of an MPEG (or other tag-wrapped) stream."""
+    start = _id3v2_size(path)
+    return [(start, _trailing_tags_start(fileobj, start, size))]
+
+
+def _flac_ranges(path: Path, fileobj: BinaryIO, size: int) -> _Ranges:
+    """Locate the audio frames of a FLAC stream after its metadata blocks."""
+    offset = _id3v2_size(path)
+    fileobj.seek(offset)
+    if fileobj.read(4) != b"fLaC":
+        raise ValueError("Not a FLAC stream")
+    offset += 4
+
+    last = False
+    while not last:
+        header = fileobj.read(4)
+        if len(header) < 4:
+            raise ValueError("Truncated FLAC metadata")
+        last = bool(header[0] & 0x80)
+        offset += 4 + int.from_bytes(header[1:4], "big")
+        fileobj.seek(offset)
+
+    return [(offset, _trailing_tags_start(fileobj, offset, size))]
+
+
+def _mp4_ranges(path: Path, fileobj: BinaryIO, size: int) -> _Ranges:
+    """Locate the media data atoms of an MP4 file."""
+    fileobj.seek(0)
+    atoms = Atoms(fileobj)
+    return [
+        (atom.offset + atom.length - atom.datalength, atom.offset + atom.length)
+        for atom in atoms.atoms
+        if atom.name == b"mdat"
+    ]
+
+
+def _iff_ranges(fileobj: BinaryIO, byteorder: str, data_id: bytes, skip: int) -> _Ranges:
+    """Locate the sample data chunk of a RIFF or AIFF file.
+
+    Args:
+        fileobj: Open audio file
+        byteorder: Byte order of the chunk sizes
+        data_id: ID of the chunk holding the samples
+        skip: Bytes at the start of that chunk that aren't samples
+
+    Returns:
+        Byte range of the samples
+    """
+    fileobj.seek(12)
+    while header := fileobj.read(8):
+        if len(header) < 8:
+            break
+        chunk_size = int.from_bytes(header[4:8], byteorder)
+        data_offset = fileobj.tell()
+        if header[:4] == data_id:
+            return [(data_offset + skip, data_offset + chunk_size)]
+        # Chunks are padded to an even size
+        fileobj.seek(data_offset + chunk_size + chunk_size % 2)
+    raise ValueError(f"No {data_id.decode()} chunk")
+
+
+def _wave_ranges(path: Path, fileobj: BinaryIO, size: int) -> _Ranges:
+    """Locate the samples of a WAVE file."""
+    return _iff_ranges(fileobj, "little", b"data", 0)
+
+
+def _aiff_ranges(path: Path, fileobj: BinaryIO, size: int) -> _Ranges:
+    """Locate the samples of an AIFF file, after the SSND offset and block size fields."""
+    return _iff_ranges(fileobj, "big", b"SSND", 8)
+
+
+def _ogg_payload(fileobj: BinaryIO) -> Iterator[bytes]:
+    """Yield the audio packets of an Ogg stream.
+
+    The stream starts with the header packets (identification, comments and,
+    for Vorbis, setup), which are skipped by count: a long comment header spans
+    several pages, so the pages' granule positions can't tell headers apart.
+    The packet data is hashed rather than the pages, since retagging renumbers
+    the pages.
+
+    Args:
+        fileobj: Open audio file
+
+    Yields:
+        Packet data
+    """
+    fileobj.seek(0)
+    header_packets: int | None = None
+    completed_packets = 0
+    while True:
+        try:
+            page = OggPage(fileobj)
+        except EOFError:
+            return
+        for index, data in enumerate(page.packets):
+            if header_packets is None:
+                header_packets = OPUS_HEADER_PACKETS if data.startswith(b"OpusHead") else VORBIS_HEADER_PACKETS
+            if completed_packets >= header_packets:
+                yield data
+            # The last packet of a page continues on the next one unless the page is complete
+            if index < len(page.packets) - 1 or page.complete:
+                completed_packets += 1
+
+
+def _read_ranges(fileobj: BinaryIO, ranges: _Ranges) -> Iterator[bytes]:
+    """Yield the bytes of ranges of a file in chunks.
+
+    Args:
+        fileobj: Open audio file
+        ranges: Byte ranges to read
+
+    Yields:
+        File data
+    """
+    for start, end in ranges:
+        fileobj.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = fileobj.read(min(READ_CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+
+# Payload locators by file extension; other extensions are treated like MPEG streams
+_RANGE_LOCATORS: dict[str, Callable[[Path, BinaryIO, int], _Ranges]] = {
+    ".flac": _flac_ranges,
+    ".m4a": _mp4_ranges,
+    ".mp4": _mp4_ranges,
+    ".wav": _wave_ranges,
+    ".aif": _aiff_ranges,
+    ".aiff": _aiff_ranges,
+}
+
+
+def audio_content_hash(path: str | Path) -> str | None:
+    """Hash the audio payload of a file, ignoring its tags.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        Hex digest of the audio payload, or None if the file can't be read or has no audio
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    digest = hashlib.sha1()
+    payload_size = 0
+
+    try:
+        with open(path, "rb") as fileobj:
+            if suffix in (".ogg", ".oga", ".opus"):
+                payload = _ogg_payload(fileobj)
+            else:
+                locate = _RANGE_LOCATORS.get(suffix, _mpeg_ranges)
+                payload = _read_ranges(fileobj, locate(path, fileobj, os.fstat(fileobj.fileno()).st_size))
+            for data in payload:
+                digest.update(data)
+                payload_size += len(data)
+    except (OSError, ValueError, MutagenError, AtomError) as e:
+        logger.warning(f"Could not hash audio of {path}: {e}")
+        return None
+
+    return digest.hexdigest() if payload_size else None
+
+
+def hash_files(
+    paths: Iterable[str],
+    max_workers: int = MAX_HASH_WORKERS,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> dict[str, str | None]:
+    """Hash the audio payload of files in parallel.
+
+    Args:
+        paths: Audio files
+        max_workers: Number of files hashed at once
+        progress_callback: Called with (files hashed, total files) after each file
+        should_stop: Polled after each file; returning True stops hashing
+
+    Returns:
+        Dictionary mapping each hashed path to its hash (None if it couldn't be hashed)
+    """
+    paths = list(dict.fromkeys(paths))
+    hashes: dict[str, str | None] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(audio_content_hash, path): path for path in paths}
+        for future in as_completed(futures):
+            hashes[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(len(hashes), len(paths))
+            if should_stop and should_stop():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+    return hashes
+
+
+def update_content_hashes(
+    track_repo: TrackRepository | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> int:
+    """Hash the local files of all tracks that don't have a content hash yet.
+
+    Meant to run as a background pass (e.g. through ThreadManager), so it opens
+    its own repository session unless one is given.
+
+    Args:
+        track_repo: Track repository to use
+        progress_callback: Called with (tracks processed, total tracks) after each batch
+        should_stop: Polled between batches; returning True ends the pass early
+
+    Returns:
+        Number of tracks that got a content hash
+    """
+    track_repo = track_repo or TrackRepository()
+    pending = track_repo.get_tracks_without_content_hash()
+    hashed = 0
+
+    for start in range(0, len(pending), HASH_BATCH_SIZE):
+        if should_stop and should_stop():
+            break
+        batch = pending[start : start + HASH_BATCH_SIZE]
+        paths = {track_id: local_path for track_id, local_path in batch if os.path.isfile(local_path)}
+        hashes = hash_files(paths.values())
+        found = {track_id: hashes[path] for track_id, path in paths.items() if hashes.get(path)}
+        track_repo.set_content_hashes(found)
+        hashed += len(found)
+        if progress_callback:
+            progress_callback(start + len(batch), len(pending))
+
+    logger.info(f"Computed content hashes for {hashed} of {len(pending)} tracks")
+    return hashed
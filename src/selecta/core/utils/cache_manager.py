@@ -129,3 +129,29 @@ class CacheManager:
         fresh_data = data_getter()
         self.set(key, fresh_data, timeout)
         return fresh_data
+
+    def get_or_refresh(
+        self,
+        key: str,
+        data_getter: Callable[[], Any],
+        refresher: Callable[[Any], Any],
+        timeout: float | None = None,
+    ) -> Any:
+        """Get cached data, refreshing an expired entry instead of fetching it again.
+
+        Args:
+            key: Cache key
+            data_getter: Function to call to get fresh data if nothing is cached
+            refresher: Function to call with the expired data to get it up to date
+            timeout: Optional custom timeout
+
+        Returns:
+            Cached, refreshed or fresh data
+        """
+        if self.has_valid(key, timeout):
+            return self.get(key)
+
+        stale = self.get(key, ignore_expiry=True)
+        fresh_data = refresher(stale) if stale else data_getter()
+        self.set(key, fresh_data, timeout)
+        return fresh_data
@@ -0,0 +1,221 @@
+"""Import of embedded cover art from local audio files.
+
+Covers are imported for all local tracks without an image in a staged pipeline:
+
+- The tracks are fetched in one query. Tracks whose files the tag cache knows
+  to have no cover art are skipped, and tracks known to share a cover (the
+  tracks of an album, usually) are grouped, so each cover is read once.
+- Covers are read from the files in a thread pool, since reading mostly waits
+  on the disk.
+- Identical covers are recognized by their digest, and each distinct cover is
+  resized in a process pool, since resizing is CPU-bound.
+- The resized covers are written in batched transactions.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from loguru import logger
+
+from selecta.core.data.models.db import ImageSize
+from selecta.core.data.repositories.image_repository import ImageRepository, ResizedImage, resize_image
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.tag_cache import TagCache, read_embedded_art
+
+# Source recorded for imported covers
+COVER_SOURCE = "audio_metadata"
+
+# Number of files covers are read from at once; reading mostly waits on the disk
+MAX_READ_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+
+# Maximum number of resizing processes
+MAX_PROCESSES = min(4, os.cpu_count() or 1)
+
+# Number of covers to read from which they are resized across processes
+PROCESS_POOL_MIN_COVERS = 200
+
+# Reads and resizes in flight at once, bounding the covers held in memory
+MAX_IN_FLIGHT = 64
+
+# Tracks whose covers are written per transaction
+WRITE_BATCH_SIZE = 200
+
+# Resized covers kept for tracks that turn out to share a cover the tag cache didn't know about
+RESIZED_CACHE_SIZE = 256
+
+
+@dataclass
+class CoverImportResult:
+    """Outcome of a cover import."""
+
+    imported: int = 0
+    without_art: int = 0
+    failed: int = 0
+    unique_covers: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Number of tracks processed."""
+        return self.imported + self.without_art + self.failed
+
+    @property
+    def tracks_per_second(self) -> float:
+        """Number of tracks processed per second."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+def _read_art(path: str) -> bytes | None:
+    """Read the cover art of a file, in a reader thread.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    return read_embedded_art(path)
+
+
+def _resize_cover(data: bytes) -> list[ResizedImage]:
+    """Resize a cover to all image sizes, in a worker process.
+
+    Covers that can't be resized are kept as they are at medium size.
+    """
+    try:
+        return resize_image(data)
+    except Exception as e:
+        logger.warning(f"Could not resize cover, storing the original: {e}")
+        return [(ImageSize.MEDIUM, data, "image/jpeg", None, None)]
+
+
+def import_covers(
+    track_repo: TrackRepository | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> CoverImportResult:
+    """Import the embedded cover art of all local tracks without an image.
+
+    Args:
+        track_repo: Track repository to use (opens its own session if not given)
+        progress_callback: Called with (tracks processed, total tracks) as tracks are processed
+        should_stop: Polled as tracks are processed; returning True stops the import after
+            writing the covers already resized
+
+    Returns:
+        Outcome of the import
+    """
+    started = time.monotonic()
+    track_repo = track_repo or TrackRepository()
+    image_repo = ImageRepository(track_repo.session)
+    pending = track_repo.get_local_tracks_without_images()
+    digests = TagCache(track_repo.session).art_digests(path for _, path in pending)
+    result = CoverImportResult()
+
+    # Tracks per file to read, with one file per cover known to the tag cache
+    reads: dict[str, list[int]] = {}
+    cover_paths: dict[str, str] = {}
+    for track_id, path in pending:
+        if path in digests:
+            digest = digests[path]
+            if digest is None:
+                result.without_art += 1
+                continue
+            path = cover_paths.setdefault(digest, path)
+        reads.setdefault(path, []).append(track_id)
+
+    resized: OrderedDict[str, list[ResizedImage]] = OrderedDict()
+    # Tracks waiting for each cover being resized
+    waiting: dict[str, list[int]] = {}
+    writes: list[tuple[int, list[ResizedImage]]] = []
+
+    def report() -> None:
+        if progress_callback:
+            progress_callback(result.processed + len(writes), len(pending))
+
+    def flush() -> None:
+        if not writes:
+            return
+        try:
+            image_repo.add_track_images(writes, source=COVER_SOURCE)
+            result.imported += len(writes)
+        except Exception as e:
+            logger.exception(f"Error storing {len(writes)} covers: {e}")
+            track_repo.session.rollback()
+            result.failed += len(writes)
+        writes.clear()
+
+    def write(track_ids: list[int], images: list[ResizedImage]) -> None:
+        writes.extend((track_id, images) for track_id in track_ids)
+        if len(writes) >= WRITE_BATCH_SIZE:
+            flush()
+
+    if len(reads) >= PROCESS_POOL_MIN_COVERS and MAX_PROCESSES > 1:
+        resizers: Executor = ProcessPoolExecutor(max_workers=MAX_PROCESSES)
+    else:
+        resizers = ThreadPoolExecutor(max_workers=1)
+    queue = iter(reads.items())
+    # Stage of each future in flight: the tracks of a read, or the digest of a resize
+    in_flight: dict[Future, list[int] | str] = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as readers, resizers:
+        stopped = False
+        while True:
+            while not stopped and len(in_flight) < MAX_IN_FLIGHT and (item := next(queue, None)):
+                path, track_ids = item
+                in_flight[readers.submit(_read_art, path)] = track_ids
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = in_flight.pop(future)
+                if isinstance(key, str):
+                    images = future.result()
+                    result.unique_covers += 1
+                    resized[key] = images
+                    if len(resized) > RESIZED_CACHE_SIZE:
+                        resized.popitem(last=False)
+                    write(waiting.pop(key), images)
+                    continue
+
+                try:
+                    data = future.result()
+                except OSError as e:
+                    logger.warning(f"Could not read cover art: {e}")
+                    result.failed += len(key)
+                    continue
+                if not data:
+                    result.without_art += len(key)
+                    continue
+
+                digest = hashlib.sha1(data).hexdigest()
+                if digest in resized:
+                    resized.move_to_end(digest)
+                    write(key, resized[digest])
+                elif digest in waiting:
+                    waiting[digest].extend(key)
+                else:
+                    waiting[digest] = list(key)
+                    in_flight[resizers.submit(_resize_cover, data)] = digest
+
+            report()
+            if not stopped and should_stop and should_stop():
+                # Let the resizes in flight finish, so no cover read is wasted
+                stopped = True
+                for future, key in list(in_flight.items()):
+                    if isinstance(key, list) and future.cancel():
+                        del in_flight[future]
+
+    flush()
+    result.elapsed = time.monotonic() - started
+    report()
+    logger.info(
+        f"Imported covers for {result.imported} of {len(pending)} tracks ({result.unique_covers} distinct covers, "
+        f"{result.without_art} without art, {result.failed} failed) at {result.tracks_per_second:.0f} tracks/s"
+    )
+    return result
@@ -0,0 +1,251 @@
+"""Candidate blocking for duplicate detection.
+
+Scoring every pair of tracks is quadratic in the collection size. Since the
+duplicate score weights title, artist and duration (see track_matching), a
+pair can only reach a threshold if both its artist and its title similarity
+reach a minimum. The blocking stage uses that to propose the pairs worth
+scoring:
+
+1. Similar artists are found among the distinct normalized artist names,
+   through an inverted index of character trigrams with prefix filtering:
+   each name only probes the index with its rarest trigrams. Only names whose
+   trigram sets overlap enough are compared, which is a heuristic: short or
+   transposed names can reach the artist similarity without sharing trigrams.
+2. Within each block of tracks by similar artists, pairs whose title lengths
+   can still reach the minimum title similarity become candidates. Very large
+   blocks (e.g. "Various Artists") only pair tracks sharing title trigrams or
+   a duration bucket, so they don't turn quadratic again.
+
+The candidates are therefore not guaranteed to include every pair above the
+threshold: pairs whose artist names share too few trigrams, and pairs in
+oversized blocks sharing neither title trigrams nor a duration bucket, are
+never proposed. The caller scores the candidates to decide what is a
+duplicate; scripts/python/benchmark_duplicate_detection.py measures the recall
+against brute-force scoring.
+"""
+
+import itertools
+import math
+from collections import Counter, defaultdict
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from selecta.core.utils.track_matching import (
+    ARTIST_WEIGHT,
+    DURATION_WEIGHT,
+    TITLE_WEIGHT,
+    normalize_artist,
+    normalize_title,
+    text_similarity,
+)
+
+# Jaccard similarity of the trigram sets of two artist names from which they are compared;
+# similar artists below it are missed, so lowering it trades speed for recall
+ARTIST_TRIGRAM_SIMILARITY = 0.2
+
+# Jaccard similarity of the title trigram sets from which tracks in oversized blocks are paired
+TITLE_TRIGRAM_SIMILARITY = 0.3
+
+# Width of the duration buckets in seconds
+DURATION_BUCKET_SECONDS = 5
+
+# Number of track pairs from which an artist block is only paired by title trigrams and duration
+MAX_BLOCK_PAIRS = 20_000
+
+
+@dataclass(slots=True)
+class BlockingRecord:
+    """Normalized fields of a track used for blocking."""
+
+    title_key: str
+    artist_key: str
+    duration_ms: int | None = None
+
+
+def track_record(track: Any) -> BlockingRecord:
+    """Build the blocking record of a track.
+
+    Args:
+        track: Track with title, artist and duration, and ideally precomputed keys
+
+    Returns:
+        Blocking record of the track
+    """
+    # Fall back to normalizing for rows that predate the key columns
+    title_key = getattr(track, "title_key", None) or normalize_title(track.title)
+    artist_key = getattr(track, "artist_key", None) or normalize_artist(track.artist)
+    return BlockingRecord(title_key, artist_key, track.duration_ms)
+
+
+def min_component_similarity(threshold: float) -> tuple[float, float]:
+    """Get the artist and title similarity a pair needs to be able to reach a score.
+
+    Args:
+        threshold: Duplicate score threshold
+
+    Returns:
+        Tuple of (minimum artist similarity, minimum title similarity)
+    """
+    min_artist = (threshold - TITLE_WEIGHT - DURATION_WEIGHT) / ARTIST_WEIGHT
+    min_title = (threshold - ARTIST_WEIGHT - DURATION_WEIGHT) / TITLE_WEIGHT
+    return max(min_artist, 0.0), max(min_title, 0.0)
+
+
+def trigrams(text: str) -> set[str]:
+    """Get the character trigrams of a normalized string.
+
+    The text is padded, so short strings and word boundaries yield trigrams too.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        Set of trigrams
+    """
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def similar_token_sets(token_sets: Sequence[set[str]], min_jaccard: float) -> set[tuple[int, int]]:
+    """Find the pairs of token sets that may reach a Jaccard similarity.
+
+    Args:
+        token_sets: Token set per item
+        min_jaccard: Jaccard similarity the pairs need to be able to reach
+
+    Returns:
+        Set of (i, j) index pairs with i < j
+    """
+    # Order tokens from rare to frequent, so the probed prefixes hit short posting lists
+    frequency = Counter(token for tokens in token_sets for token in tokens)
+    index: dict[str, list[int]] = defaultdict(list)
+    pairs: set[tuple[int, int]] = set()
+
+    for j, tokens in enumerate(token_sets):
+        if not tokens:
+            continue
+        ordered = sorted(tokens, key=lambda token: (frequency[token], token))
+        # Two sets with Jaccard >= t share a token within the first len - ceil(t * len) + 1 of each
+        prefix_length = len(ordered) - math.ceil(min_jaccard * len(ordered)) + 1
+        for token in ordered[:prefix_length]:
+            postings = index[token]
+            pairs.update((i, j) for i in postings)
+            postings.append(j)
+
+    return pairs
+
+
+def _similar_artists(artist_keys: list[str], min_similarity: float) -> list[tuple[int, int]]:
+    """Find the pairs of distinct artist names that reach a similarity.
+
+    Args:
+        artist_keys: Distinct normalized artist names
+        min_similarity: Minimum artist similarity
+
+    Returns:
+        List of (i, j) index pairs with i <= j, including every artist paired with itself
+    """
+    pairs = [(i, i) for i in range(len(artist_keys))]
+    if min_similarity <= 0:
+        return pairs + list(itertools.combinations(range(len(artist_keys)), 2))
+
+    candidates = similar_token_sets([trigrams(key) for key in artist_keys], ARTIST_TRIGRAM_SIMILARITY)
+    pairs.extend(
+        (i, j) for i, j in candidates if text_similarity(artist_keys[i], artist_keys[j]) >= min_similarity
+    )
+    return pairs
+
+
+def _lengths_compatible(length_a: int, length_b: int, min_similarity: float) -> bool:
+    """Check whether two strings' lengths allow a SequenceMatcher ratio.
+
+    The ratio 2 * matches / (len_a + len_b) can't exceed 2 * min / (len_a + len_b).
+
+    Args:
+        length_a: Length of the first string
+        length_b: Length of the second string
+        min_similarity: Ratio to reach
+
+    Returns:
+        True if the ratio is reachable
+    """
+    total = length_a + length_b
+    return total == 0 or 2 * min(length_a, length_b) >= min_similarity * total
+
+
+def _oversized_block_pairs(records: Sequence[BlockingRecord], block: list[int]) -> Iterable[tuple[int, int]]:
+    """Pair the tracks of an oversized block by title trigrams and duration buckets.
+
+    Args:
+        records: All blocking records
+        block: Indices of the records in the block
+
+    Yields:
+        (i, j) record index pairs
+    """
+    token_sets = [trigrams(records[index].title_key) for index in block]
+    for a, b in similar_token_sets(token_sets, TITLE_TRIGRAM_SIMILARITY):
+        yield block[a], block[b]
+
+    buckets: dict[int, list[int]] = defaultdict(list)
+    for index in block:
+        duration_ms = records[index].duration_ms
+        if duration_ms:
+            bucket = duration_ms // (DURATION_BUCKET_SECONDS * 1000)
+            for neighbour in (bucket - 1, bucket, bucket + 1):
+                yield from ((other, index) for other in buckets.get(neighbour, ()))
+            buckets[bucket].append(index)
+
+
+def candidate_pairs(
+    records: Sequence[BlockingRecord], threshold: float, new: Collection[int] | None = None
+) -> list[tuple[int, int]]:
+    """Propose the pairs of records worth scoring as duplicates.
+
+    Args:
+        records: Blocking records, one per track
+        threshold: Duplicate score threshold the pairs are scored against
+        new: If given, only propose pairs involving at least one of these record indices
+
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
+    """
+    min_artist, min_title = min_component_similarity(threshold)
+    new = None if new is None else set(new)
+
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for index, record in enumerate(records):
+        blocks[record.artist_key].append(index)
+    artist_keys = list(blocks)
+    new_blocks = {key: [index for index in block if index in new] for key, block in blocks.items()} if new else {}
+
+    pairs: set[tuple[int, int]] = set()
+    for a, b in _similar_artists(artist_keys, min_artist):
+        block_a, block_b = blocks[artist_keys[a]], blocks[artist_keys[b]]
+        if new is not None:
+            new_a, new_b = new_blocks.get(artist_keys[a], []), new_blocks.get(artist_keys[b], [])
+            if not new_a and not new_b:
+                continue
+        if a == b:
+            block_pairs: Iterable[tuple[int, int]] = itertools.combinations(block_a, 2)
+            pair_count = len(block_a) * (len(block_a) - 1) // 2
+        else:
+            block_pairs = itertools.product(block_a, block_b)
+            pair_count = len(block_a) * len(block_b)
+
+        if pair_count > MAX_BLOCK_PAIRS:
+            block_pairs = _oversized_block_pairs(records, sorted(set(block_a) | set(block_b)))
+        elif new is not None:
+            # Only pair the new tracks of each block with the other block
+            block_pairs = itertools.chain(
+                ((i, j) for i in new_a for j in block_b), ((i, j) for i in block_a for j in new_b)
+            )
+
+        for i, j in block_pairs:
+            if new is not None and i not in new and j not in new:
+                continue
+            if _lengths_compatible(len(records[i].title_key), len(records[j].title_key), min_title):
+                pairs.add((i, j) if i < j else (j, i))
+
+    return sorted(pair for pair in pairs if pair[0] != pair[1])
@@ -1,6 +1,8 @@
 """Utilities for detecting potential duplicate tracks in the collection."""
 
-import difflib
+import itertools
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from loguru import logger
@@ -8,9 +10,81 @@ from loguru import logger
 from selecta.core.data.database import get_session
 from selecta.core.data.repositories.playlist_repository import PlaylistRepository
 from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.duplicate_blocking import candidate_pairs, track_record
+from selecta.core.utils.duplicate_index import INDEX_MIN_SIMILARITY, DuplicateIndex
+from selecta.core.utils.duplicate_scoring import PairScorer
+from selecta.core.utils.track_matching import match_score
 from selecta.core.utils.type_helpers import column_to_bool, column_to_int, column_to_str
 
 
+def calculate_similarity(track1: Any, track2: Any) -> float:
+    """Calculate the duplicate similarity of two tracks.
+
+    Args:
+        track1: First track
+        track2: Second track
+
+    Returns:
+        Similarity score (0.0-1.0)
+    """
+    a, b = track_record(track1), track_record(track2)
+    return match_score(a.title_key, a.artist_key, a.duration_ms, b.title_key, b.artist_key, b.duration_ms)
+
+
+def find_duplicate_pairs(
+    tracks: Sequence[Any],
+    threshold: float,
+    blocking: bool = True,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> dict[int, list[tuple[int, float]]]:
+    """Find the pairs of tracks that are similar enough to be duplicates.
+
+    Args:
+        tracks: Tracks to compare
+        threshold: Similarity from which a pair counts as duplicate (0.0-1.0)
+        blocking: If False, score every pair one by one (quadratic, for comparison only)
+        progress_callback: Called with (pairs scored, total pairs) while scoring
+        should_stop: Polled while scoring; returning True ends the scoring early
+
+    Returns:
+        Dictionary mapping the index of a track to (index, similarity) pairs of its duplicates
+        with higher indices, ordered by index. Incomplete if should_stop ended the scoring.
+    """
+    duplicates: dict[int, list[tuple[int, float]]] = defaultdict(list)
+
+    if not blocking:
+        for i, j in itertools.combinations(range(len(tracks)), 2):
+            similarity = calculate_similarity(tracks[i], tracks[j])
+            if similarity >= threshold:
+                duplicates[i].append((j, similarity))
+        return duplicates
+
+    records = [track_record(track) for track in tracks]
+    pairs = candidate_pairs(records, threshold)
+    result = PairScorer(records).score(pairs, threshold, progress_callback, should_stop)
+    for i, j, similarity in result.matches:
+        duplicates[i].append((j, similarity))
+    return duplicates
+
+
+def exact_duplicate_pairs(tracks: Sequence[Any]) -> list[tuple[int, int]]:
+    """Find the pairs of tracks whose local files have the same audio content.
+
+    Args:
+        tracks: Tracks to compare
+
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
+    """
+    by_hash: dict[str, list[int]] = defaultdict(list)
+    for index, track in enumerate(tracks):
+        content_hash = getattr(track, "content_hash", None)
+        if content_hash:
+            by_hash[content_hash].append(index)
+    return sorted(pair for indices in by_hash.values() for pair in itertools.combinations(indices, 2))
+
+
 class DuplicateDetector:
     """Utility for detecting potential duplicate tracks in the collection."""
 
@@ -19,6 +93,7 @@ class DuplicateDetector:
         self.session = get_session()
         self.track_repo = TrackRepository(self.session)
         self.playlist_repo = PlaylistRepository(self.session)
+        self.index = DuplicateIndex(self.session)
 
     def get_collection_playlist_id(self) -> int | None:
         """Get the ID of the Collection playlist.
@@ -34,14 +109,21 @@ class DuplicateDetector:
 
         return None
 
-    def find_potential_duplicates(self, threshold: float = 0.85) -> list[dict[str, Any]]:
+    def find_potential_duplicates(
+        self,
+        threshold: float = 0.85,
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[dict[str, Any]]:
         """Find potential duplicate tracks in the Collection.
 
         Args:
             threshold: Similarity threshold for considering tracks as potential duplicates (0.0-1.0)
+            progress_callback: Called with (pairs scored, total pairs) while scoring
+            should_stop: Polled while scoring; returning True cancels the scan
 
         Returns:
-            List of potential duplicate groups with track information
+            List of potential duplicate groups with track information, empty if cancelled
         """
         # Get Collection playlist ID
         collection_id = self.get_collection_playlist_id()
@@ -52,56 +134,50 @@ class DuplicateDetector:
         try:
             tracks = self.playlist_repo.get_playlist_tracks(collection_id)
 
+            if threshold >= INDEX_MIN_SIMILARITY:
+                # Only score new or changed tracks, then look the pairs up
+                if not self.index.update(tracks, progress_callback, should_stop):
+                    logger.info("Duplicate scan cancelled")
+                    return []
+                duplicates_by_index = self.index.lookup(tracks, threshold)
+            else:
+                # The index doesn't hold pairs this dissimilar, so scan the whole Collection
+                duplicates_by_index = find_duplicate_pairs(
+                    tracks, threshold, progress_callback=progress_callback, should_stop=should_stop
+                )
+                if should_stop and should_stop():
+                    logger.info("Duplicate scan cancelled")
+                    return []
+
+            # Tracks with the same audio are duplicates whatever their tags say
+            for i, j in exact_duplicate_pairs(tracks):
+                matches = [match for match in duplicates_by_index.get(i, []) if match[0] != j]
+                duplicates_by_index[i] = sorted([*matches, (j, 1.0)])
+
             # Group potential duplicates
             potential_duplicates = []
-            processed_track_ids = set()
+            processed = set()
 
             for i, track1 in enumerate(tracks):
                 # Skip if this track is already in a duplicate group
-                if track1.id in processed_track_ids:
+                if i in processed:
                     continue
 
                 duplicates = []
 
-                for _, track2 in enumerate(tracks[i + 1 :], i + 1):
+                for j, similarity in duplicates_by_index.get(i, []):
                     # Skip if this track is already in a duplicate group
-                    if track2.id in processed_track_ids:
+                    if j in processed:
                         continue
 
-                    # Calculate similarity based on artist and title
-                    similarity = self._calculate_similarity(track1, track2)
-
-                    # If similar, add to duplicates
-                    if similarity >= threshold:
-                        # Add the first track if this is the first duplicate found
-                        if not duplicates:
-                            duplicates.append(
-                                {
-                                    "id": track1.id,
-                                    "title": track1.title,
-                                    "artist": track1.artist,
-                                    "album": track1.album or "",
-                                    "duration_ms": track1.duration_ms,
-                                    "platforms": self._get_track_platforms(track1),
-                                    "local_path": track1.local_path or "",
-                                }
-                            )
-                            processed_track_ids.add(track1.id)
-
-                        # Add the duplicate track
-                        duplicates.append(
-                            {
-                                "id": track2.id,
-                                "title": track2.title,
-                                "artist": track2.artist,
-                                "album": track2.album or "",
-                                "duration_ms": track2.duration_ms,
-                                "platforms": self._get_track_platforms(track2),
-                                "local_path": track2.local_path or "",
-                                "similarity": similarity,
-                            }
-                        )
-                        processed_track_ids.add(track2.id)
+                    # Add the first track if this is the first duplicate found
+                    if not duplicates:
+                        duplicates.append(self._track_entry(track1))
+                        processed.add(i)
+
+                    # Add the duplicate track
+                    duplicates.append({**self._track_entry(tracks[j]), "similarity": similarity})
+                    processed.add(j)
 
                 # If duplicates found, add the group
                 if duplicates:
@@ -123,27 +199,26 @@ class DuplicateDetector:
         Returns:
             Similarity score (0.0-1.0)
         """
-        # Compare titles
-        title_similarity = difflib.SequenceMatcher(None, track1.title.lower(), track2.title.lower()).ratio()
-
-        # Compare artists
-        artist_similarity = difflib.SequenceMatcher(None, track1.artist.lower(), track2.artist.lower()).ratio()
+        return calculate_similarity(track1, track2)
 
-        # Compare duration if available
-        duration_similarity = 1.0
-        if track1.duration_ms and track2.duration_ms:
-            # If duration differs by less than 3 seconds, consider them similar
-            duration_diff_seconds = abs(track1.duration_ms - track2.duration_ms) / 1000
-            duration_similarity = 1.0 if duration_diff_seconds < 3 else max(0, 1.0 - duration_diff_seconds / 30)
+    def _track_entry(self, track: Any) -> dict[str, Any]:
+        """Describe a track for the duplicate and orphan listings.
 
-        # Weight the factors
-        weighted_similarity = (
-            (title_similarity * 0.5)  # Title is very important
-            + (artist_similarity * 0.4)  # Artist is important
-            + (duration_similarity * 0.1)  # Duration is a secondary factor
-        )
+        Args:
+            track: Track to describe
 
-        return weighted_similarity
+        Returns:
+            Dictionary with the track information shown in the dialog
+        """
+        return {
+            "id": track.id,
+            "title": track.title,
+            "artist": track.artist,
+            "album": track.album or "",
+            "duration_ms": track.duration_ms,
+            "platforms": self._get_track_platforms(track),
+            "local_path": track.local_path or "",
+        }
 
     def _get_track_platforms(self, track: Any) -> list[str]:
         """Get the list of platforms where the track is available.
@@ -160,9 +235,13 @@ class DuplicateDetector:
 
         return platforms
 
-    def find_orphaned_tracks(self) -> list[dict[str, Any]]:
+    def find_orphaned_tracks(self, limit: int | None = None, offset: int = 0) -> list[dict[str, Any]]:
         """Find tracks in Collection that aren't in any other playlists.
 
+        Args:
+            limit: Maximum number of tracks to return (None for all)
+            offset: Number of orphaned tracks to skip, for paging
+
         Returns:
             List of orphaned tracks with track information
         """
@@ -172,50 +251,20 @@ class DuplicateDetector:
             return []
 
         try:
-            # Get all playlists
-            playlists = self.playlist_repo.get_all()
-
-            # Get all tracks in Collection
-            collection_tracks = self.playlist_repo.get_playlist_tracks(collection_id)
-            collection_track_ids = {track.id for track in collection_tracks}
-
-            # Track which tracks appear in other playlists
-            tracks_in_playlists = set()
-
-            # For each playlist except Collection
-            for playlist in playlists:
-                # Skip Collection and folders
-                if playlist.id == collection_id or playlist.is_folder:
-                    continue
-
-                # Get tracks in this playlist
-                playlist_tracks = self.playlist_repo.get_playlist_tracks(playlist.id)
-
-                # Add to the set of tracks in playlists
-                for track in playlist_tracks:
-                    tracks_in_playlists.add(track.id)
-
-            # Find orphaned tracks (in Collection but not in any other playlist)
-            orphaned_track_ids = collection_track_ids - tracks_in_playlists
-
-            # Get full track information for orphaned tracks
-            orphaned_tracks = []
-            for track in collection_tracks:
-                if track.id in orphaned_track_ids:
-                    orphaned_tracks.append(
-                        {
-                            "id": track.id,
-                            "title": track.title,
-                            "artist": track.artist,
-                            "album": track.album or "",
-                            "duration_ms": track.duration_ms,
-                            "platforms": self._get_track_platforms(track),
-                            "local_path": track.local_path or "",
-                        }
-                    )
-
-            return orphaned_tracks
+            tracks = self.playlist_repo.get_orphaned_tracks(collection_id, limit, offset)
+            return [self._track_entry(track) for track in tracks]
 
         except Exception as e:
             logger.exception(f"Error finding orphaned tracks: {e}")
             return []
+
+    def count_orphaned_tracks(self) -> int:
+        """Count the tracks in Collection that aren't in any other playlists.
+
+        Returns:
+            Number of orphaned tracks
+        """
+        collection_id = self.get_collection_playlist_id()
+        if not collection_id:
+            return 0
+        return self.playlist_repo.count_orphaned_tracks(collection_id)
@@ -0,0 +1,165 @@
+"""Persistent index of potential duplicate tracks.
+
+Scanning the Collection for duplicates scores candidate pairs of all tracks,
+although most of them haven't changed since the last scan. The index stores
+a signature per scored track and the pairs scored above INDEX_MIN_SIMILARITY:
+
+- Tracks whose signature is missing or differs (inserted or edited since the
+  last scan) are scored again, against the whole Collection.
+- Tracks no longer in the Collection, or merged into another track, are
+  removed from the index.
+
+Showing duplicates is then a lookup of the stored pairs above the threshold.
+"""
+
+import hashlib
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import delete, insert, or_
+from sqlalchemy.orm import Session
+
+from selecta.core.data.models.db import DuplicatePair, DuplicateSignature
+from selecta.core.data.repositories.track_repository import KEY_CHUNK_SIZE
+from selecta.core.utils.duplicate_blocking import candidate_pairs, track_record
+from selecta.core.utils.duplicate_scoring import PairScorer
+
+# Similarity down to which pairs are stored; scans with a lower threshold bypass the index
+INDEX_MIN_SIMILARITY = 0.75
+
+
+def track_signature(track: Any) -> str:
+    """Get the signature of the fields the duplicate score compares.
+
+    Args:
+        track: Track to sign
+
+    Returns:
+        Hex digest of the normalized title, artist and duration
+    """
+    record = track_record(track)
+    fields = f"{record.title_key}\0{record.artist_key}\0{record.duration_ms or ''}"
+    return hashlib.sha1(fields.encode()).hexdigest()
+
+
+class DuplicateIndex:
+    """Stored duplicate pairs of the Collection, updated incrementally."""
+
+    def __init__(self, session: Session):
+        """Initialize the duplicate index.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    def update(
+        self,
+        tracks: Sequence[Any],
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Bring the index up to date with the tracks of the Collection.
+
+        Only tracks that are new or changed since they were indexed are scored.
+
+        Args:
+            tracks: All tracks of the Collection
+            progress_callback: Called with (pairs scored, total pairs) while scoring
+            should_stop: Polled while scoring; returning True cancels the update
+
+        Returns:
+            True if the index is up to date, False if the update was cancelled
+        """
+        stored = dict(self.session.query(DuplicateSignature.track_id, DuplicateSignature.signature).all())
+        signatures = [track_signature(track) for track in tracks]
+
+        # Drop tracks that left the Collection
+        removed = stored.keys() - {track.id for track in tracks}
+        self._delete(removed)
+
+        stale = [index for index, track in enumerate(tracks) if stored.get(track.id) != signatures[index]]
+        if not stale:
+            self.session.commit()
+            return True
+
+        logger.info(f"Scoring {len(stale)} new or changed tracks for the duplicate index")
+        stale_ids = [tracks[index].id for index in stale]
+        self._delete(stale_ids)
+
+        records = [track_record(track) for track in tracks]
+        pairs = candidate_pairs(records, INDEX_MIN_SIMILARITY, new=stale)
+        result = PairScorer(records).score(pairs, INDEX_MIN_SIMILARITY, progress_callback, should_stop)
+        if not result.complete:
+            self.session.rollback()
+            return False
+
+        pair_rows = []
+        for i, j, similarity in result.matches:
+            track_id, other_track_id = sorted((tracks[i].id, tracks[j].id))
+            pair_rows.append({"track_id": track_id, "other_track_id": other_track_id, "similarity": similarity})
+        if pair_rows:
+            self.session.execute(insert(DuplicatePair), pair_rows)
+        self.session.execute(
+            insert(DuplicateSignature),
+            [{"track_id": tracks[index].id, "signature": signatures[index]} for index in stale],
+        )
+        self.session.commit()
+        return True
+
+    def lookup(self, tracks: Sequence[Any], threshold: float) -> dict[int, list[tuple[int, float]]]:
+        """Look up the stored duplicate pairs among tracks.
+
+        Args:
+            tracks: Tracks to look up, usually the Collection
+            threshold: Minimum similarity, at least INDEX_MIN_SIMILARITY
+
+        Returns:
+            Dictionary mapping the index of a track to (index, similarity) pairs of its duplicates
+            with higher indices, ordered by index (like duplicate_detector.find_duplicate_pairs)
+        """
+        if threshold < INDEX_MIN_SIMILARITY:
+            raise ValueError(f"The duplicate index only holds pairs from similarity {INDEX_MIN_SIMILARITY}")
+
+        positions = {track.id: index for index, track in enumerate(tracks)}
+        rows = (
+            self.session.query(DuplicatePair.track_id, DuplicatePair.other_track_id, DuplicatePair.similarity)
+            .filter(DuplicatePair.similarity >= threshold)
+            .all()
+        )
+
+        duplicates: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for track_id, other_track_id, similarity in rows:
+            if track_id in positions and other_track_id in positions:
+                i, j = sorted((positions[track_id], positions[other_track_id]))
+                duplicates[i].append((j, similarity))
+        for matches in duplicates.values():
+            matches.sort()
+        return duplicates
+
+    def remove_tracks(self, track_ids: Iterable[int]) -> None:
+        """Remove tracks and their pairs from the index, e.g. after merging them.
+
+        Args:
+            track_ids: IDs of the tracks to remove
+        """
+        self._delete(track_ids)
+        self.session.commit()
+
+    def _delete(self, track_ids: Iterable[int]) -> None:
+        """Delete the signatures and pairs of tracks without committing.
+
+        Args:
+            track_ids: IDs of the tracks to delete
+        """
+        track_ids = list(track_ids)
+        for start in range(0, len(track_ids), KEY_CHUNK_SIZE):
+            chunk = track_ids[start : start + KEY_CHUNK_SIZE]
+            self.session.execute(delete(DuplicateSignature).where(DuplicateSignature.track_id.in_(chunk)))
+            self.session.execute(
+                delete(DuplicatePair).where(
+                    or_(DuplicatePair.track_id.in_(chunk), DuplicatePair.other_track_id.in_(chunk))
+                )
+            )
@@ -0,0 +1,307 @@
+"""Vectorized scoring of duplicate candidate pairs.
+
+The exact duplicate score (see track_matching.match_score) relies on difflib,
+which costs a Python-level sequence comparison per pair. Most candidate pairs
+from the blocking stage are far from the threshold, so they are ruled out in
+NumPy batches first:
+
+- Titles and artists are encoded as hashed character histograms. The shared
+  characters of two strings bound their SequenceMatcher ratio from above
+  (ratio <= 2 * shared / total length), and hashing characters into bins can
+  only increase the overlap, so the bound stays valid.
+- The duration similarity is computed exactly on arrays.
+
+Pairs whose upper-bound score stays below the threshold can't be duplicates
+and are dropped without losing any. The rest is scored exactly with difflib,
+spread across a process pool when there are many of them.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import numpy as np
+from loguru import logger
+
+from selecta.core.utils.duplicate_blocking import BlockingRecord
+from selecta.core.utils.track_matching import (
+    ARTIST_WEIGHT,
+    DURATION_CUTOFF_SECONDS,
+    DURATION_TOLERANCE_SECONDS,
+    DURATION_WEIGHT,
+    TITLE_WEIGHT,
+    match_score,
+)
+
+# Number of hash bins of the character histograms
+HISTOGRAM_BINS = 64
+
+# Number of pairs bounded per vectorized batch
+BATCH_SIZE = 50_000
+
+# Number of pairs scored exactly per chunk (and per task in the process pool)
+EXACT_CHUNK_SIZE = 5_000
+
+# Number of exactly scored pairs from which they are spread across processes
+PROCESS_POOL_MIN_PAIRS = 20_000
+
+# Maximum number of worker processes
+MAX_PROCESSES = min(4, os.cpu_count() or 1)
+
+# Slack on the upper bound, so rounding never drops a pair exactly at the threshold
+_BOUND_EPSILON = 1e-9
+
+# Row passed to the exact scorer: title, artist and duration of both tracks
+_ScoreRow = tuple[str, str, int | None, str, str, int | None]
+
+
+@dataclass
+class ScoringResult:
+    """Pairs scored at or above the threshold."""
+
+    # (i, j, similarity) triples, ordered by (i, j)
+    matches: list[tuple[int, int, float]] = field(default_factory=list)
+    # False if should_stop ended the scoring early
+    complete: bool = True
+
+
+def _score_rows(rows: list[_ScoreRow], threshold: float) -> list[tuple[int, float]]:
+    """Score rows exactly, keeping those at or above the threshold.
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        rows: Rows to score
+        threshold: Minimum similarity
+
+    Returns:
+        (row index, similarity) for the matching rows
+    """
+    matches = []
+    for index, row in enumerate(rows):
+        similarity = match_score(*row)
+        if similarity >= threshold:
+            matches.append((index, similarity))
+    return matches
+
+
+def _histograms(texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Encode texts as hashed character histograms.
+
+    Args:
+        texts: Normalized texts
+
+    Returns:
+        Tuple of (histograms of shape (len(texts), HISTOGRAM_BINS), text lengths)
+    """
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int32, count=len(texts))
+    codes = np.fromiter((ord(char) for text in texts for char in text), dtype=np.int64, count=int(lengths.sum()))
+    rows = np.repeat(np.arange(len(texts)), lengths)
+
+    histograms = np.zeros((len(texts), HISTOGRAM_BINS), dtype=np.int32)
+    np.add.at(histograms, (rows, codes % HISTOGRAM_BINS), 1)
+    return histograms, lengths
+
+
+def _text_similarity_bound(
+    histograms: np.ndarray, lengths: np.ndarray, left: np.ndarray, right: np.ndarray
+) -> np.ndarray:
+    """Bound the text similarity of pairs from above.
+
+    Matches text_similarity for empty strings: two empty strings are equal (1.0),
+    one empty string scores 0.0.
+
+    Args:
+        histograms: Character histograms
+        lengths: Text lengths
+        left: Indices of the first texts
+        right: Indices of the second texts
+
+    Returns:
+        Upper bound of the similarity per pair
+    """
+    shared = np.minimum(histograms[left], histograms[right]).sum(axis=1)
+    total = lengths[left] + lengths[right]
+    return np.where(total == 0, 1.0, 2.0 * shared / np.maximum(total, 1))
+
+
+def _duration_similarity(durations: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Calculate the duration similarity of pairs, like track_matching.duration_similarity.
+
+    Args:
+        durations: Durations in milliseconds, 0 where unknown
+        left: Indices of the first tracks
+        right: Indices of the second tracks
+
+    Returns:
+        Similarity per pair
+    """
+    a, b = durations[left], durations[right]
+    diff_seconds = np.abs(a - b) / 1000
+    similarity = np.clip(1.0 - diff_seconds / DURATION_CUTOFF_SECONDS, 0.0, 1.0)
+    similarity[diff_seconds < DURATION_TOLERANCE_SECONDS] = 1.0
+    similarity[(a == 0) | (b == 0)] = 1.0
+    return similarity
+
+
+class PairScorer:
+    """Scores candidate pairs of blocking records against a threshold."""
+
+    def __init__(self, records: Sequence[BlockingRecord], processes: int = MAX_PROCESSES):
+        """Encode the records for vectorized scoring.
+
+        Args:
+            records: Blocking records, one per track
+            processes: Maximum number of worker processes for the exact scoring
+        """
+        self.records = records
+        self.processes = processes
+        self._titles = _histograms([record.title_key for record in records])
+        self._artists = _histograms([record.artist_key for record in records])
+        self._durations = np.fromiter(
+            (record.duration_ms or 0 for record in records), dtype=np.float64, count=len(records)
+        )
+
+    def upper_bounds(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Bound the duplicate score of pairs from above.
+
+        Args:
+            left: Indices of the first records
+            right: Indices of the second records
+
+        Returns:
+            Upper bound of the score per pair
+        """
+        return (
+            _text_similarity_bound(*self._titles, left, right) * TITLE_WEIGHT
+            + _text_similarity_bound(*self._artists, left, right) * ARTIST_WEIGHT
+            + _duration_similarity(self._durations, left, right) * DURATION_WEIGHT
+        )
+
+    def score(
+        self,
+        pairs: Sequence[tuple[int, int]],
+        threshold: float,
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ScoringResult:
+        """Score pairs and keep those at or above the threshold.
+
+        Args:
+            pairs: (i, j) record index pairs
+            threshold: Minimum similarity (0.0-1.0)
+            progress_callback: Called with (pairs done, total pairs) after each batch
+            should_stop: Polled between batches; returning True ends the scoring early
+
+        Returns:
+            Scoring result with the matching pairs
+        """
+        total = len(pairs)
+        done = 0
+        survivors: list[np.ndarray] = []
+        pair_array = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+        for start in range(0, total, BATCH_SIZE):
+            if should_stop and should_stop():
+                return ScoringResult(complete=False)
+            batch = pair_array[start : start + BATCH_SIZE]
+            keep = self.upper_bounds(batch[:, 0], batch[:, 1]) >= threshold - _BOUND_EPSILON
+            survivors.append(batch[keep])
+            done += len(batch) - int(keep.sum())
+            if progress_callback:
+                progress_callback(done, total)
+
+        candidates = np.concatenate(survivors) if survivors else pair_array
+        logger.debug(f"Scoring {len(candidates)} of {total} candidate pairs exactly")
+
+        result = ScoringResult()
+        chunks = [candidates[start : start + EXACT_CHUNK_SIZE] for start in range(0, len(candidates), EXACT_CHUNK_SIZE)]
+        if self.processes > 1 and len(candidates) >= PROCESS_POOL_MIN_PAIRS:
+            scored = self._score_in_processes(chunks, threshold, done, total, progress_callback, should_stop)
+        else:
+            scored = self._score_in_process(chunks, threshold, done, total, progress_callback, should_stop)
+
+        for chunk, matches in scored:
+            result.matches.extend((int(chunk[k, 0]), int(chunk[k, 1]), similarity) for k, similarity in matches)
+        result.complete = len(scored) == len(chunks)
+        result.matches.sort()
+        return result
+
+    def _rows(self, chunk: np.ndarray) -> list[_ScoreRow]:
+        """Build the exact scorer rows of a chunk of pairs.
+
+        Args:
+            chunk: Array of (i, j) pairs
+
+        Returns:
+            One row per pair
+        """
+        records = self.records
+        return [
+            (
+                records[i].title_key,
+                records[i].artist_key,
+                records[i].duration_ms,
+                records[j].title_key,
+                records[j].artist_key,
+                records[j].duration_ms,
+            )
+            for i, j in chunk.tolist()
+        ]
+
+    def _score_in_process(
+        self,
+        chunks: list[np.ndarray],
+        threshold: float,
+        done: int,
+        total: int,
+        progress_callback: Callable[[int, int], None] | None,
+        should_stop: Callable[[], bool] | None,
+    ) -> list[tuple[np.ndarray, list[tuple[int, float]]]]:
+        """Score chunks exactly in this process.
+
+        Returns:
+            (chunk, matches) for every chunk scored before should_stop ended the scoring
+        """
+        scored = []
+        for chunk in chunks:
+            if should_stop and should_stop():
+                break
+            scored.append((chunk, _score_rows(self._rows(chunk), threshold)))
+            done += len(chunk)
+            if progress_callback:
+                progress_callback(done, total)
+        return scored
+
+    def _score_in_processes(
+        self,
+        chunks: list[np.ndarray],
+        threshold: float,
+        done: int,
+        total: int,
+        progress_callback: Callable[[int, int], None] | None,
+        should_stop: Callable[[], bool] | None,
+    ) -> list[tuple[np.ndarray, list[tuple[int, float]]]]:
+        """Score chunks exactly in a process pool.
+
+        Returns:
+            (chunk, matches) for every chunk scored before should_stop ended the scoring
+        """
+        scored = []
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            pending: dict[Future, np.ndarray] = {
+                executor.submit(_score_rows, self._rows(chunk), threshold): chunk for chunk in chunks
+            }
+            while pending:
+                finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk = pending.pop(future)
+                    scored.append((chunk, future.result()))
+                    done += len(chunk)
+                if finished and progress_callback:
+                    progress_callback(done, total)
+                if should_stop and should_stop():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        return scored
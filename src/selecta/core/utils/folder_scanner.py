@@ -1,15 +1,174 @@
 # src/selecta/core/utils/folder_scanner.py
-import contextlib
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 
 from loguru import logger
-from tinytag import TinyTag
+from sqlalchemy import func
 
+from selecta.core.data.change_events import PlaylistTracksChanged, TrackUpdated, queue_change
+from selecta.core.data.models.db import Genre, PlaylistTrack, Track, TrackAttribute
+from selecta.core.data.repositories.library_file_repository import FileStat, LibraryFileRepository
 from selecta.core.data.repositories.playlist_repository import PlaylistRepository
-from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.data.repositories.track_repository import KEY_CHUNK_SIZE, TrackRepository
+from selecta.core.utils.audio_hash import hash_files
+from selecta.core.utils.tag_cache import TAG_CHUNK_SIZE, TagCache
 from selecta.core.utils.type_helpers import column_to_bool, column_to_int, column_to_str
 
+# Supported audio file extensions, matched case-insensitively
+AUDIO_EXTENSIONS = frozenset({".mp3", ".flac", ".wav", ".aac", ".m4a", ".ogg", ".aiff"})
+
+# Tracks written per transaction during an import
+IMPORT_BATCH_SIZE = 500
+
+# Serializes imports, so the folder watcher and a manual import don't import the same files
+_IMPORT_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class FileEntry:
+    """Audio file found in the folder with its stat signature."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @property
+    def stat(self) -> FileStat:
+        """Signature stored in the manifest."""
+        return self.size, self.mtime_ns, self.inode
+
+
+@dataclass
+class FolderChanges:
+    """Differences between the folder and its manifest from the last scan."""
+
+    # All audio files currently in the folder
+    files: list[FileEntry] = field(default_factory=list)
+    new: list[FileEntry] = field(default_factory=list)
+    changed: list[FileEntry] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    # (previous path, file at its new path)
+    moved: list[tuple[str, FileEntry]] = field(default_factory=list)
+
+
+@dataclass
+class FolderSync:
+    """Changes applied to the database by an incremental folder sync."""
+
+    imported: int = 0
+    updated: int = 0
+    relocated: int = 0
+    # Tracks whose file was deleted; they are kept in the database
+    missing: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """Whether the database changed."""
+        return bool(self.imported or self.updated or self.relocated)
+
+
+def stat_audio_file(path: str) -> FileEntry | None:
+    """Get the stat signature of a single file.
+
+    Args:
+        path: File path
+
+    Returns:
+        The file, or None if it doesn't exist or isn't a regular file
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    return FileEntry(path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def walk_audio_files(root: str | Path, extensions: frozenset[str] = AUDIO_EXTENSIONS) -> Iterator[FileEntry]:
+    """Walk a folder tree once and yield its audio files.
+
+    Args:
+        root: Folder to walk
+        extensions: Lowercase file extensions to yield
+
+    Yields:
+        Audio files with their stat signature
+    """
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        # Don't follow directory symlinks, which could loop
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                            stat = entry.stat()
+                            yield FileEntry(entry.path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                    except OSError as e:
+                        logger.warning(f"Could not read {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not list {directory}: {e}")
+
+
+def diff_manifest(manifest: dict[str, FileStat], files: list[FileEntry]) -> FolderChanges:
+    """Compare the files in a folder with its manifest.
+
+    Files that disappeared from one path and appeared at another are reported
+    as moved if they have the same inode and size, or else the same size and
+    modification time with no other candidate.
+
+    Args:
+        manifest: Manifest from the last scan, mapping paths to (size, mtime_ns, inode)
+        files: Files currently in the folder
+
+    Returns:
+        Changes since the last scan
+    """
+    changes = FolderChanges(files=files)
+    current_paths = set()
+    for entry in files:
+        current_paths.add(entry.path)
+        previous = manifest.get(entry.path)
+        if previous is None:
+            changes.new.append(entry)
+        elif previous[:2] != (entry.size, entry.mtime_ns):
+            changes.changed.append(entry)
+
+    deleted = dict.fromkeys(path for path in manifest if path not in current_paths)
+    if deleted and changes.new:
+        by_inode = {(manifest[path][2], manifest[path][0]): path for path in deleted if manifest[path][2]}
+        by_stat: dict[tuple[int, int], list[str]] = {}
+        for path in deleted:
+            by_stat.setdefault(manifest[path][:2], []).append(path)
+
+        remaining = []
+        for entry in changes.new:
+            old_path = by_inode.pop((entry.inode, entry.size), None)
+            if old_path is None:
+                candidates = by_stat.get((entry.size, entry.mtime_ns), [])
+                old_path = candidates[0] if len(candidates) == 1 else None
+            if old_path is not None and old_path in deleted:
+                changes.moved.append((old_path, entry))
+                del deleted[old_path]
+            else:
+                remaining.append(entry)
+        changes.new = remaining
+
+    changes.deleted = list(deleted)
+    return changes
+
 
 class LocalFolderScanner:
     """Utility for scanning and reconciling the local database folder."""
@@ -23,69 +182,290 @@ class LocalFolderScanner:
         self.folder_path = Path(folder_path)
         self.track_repo = TrackRepository()
         self.playlist_repo = PlaylistRepository()
+        self.library_file_repo = LibraryFileRepository(self.track_repo.session)
+        self.tag_cache = TagCache(self.track_repo.session)
 
         # Supported audio file extensions
-        self.audio_extensions = {".mp3", ".flac", ".wav", ".aac", ".m4a", ".ogg", ".aiff"}
+        self.audio_extensions = AUDIO_EXTENSIONS
+
+    def scan_changes(self, paths: Iterable[str] | None = None) -> FolderChanges:
+        """Walk the folder once and compare it with the manifest from the last scan.
+
+        No tags are read and the manifest is left as it is: once the changes are
+        applied to the database, update_manifest records them, so the next scan
+        only reports what changed after that.
+
+        Args:
+            paths: Files and folders within the folder to compare, e.g. from file
+                system events; the whole folder if None. Changes.files then only
+                holds the audio files found at these paths.
+
+        Returns:
+            Changes since the last scan
+        """
+        if paths is None:
+            files = list(walk_audio_files(self.folder_path, self.audio_extensions))
+            manifest = self.library_file_repo.get_manifest(str(self.folder_path))
+        else:
+            files, manifest = self._scoped_state(paths)
+        changes = diff_manifest(manifest, files)
+        logger.info(
+            f"Scanned {len(files)} files in {self.folder_path}: {len(changes.new)} new, "
+            f"{len(changes.changed)} changed, {len(changes.deleted)} deleted, {len(changes.moved)} moved"
+        )
+        return changes
+
+    def update_manifest(self, changes: FolderChanges) -> None:
+        """Record changes applied to the database in the manifest.
+
+        New and moved files that still have no track, e.g. because the import
+        was cancelled or their tags couldn't be read, are left out, so the next
+        scan reports them again.
+
+        Args:
+            changes: Changes as returned by scan_changes
+        """
+        arrived = [*changes.new, *(entry for _, entry in changes.moved)]
+        tracked = self._tracks_by_path([entry.path for entry in arrived])
+        upserts = {entry.path: entry.stat for entry in arrived if entry.path in tracked}
+        upserts.update((entry.path, entry.stat) for entry in changes.changed)
+        deleted = [*changes.deleted, *(old_path for old_path, _ in changes.moved)]
+        if upserts or deleted:
+            self.library_file_repo.apply_changes(upserts, deleted)
+            self.tag_cache.move((old_path, entry.path) for old_path, entry in changes.moved)
+            self.tag_cache.forget(changes.deleted)
+
+    def _scoped_state(self, paths: Iterable[str]) -> tuple[list[FileEntry], dict[str, tuple[int, int, int]]]:
+        """Get the audio files and manifest entries at some paths within the folder.
+
+        Paths with an audio extension are looked up as single files, other
+        paths as folders, walking them if they still exist.
+
+        Args:
+            paths: Files and folders within the folder
+
+        Returns:
+            Tuple of (audio files found, manifest entries at those paths)
+        """
+        files: dict[str, FileEntry] = {}
+        manifest = {}
+        single_files = []
+        for path in set(paths):
+            if os.path.splitext(path)[1].lower() in self.audio_extensions:
+                single_files.append(path)
+                entry = stat_audio_file(path)
+                if entry:
+                    files[path] = entry
+            else:
+                if os.path.isdir(path):
+                    files.update((entry.path, entry) for entry in walk_audio_files(path, self.audio_extensions))
+                manifest.update(self.library_file_repo.get_manifest(path))
+        manifest.update(self.library_file_repo.get_entries(single_files))
+        return list(files.values()), manifest
+
+    def sync_changes(
+        self, paths: Iterable[str] | None = None, should_stop: Callable[[], bool] | None = None
+    ) -> FolderSync:
+        """Apply the changes in the folder since the last scan to the database.
+
+        New files are imported, tracks of moved files are relocated and tracks
+        of modified files are updated from their tags, all in bulk. Tracks of
+        deleted files are kept and only counted as missing.
+
+        Args:
+            paths: Files and folders within the folder to sync, the whole folder if None
+            should_stop: Polled while reading tags; returning True stops the import
+
+        Returns:
+            Changes applied to the database
+        """
+        changes = self.scan_changes(paths)
+        result = FolderSync()
+
+        known = self._tracks_by_path(
+            [
+                *(entry.path for entry in [*changes.new, *changes.changed]),
+                *(path for moved in changes.moved for path in (moved[0], moved[1].path)),
+                *changes.deleted,
+            ]
+        )
+
+        # Relocate the tracks of moved files, import moved files without a track
+        imports = [entry.path for entry in changes.new if entry.path not in known]
+        moves = []
+        for old_path, entry in changes.moved:
+            if entry.path in known:
+                continue
+            if old_path in known:
+                moves.append((known[old_path][0], Path(entry.path), known[old_path][1]))
+            else:
+                imports.append(entry.path)
+        result.relocated = self.relocate_moved_files(moves)
+
+        result.missing = sum(1 for path in changes.deleted if path in known)
+        result.updated = self._update_tracks_from_tags([entry.path for entry in changes.changed if entry.path in known])
+        if imports:
+            result.imported, result.errors = self.import_files(imports, should_stop=should_stop)
+        self.update_manifest(changes)
+
+        logger.info(
+            f"Synced {self.folder_path}: {result.imported} imported, {result.updated} updated, "
+            f"{result.relocated} relocated, {result.missing} missing"
+        )
+        return result
+
+    def _tracks_by_path(self, paths: list[str]) -> dict[str, tuple[int, str | None]]:
+        """Find the tracks of local files.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Dictionary mapping the paths that belong to a track to its (ID, content hash)
+        """
+        tracks = {}
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            rows = (
+                self.track_repo.session.query(Track.id, Track.local_path, Track.content_hash)
+                .filter(Track.local_path.in_(chunk))
+                .all()
+            )
+            tracks.update((local_path, (track_id, content_hash)) for track_id, local_path, content_hash in rows)
+        return tracks
+
+    def _update_tracks_from_tags(self, paths: list[str]) -> int:
+        """Update the tracks of modified files from their tags, in one transaction.
 
-    def scan_folder(self) -> dict[str, list[Path]]:
+        Args:
+            paths: Paths of the modified files
+
+        Returns:
+            Number of updated tracks
+        """
+        if not paths:
+            return 0
+
+        tags = {path: cached.tags for path, cached in self.tag_cache.get_many(paths) if cached}
+        session = self.track_repo.session
+        updated = 0
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = [path for path in paths[start : start + KEY_CHUNK_SIZE] if path in tags]
+            for track in session.query(Track).filter(Track.local_path.in_(chunk)):
+                metadata = tags[track.local_path]
+                track_data = {key: metadata.get(key) for key in ("title", "artist", "duration_ms")}
+                changes = self.track_repo.apply_track_data(track, track_data, preserve_existing=False)
+                # The audio may have changed too, the background pass hashes it again
+                track.content_hash = None
+                queue_change(session, TrackUpdated(track.id, {**changes, "content_hash": None}))
+                updated += 1
+        session.commit()
+        return updated
+
+    def scan_folder(self) -> dict[str, Any]:
         """Scan the folder for audio files and categorize them.
 
+        Database entries whose file was renamed or moved within the folder are
+        reported as moved instead of as one new and one missing file. Moves are
+        recognized from the scan manifest, or else by the audio content hash.
+        The manifest is only updated once import_untracked_files applies the
+        result, so a scan that isn't followed by an import changes nothing.
+
         Returns:
             Dictionary with categorized files: {
                 'in_database': [files in DB],
                 'not_in_database': [files not in DB],
-                'missing_from_folder': [DB entries with missing files]
+                'missing_from_folder': [DB entries with missing files],
+                'moved': [(track ID, new file, content hash) of DB entries whose file moved],
+                'changed': [files in DB modified since the last scan],
+                'changes': FolderChanges the categories were derived from
             }
         """
-        result = {"in_database": [], "not_in_database": [], "missing_from_folder": []}
+        result: dict[str, Any] = {
+            "in_database": [],
+            "not_in_database": [],
+            "missing_from_folder": [],
+            "moved": [],
+            "changed": [],
+        }
 
-        # Get all physical files in the folder
         try:
-            physical_files = self._get_audio_files()
-            physical_paths = {str(path) for path in physical_files}
+            # Walk the folder once
+            changes = self.scan_changes()
+            result["changes"] = changes
+            physical_paths = {entry.path for entry in changes.files}
+
+            # Get all local tracks from the database
+            all_tracks = (
+                self.track_repo.session.query(Track.id, Track.local_path, Track.content_hash)
+                .filter(Track.local_path.isnot(None), Track.local_path != "")
+                .all()
+            )
+            tracks_by_path = {track.local_path: track for track in all_tracks}
 
-            # Get all tracks from the database
-            all_tracks = self.track_repo.session.query(
-                self.track_repo.session.query_model.local_path
-            ).all()
+            # Find missing files
+            missing = {track.local_path: track for track in all_tracks if track.local_path not in physical_paths}
 
-            # Extract paths and convert to set for faster lookups
-            db_paths = {track.local_path for track in all_tracks if track.local_path}
+            # Re-associate files the manifest saw move
+            moved_paths = set()
+            for old_path, entry in changes.moved:
+                track = missing.get(old_path)
+                if track and entry.path not in tracks_by_path:
+                    result["moved"].append((track.id, Path(entry.path), track.content_hash))
+                    moved_paths.add(entry.path)
+                    del missing[old_path]
 
             # Categorize files
-            for file_path in physical_files:
-                str_path = str(file_path)
-                if str_path in db_paths:
-                    result["in_database"].append(file_path)
-                else:
-                    result["not_in_database"].append(file_path)
-
-            # Find missing files
-            for db_path in db_paths:
-                if db_path and db_path not in physical_paths:
-                    result["missing_from_folder"].append(Path(db_path))
-
+            for entry in changes.files:
+                if entry.path in tracks_by_path:
+                    result["in_database"].append(Path(entry.path))
+                elif entry.path not in moved_paths:
+                    result["not_in_database"].append(Path(entry.path))
+            result["changed"] = [Path(entry.path) for entry in changes.changed if entry.path in tracks_by_path]
+
+            # Re-associate the remaining moved files by their audio content
+            missing_by_hash = {track.content_hash: track for track in missing.values() if track.content_hash}
+            if missing_by_hash and result["not_in_database"]:
+                hashes = hash_files(str(path) for path in result["not_in_database"])
+                for file_path in list(result["not_in_database"]):
+                    track = missing_by_hash.pop(hashes.get(str(file_path)) or "", None)
+                    if track:
+                        result["moved"].append((track.id, file_path, track.content_hash))
+                        result["not_in_database"].remove(file_path)
+                        del missing[track.local_path]
+
+            result["missing_from_folder"] = [Path(path) for path in missing]
             return result
 
         except Exception as e:
             logger.exception(f"Error scanning folder: {e}")
             raise
 
+    def relocate_moved_files(self, moved: list[tuple[int, Path, str | None]]) -> int:
+        """Point the tracks of moved files at their new location.
+
+        Args:
+            moved: (track ID, new file, content hash) tuples as reported by scan_folder;
+                a None hash keeps the track's hash
+
+        Returns:
+            Number of relocated tracks
+        """
+        for track_id, file_path, _ in moved:
+            logger.info(f"Track {track_id} moved to {file_path}")
+        return self.track_repo.relocate_many(
+            [(track_id, str(file_path), content_hash) for track_id, file_path, content_hash in moved]
+        )
+
     def _get_audio_files(self) -> list[Path]:
         """Get all audio files in the folder.
 
         Returns:
             List of audio file paths
         """
-        audio_files = []
-
-        for ext in self.audio_extensions:
-            audio_files.extend(self.folder_path.glob(f"**/*{ext}"))
-            audio_files.extend(self.folder_path.glob(f"**/*{ext.upper()}"))
-
-        return audio_files
+        return [Path(entry.path) for entry in walk_audio_files(self.folder_path, self.audio_extensions)]
 
-    def _extract_metadata(self, file_path: Path) -> dict[str, Any]:
+    def _extract_metadata(self, file_path: Path) -> dict[str, Any] | None:
         """Extract metadata from an audio file.
 
         Args:
@@ -94,117 +474,184 @@ class LocalFolderScanner:
         Returns:
             Dictionary of metadata or None if extraction failed
         """
-        try:
-            tag = TinyTag.get(file_path)
-
-            metadata = {
-                "title": tag.title or file_path.stem,
-                "artist": tag.artist or "Unknown Artist",
-                "album": tag.album,
-                "year": tag.year,
-                "duration_ms": int(tag.duration * 1000) if tag.duration else 0,
-                "genre": tag.genre,
-                # Some tags might have BPM stored as "bpm" or as part of the comment
-                "bpm": None,
-            }
+        cached = self.tag_cache.get(file_path)
+        return cached.tags if cached else None
+
+    def import_untracked_files(
+        self,
+        collection_playlist_id: int | None = None,
+        scan_result: dict[str, Any] | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> tuple[int, list[str]]:
+        """Import untracked files found in the folder to the database.
 
-            # Try to extract BPM if available
-            # TinyTag doesn't directly support BPM, but it could be in custom tags
-            if hasattr(tag, "get") and callable(tag.get):
-                bpm = tag.get("bpm")
-                if bpm:
-                    with contextlib.suppress(ValueError, TypeError):
-                        metadata["bpm"] = float(bpm)
+        Tracks of moved files are relocated and tracks of modified files are
+        updated from their tags first; the manifest is updated last.
 
-            return metadata
-        except Exception as e:
-            logger.error(f"Error extracting metadata from {file_path}: {e}")
-            return None
+        Tags come from the tag cache, which parses uncached files in parallel,
+        and the tracks are written in batches of IMPORT_BATCH_SIZE, one
+        transaction per batch. Batches written before a cancellation stay
+        imported.
 
-    def import_untracked_files(self, collection_playlist_id: int = None) -> tuple[int, list[str]]:
-        """Import untracked files found in the folder to the database.
+        Args:
+            collection_playlist_id: Optional ID of collection playlist to add tracks to
+            scan_result: Result of a scan_folder call just before, to avoid scanning again
+            progress_callback: Called with (files processed, total files) after each chunk of tags read
+            should_stop: Polled while reading tags; returning True cancels the import
+
+        Returns:
+            Tuple of (number of imported files, list of errors)
+        """
+        # Get untracked files, after re-associating the moved ones
+        if scan_result is None:
+            scan_result = self.scan_folder()
+        self.relocate_moved_files(scan_result["moved"])
+        self._update_tracks_from_tags([str(path) for path in scan_result["changed"]])
+        imported = self.import_files(
+            [str(path) for path in scan_result["not_in_database"]],
+            collection_playlist_id,
+            progress_callback,
+            should_stop,
+        )
+        self.update_manifest(scan_result["changes"])
+        return imported
+
+    def import_files(
+        self,
+        untracked_files: list[str],
+        collection_playlist_id: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> tuple[int, list[str]]:
+        """Import audio files without a track to the database.
 
         Args:
+            untracked_files: Paths of the files to import
             collection_playlist_id: Optional ID of collection playlist to add tracks to
+            progress_callback: Called with (files processed, total files) after each chunk of tags read
+            should_stop: Polled while reading tags; returning True cancels the import
 
         Returns:
             Tuple of (number of imported files, list of errors)
         """
+        with _IMPORT_LOCK:
+            return self._import_files(untracked_files, collection_playlist_id, progress_callback, should_stop)
+
+    def _import_files(
+        self,
+        untracked_files: list[str],
+        collection_playlist_id: int | None,
+        progress_callback: Callable[[int, int], None] | None,
+        should_stop: Callable[[], bool] | None,
+    ) -> tuple[int, list[str]]:
+        """Import audio files without a track, holding the import lock."""
         errors = []
         imported_count = 0
 
-        # Get untracked files
-        scan_result = self.scan_folder()
-        untracked_files = scan_result["not_in_database"]
+        # Skip files imported meanwhile, e.g. by the folder watcher
+        known = self._tracks_by_path(untracked_files)
+        untracked_files = [path for path in untracked_files if path not in known]
+        if not untracked_files:
+            return 0, errors
 
         # Create collection playlist if needed
         if collection_playlist_id is None:
             collection_playlist_id = self._ensure_collection_playlist()
 
-        # Process each file
-        for file_path in untracked_files:
-            try:
-                # Extract metadata
-                metadata = self._extract_metadata(file_path)
-
-                if not metadata:
-                    errors.append(f"Could not extract metadata from {file_path}")
-                    continue
-
-                # Create track in database
-                track_data = {
-                    "title": metadata.get("title", file_path.stem),
-                    "artist": metadata.get("artist", "Unknown Artist"),
-                    "duration_ms": metadata.get("duration_ms", 0),
-                    "local_path": str(file_path),
-                }
-
-                # Add album if available
-                if metadata.get("album"):
-                    # This is simplified - in a full implementation you'd create
-                    # or look up the album in a proper album table
-                    track_data["album_id"] = None
-
-                # Create track
-                new_track = self.track_repo.create(track_data)
-
-                # Add BPM if available
-                if metadata.get("bpm") is not None:
-                    self.track_repo.add_attribute(
-                        new_track.id, "bpm", float(metadata["bpm"]), "file_metadata"
-                    )
-
-                # Add genre if available
-                if metadata.get("genre"):
-                    # Add genre to genres table
-                    from selecta.core.data.models.db import Genre
+        processed = 0
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for file_path, cached in self.tag_cache.get_many(untracked_files, should_stop=should_stop):
+            processed += 1
+            if cached:
+                batch.append((file_path, cached.tags))
+            else:
+                errors.append(f"Could not extract metadata from {file_path}")
+
+            if len(batch) >= IMPORT_BATCH_SIZE or processed == len(untracked_files):
+                imported_count += self._insert_tracks(batch, collection_playlist_id, errors)
+                batch = []
+            if progress_callback and (processed % TAG_CHUNK_SIZE == 0 or processed == len(untracked_files)):
+                progress_callback(processed, len(untracked_files))
+
+        if processed < len(untracked_files):
+            # Cancelled, keep the tags read so far
+            imported_count += self._insert_tracks(batch, collection_playlist_id, errors)
+            logger.info(f"Import cancelled after {processed} of {len(untracked_files)} files")
 
-                    genre_obj = (
-                        self.track_repo.session.query(Genre)
-                        .filter(Genre.name == metadata["genre"])
-                        .first()
-                    )
-                    if not genre_obj:
-                        genre_obj = Genre(name=metadata["genre"], source="file_metadata")
-                        self.track_repo.session.add(genre_obj)
-                        self.track_repo.session.commit()
+        return imported_count, errors
 
-                    # Associate track with genre
-                    new_track.genres.append(genre_obj)
-                    self.track_repo.session.commit()
+    def _insert_tracks(
+        self, batch: list[tuple[str, dict[str, Any]]], collection_playlist_id: int | None, errors: list[str]
+    ) -> int:
+        """Write the tracks of a batch of files, with their genres, BPM and Collection entries.
 
-                # Add to collection playlist
-                if collection_playlist_id:
-                    self.playlist_repo.add_track(collection_playlist_id, new_track.id)
+        Args:
+            batch: (path, metadata) of the files to import
+            collection_playlist_id: ID of the collection playlist to append the tracks to
+            errors: List the error is appended to if the batch fails
 
-                imported_count += 1
+        Returns:
+            Number of imported tracks
+        """
+        if not batch:
+            return 0
 
-            except Exception as e:
-                error_msg = f"Error importing {file_path}: {str(e)}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+        session = self.track_repo.session
+        try:
+            # Look up the genres of the batch at once, creating the missing ones
+            genre_names = {metadata["genre"] for _, metadata in batch if metadata.get("genre")}
+            genres = {genre.name: genre for genre in session.query(Genre).filter(Genre.name.in_(genre_names))}
+            for name in genre_names - genres.keys():
+                genres[name] = Genre(name=name, source="file_metadata")
+
+            position = 0
+            if collection_playlist_id:
+                last_position = (
+                    session.query(func.max(PlaylistTrack.position))
+                    .filter(PlaylistTrack.playlist_id == collection_playlist_id)
+                    .scalar()
+                )
+                position = last_position + 1 if last_position is not None else 0
+
+            added_at = datetime.now(UTC)
+            tracks = []
+            for file_path, metadata in batch:
+                track = Track(
+                    title=metadata.get("title") or Path(file_path).stem,
+                    artist=metadata.get("artist") or "Unknown Artist",
+                    duration_ms=metadata.get("duration_ms", 0),
+                    local_path=file_path,
+                )
+                if metadata.get("bpm") is not None:
+                    track.attributes.append(
+                        TrackAttribute(name="bpm", value=float(metadata["bpm"]), source="file_metadata")
+                    )
+                if metadata.get("genre"):
+                    track.genres.append(genres[metadata["genre"]])
+                if collection_playlist_id:
+                    track.playlists.append(
+                        PlaylistTrack(playlist_id=collection_playlist_id, position=position, added_at=added_at)
+                    )
+                    position += 1
+                session.add(track)
+                tracks.append(track)
+
+            if collection_playlist_id:
+                # Assign the track IDs for the change event
+                session.flush()
+                queue_change(
+                    session, PlaylistTracksChanged(collection_playlist_id, added=tuple(track.id for track in tracks))
+                )
+            session.commit()
+            return len(batch)
 
-        return imported_count, errors
+        except Exception as e:
+            session.rollback()
+            error_msg = f"Error importing {len(batch)} files from {batch[0][0]}: {str(e)}"
+            logger.exception(error_msg)
+            errors.append(error_msg)
+            return 0
 
     def _ensure_collection_playlist(self) -> int:
         """Ensure the Collection playlist exists.
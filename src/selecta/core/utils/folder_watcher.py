@@ -0,0 +1,297 @@
+"""Live watcher of the local database folder.
+
+Changes in the folder are synced to the database in the background through
+LocalFolderScanner.sync_changes, so the library stays current without full
+rescans:
+
+- On Linux, the folder tree is watched with inotify (through a small ctypes
+  wrapper). Events only mark paths as pending, and the pending paths are synced
+  together once no event came in for DEBOUNCE_SECONDS, or at the latest every
+  MAX_DELAY_SECONDS during a long burst such as a large copy. Files are picked
+  up when they are closed after writing, not while they are being written.
+- Elsewhere, or if inotify can't watch the whole tree, the folder is compared
+  with its manifest every POLL_INTERVAL_SECONDS, which only stats the files.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+from selecta.core.utils.folder_scanner import AUDIO_EXTENSIONS, FolderSync, LocalFolderScanner
+
+# Quiet time after the last event before pending changes are synced
+DEBOUNCE_SECONDS = 2.0
+
+# Longest time pending changes wait for a sync during a continuous burst of events
+MAX_DELAY_SECONDS = 30.0
+
+# Interval between folder comparisons when inotify isn't available
+POLL_INTERVAL_SECONDS = 60.0
+
+# Number of pending paths from which the whole folder is synced instead
+MAX_PENDING_PATHS = 5_000
+
+# Longest time the watcher thread blocks before checking whether it should stop
+_STOP_CHECK_SECONDS = 1.0
+
+# inotify event bits (see inotify(7))
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+
+# Header of an inotify event: watch descriptor, mask, cookie and name length
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal inotify wrapper watching a folder tree."""
+
+    def __init__(self) -> None:
+        """Create an inotify instance.
+
+        Raises:
+            OSError: If inotify isn't available
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        # Watched folder per watch descriptor
+        self.watches: dict[int, str] = {}
+
+    def add_tree(self, root: str) -> None:
+        """Watch a folder and all folders below it.
+
+        Args:
+            root: Folder to watch
+
+        Raises:
+            OSError: If the inotify watch limit is reached
+        """
+        for directory, _, _ in os.walk(root):
+            wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK | _IN_ONLYDIR)
+            if wd < 0:
+                error = ctypes.get_errno()
+                # Folders removed since they were listed can be skipped
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                raise OSError(error, os.strerror(error), directory)
+            self.watches[wd] = directory
+
+    def read(self, timeout: float) -> list[tuple[str, int]]:
+        """Wait for events and read them.
+
+        Args:
+            timeout: Longest time to wait in seconds
+
+        Returns:
+            (path, mask) per event; the path of a queue overflow event is empty
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += _EVENT_HEADER.size + length
+
+            if mask & _IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd, "")
+            events.append((os.path.join(directory, os.fsdecode(name)) if name else directory, mask))
+        return events
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self.fd)
+
+
+class FolderWatcher:
+    """Watches the local database folder and syncs its changes in a background thread."""
+
+    def __init__(
+        self,
+        folder_path: str | Path,
+        on_sync: Callable[[FolderSync], None] | None = None,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ):
+        """Initialize the folder watcher.
+
+        Args:
+            folder_path: Folder to watch
+            on_sync: Called from the watcher thread after a sync that changed the database or
+                found missing files
+            poll_interval: Seconds between folder comparisons when inotify isn't available
+        """
+        self.folder_path = str(Path(folder_path))
+        self.on_sync = on_sync
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._scanner: LocalFolderScanner | None = None
+
+        # Paths changed since the last sync, and whether the whole folder needs syncing
+        self._pending: set[str] = set()
+        self._full_sync = False
+        self._first_event = 0.0
+        self._last_event = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FolderWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop watching, letting a running sync finish its current batch.
+
+        Args:
+            timeout: Longest time to wait for the watcher thread in seconds
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Watch the folder until stopped."""
+        inotify = None
+        if sys.platform.startswith("linux"):
+            try:
+                inotify = _Inotify()
+                inotify.add_tree(self.folder_path)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"Can't watch {self.folder_path} with inotify, polling instead: {e}")
+                if inotify is not None:
+                    inotify.close()
+                inotify = None
+
+        # Catch up with changes made while nobody was watching
+        self._full_sync = True
+        self._sync()
+
+        if inotify is None:
+            while not self._stop_event.wait(self.poll_interval):
+                self._full_sync = True
+                self._sync()
+            return
+
+        logger.info(f"Watching {self.folder_path} ({len(inotify.watches)} folders)")
+        try:
+            while not self._stop_event.is_set():
+                for path, mask in inotify.read(self._wait_time()):
+                    self._on_event(inotify, path, mask)
+                if self._sync_due():
+                    self._sync()
+        finally:
+            inotify.close()
+
+    def _on_event(self, inotify: _Inotify, path: str, mask: int) -> None:
+        """Record a file system event as a pending change.
+
+        Args:
+            inotify: The inotify instance, to watch new folders
+            path: Path of the event
+            mask: Event bits
+        """
+        if mask & _IN_Q_OVERFLOW or (mask & (_IN_DELETE_SELF | _IN_MOVE_SELF) and path == self.folder_path):
+            # Events were lost, or the folder itself went away
+            self._full_sync = True
+        elif mask & _IN_ISDIR:
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                try:
+                    inotify.add_tree(path)
+                except OSError as e:
+                    logger.warning(f"Can't watch {path}, changes below it are picked up by the next full sync: {e}")
+            self._pending.add(path)
+        elif mask & _IN_CREATE or os.path.splitext(path)[1].lower() not in AUDIO_EXTENSIONS:
+            # New files are synced once they are closed after writing
+            return
+        else:
+            self._pending.add(path)
+
+        if len(self._pending) > MAX_PENDING_PATHS:
+            self._full_sync = True
+        now = time.monotonic()
+        if not self._first_event:
+            self._first_event = now
+        self._last_event = now
+
+    def _wait_time(self) -> float:
+        """Get the time to wait for events before the next sync is due."""
+        if not (self._pending or self._full_sync):
+            return _STOP_CHECK_SECONDS
+        now = time.monotonic()
+        due = min(self._last_event + DEBOUNCE_SECONDS, self._first_event + MAX_DELAY_SECONDS)
+        return max(0.0, min(due - now, _STOP_CHECK_SECONDS))
+
+    def _sync_due(self) -> bool:
+        """Whether the pending changes should be synced now."""
+        if not (self._pending or self._full_sync):
+            return False
+        now = time.monotonic()
+        return now - self._last_event >= DEBOUNCE_SECONDS or now - self._first_event >= MAX_DELAY_SECONDS
+
+    def _sync(self) -> None:
+        """Sync the pending changes to the database."""
+        paths = None if self._full_sync else list(self._pending)
+        self._pending.clear()
+        self._full_sync = False
+        self._first_event = self._last_event = 0.0
+
+        # An unmounted or removed folder would look like all files were deleted
+        if not os.path.isdir(self.folder_path):
+            logger.warning(f"Folder {self.folder_path} is not available, skipping sync")
+            return
+
+        try:
+            if self._scanner is None:
+                self._scanner = LocalFolderScanner(self.folder_path)
+            result = self._scanner.sync_changes(paths, should_stop=self._stop_event.is_set)
+        except Exception as e:
+            logger.exception(f"Error syncing {self.folder_path}: {e}")
+            # Start over with a fresh session
+            self._scanner = None
+            return
+
+        if self.on_sync and (result.changed or result.missing):
+            self.on_sync(result)
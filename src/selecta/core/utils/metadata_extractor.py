@@ -3,11 +3,11 @@
 from pathlib import Path
 
 from loguru import logger
-from mutagen import File as MutagenFile
-from mutagen.id3 import APIC, ID3
 
 from selecta.core.data.repositories.image_repository import ImageRepository
 from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.cover_import import import_covers
+from selecta.core.utils.tag_cache import TagCache
 
 
 class MetadataExtractor:
@@ -17,6 +17,7 @@ class MetadataExtractor:
         """Initialize the metadata extractor."""
         self.track_repo = TrackRepository()
         self.image_repo = ImageRepository()
+        self.tag_cache = TagCache(self.track_repo.session)
 
     def extract_cover_from_track(self, track_id: int) -> bool:
         """Extract cover art from a track's audio file and add it to the database.
@@ -64,77 +65,25 @@ class MetadataExtractor:
             logger.exception(f"Error extracting cover for track {track_id}: {e}")
             return False
 
-    def _extract_cover_from_file(self, file_path: Path) -> bytes:
+    def _extract_cover_from_file(self, file_path: Path) -> bytes | None:
         """Extract cover art from an audio file.
 
+        Files the tag cache knows to have no cover art aren't opened.
+
         Args:
             file_path: Path to the audio file
 
         Returns:
             Cover art data as bytes or None if not found
         """
-        try:
-            # Try with Mutagen's generic File
-            audio = MutagenFile(file_path)
-            if audio is None:
-                return None
-
-            # Different audio formats store artwork differently
-            # MP3 (ID3)
-            if hasattr(audio, "tags") and isinstance(audio.tags, ID3):
-                for tag in audio.tags.values():
-                    if isinstance(tag, APIC):
-                        return tag.data
-
-            # FLAC and others often use the 'pictures' attribute
-            if hasattr(audio, "pictures"):
-                for pic in audio.pictures:
-                    return pic.data
-
-            # MP4/AAC files use 'covr' atom
-            if "covr" in audio:
-                return audio["covr"][0]
-
-            # Try a more general approach for other formats
-            for key in audio:
-                if key.startswith("APIC:") or key == "APIC" or key == "covr":
-                    return audio[key][0]
-
-            # No cover found
-            return None
-
-        except Exception as e:
-            logger.exception(f"Error extracting cover from {file_path}: {e}")
-            return None
+        cached = self.tag_cache.get(file_path, with_art=True)
+        return cached.art if cached else None
 
-    def batch_extract_covers(self, limit: int = None) -> tuple[int, int]:
+    def batch_extract_covers(self) -> tuple[int, int]:
         """Extract covers for all tracks without images.
 
-        Args:
-            limit: Maximum number of tracks to process (None for all)
-
         Returns:
             Tuple of (successful extractions, failed extractions)
         """
-        # Get all tracks with local paths but no images
-        tracks_with_local_paths = self.track_repo.get_all_with_local_path()
-
-        success_count = 0
-        failed_count = 0
-
-        # Process tracks
-        for i, track in enumerate(tracks_with_local_paths):
-            if limit and i >= limit:
-                break
-
-            # Skip tracks that already have images
-            if self.image_repo.get_track_image(track.id):
-                continue
-
-            # Extract and add cover
-            if self.extract_cover_from_track(track.id):
-                success_count += 1
-            else:
-                failed_count += 1
-
-        return success_count, failed_count
+        result = import_covers(self.track_repo)
+        return result.imported, result.failed + result.without_art
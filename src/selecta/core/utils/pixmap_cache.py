@@ -0,0 +1,133 @@
+"""Memory-bounded cache of decoded images."""
+
+from collections import OrderedDict
+
+from PyQt6.QtGui import QImage, QPixmap
+
+from selecta.core.data.models.db import ImageSize
+
+# Memory budget in bytes of the decoded pixmaps kept per image size
+PIXMAP_CACHE_BUDGETS = {
+    ImageSize.THUMBNAIL: 16 * 1024 * 1024,
+    ImageSize.SMALL: 16 * 1024 * 1024,
+    ImageSize.MEDIUM: 32 * 1024 * 1024,
+    ImageSize.LARGE: 32 * 1024 * 1024,
+}
+
+
+class PixmapCache:
+    """Least recently used pixmaps, kept within a memory budget per image size.
+
+    QPixmapCache only has one budget for all pixmaps, so a table full of
+    thumbnails would evict the cover shown in the details panel. Pixmaps are
+    only used from the GUI thread, so the cache isn't locked.
+    """
+
+    def __init__(self, budgets: dict[ImageSize, int] | None = None):
+        """Initialize the pixmap cache.
+
+        Args:
+            budgets: Memory budget in bytes per image size (PIXMAP_CACHE_BUDGETS if not given)
+        """
+        self.budgets = dict(budgets or PIXMAP_CACHE_BUDGETS)
+        self._entries: dict[ImageSize, OrderedDict[str, tuple[QPixmap, int]]] = {
+            size: OrderedDict() for size in ImageSize
+        }
+        self._used = dict.fromkeys(ImageSize, 0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def cost(pixmap: QPixmap | QImage) -> int:
+        """Get the memory used by a decoded pixmap in bytes."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def get(self, key: str, size: ImageSize) -> QPixmap | None:
+        """Get a pixmap, marking it as recently used.
+
+        Args:
+            key: Cache key, e.g. "track_<id>"
+            size: Image size
+
+        Returns:
+            The pixmap, or None if it isn't cached
+        """
+        entries = self._entries[size]
+        entry = entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def contains(self, key: str, size: ImageSize) -> bool:
+        """Whether a pixmap is cached, without counting a hit or miss or marking it as used."""
+        return key in self._entries[size]
+
+    def insert(self, key: str, size: ImageSize, pixmap: QPixmap) -> None:
+        """Cache a pixmap, evicting the least recently used ones of its size over the budget.
+
+        Pixmaps larger than the whole budget aren't cached.
+
+        Args:
+            key: Cache key, e.g. "track_<id>"
+            size: Image size
+            pixmap: The pixmap
+        """
+        self.remove(key, size)
+        cost = self.cost(pixmap)
+        budget = self.budgets.get(size, 0)
+        if cost > budget:
+            return
+
+        entries = self._entries[size]
+        while entries and self._used[size] + cost > budget:
+            _, (_, evicted_cost) = entries.popitem(last=False)
+            self._used[size] -= evicted_cost
+            self.evictions += 1
+        entries[key] = (pixmap, cost)
+        self._used[size] += cost
+
+    def remove(self, key: str, size: ImageSize | None = None) -> None:
+        """Remove a pixmap from the cache.
+
+        Args:
+            key: Cache key
+            size: Image size (all sizes if None)
+        """
+        for entry_size in [size] if size is not None else list(ImageSize):
+            entry = self._entries[entry_size].pop(key, None)
+            if entry is not None:
+                self._used[entry_size] -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all pixmaps, keeping the statistics."""
+        for size in ImageSize:
+            self._entries[size].clear()
+            self._used[size] = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that found their pixmap."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, object]:
+        """Get the cache statistics.
+
+        Returns:
+            Dictionary with the hits, misses, evictions and hit rate, and the number of pixmaps and
+            bytes used per image size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "sizes": {
+                size.name: {"pixmaps": len(self._entries[size]), "bytes": self._used[size], "budget": budget}
+                for size, budget in self.budgets.items()
+            },
+        }
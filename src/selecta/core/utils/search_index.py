@@ -0,0 +1,117 @@
+"""Search keys and prefix index for searching within track lists."""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# Characters of each word suffix stored in the prefix index; longer queries are checked against the full text
+PREFIX_KEY_LENGTH = 24
+
+# Default maximum number of items returned by a prefix search
+MAX_PREFIX_RESULTS = 50
+
+
+def search_key(artist: str | None, title: str | None) -> str:
+    """Build the lowercase search key of a track, in the "Artist - Title" form of the search suggestions.
+
+    Args:
+        artist: Track artist
+        title: Track title
+
+    Returns:
+        Search key to match search tokens against
+    """
+    return f"{artist or ''} - {title or ''}".lower()
+
+
+def search_tokens(text: str) -> list[str]:
+    """Split search text into lowercase tokens, which must all be found in a search key.
+
+    Args:
+        text: Search text
+
+    Returns:
+        Search tokens, empty if the text is blank
+    """
+    return text.lower().split()
+
+
+def matches_tokens(key: str, tokens: list[str]) -> bool:
+    """Whether a search key contains all search tokens.
+
+    Args:
+        key: Lowercase search key
+        tokens: Search tokens
+
+    Returns:
+        True if every token is found in the key
+    """
+    return all(token in key for token in tokens)
+
+
+def _word_starts(text: str) -> Iterable[int]:
+    """Get the offsets of the words of a text."""
+    previous_alnum = False
+    for offset, char in enumerate(text):
+        alnum = char.isalnum()
+        if alnum and not previous_alnum:
+            yield offset
+        previous_alnum = alnum
+
+
+class PrefixIndex:
+    """Index of items by the beginnings of their words.
+
+    A query matches an item if a word of the item begins with the query, so
+    "nig" and "night dr" both match "Night Drive". The lowercase text from
+    each word start is stored, cut to PREFIX_KEY_LENGTH characters, in one
+    sorted list, so a search is a binary search plus a scan of the matches.
+    """
+
+    def __init__(self, items: Iterable[str]):
+        """Build the index.
+
+        Args:
+            items: Items to index
+        """
+        self.items = list(items)
+        self._lowered = [item.lower() for item in self.items]
+
+        keys = []
+        positions = []
+        for item_id, text in enumerate(self._lowered):
+            for offset in _word_starts(text):
+                keys.append(text[offset : offset + PREFIX_KEY_LENGTH])
+                positions.append((item_id, offset))
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[entry] for entry in order]
+        self._positions = [positions[entry] for entry in order]
+
+    def __len__(self) -> int:
+        """Number of indexed items."""
+        return len(self.items)
+
+    def search(self, query: str, limit: int = MAX_PREFIX_RESULTS) -> list[str]:
+        """Find the items with a word beginning with a query.
+
+        Args:
+            query: Query text (case-insensitive)
+            limit: Maximum number of items to return
+
+        Returns:
+            Matching items in index order, empty if the query is blank
+        """
+        query = query.lower().lstrip()
+        if not query:
+            return []
+
+        key_prefix = query[:PREFIX_KEY_LENGTH]
+        found: set[int] = set()
+        for position in range(bisect_left(self._keys, key_prefix), len(self._keys)):
+            if not self._keys[position].startswith(key_prefix):
+                break
+            item_id, offset = self._positions[position]
+            if item_id not in found and self._lowered[item_id].startswith(query, offset):
+                found.add(item_id)
+                if len(found) >= limit:
+                    break
+        return [self.items[item_id] for item_id in sorted(found)]
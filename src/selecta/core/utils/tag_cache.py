@@ -0,0 +1,343 @@
+"""Persistent cache of parsed audio file tags.
+
+Reading the tags of a local file means opening and parsing it, which the
+folder import, the cover extraction and the player would otherwise each do on
+their own, in every session. Parsed tags are stored per path together with the
+file's size and modification time, and reused as long as both are unchanged.
+
+Each entry also holds a digest of the embedded cover art, so files without art
+are known without opening them again.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+from tinytag import TinyTag
+
+from selecta.core.data.database import get_session
+from selecta.core.data.models.db import FileTags
+from selecta.core.data.repositories.track_repository import KEY_CHUNK_SIZE
+
+# Files parsed per task in the process pool
+TAG_CHUNK_SIZE = 50
+
+# Number of files to parse from which they are spread across processes
+PROCESS_POOL_MIN_FILES = 200
+
+# Maximum number of parsing processes
+MAX_PROCESSES = min(4, os.cpu_count() or 1)
+
+# Parsed files stored per transaction
+STORE_BATCH_SIZE = 500
+
+# Size and modification time of a file
+_FileStat = tuple[int, int]
+
+
+@dataclass
+class CachedTags:
+    """Parsed tags of an audio file."""
+
+    tags: dict[str, Any]
+    # SHA-1 of the embedded cover art, None if the file has none
+    art_digest: str | None = None
+    # Embedded cover art, only set when requested
+    art: bytes | None = None
+
+
+def _stat(path: str) -> _FileStat | None:
+    """Get the size and modification time of a file, None if it can't be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def parse_file(path: str | Path, keep_art: bool = False) -> CachedTags | None:
+    """Parse the tags and embedded cover art of an audio file.
+
+    Args:
+        path: Path to the audio file
+        keep_art: Whether to return the cover art itself, not only its digest
+
+    Returns:
+        Parsed tags, or None if the file couldn't be parsed
+    """
+    path = Path(path)
+    try:
+        tag = TinyTag.get(path, image=True)
+    except Exception as e:
+        logger.error(f"Error extracting metadata from {path}: {e}")
+        return None
+
+    tags = {
+        "title": tag.title or path.stem,
+        "artist": tag.artist or "Unknown Artist",
+        "album": tag.album,
+        "year": tag.year,
+        "duration_ms": int(tag.duration * 1000) if tag.duration else 0,
+        "genre": tag.genre,
+        "bpm": None,
+    }
+
+    # TinyTag has no BPM field, but reads it into the other fields (a list of values per field)
+    bpm = (getattr(tag, "other", None) or {}).get("bpm")
+    if isinstance(bpm, list):
+        bpm = bpm[0] if bpm else None
+    if bpm:
+        with contextlib.suppress(ValueError, TypeError):
+            tags["bpm"] = float(bpm)
+
+    image = tag.images.any
+    art = image.data if image and image.data else None
+    return CachedTags(
+        tags=tags,
+        art_digest=hashlib.sha1(art).hexdigest() if art else None,
+        art=art if keep_art else None,
+    )
+
+
+def read_embedded_art(path: str | Path) -> bytes | None:
+    """Read the embedded cover art of an audio file.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Cover art data, or None if the file has none or can't be read
+    """
+    try:
+        # TinyTag reads images along with the tags, so the tags can't be skipped
+        image = TinyTag.get(path, duration=False, image=True).images.any
+    except Exception as e:
+        logger.error(f"Error reading cover art from {path}: {e}")
+        return None
+    return image.data if image and image.data else None
+
+
+def _parse_chunk(paths: list[str]) -> list[tuple[str, _FileStat | None, CachedTags | None]]:
+    """Stat and parse a chunk of files, in a worker process.
+
+    The stat is taken before parsing, so a file changing meanwhile is parsed again next time.
+    """
+    results = []
+    for path in paths:
+        stat = _stat(path)
+        results.append((path, stat, parse_file(path) if stat else None))
+    return results
+
+
+def parse_files(
+    paths: Sequence[str],
+    processes: int = MAX_PROCESSES,
+    should_stop: Callable[[], bool] | None = None,
+) -> Iterator[tuple[str, _FileStat | None, CachedTags | None]]:
+    """Parse audio files, in a process pool when there are many.
+
+    Tag parsing is CPU-bound Python, so threads wouldn't parse in parallel.
+
+    Args:
+        paths: Audio files
+        processes: Maximum number of worker processes
+        should_stop: Polled between chunks; returning True stops parsing
+
+    Yields:
+        (path, stat, tags) per file in the order of paths, tags are None if the file couldn't be parsed
+    """
+    chunks = [list(paths[start : start + TAG_CHUNK_SIZE]) for start in range(0, len(paths), TAG_CHUNK_SIZE)]
+    if processes <= 1 or len(paths) < PROCESS_POOL_MIN_FILES:
+        for chunk in chunks:
+            if should_stop and should_stop():
+                return
+            yield from _parse_chunk(chunk)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=processes)
+    try:
+        for results in executor.map(_parse_chunk, chunks):
+            yield from results
+            if should_stop and should_stop():
+                return
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class TagCache:
+    """Parsed tags of local audio files, stored in the database."""
+
+    def __init__(self, session: Session | None = None):
+        """Initialize the tag cache.
+
+        Args:
+            session: Database session (creates a new one if not provided)
+        """
+        self.session = session or get_session()
+
+    def get(self, path: str | Path, with_art: bool = False) -> CachedTags | None:
+        """Get the tags of a file, parsing it only if it changed since it was cached.
+
+        Args:
+            path: Path to the audio file
+            with_art: Whether to also return the embedded cover art
+
+        Returns:
+            Tags of the file, or None if it doesn't exist or can't be parsed
+        """
+        path = str(path)
+        stat = _stat(path)
+        if stat is None:
+            return None
+
+        row = self.session.get(FileTags, path)
+        if row is not None and (row.size, row.mtime_ns) == stat:
+            cached = CachedTags(json.loads(row.tags), row.art_digest)
+            if with_art and cached.art_digest:
+                cached.art = read_embedded_art(path)
+            return cached
+
+        cached = parse_file(path, keep_art=with_art)
+        if cached:
+            self._store([(path, stat, cached)])
+        return cached
+
+    def get_many(
+        self, paths: Iterable[str | Path], should_stop: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, CachedTags | None]]:
+        """Get the tags of many files, parsing the uncached ones in parallel.
+
+        Cached files are yielded first, then the parsed ones as they come in.
+
+        Args:
+            paths: Paths to the audio files
+            should_stop: Polled while parsing; returning True stops parsing
+
+        Yields:
+            (path, tags) per file, tags are None if it doesn't exist or can't be parsed
+        """
+        paths = list(dict.fromkeys(str(path) for path in paths))
+        misses = []
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            rows = {row.path: row for row in self.session.query(FileTags).filter(FileTags.path.in_(chunk))}
+            for path in chunk:
+                row = rows.get(path)
+                if row is not None and (row.size, row.mtime_ns) == _stat(path):
+                    yield path, CachedTags(json.loads(row.tags), row.art_digest)
+                else:
+                    misses.append(path)
+
+        parsed = []
+        for path, stat, cached in parse_files(misses, should_stop=should_stop):
+            if stat and cached:
+                parsed.append((path, stat, cached))
+                if len(parsed) >= STORE_BATCH_SIZE:
+                    self._store(parsed)
+                    parsed = []
+            yield path, cached
+        self._store(parsed)
+
+    def art_digests(self, paths: Iterable[str | Path]) -> dict[str, str | None]:
+        """Get the cover art digests of files without parsing them.
+
+        Args:
+            paths: Paths to the audio files
+
+        Returns:
+            Dictionary mapping the paths whose cached tags are current to their art digest (None if the
+            file has no cover art)
+        """
+        paths = list(dict.fromkeys(str(path) for path in paths))
+        digests = {}
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            rows = (
+                self.session.query(FileTags.path, FileTags.size, FileTags.mtime_ns, FileTags.art_digest)
+                .filter(FileTags.path.in_(chunk))
+                .all()
+            )
+            for path, size, mtime_ns, art_digest in rows:
+                if (size, mtime_ns) == _stat(path):
+                    digests[path] = art_digest
+        return digests
+
+    def read_art(self, path: str | Path) -> bytes | None:
+        """Read the embedded cover art of a file, unless its cached tags show it has none.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            Cover art data, or None if the file has none or can't be read
+        """
+        path = str(path)
+        digests = self.art_digests([path])
+        if path in digests and digests[path] is None:
+            return None
+        return read_embedded_art(path)
+
+    def move(self, moved: Iterable[tuple[str, str]]) -> None:
+        """Keep the cached tags of renamed or moved files.
+
+        Args:
+            moved: (previous path, new path) of each file
+        """
+        moved = list(moved)
+        if not moved:
+            return
+        new_paths = [new_path for _, new_path in moved]
+        for start in range(0, len(new_paths), KEY_CHUNK_SIZE):
+            chunk = new_paths[start : start + KEY_CHUNK_SIZE]
+            self.session.execute(delete(FileTags).where(FileTags.path.in_(chunk)))
+        for old_path, new_path in moved:
+            self.session.execute(update(FileTags).where(FileTags.path == old_path).values(path=new_path))
+        self.session.commit()
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Drop the cached tags of deleted files.
+
+        Args:
+            paths: Paths of the deleted files
+        """
+        paths = list(paths)
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            self.session.execute(delete(FileTags).where(FileTags.path.in_(chunk)))
+        self.session.commit()
+
+    def _store(self, entries: list[tuple[str, _FileStat, CachedTags]]) -> None:
+        """Store parsed tags, replacing outdated entries, in one transaction.
+
+        Args:
+            entries: (path, stat, tags) of the parsed files
+        """
+        if not entries:
+            return
+        paths = [path for path, _, _ in entries]
+        for start in range(0, len(paths), KEY_CHUNK_SIZE):
+            chunk = paths[start : start + KEY_CHUNK_SIZE]
+            self.session.execute(delete(FileTags).where(FileTags.path.in_(chunk)))
+        self.session.execute(
+            insert(FileTags),
+            [
+                {
+                    "path": path,
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "tags": json.dumps(cached.tags),
+                    "art_digest": cached.art_digest,
+                }
+                for path, (size, mtime_ns), cached in entries
+            ],
+        )
+        self.session.commit()
@@ -0,0 +1,166 @@
+"""Normalization and similarity scoring for matching tracks across sources.
+
+Titles and artists of the same recording differ between platforms in case,
+diacritics, punctuation, featured-artist credits and decorations such as
+"(Original Mix)" or "(Official Video)". The helpers in this module reduce
+them to comparable keys and score how well two tracks match.
+"""
+
+import difflib
+import re
+import unicodedata
+
+# Featured-artist credits, e.g. "feat. X", "ft X", "(featuring X)"
+_FEATURING_RE = re.compile(r"[\(\[]?\s*\b(?:feat|ft|featuring)\b\.?\s+[^\)\]]*[\)\]]?", re.IGNORECASE)
+
+# Bracketed decorations that don't distinguish recordings
+_DECORATION_RE = re.compile(
+    r"[\(\[]\s*(?:original(?: mix)?|official(?: music)?(?: video| audio)?|lyrics?(?: video)?|audio|hq|hd)\s*[\)\]]",
+    re.IGNORECASE,
+)
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+# Separates artist and title in combined matching keys; never part of normalized text
+KEY_SEPARATOR = "|"
+
+# Weights of the title, artist and duration similarity in match_score
+TITLE_WEIGHT = 0.5
+ARTIST_WEIGHT = 0.4
+DURATION_WEIGHT = 0.1
+
+# Duration difference (seconds) under which two tracks count as equally long
+DURATION_TOLERANCE_SECONDS = 3
+
+# Duration difference (seconds) at which the duration similarity drops to zero
+DURATION_CUTOFF_SECONDS = 30
+
+
+def normalize_text(text: str | None) -> str:
+    """Reduce text to lowercase words without diacritics or punctuation.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Space-separated lowercase words
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD_RE.sub(" ", stripped.casefold().replace("_", " ")).strip()
+
+
+def normalize_title(title: str | None) -> str:
+    """Normalize a track title for matching.
+
+    Removes featured-artist credits and decorations like "(Original Mix)" or
+    "(Official Video)" before normalizing the text. Other mix names such as
+    "(Extended Mix)" are kept, since they identify a different recording.
+
+    Args:
+        title: Track title
+
+    Returns:
+        Normalized title
+    """
+    if not title:
+        return ""
+    title = _DECORATION_RE.sub(" ", title)
+    title = _FEATURING_RE.sub(" ", title)
+    return normalize_text(title)
+
+
+def normalize_artist(artist: str | None) -> str:
+    """Normalize an artist name for matching.
+
+    Args:
+        artist: Artist name, possibly with featured artists
+
+    Returns:
+        Normalized name of the main artist(s)
+    """
+    if not artist:
+        return ""
+    return normalize_text(_FEATURING_RE.sub(" ", artist))
+
+
+def track_match_key(title_key: str, artist_key: str) -> str:
+    """Combine normalized title and artist into one matching key.
+
+    The artist comes first, so prefix lookups on the key find all tracks of an artist.
+
+    Args:
+        title_key: Normalized title
+        artist_key: Normalized artist
+
+    Returns:
+        Combined key
+    """
+    return f"{artist_key}{KEY_SEPARATOR}{title_key}"
+
+
+def text_similarity(a: str, b: str) -> float:
+    """Calculate the similarity of two normalized strings.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Similarity ratio (0.0-1.0)
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def duration_similarity(duration_ms_a: int | None, duration_ms_b: int | None) -> float:
+    """Calculate the similarity of two track durations.
+
+    Unknown durations count as a match, so they don't penalize the score.
+
+    Args:
+        duration_ms_a: First duration in milliseconds
+        duration_ms_b: Second duration in milliseconds
+
+    Returns:
+        Similarity (0.0-1.0)
+    """
+    if not duration_ms_a or not duration_ms_b:
+        return 1.0
+    diff_seconds = abs(duration_ms_a - duration_ms_b) / 1000
+    if diff_seconds < DURATION_TOLERANCE_SECONDS:
+        return 1.0
+    return max(0.0, 1.0 - diff_seconds / DURATION_CUTOFF_SECONDS)
+
+
+def match_score(
+    title_a: str,
+    artist_a: str,
+    duration_ms_a: int | None,
+    title_b: str,
+    artist_b: str,
+    duration_ms_b: int | None,
+) -> float:
+    """Score how likely two normalized tracks are the same recording.
+
+    Args:
+        title_a: Normalized title of the first track
+        artist_a: Normalized artist of the first track
+        duration_ms_a: Duration of the first track in milliseconds
+        title_b: Normalized title of the second track
+        artist_b: Normalized artist of the second track
+        duration_ms_b: Duration of the second track in milliseconds
+
+    Returns:
+        Weighted similarity (0.0-1.0)
+    """
+    return (
+        text_similarity(title_a, title_b) * TITLE_WEIGHT  # Title is very important
+        + text_similarity(artist_a, artist_b) * ARTIST_WEIGHT  # Artist is important
+        + duration_similarity(duration_ms_a, duration_ms_b) * DURATION_WEIGHT  # Duration is a secondary factor
+    )
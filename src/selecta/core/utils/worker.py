@@ -76,3 +76,19 @@ class ThreadManager:
         worker = Worker(fn, *args, **kwargs)
         self.thread_pool.start(worker)  # type: ignore
         return worker
+
+    def run_task_with_priority(self, priority: int, fn: Callable, *args: Any, **kwargs: Any) -> Worker:
+        """Run a task in a background thread, ahead of queued tasks with a lower priority.
+
+        Args:
+            priority: Priority of the task; tasks waiting for a thread start in order of priority
+            fn: The function to run
+            *args: Arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            Worker instance with signal connections
+        """
+        worker = Worker(fn, *args, **kwargs)
+        self.thread_pool.start(worker, priority)  # type: ignore
+        return worker
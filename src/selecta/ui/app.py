@@ -2,7 +2,7 @@ import sys
 from typing import Any
 
 from loguru import logger
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from selecta.core.utils.folder_watcher import FolderWatcher
 from selecta.core.utils.type_helpers import (
     has_details_panel,
     has_horizontal_splitter,
@@ -28,6 +29,9 @@ from selecta.ui.themes.theme_manager import Theme, ThemeManager
 class SelectaMainWindow(QMainWindow):
     """Main application window for Selecta."""
 
+    # Emitted (from the folder watcher thread) with the FolderSync of a background folder sync
+    library_synced = pyqtSignal(object)
+
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -135,6 +139,55 @@ class SelectaMainWindow(QMainWindow):
         # Dynamic content will be created later
         self.dynamic_content = None
 
+        # Keep the library in sync with the local database folder
+        self.folder_watcher: FolderWatcher | None = None
+        self.library_synced.connect(self._on_library_synced)
+        self._start_folder_watcher()
+
+    def _start_folder_watcher(self, folder_path: str | None = None) -> None:
+        """Start watching the local database folder, replacing any previous watcher.
+
+        Args:
+            folder_path: Folder to watch (default: the folder from the settings)
+        """
+        if self.folder_watcher:
+            self.folder_watcher.stop()
+            self.folder_watcher = None
+
+        if folder_path is None:
+            from selecta.core.data.repositories.settings_repository import SettingsRepository
+
+            folder_path = SettingsRepository().get_local_database_folder()
+        if not folder_path:
+            return
+
+        self.folder_watcher = FolderWatcher(folder_path, on_sync=self.library_synced.emit)
+        self.folder_watcher.start()
+
+    def _on_library_synced(self, result: Any) -> None:
+        """Refresh the library view after the folder watcher changed the database.
+
+        Args:
+            result: FolderSync of the background sync
+        """
+        if result.missing:
+            logger.warning(f"{result.missing} tracks in the library have missing files")
+        if not result.changed or self.current_platform not in ("library", "local"):
+            return
+
+        from selecta.ui.components.playlist.playlist_component import PlaylistComponent
+
+        for i in range(self.playlist_layout.count()):
+            widget = self.playlist_layout.itemAt(i).widget()
+            if isinstance(widget, PlaylistComponent):
+                widget.refresh()
+
+    def closeEvent(self, event):
+        """Stop the folder watcher when the window closes."""
+        if self.folder_watcher:
+            self.folder_watcher.stop()
+        super().closeEvent(event)
+
     def resize_to_available_screen(self):
         """Resize the window to fill the available screen space."""
         # Get the primary screen
@@ -638,6 +691,9 @@ class SelectaMainWindow(QMainWindow):
             # Start the scanning process
             self._scan_local_database_folder(folder_path)
 
+        # Watch the new folder, after the scan so both don't import the same files at once
+        self._start_folder_watcher(folder_path)
+
     def _scan_local_database_folder(self, folder_path: str):
         """Scan the local database folder for music files.
 
@@ -663,8 +719,6 @@ class SelectaMainWindow(QMainWindow):
 
             # Start scanning
             logger.info(f"Starting scan of folder: {folder_path}")
-            audio_extensions = {".mp3", ".flac", ".wav", ".aac", ".m4a", ".ogg", ".aiff"}
-            folder = Path(folder_path)
 
             # First, count the total files to process
             # Since this might take a while, update the progress dialog
@@ -677,7 +731,9 @@ class SelectaMainWindow(QMainWindow):
             QCoreApplication.processEvents()
 
             # Count files using a simplified approach to avoid traversing twice
-            audio_files = [f for f in folder.glob("**/*") if f.is_file() and f.suffix.lower() in audio_extensions]
+            from selecta.core.utils.folder_scanner import walk_audio_files
+
+            audio_files = [Path(entry.path) for entry in walk_audio_files(folder_path)]
             total_files = len(audio_files)
 
             if total_files == 0:
@@ -1,9 +1,11 @@
 """Common utilities and shared components."""
 
+from selecta.ui.components.common.change_relay import ChangeRelay
 from selecta.ui.components.common.image_loader import DatabaseImageLoader
 from selecta.ui.components.common.selection_state import SelectionState
 
 __all__ = [
+    "ChangeRelay",
     "DatabaseImageLoader",
     "SelectionState",
 ]
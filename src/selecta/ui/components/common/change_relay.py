@@ -0,0 +1,68 @@
+"""Relay of the repositories' change events to the GUI thread."""
+
+import threading
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from selecta.core.data.change_events import ChangeEvent, change_bus, coalesce_changes
+
+
+class ChangeRelay(QObject):
+    """Delivers the committed change events to the GUI thread, merged per event loop turn.
+
+    The repositories publish their events in whichever thread commits. The
+    relay collects them and emits changes_committed once control returns to
+    the GUI event loop, with the events of all commits since merged, so a
+    sync committing track after track updates the views once.
+
+    This is implemented as a singleton, like SelectionState.
+    """
+
+    # Signal emitted in the GUI thread with the merged change events (list of ChangeEvent)
+    changes_committed = pyqtSignal(object)
+
+    # Signal from the committing threads to flush the collected events in the GUI thread
+    _flush_requested = pyqtSignal()
+
+    # Singleton instance
+    _instance = None
+
+    def __new__(cls):
+        """Create or return the singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the relay and subscribe to the change events."""
+        if self._initialized:
+            return
+
+        super().__init__()
+        self._pending: list[ChangeEvent] = []
+        self._lock = threading.Lock()
+        self._initialized = True
+
+        # Queued even when emitted in the GUI thread, so the events of a commit are handled after it returns
+        self._flush_requested.connect(self._flush, Qt.ConnectionType.QueuedConnection)
+        change_bus.subscribe(self._collect)
+
+    def _collect(self, events: list[ChangeEvent]) -> None:
+        """Collect the events of a commit, in the committing thread.
+
+        Args:
+            events: Change events
+        """
+        with self._lock:
+            was_empty = not self._pending
+            self._pending.extend(events)
+        if was_empty:
+            self._flush_requested.emit()
+
+    def _flush(self) -> None:
+        """Emit the collected events, in the GUI thread."""
+        with self._lock:
+            events, self._pending = self._pending, []
+        if events:
+            self.changes_committed.emit(coalesce_changes(events))
@@ -1,17 +1,25 @@
 """Utility for asynchronously loading images from the database."""
 
 import time
+from collections.abc import Iterable
 
 from loguru import logger
-from PyQt6.QtCore import QByteArray, QObject, pyqtSignal
+from PyQt6.QtCore import QByteArray, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
+from selecta.core.data.change_events import ChangeEvent, TrackUpdated, change_bus
 from selecta.core.data.models.db import ImageSize
 from selecta.core.data.repositories.image_repository import ImageRepository
+from selecta.core.utils.pixmap_cache import PixmapCache
 
 
 class DatabaseImageLoader(QObject):
-    """Asynchronous image loader for loading images from the database."""
+    """Asynchronous image loader for loading images from the database.
+
+    Single loads requested while the event loop is busy (e.g. by a delegate
+    painting the rows of a table) are collected and loaded together with one
+    query per image size, once control returns to the event loop.
+    """
 
     # Signal emitted when an image is loaded successfully
     image_loaded = pyqtSignal(str, QPixmap)
@@ -23,6 +31,19 @@ class DatabaseImageLoader(QObject):
     album_image_failed = pyqtSignal(int, str)
     track_image_failed = pyqtSignal(int, str)
 
+    # Signal emitted when a batch of images was handled, loaded or not: kind ("track" or "album"), size, IDs
+    batch_loaded = pyqtSignal(str, object, object)
+
+    # Signal from the worker threads with the decoded images of a batch: kind, size, IDs, images by ID
+    # (None if the batch failed)
+    _images_decoded = pyqtSignal(str, object, object, object)
+
+    # Pixmaps shared by all loaders
+    cache = PixmapCache()
+
+    # Keys ("track_<id>_<size>" or "album_<id>_<size>") of images known not to exist
+    _missing: set[str] = set()
+
     def __init__(self, parent=None):
         """Initialize the database image loader.
 
@@ -30,197 +51,278 @@ class DatabaseImageLoader(QObject):
             parent: Parent QObject
         """
         super().__init__(parent)
-        self._cache = {}  # Simple in-memory cache: keys: "track_<id>_<size>" or "album_<id>_<size>"
-        self._loading = set()  # Track keys currently being loaded
+        self._loading = set()  # Keys ("track_<id>_<size>" or "album_<id>_<size>") currently being loaded
+        # IDs to load in the next batch per (kind, size)
+        self._pending: dict[tuple[str, ImageSize], set[int]] = {}
+        self._images_decoded.connect(self._on_images_decoded)
+        change_bus.subscribe(DatabaseImageLoader._forget_missing)
 
-        # Create a persistent session for the image repository
-        from selecta.core.data.database import get_session
+    def cached_track_image(self, track_id: int, size: ImageSize = ImageSize.THUMBNAIL) -> QPixmap | None:
+        """Get a track's image if it's cached, without loading it.
 
-        session = get_session()
-        self._image_repo = ImageRepository(session)
+        Args:
+            track_id: The track ID
+            size: Image size
+
+        Returns:
+            The cached pixmap, or None
+        """
+        return self.cache.get(f"track_{track_id}", size)
+
+    def cached_album_image(self, album_id: int, size: ImageSize = ImageSize.THUMBNAIL) -> QPixmap | None:
+        """Get an album's image if it's cached, without loading it.
+
+        Args:
+            album_id: The album ID
+            size: Image size
+
+        Returns:
+            The cached pixmap, or None
+        """
+        return self.cache.get(f"album_{album_id}", size)
+
+    def is_missing(self, kind: str, item_id: int, size: ImageSize) -> bool:
+        """Whether an image is known not to exist.
+
+        Args:
+            kind: "track" or "album"
+            item_id: Track or album ID
+            size: Image size
+
+        Returns:
+            True if loading the image found none
+        """
+        return f"{kind}_{item_id}_{size.name}" in self._missing
 
     def load_track_image(self, track_id: int, size: ImageSize = ImageSize.THUMBNAIL) -> None:
         """Load a track's image from the database.
 
+        Emits track_image_loaded right away if the image is cached, otherwise once it's loaded.
+
         Args:
             track_id: The track ID
             size: Desired image size
         """
-        # Create a unique key for this request
-        cache_key = f"track_{track_id}_{size.name}"
-
-        # Check cache first
-        if cache_key in self._cache:
-            self.track_image_loaded.emit(track_id, self._cache[cache_key])
-            return
-
-        # Skip if already loading
-        if cache_key in self._loading:
+        # Callers usually looked the image up already, so a miss isn't counted twice
+        if self.cache.contains(f"track_{track_id}", size):
+            self.track_image_loaded.emit(track_id, self.cached_track_image(track_id, size))
             return
+        self._queue("track", [track_id], size)
 
-        # Mark as loading
-        self._loading.add(cache_key)
+    def load_track_images(
+        self, track_ids: Iterable[int], size: ImageSize = ImageSize.THUMBNAIL, priority: int = 0
+    ) -> dict[int, QPixmap]:
+        """Load the images of many tracks, e.g. the visible rows of a table, with one query.
 
-        # Use ThreadManager instead of raw Thread for better performance
-        from selecta.core.utils.worker import ThreadManager
-
-        thread_manager = ThreadManager()
-        worker = thread_manager.run_task(self._load_track_image_task, track_id, size, cache_key)
+        Args:
+            track_ids: The track IDs
+            size: Desired image size
+            priority: Priority of the query among the queued loading tasks
 
-        # Connect signals
-        worker.signals.error.connect(lambda err: self._handle_track_image_error(track_id, err, cache_key))
-        worker.signals.finished.connect(lambda: self._loading.discard(cache_key))
+        Returns:
+            The cached images by track ID; track_image_loaded is emitted for the others once loaded
+        """
+        cached, missing = self._split_cached("track", track_ids, size)
+        self._queue("track", missing, size)
+        self._flush_pending(priority)
+        return cached
 
     def load_album_image(self, album_id: int, size: ImageSize = ImageSize.THUMBNAIL) -> None:
         """Load an album's image from the database.
 
+        Emits album_image_loaded right away if the image is cached, otherwise once it's loaded.
+
         Args:
             album_id: The album ID
             size: Desired image size
         """
-        # Create a unique key for this request
-        cache_key = f"album_{album_id}_{size.name}"
-
-        # Check cache first
-        if cache_key in self._cache:
-            self.album_image_loaded.emit(album_id, self._cache[cache_key])
+        if self.cache.contains(f"album_{album_id}", size):
+            self.album_image_loaded.emit(album_id, self.cached_album_image(album_id, size))
             return
+        self._queue("album", [album_id], size)
 
-        # Skip if already loading
-        if cache_key in self._loading:
-            return
-
-        # Mark as loading
-        self._loading.add(cache_key)
-
-        # Use ThreadManager instead of raw Thread for better performance
-        from selecta.core.utils.worker import ThreadManager
-
-        thread_manager = ThreadManager()
-        worker = thread_manager.run_task(self._load_album_image_task, album_id, size, cache_key)
-
-        # Connect signals
-        worker.signals.error.connect(lambda err: self._handle_album_image_error(album_id, err, cache_key))
-        worker.signals.finished.connect(lambda: self._loading.discard(cache_key))
-
-    def _load_track_image_task(self, track_id: int, size: ImageSize, cache_key: str) -> QPixmap | None:
-        """Task function for loading a track's image using ThreadManager.
+    def load_album_images(
+        self, album_ids: Iterable[int], size: ImageSize = ImageSize.THUMBNAIL, priority: int = 0
+    ) -> dict[int, QPixmap]:
+        """Load the images of many albums with one query.
 
         Args:
-            track_id: The track ID
+            album_ids: The album IDs
             size: Desired image size
-            cache_key: Unique cache key for this request
+            priority: Priority of the query among the queued loading tasks
 
         Returns:
-            QPixmap if successful, None otherwise
+            The cached images by album ID; album_image_loaded is emitted for the others once loaded
         """
-        start_time = time.time()
-
-        # Get image from repository
-        image = self._image_repo.get_track_image(track_id, size)
+        cached, missing = self._split_cached("album", album_ids, size)
+        self._queue("album", missing, size)
+        self._flush_pending(priority)
+        return cached
 
-        if not image or not image.data:
-            return None
-
-        # Convert to QPixmap
-        pixmap = self._create_pixmap_from_image_data(image.data)
+    def _split_cached(self, kind: str, ids: Iterable[int], size: ImageSize) -> tuple[dict[int, QPixmap], list[int]]:
+        """Split IDs into the cached images and the IDs to load.
 
-        if pixmap is None:
-            return None
+        Args:
+            kind: "track" or "album"
+            ids: Track or album IDs
+            size: Image size
 
-        # Cache the pixmap
-        self._cache[cache_key] = pixmap
+        Returns:
+            Tuple of (cached images by ID, IDs not cached)
+        """
+        cached = {}
+        missing = []
+        for item_id in dict.fromkeys(ids):
+            key = f"{kind}_{item_id}"
+            if self.cache.contains(key, size):
+                cached[item_id] = self.cache.get(key, size)
+            else:
+                missing.append(item_id)
+        return cached, missing
+
+    def _queue(self, kind: str, ids: Iterable[int], size: ImageSize) -> None:
+        """Queue images for the next batch, skipping the ones loading or known not to exist.
 
-        # Emit signal with result - will be handled by the main thread
-        logger.debug(f"Loaded track image {track_id} in {time.time() - start_time:.2f}s")
+        Args:
+            kind: "track" or "album"
+            ids: Track or album IDs
+            size: Image size
+        """
+        was_empty = not self._pending
+        for item_id in ids:
+            key = f"{kind}_{item_id}_{size.name}"
+            if key in self._loading or key in self._missing:
+                continue
+            self._loading.add(key)
+            self._pending.setdefault((kind, size), set()).add(item_id)
 
-        # We return the pixmap, and the Worker will pass it to the result signal
-        # We'll connect to the signal in the load method
-        self.track_image_loaded.emit(track_id, pixmap)
-        return pixmap
+        if was_empty and self._pending:
+            QTimer.singleShot(0, self._flush_pending)
 
-    def _handle_track_image_error(self, track_id: int, error: str, cache_key: str) -> None:
-        """Handle errors from track image loading.
+    def _flush_pending(self, priority: int = 0) -> None:
+        """Start loading the queued images, one task per kind and size.
 
         Args:
-            track_id: The track ID
-            error: Error message
-            cache_key: Cache key to clean up
+            priority: Priority of the tasks among the queued loading tasks
         """
-        logger.error(f"Error loading track image {track_id}: {error}")
-        self.track_image_failed.emit(track_id, error)
+        from selecta.core.utils.worker import ThreadManager
+
+        pending, self._pending = self._pending, {}
+        thread_manager = ThreadManager()
+        for (kind, size), ids in pending.items():
+            thread_manager.run_task_with_priority(priority, self._load_images_task, kind, sorted(ids), size)
 
-    def _load_album_image_task(self, album_id: int, size: ImageSize, cache_key: str) -> QPixmap | None:
-        """Task function for loading an album's image using ThreadManager.
+    def _load_images_task(self, kind: str, ids: list[int], size: ImageSize) -> None:
+        """Task function for loading a batch of images using ThreadManager.
+
+        The images are decoded here, and turned into pixmaps in the GUI thread,
+        since pixmaps can't be created in other threads.
 
         Args:
-            album_id: The album ID
+            kind: "track" or "album"
+            ids: Track or album IDs
             size: Desired image size
-            cache_key: Unique cache key for this request
-
-        Returns:
-            QPixmap if successful, None otherwise
         """
-        start_time = time.time()
-
-        # Get image from repository
-        image = self._image_repo.get_album_image(album_id, size)
+        from selecta.core.data.database import get_session
 
-        if not image or not image.data:
-            return None
+        start_time = time.time()
+        session = get_session()
+        try:
+            image_repo = ImageRepository(session)
+            if kind == "track":
+                image_data = image_repo.get_track_image_data(ids, size)
+            else:
+                image_data = image_repo.get_album_image_data(ids, size)
+
+            images = {}
+            for item_id, data in image_data.items():
+                image = self._create_image_from_data(data)
+                if image is not None:
+                    images[item_id] = image
+        except Exception as e:
+            logger.error(f"Error loading {len(ids)} {kind} images: {e}")
+            self._images_decoded.emit(kind, size, ids, None)
+            return
+        finally:
+            session.close()
 
-        # Convert to QPixmap
-        pixmap = self._create_pixmap_from_image_data(image.data)
+        logger.debug(f"Loaded {len(images)} of {len(ids)} {kind} images in {time.time() - start_time:.2f}s")
+        self._images_decoded.emit(kind, size, ids, images)
 
-        if pixmap is None:
-            return None
+    def _on_images_decoded(self, kind: str, size: ImageSize, ids: list[int], images: dict[int, QImage] | None) -> None:
+        """Cache and announce a loaded batch of images, in the GUI thread.
 
-        # Cache the pixmap
-        self._cache[cache_key] = pixmap
+        Args:
+            kind: "track" or "album"
+            size: Image size
+            ids: Track or album IDs of the batch
+            images: Decoded images by ID, None if the batch failed
+        """
+        loaded = self.track_image_loaded if kind == "track" else self.album_image_loaded
+        failed = self.track_image_failed if kind == "track" else self.album_image_failed
 
-        # Log performance
-        logger.debug(f"Loaded album image {album_id} in {time.time() - start_time:.2f}s")
+        for item_id in ids:
+            key = f"{kind}_{item_id}_{size.name}"
+            self._loading.discard(key)
+            if images is None:
+                failed.emit(item_id, "Error loading image")
+                continue
 
-        # Emit signal with the loaded image
-        self.album_image_loaded.emit(album_id, pixmap)
-        return pixmap
+            image = images.get(item_id)
+            if image is None:
+                # Don't query again for images that don't exist
+                self._missing.add(key)
+                continue
 
-    def _handle_album_image_error(self, album_id: int, error: str, cache_key: str) -> None:
-        """Handle errors from album image loading.
+            pixmap = QPixmap.fromImage(image)
+            self.cache.insert(f"{kind}_{item_id}", size, pixmap)
+            loaded.emit(item_id, pixmap)
 
-        Args:
-            album_id: The album ID
-            error: Error message
-            cache_key: Cache key to clean up
-        """
-        logger.error(f"Error loading album image {album_id}: {error}")
-        self.album_image_failed.emit(album_id, error)
+        self.batch_loaded.emit(kind, size, ids)
 
-    def _create_pixmap_from_image_data(self, image_data: bytes) -> QPixmap | None:
-        """Create a QPixmap from image binary data.
+    def _create_image_from_data(self, image_data: bytes) -> QImage | None:
+        """Decode image binary data.
 
         Args:
             image_data: Binary image data
 
         Returns:
-            QPixmap object or None if conversion fails
+            QImage object or None if decoding fails
         """
         try:
-            # Convert binary data to QImage
-            byte_array = QByteArray(image_data)
-            image = QImage.fromData(byte_array)
-
-            if image.isNull():
-                return None
-
-            return QPixmap.fromImage(image)
+            image = QImage.fromData(QByteArray(image_data))
+            return None if image.isNull() else image
         except Exception as e:
-            logger.error(f"Error creating pixmap: {e}")
+            logger.error(f"Error decoding image: {e}")
             return None
 
-    def clear_cache(self) -> None:
-        """Clear the image cache."""
-        self._cache.clear()
+    def cache_stats(self) -> dict[str, object]:
+        """Get the statistics of the shared pixmap cache.
+
+        Returns:
+            Dictionary with the hits, misses, evictions, hit rate and memory use per image size
+        """
+        return self.cache.stats()
+
+    @classmethod
+    def _forget_missing(cls, events: list[ChangeEvent]) -> None:
+        """Stop treating the images of tracks as missing once images were stored for them.
+
+        Called in the committing thread, before any view reacts to the change,
+        so a repaint right after loads the new image.
+
+        Args:
+            events: Committed change events
+        """
+        for change in events:
+            if isinstance(change, TrackUpdated) and change.changes.get("has_image"):
+                cls._missing.difference_update({f"track_{change.track_id}_{size.name}" for size in ImageSize})
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the image cache shared by all loaders, e.g. after images were added."""
+        cls.cache.clear()
+        cls._missing.clear()
 
     def clear_track_image_cache(self, track_id: int) -> None:
         """Clear the cache for a specific track.
@@ -228,11 +330,6 @@ class DatabaseImageLoader(QObject):
         Args:
             track_id: The track ID to clear from cache
         """
-        keys_to_remove = []
-        for key in self._cache:
-            if key.startswith(f"track_{track_id}_"):
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            logger.debug(f"Removing {key} from image cache")
-            del self._cache[key]
+        logger.debug(f"Removing track {track_id} from image cache")
+        self.cache.remove(f"track_{track_id}")
+        self._missing.difference_update({f"track_{track_id}_{size.name}" for size in ImageSize})
@@ -2,7 +2,7 @@
 
 from loguru import logger
 from PyQt6.QtCore import Qt, QUrl, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QDesktopServices, QMouseEvent, QPixmap
+from PyQt6.QtGui import QDesktopServices, QImage, QMouseEvent, QPixmap
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -14,7 +14,10 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from selecta.core.data.database import session_scope
 from selecta.core.data.models.db import ImageSize
+from selecta.core.utils.tag_cache import TagCache
+from selecta.core.utils.worker import ThreadManager
 from selecta.ui.components.common.image_loader import DatabaseImageLoader
 from selecta.ui.dialogs.spotify_device_dialog import SpotifyDeviceDialog
 
@@ -579,6 +582,12 @@ class AudioPlayerComponent(QWidget):
             except Exception as e:
                 logger.debug(f"Error getting cover from metadata: {e}")
 
+        # Fall back to the cover art embedded in the local file, read in the background
+        if not cover_path and getattr(track, "local_path", None):
+            worker = ThreadManager().run_task(self._read_embedded_cover, track.local_path)
+            worker.signals.result.connect(lambda image: self._on_embedded_cover_loaded(track, image))
+            worker.signals.error.connect(lambda err: logger.debug(f"Error loading embedded cover image: {err}"))
+
         # If we found a cover path, try to load it
         if cover_path:
             try:
@@ -591,6 +600,36 @@ class AudioPlayerComponent(QWidget):
             except Exception as e:
                 logger.debug(f"Error loading cover image: {e}")
 
+    @staticmethod
+    def _read_embedded_cover(path: str) -> QImage | None:
+        """Read and decode the cover art embedded in an audio file, in a worker thread.
+
+        Files the tag cache knows to have no cover art aren't opened.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            Decoded cover image, or None if the file has none
+        """
+        with session_scope() as session:
+            data = TagCache(session).read_art(path)
+        image = QImage.fromData(data) if data else None
+        return image if image is not None and not image.isNull() else None
+
+    def _on_embedded_cover_loaded(self, track, image: QImage | None) -> None:
+        """Show an embedded cover image read in the background, in the GUI thread.
+
+        Args:
+            track: Track the cover was read for
+            image: Decoded cover image, None if the file has none
+        """
+        if image is None or track is not self.current_track:
+            return
+        pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
+        self.cover_image.setPixmap(pixmap)
+        logger.debug(f"Loaded embedded cover image from {track.local_path}")
+
     def _on_player_error(self, error: str) -> None:
         """Handle player errors.
 
@@ -0,0 +1,224 @@
+"""Viewport-aware scheduling of artwork loads for item views."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QObject, QPoint, Qt, QTimer
+from PyQt6.QtWidgets import QAbstractItemView
+
+from selecta.core.data.models.db import ImageSize
+from selecta.ui.components.common.image_loader import DatabaseImageLoader
+
+# Delay in milliseconds between the first request and issuing the queued requests, so rows
+# scrolled past during a fast scroll are dropped before they are loaded
+SCHEDULE_DELAY_MS = 30
+
+# Rows beyond the visible ones prefetched in the scroll direction
+PREFETCH_ROWS = 20
+
+# Priorities of the loading tasks for visible and prefetched rows
+VISIBLE_PRIORITY = 10
+PREFETCH_PRIORITY = -10
+
+# Number of recent load latencies the metrics are computed from
+LATENCY_SAMPLES = 200
+
+
+@dataclass
+class ArtworkRequest:
+    """Artwork needed for a row of a view."""
+
+    track_id: int | None
+    album_id: int | None
+    has_image: bool
+    requested_at: float
+
+    @property
+    def image_key(self) -> tuple[str, int] | None:
+        """Kind and ID of the image to load: the track's (which falls back to its album's) or the album's."""
+        if self.track_id and self.has_image:
+            return "track", self.track_id
+        if self.album_id:
+            return "album", self.album_id
+        return None
+
+
+class ArtworkScheduler(QObject):
+    """Loads the artwork of the rows a view paints, visible rows first.
+
+    Paint requests are collected for SCHEDULE_DELAY_MS. Then the requests for
+    rows still visible are loaded in one batch at high priority, the ones for
+    rows that scrolled out of view meanwhile are dropped, and the next
+    PREFETCH_ROWS rows in the scroll direction are loaded at low priority, so
+    loads for rows scrolled past queue up behind the rows now visible.
+    """
+
+    def __init__(
+        self,
+        view: QAbstractItemView,
+        loader: DatabaseImageLoader,
+        size: ImageSize = ImageSize.THUMBNAIL,
+        column: int = 0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            view: View whose rows need artwork
+            loader: Image loader
+            size: Image size to load
+            column: Column whose UserRole data holds the track_id, album_id and has_image of a row
+        """
+        super().__init__(view)
+        self.view = view
+        self.loader = loader
+        self.size = size
+        self.column = column
+
+        # Requests per row waiting to be issued
+        self._queued: dict[int, ArtworkRequest] = {}
+        # Request time of the images being loaded, by (kind, ID)
+        self._in_flight: dict[tuple[str, int], float] = {}
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._previous_first_row = 0
+
+        # Counters for the metrics
+        self.issued = 0
+        self.prefetched = 0
+        self.cancelled = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SCHEDULE_DELAY_MS)
+        self._timer.timeout.connect(self._dispatch)
+        loader.batch_loaded.connect(self._on_batch_loaded)
+
+    def request(self, row: int, track_id: int | None, album_id: int | None, has_image: bool) -> None:
+        """Request the artwork of a painted row.
+
+        Args:
+            row: Row of the view
+            track_id: Track ID of the row
+            album_id: Album ID of the row
+            has_image: Whether the track has its own image
+        """
+        request = self._queued.get(row)
+        if request is None or (request.track_id, request.album_id) != (track_id, album_id):
+            self._queued[row] = ArtworkRequest(track_id, album_id, has_image, time.monotonic())
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def metrics(self) -> dict[str, float]:
+        """Get the scheduling metrics.
+
+        Returns:
+            Dictionary with the number of queued and in-flight requests, the counts of issued,
+            prefetched and cancelled requests, and the mean and 95th percentile latency in milliseconds
+            from request to loaded image over the recent loads
+        """
+        latencies = sorted(self._latencies)
+        mean = sum(latencies) / len(latencies) if latencies else 0.0
+        p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else 0.0
+        return {
+            "queued": len(self._queued),
+            "in_flight": len(self._in_flight),
+            "issued": self.issued,
+            "prefetched": self.prefetched,
+            "cancelled": self.cancelled,
+            "latency_mean_ms": mean * 1000,
+            "latency_p95_ms": p95 * 1000,
+        }
+
+    def _visible_rows(self) -> tuple[int, int]:
+        """Get the first and last visible row, (0, -1) if there are none."""
+        model = self.view.model()
+        viewport = self.view.viewport()
+        if model is None or viewport is None or model.rowCount() == 0:
+            return 0, -1
+        first = self.view.indexAt(QPoint(0, 0)).row()
+        last = self.view.indexAt(QPoint(0, viewport.height() - 1)).row()
+        return max(first, 0), last if last >= 0 else model.rowCount() - 1
+
+    def _row_request(self, row: int, requested_at: float) -> ArtworkRequest | None:
+        """Get the artwork request for a row that wasn't painted yet.
+
+        Args:
+            row: Row of the view
+            requested_at: Time of the request
+
+        Returns:
+            The request, or None if the row has no artwork
+        """
+        model = self.view.model()
+        data = model.index(row, self.column).data(Qt.ItemDataRole.UserRole) if model is not None else None
+        if not isinstance(data, dict):
+            return None
+        return ArtworkRequest(data.get("track_id"), data.get("album_id"), data.get("has_image", False), requested_at)
+
+    def _dispatch(self) -> None:
+        """Issue the requests of the visible rows and prefetch the rows ahead."""
+        first, last = self._visible_rows()
+        queued, self._queued = self._queued, {}
+        visible = [request for row, request in queued.items() if first <= row <= last]
+        self.cancelled += len(queued) - len(visible)
+        self.issued += self._load(visible, VISIBLE_PRIORITY)
+        if last < first:
+            return
+
+        # Prefetch in the direction of the last scroll
+        model = self.view.model()
+        row_count = model.rowCount() if model is not None else 0
+        if first >= self._previous_first_row:
+            rows = range(last + 1, min(last + 1 + PREFETCH_ROWS, row_count))
+        else:
+            rows = range(first - 1, max(first - 1 - PREFETCH_ROWS, -1), -1)
+        self._previous_first_row = first
+
+        now = time.monotonic()
+        prefetch = [request for row in rows if (request := self._row_request(row, now))]
+        self.prefetched += self._load(prefetch, PREFETCH_PRIORITY)
+
+    def _load(self, requests: list[ArtworkRequest], priority: int) -> int:
+        """Load the images of requests that aren't cached or loading already.
+
+        Args:
+            requests: Artwork requests
+            priority: Priority of the loading tasks
+
+        Returns:
+            Number of images requested from the loader
+        """
+        ids: dict[str, list[int]] = {"track": [], "album": []}
+        for request in requests:
+            image_key = request.image_key
+            if image_key is None or image_key in self._in_flight:
+                continue
+            kind, item_id = image_key
+            if self.loader.cache.contains(f"{kind}_{item_id}", self.size) or self.loader.is_missing(
+                kind, item_id, self.size
+            ):
+                continue
+            self._in_flight[image_key] = request.requested_at
+            ids[kind].append(item_id)
+
+        if ids["track"]:
+            self.loader.load_track_images(ids["track"], self.size, priority)
+        if ids["album"]:
+            self.loader.load_album_images(ids["album"], self.size, priority)
+        return len(ids["track"]) + len(ids["album"])
+
+    def _on_batch_loaded(self, kind: str, size: ImageSize, ids: list[int]) -> None:
+        """Record the latency of the loaded images.
+
+        Args:
+            kind: "track" or "album"
+            size: Image size
+            ids: Track or album IDs of the batch
+        """
+        if size != self.size:
+            return
+        now = time.monotonic()
+        for item_id in ids:
+            requested_at = self._in_flight.pop((kind, item_id), None)
+            if requested_at is not None:
+                self._latencies.append(now - requested_at)
@@ -2,10 +2,11 @@
 
 from PyQt6.QtCore import QRect, QSize, Qt
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtWidgets import QItemDelegate, QStyle
+from PyQt6.QtWidgets import QAbstractItemView, QItemDelegate, QStyle
 
 from selecta.core.data.models.db import ImageSize
 from selecta.ui.components.common.image_loader import DatabaseImageLoader
+from selecta.ui.components.playlist.icons.artwork_scheduler import ArtworkScheduler
 
 
 class TrackImageDelegate(QItemDelegate):
@@ -21,7 +22,6 @@ class TrackImageDelegate(QItemDelegate):
             parent: Parent widget
         """
         super().__init__(parent)
-        self._loaded_images = {}  # Cache for loaded images by id
 
         # Initialize the DB image loader if needed
         if TrackImageDelegate._db_image_loader is None:
@@ -31,23 +31,21 @@ class TrackImageDelegate(QItemDelegate):
         TrackImageDelegate._db_image_loader.track_image_loaded.connect(self._on_track_image_loaded)
         TrackImageDelegate._db_image_loader.album_image_loaded.connect(self._on_album_image_loaded)
 
+        # Schedule loads by what the view shows, if the delegate belongs to one
+        self._scheduler = None
+        if isinstance(parent, QAbstractItemView):
+            self._scheduler = ArtworkScheduler(parent, TrackImageDelegate._db_image_loader)
+
     def _on_track_image_loaded(self, track_id: int, pixmap: QPixmap):
         """Handle loaded image from database for a track.
 
+        The image is kept in the loader's cache, so the view only needs a repaint.
+
         Args:
             track_id: The track ID
             pixmap: The loaded image pixmap
         """
-        # Store the image in our cache
-        cache_key = f"track_{track_id}"
-        self._loaded_images[cache_key] = pixmap
-
-        # Request a repaint of the view
-        parent = self.parent()
-        if parent is not None and hasattr(parent, "viewport"):
-            viewport = parent.viewport()
-            if viewport is not None:
-                viewport.update()
+        self._update_viewport()
 
     def _on_album_image_loaded(self, album_id: int, pixmap: QPixmap):
         """Handle loaded image from database for an album.
@@ -56,11 +54,10 @@ class TrackImageDelegate(QItemDelegate):
             album_id: The album ID
             pixmap: The loaded image pixmap
         """
-        # Store the image in our cache
-        cache_key = f"album_{album_id}"
-        self._loaded_images[cache_key] = pixmap
+        self._update_viewport()
 
-        # Request a repaint of the view
+    def _update_viewport(self):
+        """Request a repaint of the view."""
         parent = self.parent()
         if parent is not None and hasattr(parent, "viewport"):
             viewport = parent.viewport()
@@ -93,24 +90,24 @@ class TrackImageDelegate(QItemDelegate):
             super().paint(painter, option, index)
             return
 
-        # Check if we already have the image cached
-        track_cache_key = f"track_{track_id}" if track_id else None
-        album_cache_key = f"album_{album_id}" if album_id else None
-
+        # Try to get the track image first, then fall back to the album image
+        loader = TrackImageDelegate._db_image_loader
         pixmap = None
-
-        # Try to get the track image first
-        if track_cache_key and track_cache_key in self._loaded_images:
-            pixmap = self._loaded_images[track_cache_key]
-        # Fall back to album image
-        elif album_cache_key and album_cache_key in self._loaded_images:
-            pixmap = self._loaded_images[album_cache_key]
-        # If we don't have either image, try to load them
-        else:
-            if has_image and track_id and TrackImageDelegate._db_image_loader:
-                TrackImageDelegate._db_image_loader.load_track_image(track_id, ImageSize.THUMBNAIL)
-            if album_id and TrackImageDelegate._db_image_loader:
-                TrackImageDelegate._db_image_loader.load_album_image(album_id, ImageSize.THUMBNAIL)
+        if track_id:
+            pixmap = loader.cached_track_image(track_id, ImageSize.THUMBNAIL)
+        if pixmap is None and album_id:
+            pixmap = loader.cached_album_image(album_id, ImageSize.THUMBNAIL)
+
+        # If we don't have either image, try to load them; loads of all painted rows are batched
+        if pixmap is None:
+            if self._scheduler is not None:
+                self._scheduler.column = index.column()
+                self._scheduler.request(index.row(), track_id, album_id, has_image)
+            else:
+                if has_image and track_id:
+                    loader.load_track_image(track_id, ImageSize.THUMBNAIL)
+                if album_id:
+                    loader.load_album_image(album_id, ImageSize.THUMBNAIL)
 
         # Prepare the option for rendering
         if painter is not None and option.state & QStyle.StateFlag.State_Selected:
@@ -171,6 +168,14 @@ class TrackImageDelegate(QItemDelegate):
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
             painter.restore()
 
+    def artwork_metrics(self) -> dict[str, float]:
+        """Get the metrics of the artwork loads scheduled for the view.
+
+        Returns:
+            Dictionary with queue depths, request counts and load latencies (empty without a view)
+        """
+        return self._scheduler.metrics() if self._scheduler is not None else {}
+
     def sizeHint(self, option, index):
         """Get the size hint for the delegate.
 
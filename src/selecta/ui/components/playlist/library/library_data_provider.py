@@ -211,60 +211,82 @@ class LibraryDataProvider(BasePlatformDataProvider):
             # Get all tracks in the playlist
             tracks = self.playlist_repo.get_playlist_tracks(playlist_id)
 
-            # Convert to TrackItems
-            track_items = []
+            return [self._create_track_item(track) for track in tracks]
+        except Exception as e:
+            logger.exception(f"Error fetching playlist tracks: {e}")
+            return []
 
-            for track in tracks:
-                # Get all platforms this track is available on
-                available_platforms = []
-
-                # Create platform info list
-                platform_info_list = []
-                for info in track.platform_info:
-                    platform_name = info.platform
-                    available_platforms.append(platform_name)
-
-                    platform_info_list.append(
-                        {
-                            "platform": platform_name,
-                            "platform_id": info.platform_id,
-                            "uri": info.uri,
-                        }
-                    )
+    def get_track_items(self, track_ids: list[int]) -> list[LibraryTrackItem]:
+        """Get the track items of tracks, e.g. of tracks just added to a playlist.
 
-                # Get genre names if available
-                genre_str = ""
-                if hasattr(track, "genres") and track.genres:
-                    genre_str = ", ".join([g.name for g in track.genres])
-
-                # Get tags if available
-                tags = []
-                if hasattr(track, "tags") and track.tags:
-                    tags = [tag.name for tag in track.tags]
-
-                # Create the track item
-                track_items.append(
-                    LibraryTrackItem(
-                        track_id=track.id,
-                        title=track.title,
-                        artist=track.artist,
-                        album=track.album,
-                        genre=genre_str,
-                        duration_ms=track.duration_ms,
-                        local_path=track.local_path,
-                        bpm=track.bpm,
-                        tags=tags,
-                        platform_info=platform_info_list,
-                        quality=track.quality if hasattr(track, "quality") else -1,
-                        has_image=bool(track.images),
-                        platforms=available_platforms,
-                    )
-                )
+        Args:
+            track_ids: Database IDs of the tracks
 
-            return track_items
+        Returns:
+            Track items in the order of the IDs, without the tracks not found
+        """
+        # A new session, since tracks in the provider's session may predate the change
+        session = get_session()
+        try:
+            return [self._create_track_item(track) for track in TrackRepository(session).get_by_ids(track_ids)]
         except Exception as e:
-            logger.exception(f"Error fetching playlist tracks: {e}")
+            logger.exception(f"Error fetching {len(track_ids)} tracks: {e}")
             return []
+        finally:
+            session.close()
+
+    @staticmethod
+    def _create_track_item(track: Any) -> LibraryTrackItem:
+        """Create the track item of a database track.
+
+        Args:
+            track: Database track
+
+        Returns:
+            Track item
+        """
+        # Get all platforms this track is available on
+        available_platforms = []
+
+        # Create platform info list
+        platform_info_list = []
+        for info in track.platform_info:
+            platform_name = info.platform
+            available_platforms.append(platform_name)
+
+            platform_info_list.append(
+                {
+                    "platform": platform_name,
+                    "platform_id": info.platform_id,
+                    "uri": info.uri,
+                }
+            )
+
+        # Get genre names if available
+        genre_str = ""
+        if hasattr(track, "genres") and track.genres:
+            genre_str = ", ".join([g.name for g in track.genres])
+
+        # Get tags if available
+        tags = []
+        if hasattr(track, "tags") and track.tags:
+            tags = [tag.name for tag in track.tags]
+
+        return LibraryTrackItem(
+            track_id=track.id,
+            title=track.title,
+            artist=track.artist,
+            album=track.album,
+            genre=genre_str,
+            duration_ms=track.duration_ms,
+            local_path=track.local_path,
+            bpm=track.bpm,
+            tags=tags,
+            platform_info=platform_info_list,
+            quality=track.quality if hasattr(track, "quality") else -1,
+            has_image=bool(track.images),
+            platforms=available_platforms,
+        )
 
     def _ensure_tracks_in_collection(self, track_ids: list[int]) -> None:
         """Ensure all tracks are in the Collection playlist.
@@ -427,12 +449,10 @@ class LibraryDataProvider(BasePlatformDataProvider):
 
         try:
             # Get tracks IDs and add to Collection
+            # The views follow the repository's change events, no refresh is needed
             track_ids = [track.track_id for track in tracks]
             self._ensure_tracks_in_collection(track_ids)
 
-            # Refresh the UI if needed
-            self.notify_refresh_needed()
-
         except Exception as e:
             logger.exception(f"Error adding tracks to Collection: {e}")
 
@@ -497,10 +517,6 @@ class LibraryDataProvider(BasePlatformDataProvider):
 
                 QMessageBox.information(None, "Tracks Added", "\n".join(messages))
 
-            # Refresh if this is the currently displayed playlist
-            if self._current_playlist_id is not None and self._current_playlist_id == playlist_id:
-                self.refresh()
-
         except Exception as e:
             logger.exception(f"Error adding tracks to playlist: {e}")
             QMessageBox.critical(None, "Error", f"Failed to add tracks to playlist: {str(e)}")
@@ -552,9 +568,6 @@ class LibraryDataProvider(BasePlatformDataProvider):
                     "Tracks Removed",
                     f"Removed {removed_count} track{'s' if removed_count > 1 else ''} from playlist '{playlist.name}'.",
                 )
-
-                # Refresh the view
-                self.refresh()
             else:
                 QMessageBox.information(None, "No Tracks Removed", "No tracks were removed from the playlist.")
 
@@ -1,6 +1,7 @@
 """Model classes for playlist UI."""
 
 from selecta.ui.components.playlist.model.playlist_tree_model import PlaylistTreeModel
+from selecta.ui.components.playlist.model.tracks_filter_proxy_model import TracksFilterProxyModel
 from selecta.ui.components.playlist.model.tracks_table_model import TracksTableModel
 
-__all__ = ["PlaylistTreeModel", "TracksTableModel"]
+__all__ = ["PlaylistTreeModel", "TracksFilterProxyModel", "TracksTableModel"]
@@ -434,3 +434,48 @@ class PlaylistTreeModel(QAbstractItemModel):
             check_recursion(root)
 
         self.endResetModel()
+
+    def _index_for_item(self, item: BasePlaylistItem) -> QModelIndex:
+        """Get the index of an item in the tree.
+
+        Args:
+            item: Playlist item
+
+        Returns:
+            QModelIndex of the item, invalid if it isn't in the tree
+        """
+        if item.parent_id is None:
+            siblings = self.root_items
+            parent_index = QModelIndex()
+        else:
+            parent_item = self.id_to_item.get(item.parent_id)
+            if not parent_item:
+                return QModelIndex()
+            siblings = parent_item.children
+            parent_index = self._index_for_item(parent_item)
+            if not parent_index.isValid():
+                return QModelIndex()
+        try:
+            return self.index(siblings.index(item), 0, parent_index)
+        except ValueError:
+            return QModelIndex()
+
+    def update_track_count(self, item_id: Any, delta: int) -> bool:
+        """Change the track count shown for a playlist, e.g. after tracks were added to it.
+
+        Args:
+            item_id: ID of the playlist item
+            delta: Number of tracks added, negative if tracks were removed
+
+        Returns:
+            True if the playlist is in the tree
+        """
+        item = self.id_to_item.get(item_id)
+        if not item:
+            return False
+        if delta:
+            item.track_count = max(0, item.track_count + delta)
+            index = self._index_for_item(item)
+            if index.isValid():
+                self.dataChanged.emit(index, index)
+        return True
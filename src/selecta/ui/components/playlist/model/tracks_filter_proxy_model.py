@@ -0,0 +1,100 @@
+from typing import Any
+
+from PyQt6.QtCore import QModelIndex, QSortFilterProxyModel
+
+from selecta.core.utils.search_index import matches_tokens, search_tokens
+from selecta.ui.components.playlist.base_items import BaseTrackItem
+from selecta.ui.components.playlist.model.tracks_table_model import TracksTableModel
+
+
+class TracksFilterProxyModel(QSortFilterProxyModel):
+    """Sort/filter proxy showing the tracks that match a search.
+
+    A track matches if its search key contains every word of the search text.
+    The keys are the lowercase keys the TracksTableModel builds once when the
+    tracks are set, so filtering doesn't touch the track items.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the proxy model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._tokens: list[str] = []
+
+    def set_search_text(self, text: str) -> None:
+        """Filter the rows by a search text.
+
+        Tracks not fetched into the source model yet are matched too: the rows
+        up to the last match are fetched before the filter is applied.
+
+        Args:
+            text: Search text, empty to show all rows
+        """
+        tokens = search_tokens(text)
+        if tokens == self._tokens:
+            return
+
+        source = self.sourceModel()
+        if tokens and isinstance(source, TracksTableModel):
+            keys = source.search_keys
+            last_match = next((row for row in range(len(keys) - 1, -1, -1) if matches_tokens(keys[row], tokens)), -1)
+            if last_match >= 0:
+                source.fetch_through(last_match)
+
+        self._tokens = tokens
+        self.invalidateFilter()
+
+    def is_filtered(self) -> bool:
+        """Whether a search filters the rows."""
+        return bool(self._tokens)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Check whether a source row matches the search.
+
+        Args:
+            source_row: Row in the source model
+            source_parent: Parent index in the source model
+
+        Returns:
+            True if the row should be shown
+        """
+        if not self._tokens:
+            return True
+        source = self.sourceModel()
+        keys: list[str] = getattr(source, "search_keys", [])
+        return source_row < len(keys) and matches_tokens(keys[source_row], self._tokens)
+
+    def get_track(self, row: int) -> BaseTrackItem | None:
+        """Get the track shown at a row of the proxy.
+
+        Args:
+            row: Proxy row index
+
+        Returns:
+            The track, or None if the row doesn't exist
+        """
+        source = self.sourceModel()
+        source_index = self.mapToSource(self.index(row, 0))
+        if not isinstance(source, TracksTableModel) or not source_index.isValid():
+            return None
+        return source.get_track(source_index.row())
+
+    def row_for_track(self, track_id: Any) -> int:
+        """Get the proxy row of a track.
+
+        Args:
+            track_id: The track ID
+
+        Returns:
+            Proxy row index, or -1 if the track isn't in the model or is filtered out
+        """
+        source = self.sourceModel()
+        if not isinstance(source, TracksTableModel):
+            return -1
+        source_row = source.row_for_track(track_id)
+        if source_row < 0:
+            return -1
+        return self.mapFromSource(source.index(source_row, 0)).row()
@@ -1,12 +1,45 @@
 from typing import Any
 
+from loguru import logger
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+from selecta.core.utils.search_index import search_key
+from selecta.core.utils.type_helpers import column_to_str
 from selecta.ui.components.playlist.base_items import BaseTrackItem
 
+# Rows whose display data is built per fetchMore call
+FETCH_BATCH_SIZE = 500
+
+# Display data fields stored per row: the column keys of all platforms and the tooltip fields
+DISPLAY_FIELDS = (
+    "title",
+    "artist",
+    "album",
+    "duration",
+    "added_at",
+    "genre",
+    "bpm",
+    "tags",
+    "platforms_tooltip",
+    "quality_str",
+)
+
+# Columns drawn by delegates from their UserRole data, without display text
+DELEGATE_COLUMNS = ("platforms", "quality")
+
+# Roles the model provides data for
+DATA_ROLES = frozenset({Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole, Qt.ItemDataRole.ToolTipRole})
+
 
 class TracksTableModel(QAbstractTableModel):
-    """Model for displaying tracks in a table view."""
+    """Model for displaying tracks in a table view.
+
+    The display data of the tracks is built once per row and kept in one list
+    per field, so painting a cell is a list lookup. Rows are built in batches
+    as the view scrolls to them (canFetchMore/fetchMore), so setting a large
+    playlist only builds the first FETCH_BATCH_SIZE rows. The search keys of
+    all tracks are built up front, for filtering rows not fetched yet.
+    """
 
     def __init__(self, parent=None):
         """Initialize the tracks table model.
@@ -17,6 +50,17 @@ class TracksTableModel(QAbstractTableModel):
         super().__init__(parent)
         self.tracks: list[BaseTrackItem] = []
 
+        # Number of rows whose display data is built, which is the row count seen by the view
+        self._loaded_rows = 0
+        # Display strings per field, and the platforms and quality per row for the delegates
+        self._display: dict[str, list[str]] = {field: [] for field in DISPLAY_FIELDS}
+        self._platforms: list[list[str]] = []
+        self._quality: list[int] = []
+        # Row of each track ID (the first row if a track is listed twice)
+        self._rows_by_id: dict[Any, int] = {}
+        # Lowercase search key of every track, fetched or not
+        self.search_keys: list[str] = []
+
         # Flag to disable display data caching
         # This is used to resolve the issue with platform icons not updating
         self.force_refresh_data = True
@@ -62,9 +106,9 @@ class TracksTableModel(QAbstractTableModel):
             parent: Parent index
 
         Returns:
-            Number of rows
+            Number of rows fetched so far
         """
-        return len(self.tracks)
+        return self._loaded_rows
 
     def columnCount(self, parent: QModelIndex | None = None) -> int:
         """Get the number of columns.
@@ -77,6 +121,29 @@ class TracksTableModel(QAbstractTableModel):
         """
         return len(self.columns)
 
+    def canFetchMore(self, parent: QModelIndex | None = None) -> bool:
+        """Check whether there are tracks whose rows weren't fetched yet.
+
+        Args:
+            parent: Parent index
+
+        Returns:
+            True if more rows can be fetched
+        """
+        if parent is not None and parent.isValid():
+            return False
+        return self._loaded_rows < len(self.tracks)
+
+    def fetchMore(self, parent: QModelIndex | None = None) -> None:
+        """Fetch the next batch of rows.
+
+        Args:
+            parent: Parent index
+        """
+        if parent is not None and parent.isValid():
+            return
+        self._fetch_rows(min(self._loaded_rows + FETCH_BATCH_SIZE, len(self.tracks)))
+
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         """Get data for the given index and role.
 
@@ -87,77 +154,32 @@ class TracksTableModel(QAbstractTableModel):
         Returns:
             Data for the index and role
         """
-        if not index.isValid():
+        # Most roles a view asks for while painting have no data here
+        if role not in DATA_ROLES or not index.isValid():
             return None
 
-        if index.row() >= len(self.tracks) or index.row() < 0:
+        row = index.row()
+        if row >= self._loaded_rows or row < 0:
             return None
 
-        track = self.tracks[index.row()]
         column_key = self.column_keys[index.column()]
 
-        # Get display data from the track - BaseTrackItem implementation
-        try:
-            # Call the method to retrieve display data (this uses the cache if available)
-            display_data = track.to_display_data()
-        except Exception as e:
-            from loguru import logger
-
-            logger.error(f"Error getting display data for track: {e}")
-            # Return empty dict if to_display_data fails
-            display_data = {}
-
-        from loguru import logger
-
-        from selecta.core.utils.type_helpers import dict_str
-
-        # Use display_data directly with our typed helper functions
-        track_data = display_data
-
         if role == Qt.ItemDataRole.DisplayRole:
             # For platforms and quality columns, we'll handle this differently - we return
             # empty string here and use custom delegates for visualization
-            if column_key == "platforms" or column_key == "quality":
+            if column_key in DELEGATE_COLUMNS:
                 return ""
-            return dict_str(track_data, column_key)
+            return self._display[column_key][row]
         elif role == Qt.ItemDataRole.UserRole:
             # Return the list of platforms for the PlatformIconDelegate
             if column_key == "platforms":
-                # Get platforms directly from the BaseTrackItem
-                platforms = track.platforms if hasattr(track, "platforms") else []
-
-                # Fallback to display data if needed
-                if not platforms and track_data and "platforms" in track_data:
-                    platforms = track_data.get("platforms", [])
-
-                # Only log platform data when it changes to reduce spam
-                if hasattr(track, "track_id"):
-                    track_id = track.track_id
-
-                    # Use a class attribute to track platform changes
-                    if not hasattr(self, "_last_platform_data"):
-                        self._last_platform_data = {}
-
-                    # Only log if platforms changed or it's been a while
-                    last_data = self._last_platform_data.get(track_id, {})
-                    last_platforms = last_data.get("platforms", [])
-                    last_time = last_data.get("time", 0)
-
-                    import time
-
-                    current_time = time.time()
-
-                    if set(platforms) != set(last_platforms) or current_time - last_time > 60:
-                        # Only log when platforms actually change or once a minute
-                        logger.debug(f"Returning platforms for track {track_id}: {platforms}")
-                        self._last_platform_data[track_id] = {"platforms": platforms, "time": current_time}
-
-                return platforms
+                return self._platforms[row]
             # Return the quality value for the TrackQualityDelegate
             if column_key == "quality":
-                return track_data.get("quality", -1)
+                return self._quality[row]
             # Return the raw track data for any UserRole requests
             if column_key == "title":
+                track = self.tracks[row]
                 return {
                     "track_id": track.track_id,
                     "album_id": track.album_id,
@@ -166,14 +188,12 @@ class TracksTableModel(QAbstractTableModel):
                 }
         elif role == Qt.ItemDataRole.ToolTipRole:
             if column_key == "title":
-                title = dict_str(track_data, "title")
-                artist = dict_str(track_data, "artist")
-                return f"{title} by {artist}"
+                return f"{self._display['title'][row]} by {self._display['artist'][row]}"
             if column_key == "platforms":
-                return dict_str(track_data, "platforms_tooltip")
+                return self._display["platforms_tooltip"][row]
             if column_key == "quality":
-                return dict_str(track_data, "quality_str")
-            return dict_str(track_data, column_key)
+                return self._display["quality_str"][row]
+            return self._display[column_key][row]
 
         return None
 
@@ -213,20 +233,251 @@ class TracksTableModel(QAbstractTableModel):
 
     def clear(self) -> None:
         """Clear all tracks from the model."""
-        self.beginResetModel()
-        self.tracks.clear()
-        self.endResetModel()
+        self.set_tracks([])
 
     def set_tracks(self, tracks: list[BaseTrackItem]) -> None:
-        """Set the tracks in the model.
+        """Set the tracks in the model, building the display data of the first batch of rows.
 
         Args:
             tracks: List of track items
         """
         self.beginResetModel()
         self.tracks = tracks
+        self._loaded_rows = 0
+        self._display = {field: [] for field in DISPLAY_FIELDS}
+        self._platforms = []
+        self._quality = []
+        self._rows_by_id = {}
+        for row, track in enumerate(tracks):
+            self._rows_by_id.setdefault(track.track_id, row)
+        self.search_keys = [search_key(track.artist, track.title) for track in tracks]
+        self._append_rows(min(FETCH_BATCH_SIZE, len(tracks)))
         self.endResetModel()
 
+    def _fetch_rows(self, end: int) -> None:
+        """Fetch the rows up to a row, announcing them to the view.
+
+        Args:
+            end: Number of rows to have fetched
+        """
+        if end <= self._loaded_rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, end - 1)
+        self._append_rows(end)
+        self.endInsertRows()
+
+    def _append_rows(self, end: int) -> None:
+        """Build the display data of the rows up to a row.
+
+        Args:
+            end: Number of rows to have built
+        """
+        for track in self.tracks[self._loaded_rows : end]:
+            display_data = self._display_data(track)
+            for field in DISPLAY_FIELDS:
+                self._display[field].append(column_to_str(display_data.get(field)))
+            self._platforms.append(self._track_platforms(track, display_data))
+            self._quality.append(display_data.get("quality", -1))
+        self._loaded_rows = end
+
+    def _refresh_row(self, row: int) -> None:
+        """Rebuild the search key, and the display data if the row is fetched, after its track changed.
+
+        Args:
+            row: Row index
+        """
+        track = self.tracks[row]
+        self.search_keys[row] = search_key(track.artist, track.title)
+        if row >= self._loaded_rows:
+            return
+        track.clear_display_cache()
+        display_data = self._display_data(track)
+        for field in DISPLAY_FIELDS:
+            self._display[field][row] = column_to_str(display_data.get(field))
+        self._platforms[row] = self._track_platforms(track, display_data)
+        self._quality[row] = display_data.get("quality", -1)
+
+    @staticmethod
+    def _display_data(track: BaseTrackItem) -> dict[str, Any]:
+        """Get the display data of a track, empty if it can't be built.
+
+        Args:
+            track: Track item
+
+        Returns:
+            Display data of the track
+        """
+        try:
+            return track.to_display_data()
+        except Exception as e:
+            logger.error(f"Error getting display data for track: {e}")
+            return {}
+
+    @staticmethod
+    def _track_platforms(track: BaseTrackItem, display_data: dict[str, Any]) -> list[str]:
+        """Get the platforms of a track for the PlatformIconDelegate.
+
+        Args:
+            track: Track item
+            display_data: Display data of the track
+
+        Returns:
+            Platform names
+        """
+        return getattr(track, "platforms", None) or display_data.get("platforms") or []
+
+    def row_for_track(self, track_id: Any) -> int:
+        """Get the row of a track, fetching the rows up to it.
+
+        Args:
+            track_id: The track ID
+
+        Returns:
+            Row index, or -1 if the track isn't in the model
+        """
+        row = self._rows_by_id.get(track_id, -1)
+        if row >= 0:
+            self._fetch_rows(row + 1)
+        return row
+
+    def fetch_through(self, row: int) -> None:
+        """Fetch the rows up to and including a row, e.g. before selecting it.
+
+        Args:
+            row: Row index
+        """
+        self._fetch_rows(min(row + 1, len(self.tracks)))
+
+    def refresh_track(self, track_id: Any) -> bool:
+        """Rebuild the display data of a track after it was changed outside the model.
+
+        Args:
+            track_id: The track ID
+
+        Returns:
+            True if the track is in the model
+        """
+        row = self._rows_by_id.get(track_id, -1)
+        if row < 0:
+            return False
+        self._refresh_row(row)
+        self._emit_row_changed(row)
+        return True
+
+    def _emit_row_changed(self, row: int) -> None:
+        """Notify the view that all cells of a fetched row changed.
+
+        Args:
+            row: Row index
+        """
+        if row < self._loaded_rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def apply_track_changes(self, track_id: Any, changes: dict[str, Any]) -> bool:
+        """Apply the committed field changes of a track (a TrackUpdated event) to its row.
+
+        Args:
+            track_id: The track ID
+            changes: New values by Track column name, "genres" and "tags" mapping to lists of names
+
+        Returns:
+            True if the track is in the model
+        """
+        row = self._rows_by_id.get(track_id, -1)
+        if row < 0:
+            return False
+
+        track = self.tracks[row]
+        fields = {}
+        for name, value in changes.items():
+            if name == "genres":
+                fields["genre"] = ", ".join(value)
+            else:
+                fields[name] = value
+        for name, value in fields.items():
+            if hasattr(track, name):
+                setattr(track, name, value)
+        self._refresh_row(row)
+
+        # A single changed field in a column only needs its cell repainted
+        if len(fields) == 1 and row < self._loaded_rows:
+            (name,) = fields
+            if name in self.column_keys:
+                cell_index = self.index(row, self.column_keys.index(name))
+                self.dataChanged.emit(cell_index, cell_index)
+                return True
+        self._emit_row_changed(row)
+        return True
+
+    def add_track_platform(self, track_id: Any, platform: str) -> bool:
+        """Show a track as available on a platform after it was linked (a PlatformLinkAdded event).
+
+        Args:
+            track_id: The track ID
+            platform: Platform name
+
+        Returns:
+            True if the track is in the model
+        """
+        row = self._rows_by_id.get(track_id, -1)
+        if row < 0:
+            return False
+        self.tracks[row].add_platform(platform)
+        self._refresh_row(row)
+        self._emit_row_changed(row)
+        return True
+
+    def insert_tracks(self, tracks: list[BaseTrackItem]) -> None:
+        """Append tracks, e.g. tracks added to the shown playlist, without resetting the model.
+
+        The rows are announced to the view right away only if all rows are
+        fetched; otherwise they're fetched when the view scrolls to them.
+
+        Args:
+            tracks: Track items to append
+        """
+        if not tracks:
+            return
+        start = len(self.tracks)
+        fetch_now = self._loaded_rows == start
+        self.tracks.extend(tracks)
+        for row, track in enumerate(tracks, start):
+            self._rows_by_id.setdefault(track.track_id, row)
+            self.search_keys.append(search_key(track.artist, track.title))
+        if fetch_now:
+            self._fetch_rows(min(start + FETCH_BATCH_SIZE, len(self.tracks)))
+
+    def remove_tracks(self, track_ids: list[Any]) -> int:
+        """Remove all rows of tracks, e.g. tracks removed from the shown playlist, without resetting the model.
+
+        Args:
+            track_ids: IDs of the tracks to remove
+
+        Returns:
+            Number of rows removed
+        """
+        removed_ids = set(track_ids)
+        rows = [row for row, track in enumerate(self.tracks) if track.track_id in removed_ids]
+        for row in reversed(rows):
+            fetched = row < self._loaded_rows
+            if fetched:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                for values in self._display.values():
+                    del values[row]
+                del self._platforms[row]
+                del self._quality[row]
+                self._loaded_rows -= 1
+            del self.tracks[row]
+            del self.search_keys[row]
+            if fetched:
+                self.endRemoveRows()
+
+        if rows:
+            self._rows_by_id = {}
+            for row, track in enumerate(self.tracks):
+                self._rows_by_id.setdefault(track.track_id, row)
+        return len(rows)
+
     def get_track(self, row: int) -> BaseTrackItem | None:
         """Get the track at the given row.
 
@@ -278,49 +529,17 @@ class TracksTableModel(QAbstractTableModel):
             self.column_keys = self._platform_columns["default"]["column_keys"]
             self.endResetModel()
 
-    def update_track_quality(self, track_id: Any, quality: int | None = None) -> bool:
+    def update_track_quality(self, track_id: Any, quality: int) -> bool:
         """Update a specific track's quality rating.
 
         Args:
             track_id: The track ID to update
-            quality: The new quality rating, or None to fetch from database
+            quality: The new quality rating
 
         Returns:
             True if track was found and updated, False otherwise
         """
-        from loguru import logger
-
-        # If quality is explicitly provided, we need to update it directly
-        if quality is not None:
-            for row, track in enumerate(self.tracks):
-                if track.track_id == track_id:
-                    # Update the track's quality
-                    track.quality = quality
-
-                    # Clear display cache to ensure it's regenerated with the new quality
-                    track.clear_display_cache()
-
-                    # Notify the view that this row has changed
-                    first_index = self.index(row, 0)
-                    last_index = self.index(row, self.columnCount() - 1)
-                    self.dataChanged.emit(first_index, last_index)
-
-                    # Also specifically update the quality cell
-                    if "quality" in self.column_keys:
-                        quality_col = self.column_keys.index("quality")
-                        quality_index = self.index(row, quality_col)
-                        self.dataChanged.emit(quality_index, quality_index)
-
-                    logger.debug(f"Directly updated quality for track {track_id} to {quality}")
-                    return True
-
-            logger.warning(f"Track {track_id} not found for direct quality update")
-            return False
-        else:
-            # If no quality provided, use the comprehensive update method
-            # that fetches all track data from the database
-            logger.debug(f"Fetching updated track data from database for track {track_id}")
-            return self.update_track_from_database(track_id)
+        return self.update_track_field(track_id, "quality", quality)
 
     def update_track_field(self, track_id: Any, field_name: str, value: Any) -> bool:
         """Update a specific field of a track without a full database reload.
@@ -336,15 +555,7 @@ class TracksTableModel(QAbstractTableModel):
         Returns:
             True if the update was successful, False otherwise
         """
-        from loguru import logger
-
-        # Find the track in our current model
-        track_row = -1
-        for row, track in enumerate(self.tracks):
-            if hasattr(track, "track_id") and track.track_id == track_id:
-                track_row = row
-                break
-
+        track_row = self._rows_by_id.get(track_id, -1)
         if track_row == -1:
             logger.warning(f"Track {track_id} not found in current view for field update")
             return False
@@ -358,182 +569,20 @@ class TracksTableModel(QAbstractTableModel):
             logger.debug(f"Updating track {track_id} field {field_name}: {getattr(track, field_name)} -> {value}")
             setattr(track, field_name, value)
 
-            # Clear cached display data just for this track
-            track.clear_display_cache()
-
-            # Find which column corresponds to this field
-            col_idx = -1
-            if field_name in self.column_keys:
-                col_idx = self.column_keys.index(field_name)
+            # Rebuild the display data just for this track
+            self._refresh_row(track_row)
+            if track_row >= self._loaded_rows:
+                return True
 
             # Notify the view that this cell has changed
-            if col_idx >= 0:
-                cell_index = self.index(track_row, col_idx)
+            if field_name in self.column_keys:
+                cell_index = self.index(track_row, self.column_keys.index(field_name))
                 self.dataChanged.emit(cell_index, cell_index)
             else:
                 # If we can't match the field to a column, update the whole row
-                first_index = self.index(track_row, 0)
-                last_index = self.index(track_row, self.columnCount() - 1)
-                self.dataChanged.emit(first_index, last_index)
+                self._emit_row_changed(track_row)
 
             return True
         else:
             logger.warning(f"Field {field_name} not found in track {track_id}")
             return False
-
-    def update_track_platform_info(self, track_id: Any) -> bool:
-        """Update just the platform information for a track.
-
-        Updates platform-related fields for a track by fetching the latest data from the database.
-
-        Args:
-            track_id: The ID of the track to update
-
-        Returns:
-            True if the update was successful, False otherwise
-        """
-        # For simplicity and reliability, use the more comprehensive database update method
-        # This avoids duplication and ensures all platform data is properly updated
-        return self.update_track_from_database(track_id)
-
-    def update_track_from_database(self, track_id: Any) -> bool:
-        """Update all track information from the database.
-
-        This comprehensive update method refreshes all track properties from the database,
-        including platform links, metadata, and any other fields. It's designed to handle
-        any type of track update in a consistent way.
-
-        Args:
-            track_id: The track ID to update
-
-        Returns:
-            True if track was found and updated, False otherwise
-        """
-        from loguru import logger
-
-        # Find the track row in our model
-        track_row = -1
-        for row, track in enumerate(self.tracks):
-            if hasattr(track, "track_id") and track.track_id == track_id:
-                track_row = row
-                break
-
-        if track_row == -1:
-            logger.warning(f"Track {track_id} not found in current view for update")
-            return False
-
-        # Get the track from our model
-        track = self.tracks[track_row]
-
-        # Fetch the track from database - this is the only database call we'll make
-        from selecta.core.data.database import get_session
-        from selecta.core.data.repositories.track_repository import TrackRepository
-
-        session = get_session()
-        track_repo = TrackRepository(session)
-        db_track = track_repo.get_by_id(track_id)
-
-        if not db_track:
-            logger.warning(f"Track {track_id} not found in database for update")
-            return False
-
-        # --- Extract and update platform information ---
-        platforms = []
-        platform_info = []
-
-        # Process platform info if available
-        if hasattr(db_track, "platform_info") and db_track.platform_info:
-            for info in db_track.platform_info:
-                platform_name = getattr(info, "platform", None)
-                if platform_name:
-                    # Add to platforms list
-                    platforms.append(platform_name)
-
-                    # Convert TrackPlatformInfo to dictionary for display
-                    platform_data = {
-                        "platform": platform_name,
-                        "platform_id": getattr(info, "platform_id", ""),
-                        "uri": getattr(info, "uri", ""),
-                    }
-
-                    # Add metadata if available
-                    if hasattr(info, "platform_data") and info.platform_data:
-                        import json
-
-                        try:
-                            metadata = json.loads(info.platform_data)
-                            platform_data.update(metadata)
-                        except Exception:
-                            pass
-
-                    platform_info.append(platform_data)
-
-        # --- Extract other track fields ---
-        # This approach minimizes code duplication
-        field_updates = {
-            "title": getattr(db_track, "title", None),
-            "artist": getattr(db_track, "artist", None),
-            "album": getattr(db_track, "album", None),
-            "quality": getattr(db_track, "quality", None),
-            "has_image": bool(getattr(db_track, "images", [])),
-        }
-
-        # Handle BPM - preserve existing value if needed
-        if hasattr(db_track, "bpm") and db_track.bpm is not None:
-            field_updates["bpm"] = db_track.bpm
-        elif hasattr(db_track, "attributes") and db_track.attributes:
-            for attr in db_track.attributes:
-                if attr.name.lower() == "bpm":
-                    field_updates["bpm"] = attr.value
-                    break
-
-        # Handle genre - convert from list of genre objects to string
-        if hasattr(db_track, "genres") and db_track.genres:
-            genre_str = ", ".join([g.name for g in db_track.genres])
-            field_updates["genre"] = genre_str
-        elif hasattr(db_track, "genre") and db_track.genre:
-            field_updates["genre"] = db_track.genre
-
-        # Handle tags - convert from list of tag objects to list of strings
-        if hasattr(db_track, "tags") and db_track.tags:
-            field_updates["tags"] = [tag.name for tag in db_track.tags]
-
-        # --- Apply updates to the track ---
-        # Clear any display cache
-        track.clear_display_cache()
-
-        # Update platform info using the standard method
-        track.set_platforms(platforms.copy() if platforms else [])
-
-        # Update all other fields
-        for field, value in field_updates.items():
-            if hasattr(track, field) and value is not None:
-                # Skip setting value if it's None
-                current_value = getattr(track, field)
-                if current_value != value:
-                    setattr(track, field, value)
-
-        # Log the update
-        logger.debug(f"Updated track {track_id} from database")
-
-        # Notify just once for the whole row
-        first_index = self.index(track_row, 0)
-        last_index = self.index(track_row, self.columnCount() - 1)
-        self.dataChanged.emit(first_index, last_index)
-
-        return True
-
-    def update_track_platforms(self, track_id: Any) -> bool:
-        """Update a track's platform information after linking.
-
-        This method is a specialized version of update_track_from_database
-        that focuses only on platform information.
-
-        Args:
-            track_id: The track ID to update
-
-        Returns:
-            True if track was found and updated, False otherwise
-        """
-        # Delegate to the more comprehensive update method
-        return self.update_track_from_database(track_id)
@@ -175,12 +175,19 @@ class BasePlatformDataProvider(IPlatformDataProvider):
             playlist_id: ID of the playlist to refresh
         """
         # Invalidate just this playlist's cache
-        cache_key = f"{self._platform_name}_tracks_{playlist_id}"
-        self.cache.invalidate(cache_key)
+        self.invalidate_playlist_tracks(playlist_id)
 
         # Notify listeners
         self.notify_refresh_needed()
 
+    def invalidate_playlist_tracks(self, playlist_id: Any) -> None:
+        """Drop a playlist's cached tracks without notifying listeners, e.g. after its tracks changed.
+
+        Args:
+            playlist_id: ID of the playlist
+        """
+        self.cache.invalidate(f"{self._platform_name}_tracks_{playlist_id}")
+
     def _trigger_background_refresh(self, playlist_id: Any, cache_key: str) -> None:
         """Trigger a background refresh of a playlist's tracks.
 
@@ -182,14 +182,11 @@ class DiscogsDataProvider(BasePlatformDataProvider):
         # Get collection count from cache or API
         collection_count = 0
         try:
-            if self.cache.has_valid(self._collection_cache_key):
-                collection = self.cache.get(self._collection_cache_key, [])
-                collection_count = len(collection)
-            else:
-                collection = self.client.get_collection()
-                collection_count = len(collection)
-                # Cache the collection data
-                self.cache.set(self._collection_cache_key, collection)
+            # An expired entry is refreshed with only the items added since the last load
+            collection = self.cache.get_or_refresh(
+                self._collection_cache_key, self.client.get_collection, self.client.refresh_collection
+            )
+            collection_count = len(collection)
 
             collection_item = DiscogsPlaylistItem(
                 name=f"Collection ({collection_count} items)",
@@ -217,14 +214,11 @@ class DiscogsDataProvider(BasePlatformDataProvider):
         # Get wantlist count from cache or API
         wantlist_count = 0
         try:
-            if self.cache.has_valid(self._wantlist_cache_key):
-                wantlist = self.cache.get(self._wantlist_cache_key, [])
-                wantlist_count = len(wantlist)
-            else:
-                wantlist = self.client.get_wantlist()
-                wantlist_count = len(wantlist)
-                # Cache the wantlist data
-                self.cache.set(self._wantlist_cache_key, wantlist)
+            # An expired entry is refreshed with only the items added since the last load
+            wantlist = self.cache.get_or_refresh(
+                self._wantlist_cache_key, self.client.get_wantlist, self.client.refresh_wantlist
+            )
+            wantlist_count = len(wantlist)
 
             wantlist_item = DiscogsPlaylistItem(
                 name=f"Wantlist ({wantlist_count} items)",
@@ -273,7 +267,9 @@ class DiscogsDataProvider(BasePlatformDataProvider):
             # Get tracks based on playlist type
             if playlist_id == "collection":
                 # Get collection items from cache or API
-                collection = self.cache.get_or_set(self._collection_cache_key, lambda: self.client.get_collection())
+                collection = self.cache.get_or_refresh(
+                    self._collection_cache_key, self.client.get_collection, self.client.refresh_collection
+                )
 
                 for i, vinyl in enumerate(collection):
                     release = vinyl.release
@@ -300,7 +296,9 @@ class DiscogsDataProvider(BasePlatformDataProvider):
                     )
             elif playlist_id == "wantlist":
                 # Get wantlist items from cache or API
-                wantlist = self.cache.get_or_set(self._wantlist_cache_key, lambda: self.client.get_wantlist())
+                wantlist = self.cache.get_or_refresh(
+                    self._wantlist_cache_key, self.client.get_wantlist, self.client.refresh_wantlist
+                )
 
                 for i, vinyl in enumerate(wantlist):
                     release = vinyl.release
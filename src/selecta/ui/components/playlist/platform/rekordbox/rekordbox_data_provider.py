@@ -180,7 +180,7 @@ class RekordboxDataProvider(BasePlatformDataProvider):
                 item_id=rb_item.id,
                 parent_id=rb_item.parent_id,
                 is_folder_flag=rb_item.is_folder,  # Pass the folder status directly
-                track_count=len(rb_item.tracks) if not rb_item.is_folder else 0,
+                track_count=rb_item.track_count if not rb_item.is_folder else 0,
                 is_imported=is_imported,
             )
 
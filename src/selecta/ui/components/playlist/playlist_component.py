@@ -2,7 +2,7 @@ from contextlib import suppress
 from typing import Any
 
 from loguru import logger
-from PyQt6.QtCore import QItemSelectionModel, QModelIndex, Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QItemSelectionModel, QModelIndex, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
@@ -19,13 +19,14 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.data.change_events import ChangeEvent, PlatformLinkAdded, PlaylistTracksChanged, TrackUpdated
 from selecta.core.utils.worker import ThreadManager
 from selecta.ui.components.playlist.icons.platform_icon_delegate import PlatformIconDelegate
 from selecta.ui.components.playlist.icons.playlist_icon_delegate import PlaylistIconDelegate
 from selecta.ui.components.playlist.icons.track_quality_delegate import TrackQualityDelegate
 from selecta.ui.components.playlist.interfaces import IPlatformDataProvider
 from selecta.ui.components.playlist.model.playlist_tree_model import PlaylistTreeModel
+from selecta.ui.components.playlist.model.tracks_filter_proxy_model import TracksFilterProxyModel
 from selecta.ui.components.playlist.model.tracks_table_model import TracksTableModel
 from selecta.ui.dialogs.collection_management_dialog import CollectionManagementDialog
 from selecta.ui.widgets.loading_widget import LoadingWidget
@@ -232,6 +233,7 @@ class PlaylistComponent(QWidget):
         self.data_provider: IPlatformDataProvider | None = None
         self.current_playlist_id: int | None = None
         self.current_tracks: list[Any] = []  # Store current tracks for search suggestions
+        self._tracks_by_suggestion: dict[str, Any] = {}  # Track of each search suggestion
 
         # Import TrackDetailsPanel here to avoid circular imports
         from selecta.ui.components.views.track_details_panel import TrackDetailsPanel
@@ -241,10 +243,6 @@ class PlaylistComponent(QWidget):
         self.details_panel = TrackDetailsPanel()
         self.details_panel.setMinimumWidth(250)  # Ensure details panel has a reasonable width
 
-        # Connect the quality changed signal directly in the constructor
-        logger.debug("Connecting quality_changed signal in constructor")
-        self.details_panel.quality_changed.connect(self._on_track_quality_changed)
-
         # Use the shared selection state - import here to avoid circular imports
         from selecta.ui.components.common.selection_state import SelectionState
 
@@ -252,6 +250,11 @@ class PlaylistComponent(QWidget):
         self.selection_state.data_changed.connect(self._on_data_changed)
         self.selection_state.track_updated.connect(self._on_track_updated)
 
+        # Apply the committed changes of the repositories to the models row by row
+        from selecta.ui.components.common.change_relay import ChangeRelay
+
+        ChangeRelay().changes_committed.connect(self._on_changes_committed)
+
         # Set up the UI
         self._setup_ui()
         self._connect_signals()
@@ -302,9 +305,11 @@ class PlaylistComponent(QWidget):
         self.playlist_header = self.track_container.playlist_header
         self.search_bar = self.track_container.search_bar
 
-        # Create model for the tracks table
+        # Create model for the tracks table, shown through a proxy that filters it by the search text
         self.tracks_model = TracksTableModel()
-        self.tracks_table.setModel(self.tracks_model)
+        self.tracks_proxy = TracksFilterProxyModel(self)
+        self.tracks_proxy.setSourceModel(self.tracks_model)
+        self.tracks_table.setModel(self.tracks_proxy)
 
         # Set context menu for tracks table
         self.tracks_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -382,6 +387,9 @@ class PlaylistComponent(QWidget):
         # Connect search bar signals
         self.search_bar.search_confirmed.connect(self._on_search)
 
+        # Filter the tracks as the user types
+        self.search_bar.search_changed.connect(self.tracks_proxy.set_search_text)
+
         # When a search completion is selected, find and select that track
         self.search_bar.completer_activated.connect(self._on_search_completion_selected)
 
@@ -518,27 +526,14 @@ class PlaylistComponent(QWidget):
         Args:
             text: The highlighted completion text (format: "Artist - Title")
         """
-        if not text or not self.current_tracks:
+        track = self._tracks_by_suggestion.get(text)
+        if track is None:
             return
 
-        # Find the track that matches the highlighted suggestion
-        for track in self.current_tracks:
-            track_text = f"{track.artist} - {track.title}"
-            if track_text == text:
-                # Find the track in the current view (might be filtered)
-                for row in range(self.tracks_model.rowCount()):
-                    view_track = self.tracks_model.get_track(row)
-                    if view_track and view_track.track_id == track.track_id:
-                        # Select this track in the table
-                        index = self.tracks_model.index(row, 0)
-                        self.tracks_table.selectionModel().select(  # type: ignore
-                            index,
-                            QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows,
-                        )
-                        # Scroll to the selected track
-                        self.tracks_table.scrollTo(index)
-                        break
-                break
+        # Find the track in the current view (might be filtered)
+        row = self.tracks_proxy.row_for_track(track.track_id)
+        if row >= 0:
+            self._select_track_row(row)
 
     def _load_playlists(self) -> None:
         """Load playlists from the data provider."""
@@ -746,10 +741,11 @@ class PlaylistComponent(QWidget):
         # If it's a folder, don't load tracks
         if item.is_folder():
             self.playlist_header.setText(f"Folder: {item.name}")
+            self.current_playlist_id = None
             self.tracks_model.clear()
             self.details_panel.set_track(None)
-            self.search_bar.set_completion_items(None)
             self.current_tracks = []
+            self._update_search_suggestions()
             self.track_container.show_message("This is a folder. Select a playlist to view tracks.")
             return
 
@@ -911,13 +907,11 @@ class PlaylistComponent(QWidget):
 
     def _update_search_suggestions(self) -> None:
         """Update search bar suggestions with current tracks."""
-        if not self.current_tracks:
-            self.search_bar.set_completion_items(None)
-            return
-
-        # Format suggestions as "Artist - Title"
-        suggestions = [f"{track.artist} - {track.title}" for track in self.current_tracks]
-        self.search_bar.set_completion_items(suggestions)
+        # Format suggestions as "Artist - Title", the first track of each suggestion being selected for it
+        self._tracks_by_suggestion = {}
+        for track in self.current_tracks:
+            self._tracks_by_suggestion.setdefault(f"{track.artist} - {track.title}", track)
+        self.search_bar.set_completion_items(list(self._tracks_by_suggestion) or None)
 
     def _on_track_selected(self) -> None:
         """Handle track selection."""
@@ -939,7 +933,7 @@ class PlaylistComponent(QWidget):
         if selected_count == 1:
             # Single selection - show track details as before
             row = selected_indexes[0].row()
-            track = self.tracks_model.get_track(row)
+            track = self.tracks_proxy.get_track(row)
 
             if track:
                 # Update track details panel
@@ -967,28 +961,26 @@ class PlaylistComponent(QWidget):
         if not self.current_tracks:
             return
 
-        # Always show all tracks
-        self.tracks_model.set_tracks(self.current_tracks)
+        # Filter right away instead of waiting for the debounced filter
+        self.tracks_proxy.set_search_text(search_text)
         self.track_container.hide_loading()  # Make sure we are showing the tracks table
 
-        if not search_text:
-            return
+        # Select the first matching track
+        if search_text.strip() and self.tracks_proxy.rowCount() > 0:
+            self._select_track_row(0)
 
-        # Find and select the first matching track
-        search_text_lower = search_text.lower()
-
-        for row in range(self.tracks_model.rowCount()):
-            track = self.tracks_model.get_track(row)
-            if track and (search_text_lower in track.artist.lower() or search_text_lower in track.title.lower()):
-                # Select this track
-                index = self.tracks_model.index(row, 0)
-                self.tracks_table.selectionModel().select(  # type: ignore
-                    index,
-                    QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows,
-                )
-                # Scroll to the selected track
-                self.tracks_table.scrollTo(index)
-                break
+    def _select_track_row(self, row: int) -> None:
+        """Select a row of the tracks table and scroll to it.
+
+        Args:
+            row: Row of the table view
+        """
+        index = self.tracks_proxy.index(row, 0)
+        self.tracks_table.selectionModel().select(  # type: ignore
+            index,
+            QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows,
+        )
+        self.tracks_table.scrollTo(index)
 
     def _on_search_completion_selected(self, text: str) -> None:
         """Handle selection of a search completion item.
@@ -996,27 +988,14 @@ class PlaylistComponent(QWidget):
         Args:
             text: The selected completion text (format: "Artist - Title")
         """
-        if not text or not self.current_tracks:
+        track = self._tracks_by_suggestion.get(text)
+        if track is None:
             return
 
-        # Find the track that matches the selected suggestion
-        for track in self.current_tracks:
-            track_text = f"{track.artist} - {track.title}"
-            if track_text == text:
-                # Find the track in the current view (might be filtered)
-                for row in range(self.tracks_model.rowCount()):
-                    view_track = self.tracks_model.get_track(row)
-                    if view_track and view_track.track_id == track.track_id:
-                        # Select this track in the table
-                        index = self.tracks_model.index(row, 0)
-                        self.tracks_table.selectionModel().select(  # type: ignore
-                            index,
-                            QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows,
-                        )
-                        # Scroll to the selected track
-                        self.tracks_table.scrollTo(index)
-                        break
-                break
+        # Find the track in the current view (might be filtered)
+        row = self.tracks_proxy.row_for_track(track.track_id)
+        if row >= 0:
+            self._select_track_row(row)
 
     def refresh(self) -> None:
         """Refresh the playlist and track data."""
@@ -1169,7 +1148,7 @@ class PlaylistComponent(QWidget):
         selected_tracks = []
         for index in selected_indexes:
             row = index.row()
-            track = self.tracks_model.get_track(row)
+            track = self.tracks_proxy.get_track(row)
             if track:
                 selected_tracks.append(track)
 
@@ -1462,53 +1441,6 @@ class PlaylistComponent(QWidget):
             if callable(search_method):
                 search_method(search_query)
 
-    @pyqtSlot(int, int)
-    def _on_track_quality_changed(self, track_id: int, quality: int) -> None:
-        """Handle quality rating changes from the details panel.
-
-        Args:
-            track_id: The track ID
-            quality: The new quality rating
-        """
-        logger.debug(f"Playlist component received quality_changed signal: track_id={track_id}, quality={quality}")
-
-        if not track_id:
-            logger.warning("Invalid track ID, ignoring quality change")
-            return
-
-        # Update the track quality in the database
-        from selecta.core.data.database import get_session
-
-        # Create a track repository
-        session = get_session()
-        track_repo = TrackRepository(session)
-
-        logger.info(f"Updating quality in database: track_id={track_id}, quality={quality}")
-        # Set the track quality
-        success = track_repo.set_track_quality(track_id, quality)
-
-        if success:
-            logger.info("Quality update successful")
-
-            # Use our dedicated method to update the track quality in the model
-            updated = self.tracks_model.update_track_quality(track_id, quality)
-
-            if updated:
-                logger.debug(f"Updated track {track_id} quality in model to {quality}")
-            else:
-                logger.warning(f"Could not find track {track_id} in the current model")
-                logger.debug("Falling back to full refresh")
-                self.refresh()
-        else:
-            logger.error(f"Quality update failed for track {track_id}")
-            from PyQt6.QtWidgets import QMessageBox
-
-            QMessageBox.warning(
-                self,
-                "Quality Update Failed",
-                f"Failed to update quality rating for track {track_id}.",
-            )
-
     def _on_data_changed(self) -> None:
         """Handle notification that data has changed."""
         # Skip refresh if we're already in a loading state
@@ -1529,6 +1461,69 @@ class PlaylistComponent(QWidget):
         logger.debug("Executing debounced data_changed refresh")
         self.refresh()
 
+    def _on_changes_committed(self, events: list[ChangeEvent]) -> None:
+        """Apply the committed changes of the repositories to the shown playlists and tracks.
+
+        Only the rows the changes touch are updated: changed tracks are rebuilt,
+        and tracks added to or removed from the shown playlist are inserted or
+        removed, so e.g. rating a track doesn't reload the playlist.
+
+        Args:
+            events: Merged change events
+        """
+        # Only views of the library database show the repositories' data
+        if self.data_provider is None or not hasattr(self.data_provider, "get_track_items"):
+            return
+
+        selected_track = self.selection_state.get_selected_track()
+        selected_changed = False
+        for change in events:
+            if isinstance(change, TrackUpdated):
+                updated = self.tracks_model.apply_track_changes(change.track_id, change.changes)
+                selected_changed |= updated and getattr(selected_track, "track_id", None) == change.track_id
+            elif isinstance(change, PlatformLinkAdded):
+                updated = self.tracks_model.add_track_platform(change.track_id, change.platform)
+                selected_changed |= updated and getattr(selected_track, "track_id", None) == change.track_id
+            elif isinstance(change, PlaylistTracksChanged):
+                self._apply_playlist_tracks_change(change)
+
+        if selected_changed:
+            self.details_panel.set_track(selected_track)
+
+    def _apply_playlist_tracks_change(self, change: PlaylistTracksChanged) -> None:
+        """Apply a committed change of a playlist's tracks to the tree and, if it's shown, the tracks table.
+
+        Args:
+            change: Membership change of the playlist
+        """
+        if hasattr(self.data_provider, "invalidate_playlist_tracks"):
+            self.data_provider.invalidate_playlist_tracks(change.playlist_id)
+        self.playlist_model.update_track_count(change.playlist_id, len(change.added) - len(change.removed))
+
+        if change.playlist_id != self.current_playlist_id:
+            return
+        if self.track_container.stacked_widget.currentWidget() == self.track_container.loading_widget:
+            # A load is in flight; with the cache invalidated, the next load includes the change
+            return
+        if change.reordered:
+            # Positions aren't part of the event, so reload the tracks in their new order
+            self._refresh_current_playlist_tracks()
+            return
+
+        self.tracks_model.remove_tracks(list(change.removed))
+        if change.added:
+            self.tracks_model.insert_tracks(self.data_provider.get_track_items(list(change.added)))  # type: ignore
+        self.current_tracks = self.tracks_model.tracks
+        self._update_search_suggestions()
+
+        playlist_item = self.playlist_model.id_to_item.get(change.playlist_id)
+        if playlist_item:
+            self.playlist_header.setText(f"Playlist: {playlist_item.name} ({len(self.current_tracks)} tracks)")
+        if self.current_tracks:
+            self.track_container.hide_loading()
+        else:
+            self.track_container.show_message("This playlist is empty.")
+
     def _on_track_updated(self, track_id: int) -> None:
         """Handle notification that a specific track has been updated.
 
@@ -1600,7 +1595,7 @@ class PlaylistComponent(QWidget):
 
             # Update all tracks in the model
             track_found = False
-            for i, track in enumerate(self.current_tracks):
+            for track in self.current_tracks:
                 if hasattr(track, "track_id") and track.track_id == track_id:
                     track_found = True
                     # Replace with database track if possible
@@ -1621,20 +1616,8 @@ class PlaylistComponent(QWidget):
                     if hasattr(track, "platforms"):
                         track.platforms = platforms
 
-                    # Force clear cached display data
-                    if hasattr(track, "_display_data"):
-                        delattr(track, "_display_data")
-
-                    # Force model to update this row
-                    row_index = self.tracks_model.index(i, 0)
-                    last_index = self.tracks_model.index(i, self.tracks_model.columnCount() - 1)
-                    self.tracks_model.dataChanged.emit(row_index, last_index)
-
-                    # Specifically update platforms column if it exists
-                    if "platforms" in self.tracks_model.column_keys:
-                        platform_col = self.tracks_model.column_keys.index("platforms")
-                        platform_index = self.tracks_model.index(i, platform_col)
-                        self.tracks_model.dataChanged.emit(platform_index, platform_index)
+                    # Rebuild the track's row in the model and update it
+                    self.tracks_model.refresh_track(track_id)
 
                     # Also update the details panel if this track is currently selected
                     selected_track = self.selection_state.get_selected_track()
@@ -1676,7 +1659,7 @@ class PlaylistComponent(QWidget):
             index: The index of the clicked item
         """
         row = index.row()
-        track = self.tracks_model.get_track(row)
+        track = self.tracks_proxy.get_track(row)
         if track:
             # Emit signal to play the track
             self.play_track.emit(track)
@@ -1885,10 +1868,6 @@ class PlaylistComponent(QWidget):
                     f"All {already_exists_count} track{'s' if already_exists_count > 1 else ''} already exist in playlist '{playlist.name}'.",  # noqa: E501
                 )
 
-            # Refresh if this is the currently displayed playlist
-            if self.current_playlist_id == playlist_id:
-                self.refresh()
-
         except Exception as e:
             logger.exception(f"Error adding tracks to playlist: {e}")
             from PyQt6.QtWidgets import QMessageBox
@@ -1951,9 +1930,6 @@ class PlaylistComponent(QWidget):
                     "Tracks Removed",
                     f"Removed {removed_count} track{'s' if removed_count > 1 else ''} from playlist '{playlist.name}'.",  # noqa: E501
                 )
-
-                # Refresh the view
-                self.refresh()
             else:
                 QMessageBox.information(self, "No Tracks Removed", "No tracks were removed from the playlist.")
 
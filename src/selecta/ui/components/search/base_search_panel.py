@@ -272,63 +272,8 @@ class BaseSearchPanel(LoadableWidget):
         selected_track = self.selection_state.get_selected_track()
 
         if selected_track and hasattr(selected_track, "track_id"):
-            track_id = selected_track.track_id
-            logger.debug(f"Updating platforms for track_id={track_id}")
-
-            # Force a direct database refresh
-            try:
-                # Get fresh track data from database for display
-                from selecta.core.data.database import get_session
-                from selecta.core.data.repositories.track_repository import TrackRepository
-
-                session = get_session()
-                track_repo = TrackRepository(session)
-
-                # Get the complete track
-                fresh_track_data = track_repo.get_by_id(track_id)
-
-                if not fresh_track_data:
-                    logger.warning(f"Could not find track {track_id} in database")
-                else:
-                    logger.debug(f"Retrieved fresh track data for track_id={track_id}")
-            except Exception as e:
-                logger.error(f"Error getting fresh track data: {e}")
-
-            # Use the models property to get access to the tracks table model
-            from selecta.ui.components.playlist.model.tracks_table_model import TracksTableModel
-
-            # Find the active model in the UI
-            tracks_model = None
-            main_window = self.window()
-
-            # Use a safer approach with explicit type checking
-            if main_window is not None:
-                playlist_content = main_window.findChild(QWidget, "playlistContent")
-
-                # Type-safe navigation with type casting for analysis tools
-                if playlist_content is not None:
-                    # Use getattr to avoid direct attribute access that causes type errors
-                    component = getattr(playlist_content, "playlist_component", None)
-
-                    if component is not None:
-                        # Try direct tracks_model access
-                        tracks_model = getattr(component, "tracks_model", None)
-
-                        # If not found, try via track_container
-                        if tracks_model is None:
-                            track_container = getattr(component, "track_container", None)
-                            if track_container is not None:
-                                tracks_model = getattr(track_container, "tracks_model", None)
-
-            # Use the targeted update method if we found the model
-            if tracks_model and isinstance(tracks_model, TracksTableModel):
-                # Force a reload from database to ensure we have latest platform info
-                result = tracks_model.update_track_from_database(track_id)
-                logger.debug(f"Used database reload for platform update for track_id={track_id}, result={result}")
-            else:
-                # Fall back to the selection state mechanism if we can't find the model
-                logger.debug(f"Used selection state notification for track_id={track_id}")
-                self.selection_state.notify_track_updated(track_id)
+            # The tracks table adds the platform from the repository's change event, no reload is needed
+            logger.debug(f"Linked track_id={selected_track.track_id}")
 
             # Re-select the track immediately
             self.selection_state.set_selected_track(selected_track)
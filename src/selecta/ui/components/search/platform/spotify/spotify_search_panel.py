@@ -6,9 +6,7 @@ from typing import Any
 import requests
 from loguru import logger
 from PyQt6.QtWidgets import QHBoxLayout, QMessageBox, QWidget
-from sqlalchemy import and_
 
-from selecta.core.data.models.db import Track
 from selecta.core.data.repositories.image_repository import ImageRepository
 from selecta.core.data.repositories.playlist_repository import PlaylistRepository
 from selecta.core.data.repositories.settings_repository import SettingsRepository
@@ -281,10 +279,8 @@ class SpotifySearchPanel(BaseSearchPanel):
                 return
 
             # Check if a track with the same title and artist already exists
-            # This check should be quick so we'll keep it in the UI thread
-            existing_track = (
-                self.track_repo.session.query(Track).filter(and_(Track.title == title, Track.artist == artist)).first()
-            )
+            # This is an indexed key lookup, so we'll keep it in the UI thread
+            existing_track = self.track_repo.find_by_title_artist(title, artist)
 
             if existing_track:
                 QMessageBox.warning(self, "Add Error", f"Track already exists: {artist} - {title}")
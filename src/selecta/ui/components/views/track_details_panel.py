@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import (
 
 from selecta.core.data.database import get_session
 from selecta.core.data.models.db import ImageSize, Track
+from selecta.core.data.repositories.image_repository import ImageRepository
 from selecta.core.data.repositories.track_repository import TrackRepository
 from selecta.core.utils.path_helper import get_resource_path
 from selecta.ui.components.common.image_loader import DatabaseImageLoader
@@ -1006,10 +1007,8 @@ class TrackDetailsPanel(QWidget):
                 logger.info(f"Quality updated successfully for track {self._current_track_id}")
 
                 # Still emit the signal for any listeners that want to know about the change
+                # The views update the track's row from the repository's change event
                 self.quality_changed.emit(self._current_track_id, quality)
-
-                # Notify the global selection state that this track was updated
-                SelectionState().notify_track_updated(self._current_track_id)
             else:
                 logger.error(f"Failed to update quality for track {self._current_track_id}")
                 from PyQt6.QtWidgets import QMessageBox
@@ -1285,84 +1284,36 @@ class TrackDetailsPanel(QWidget):
             pixmap.save(buffer, "PNG")  # Save as PNG format
             buffer.close()
 
-            # Get image dimensions
-            width = pixmap.width()
-            height = pixmap.height()
-            size_bytes = len(image_bytes.data())
-
-            # Create image object
             session = get_session()
-
-            # Create new Image record
-            from selecta.core.data.models.db import Image, ImageSize
+            image_repo = ImageRepository(session)
 
             logger.info(f"Saving new cover image for track {track.id}")
 
-            # Delete existing images for this track first to avoid conflicts
-            existing_images = session.query(Image).filter(Image.track_id == track.id).all()
-            for img in existing_images:
-                logger.info(f"Deleting existing image: {img.id}")
-                session.delete(img)
-
-            # Commit the deletion before adding the new image
-            session.commit()
+            # Replace the existing images of this track; the repository publishes the change
+            image_repo.delete_track_images(track.id)
 
             # Clear image loader cache to ensure fresh images are loaded
             if TrackDetailsPanel._db_image_loader:
                 TrackDetailsPanel._db_image_loader.clear_track_image_cache(track.id)
 
-            # Create new image
-            new_image = Image(
-                data=image_bytes.data(),
+            new_image = image_repo.add_track_image(
+                track.id,
+                bytes(image_bytes.data()),
+                ImageSize.MEDIUM,
                 mime_type="image/png",
-                size=ImageSize.MEDIUM,
-                width=width,
-                height=height,
-                file_size=size_bytes,
-                track_id=track.id,
                 source=metadata.get("source", "unknown"),
                 source_url=metadata.get("url", ""),
             )
+            logger.info(f"Saved new cover image (id={new_image.id}) for track {track.id}")
 
-            # Save to database - use add() and commit() since there's no save_image method
-            session.add(new_image)
-            session.commit()
-            image_id = new_image.id
-
-            logger.info(f"New image saved with ID: {image_id}")
-
-            if image_id:
-                logger.info(f"Saved new cover image (id={image_id}) for track {track.id}")
-
-                # Update track relationships if needed
-                from selecta.core.data.repositories.track_repository import TrackRepository
+            # Reload the track to ensure it has the new image
+            TrackRepository(session).refresh_track(track.id)
 
-                track_repo = TrackRepository(session)
-
-                # Reload the track to ensure it has the new image
-                track_repo.refresh_track(track.id)
-
-                # Instead of relying on refresh, directly update the displayed image
-                # This ensures the image change is immediately visible
-                if TrackDetailsPanel._db_image_loader:
-                    # Force reload from database
-                    logger.info(f"Forcing image reload for track {track.id}")
-
-                    # Clear any existing image from the cache
-                    TrackDetailsPanel._db_image_loader.clear_track_image_cache(track.id)
-
-                # Keep the current image displayed (it's already showing the user selection)
-                # and avoid refreshing the panel which might revert to database image
-                self._image_just_saved = True
-                self._saved_image_track_id = track.id
-
-                # Notify UI of update WITHOUT triggering a full refresh
-                SelectionState().notify_track_updated(track.id)
-
-                return True
-            else:
-                logger.error(f"Failed to save cover image for track {track.id}")
-                return False
+            # Keep the current image displayed (it's already showing the user selection)
+            # and avoid refreshing the panel which might revert to database image
+            self._image_just_saved = True
+            self._saved_image_track_id = track.id
+            return True
 
         except Exception as e:
             logger.error(f"Error saving cover image: {e}")
@@ -28,6 +28,9 @@ from selecta.core.data.repositories.track_repository import TrackRepository
 from selecta.core.utils.duplicate_detector import DuplicateDetector
 from selecta.ui.themes.theme_manager import ThemeManager
 
+# Orphaned tracks loaded and added to the orphans table at once
+ORPHAN_PAGE_SIZE = 200
+
 
 class CollectionManagementDialog(QDialog):
     """Dialog for managing Collection tracks and detecting duplicates."""
@@ -330,8 +333,20 @@ class CollectionManagementDialog(QDialog):
             progress.setValue(30)
             QApplication.processEvents()
 
+            def on_progress(done: int, total: int):
+                # Scoring takes the progress from 30 to 70
+                progress.setValue(30 + (40 * done // total if total else 40))
+
+            def should_stop() -> bool:
+                QApplication.processEvents()
+                return progress.wasCanceled()
+
             # Find potential duplicates
-            self.potential_duplicates = self.duplicate_detector.find_potential_duplicates(threshold)
+            self.potential_duplicates = self.duplicate_detector.find_potential_duplicates(
+                threshold, progress_callback=on_progress, should_stop=should_stop
+            )
+            if progress.wasCanceled():
+                return
 
             # Update progress dialog
             progress.setValue(70)
@@ -458,12 +473,7 @@ class CollectionManagementDialog(QDialog):
             progress.close()
 
     def _refresh_orphans(self):
-        """Refresh the orphaned tracks list."""
-        # Show a progress dialog
-        progress = QProgressDialog("Finding orphaned tracks...", "Cancel", 0, 100, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setValue(10)
-
+        """Refresh the orphaned tracks list, adding the tracks to the table page by page."""
         # Clear existing data
         self.orphans_table.setRowCount(0)
         self.orphans_table.clearContents()
@@ -472,71 +482,30 @@ class CollectionManagementDialog(QDialog):
         self.create_playlist_button.setEnabled(False)
         self.remove_selected_button.setEnabled(False)
 
-        try:
-            # Update progress dialog
-            progress.setValue(30)
-            QApplication.processEvents()
-
-            # Find orphaned tracks
-            self.orphaned_tracks = self.duplicate_detector.find_orphaned_tracks()
-
-            # Update progress dialog
-            progress.setValue(70)
-            QApplication.processEvents()
-
-            # Populate table with orphaned tracks
-            for row, track in enumerate(self.orphaned_tracks):
-                self.orphans_table.insertRow(row)
-
-                # Track ID stored as hidden data in first column with type checking
-                is_valid_dict = isinstance(track, dict)
-                track_id = track["id"] if is_valid_dict and "id" in track else 0
-
-                # Checkbox for selection
-                checkbox_item = QTableWidgetItem()
-                checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                checkbox_item.setCheckState(Qt.CheckState.Unchecked)
-                checkbox_item.setData(Qt.ItemDataRole.UserRole, track_id)
-                self.orphans_table.setItem(row, 0, checkbox_item)
-
-                # Track information with type checking
-                title = track["title"] if is_valid_dict and "title" in track else ""
-                artist = track["artist"] if is_valid_dict and "artist" in track else ""
-                album = track["album"] if is_valid_dict and "album" in track else ""
-
-                self.orphans_table.setItem(row, 1, QTableWidgetItem(title))
-                self.orphans_table.setItem(row, 2, QTableWidgetItem(artist))
-                self.orphans_table.setItem(row, 3, QTableWidgetItem(album))
-
-                # Duration in minutes:seconds with type checking
-                duration_ms = track["duration_ms"] if is_valid_dict and "duration_ms" in track else 0
-
-                # Ensure duration_ms is valid for integer operations
-                try:
-                    duration_ms_int = int(duration_ms)
-                    minutes = duration_ms_int // 60000
-                    seconds = (duration_ms_int % 60000) // 1000
-                    duration_str = f"{minutes}:{seconds:02d}"
-                except (ValueError, TypeError):
-                    duration_str = "0:00"
+        # Show a progress dialog over the number of orphaned tracks
+        total = self.duplicate_detector.count_orphaned_tracks()
+        progress = QProgressDialog("Finding orphaned tracks...", "Cancel", 0, max(total, 1), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setValue(0)
 
-                self.orphans_table.setItem(row, 4, QTableWidgetItem(duration_str))
+        try:
+            # Stream the orphaned tracks into the table
+            while len(self.orphaned_tracks) < total and not progress.wasCanceled():
+                page = self.duplicate_detector.find_orphaned_tracks(ORPHAN_PAGE_SIZE, len(self.orphaned_tracks))
+                if not page:
+                    break
+                for track in page:
+                    self._add_orphan_row(track)
+                self.orphaned_tracks.extend(page)
 
-                # Platforms with type checking
-                platforms = track["platforms"] if is_valid_dict and "platforms" in track else []
-                is_list = isinstance(platforms, list)
-                platforms_str = ", ".join(platforms) if is_list else str(platforms)
-                self.orphans_table.setItem(row, 5, QTableWidgetItem(platforms_str))
+                progress.setValue(len(self.orphaned_tracks))
+                QApplication.processEvents()
 
-                # Local path (shortened) with type checking
-                path = track["local_path"] if is_valid_dict and "local_path" in track else ""
-                path_display = os.path.basename(path) if path else ""
-                path_item = QTableWidgetItem(path_display)
-                path_item.setToolTip(path)
-                self.orphans_table.setItem(row, 6, QTableWidgetItem(path_display))
+            if progress.wasCanceled():
+                return
 
             # Close progress dialog
-            progress.setValue(100)
+            progress.setValue(progress.maximum())
 
             # Show result message
             if self.orphaned_tracks:
@@ -560,6 +529,62 @@ class CollectionManagementDialog(QDialog):
         finally:
             progress.close()
 
+    def _add_orphan_row(self, track: dict):
+        """Append an orphaned track to the orphans table.
+
+        Args:
+            track: Track information as returned by DuplicateDetector.find_orphaned_tracks
+        """
+        row = self.orphans_table.rowCount()
+        self.orphans_table.insertRow(row)
+
+        # Track ID stored as hidden data in first column with type checking
+        is_valid_dict = isinstance(track, dict)
+        track_id = track["id"] if is_valid_dict and "id" in track else 0
+
+        # Checkbox for selection
+        checkbox_item = QTableWidgetItem()
+        checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
+        checkbox_item.setCheckState(Qt.CheckState.Unchecked)
+        checkbox_item.setData(Qt.ItemDataRole.UserRole, track_id)
+        self.orphans_table.setItem(row, 0, checkbox_item)
+
+        # Track information with type checking
+        title = track["title"] if is_valid_dict and "title" in track else ""
+        artist = track["artist"] if is_valid_dict and "artist" in track else ""
+        album = track["album"] if is_valid_dict and "album" in track else ""
+
+        self.orphans_table.setItem(row, 1, QTableWidgetItem(title))
+        self.orphans_table.setItem(row, 2, QTableWidgetItem(artist))
+        self.orphans_table.setItem(row, 3, QTableWidgetItem(album))
+
+        # Duration in minutes:seconds with type checking
+        duration_ms = track["duration_ms"] if is_valid_dict and "duration_ms" in track else 0
+
+        # Ensure duration_ms is valid for integer operations
+        try:
+            duration_ms_int = int(duration_ms)
+            minutes = duration_ms_int // 60000
+            seconds = (duration_ms_int % 60000) // 1000
+            duration_str = f"{minutes}:{seconds:02d}"
+        except (ValueError, TypeError):
+            duration_str = "0:00"
+
+        self.orphans_table.setItem(row, 4, QTableWidgetItem(duration_str))
+
+        # Platforms with type checking
+        platforms = track["platforms"] if is_valid_dict and "platforms" in track else []
+        is_list = isinstance(platforms, list)
+        platforms_str = ", ".join(platforms) if is_list else str(platforms)
+        self.orphans_table.setItem(row, 5, QTableWidgetItem(platforms_str))
+
+        # Local path (shortened) with type checking
+        path = track["local_path"] if is_valid_dict and "local_path" in track else ""
+        path_display = os.path.basename(path) if path else ""
+        path_item = QTableWidgetItem(path_display)
+        path_item.setToolTip(path)
+        self.orphans_table.setItem(row, 6, QTableWidgetItem(path_display))
+
     def _on_duplicate_selection_changed(self):
         """Handle selection change in duplicates table."""
         # Update merge button state
@@ -761,6 +786,9 @@ class CollectionManagementDialog(QDialog):
                         # Mark the merged track for deletion
                         self.track_repo.update(merge_id, {"status": "deleted"})
 
+                        # The merged track no longer has duplicates of its own
+                        self.duplicate_detector.index.remove_tracks([merge_id])
+
                         merged_count += 1
 
             progress.setValue(len(groups_to_merge))
@@ -14,8 +14,8 @@ from PyQt6.QtWidgets import (
 )
 
 from selecta.core.data.repositories.settings_repository import SettingsRepository
-from selecta.core.data.repositories.track_repository import TrackRepository
-from selecta.core.utils.metadata_extractor import MetadataExtractor
+from selecta.core.utils.cover_import import import_covers
+from selecta.ui.components.common.image_loader import DatabaseImageLoader
 
 
 class ImportCoversThread(QThread):
@@ -33,8 +33,7 @@ class ImportCoversThread(QThread):
         """
         super().__init__(parent)
         self.cancelled = False
-        self.extractor = MetadataExtractor()
-        self.track_repo = TrackRepository()
+        self.started_at = 0.0
 
         # Statistics
         self.succeeded = 0
@@ -44,43 +43,39 @@ class ImportCoversThread(QThread):
         """Cancel the import process."""
         self.cancelled = True
 
+    def _on_progress(self, processed: int, total: int):
+        """Report the import progress with its throughput.
+
+        Args:
+            processed: Number of tracks processed
+            total: Number of tracks without a cover
+        """
+        elapsed = time.monotonic() - self.started_at
+        rate = processed / elapsed if elapsed else 0.0
+        self.progress_update.emit(
+            int(processed / total * 100) if total else 100,
+            f"Processed {processed} of {total} tracks ({rate:.0f} tracks/s)",
+        )
+
     def run(self):
         """Run the import process."""
         try:
-            # Get all tracks with local paths
-            tracks = self.track_repo.get_all_with_local_path()
-
-            if not tracks:
-                self.error_occurred.emit("No local tracks found")
-                return
-
-            # Calculate total
-            total_tracks = len(tracks)
-            self.progress_update.emit(0, f"Found {total_tracks} local tracks")
-
-            # Process each track
-            for i, track in enumerate(tracks):
-                if self.cancelled:
-                    break
-
-                # Update progress (0-100)
-                progress = int((i / total_tracks) * 100)
-                self.progress_update.emit(
-                    progress,
-                    f"Processing track {i + 1} of {total_tracks}: {track.artist} - {track.title}",
-                )
-
-                # Process the track
-                if self.extractor.extract_cover_from_track(track.id):
-                    self.succeeded += 1
-                else:
-                    self.failed += 1
-
-                # Small delay to prevent UI freezing
-                time.sleep(0.01)
+            self.started_at = time.monotonic()
+            self.progress_update.emit(0, "Looking for tracks without covers...")
+
+            result = import_covers(
+                progress_callback=self._on_progress,
+                should_stop=lambda: self.cancelled,
+            )
+            self.succeeded = result.imported
+            self.failed = result.failed + result.without_art
 
             # Final update
-            self.progress_update.emit(100, "Import complete")
+            self.progress_update.emit(
+                100,
+                f"Import complete: {result.imported} covers from {result.unique_covers} distinct images "
+                f"in {result.elapsed:.1f}s ({result.tracks_per_second:.0f} tracks/s)",
+            )
             self.import_complete.emit(self.succeeded, self.failed)
 
         except Exception as e:
@@ -189,6 +184,10 @@ class ImportCoversDialog(QDialog):
         self.cancel_button.clicked.disconnect()
         self.cancel_button.clicked.connect(self.accept)
 
+        # Images known to be missing may exist now
+        if succeeded:
+            DatabaseImageLoader.clear_cache()
+
         # Show a summary
         if failed == 0 and succeeded == 0:
             QMessageBox.information(self, "Import Complete", "No new covers were found to import.")
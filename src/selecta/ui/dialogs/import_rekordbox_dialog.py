@@ -1,8 +1,11 @@
 """Dialog for importing tracks from Rekordbox."""
 
+import json
 import os
 import shutil
 import time
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
 
 from loguru import logger
@@ -19,12 +22,12 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from selecta.core.data.models.db import TrackAttribute
 from selecta.core.data.repositories.playlist_repository import PlaylistRepository
 from selecta.core.data.repositories.settings_repository import SettingsRepository
 from selecta.core.data.repositories.track_repository import TrackRepository
 from selecta.core.platform.platform_factory import PlatformFactory
 from selecta.core.platform.rekordbox.client import RekordboxClient
+from selecta.core.platform.rekordbox.incremental import RekordboxImportState
 from selecta.core.platform.rekordbox.models import RekordboxTrack
 
 
@@ -40,6 +43,7 @@ class ImportThread(QThread):
         rekordbox_client: RekordboxClient,
         destination_folder: str,
         create_collection_playlist: bool = True,
+        incremental: bool = False,
         parent=None,
     ):
         """Initialize the import thread.
@@ -48,21 +52,28 @@ class ImportThread(QThread):
             rekordbox_client: Rekordbox client instance
             destination_folder: Folder to copy files to
             create_collection_playlist: Whether to create a collection playlist
+            incremental: Whether to import only tracks changed since the last import
             parent: Parent object
         """
         super().__init__(parent)
         self.rekordbox_client = rekordbox_client
         self.destination_folder = destination_folder
         self.create_collection_playlist = create_collection_playlist
+        self.incremental = incremental
         self.cancelled = False
 
         # Repositories
         self.track_repo = TrackRepository()
         self.playlist_repo = PlaylistRepository()
+        self.import_state = RekordboxImportState(SettingsRepository(), rekordbox_client.database_key())
+
+        # Local track IDs by Rekordbox ID, loaded once instead of a lookup per track
+        self.linked_tracks: dict[str, int] = {}
 
         # Statistics
         self.imported_count = 0
         self.failed_count = 0
+        self.failed_ids: list[str] = []
         self.error_messages = []
 
     def cancel(self):
@@ -72,30 +83,57 @@ class ImportThread(QThread):
     def run(self):
         """Run the import process."""
         try:
-            # Get all tracks from Rekordbox
             self.progress_update.emit(0, "Getting tracks from Rekordbox...")
-            tracks = self.rekordbox_client.get_all_tracks()
-
-            if not tracks:
-                self.error_occurred.emit("No tracks found in Rekordbox")
-                return
+            self.linked_tracks = self.track_repo.get_platform_id_map("rekordbox")
 
-            # Calculate total
-            total_tracks = len(tracks)
-            self.progress_update.emit(0, f"Found {total_tracks} tracks in Rekordbox")
+            since = self.import_state.load() if self.incremental else None
+            if since is not None:
+                # Only read the rows changed since the last import, plus the tracks that failed last time
+                changes = self.rekordbox_client.get_content_changes(
+                    since, self.linked_tracks.keys(), self.import_state.failed_ids
+                )
+                watermark = changes.watermark
+                total_tracks = len(changes.changed)
+                tracks: Iterable[RekordboxTrack] = changes.changed
+
+                if changes.deleted_ids:
+                    removed = self.track_repo.remove_platform_info("rekordbox", changes.deleted_ids)
+                    logger.info(f"Unlinked {removed} tracks deleted from Rekordbox")
+
+                if not total_tracks:
+                    self.import_state.save(watermark, failed_ids=[])
+                    self.progress_update.emit(100, "Library is up to date")
+                    self.import_complete.emit(0, 0, [])
+                    return
+            else:
+                # Take the watermark before reading so changes made meanwhile are picked up next time
+                watermark = self.rekordbox_client.get_content_watermark()
+                total_tracks = self.rekordbox_client.count_tracks()
+                tracks = chain.from_iterable(self.rekordbox_client.iter_tracks())
+
+                if not total_tracks:
+                    self.error_occurred.emit("No tracks found in Rekordbox")
+                    return
+
+            self.progress_update.emit(0, f"Found {total_tracks} tracks to import from Rekordbox")
             time.sleep(0.5)  # Short pause to show message
 
             # Make sure the destination folder exists
             os.makedirs(self.destination_folder, exist_ok=True)
 
-            # Create collection playlist if requested
+            # Reuse the collection playlist of earlier imports or create it if requested
             collection_playlist_id = None
             if self.create_collection_playlist:
-                collection_playlist_id = self.playlist_repo.create_playlist(
-                    "Rekordbox Collection", is_folder=False, parent_id=None
-                )
-
-            # Process each track
+                collection_playlist_id = self.import_state.collection_playlist_id
+                if collection_playlist_id is None or not self.playlist_repo.get_by_id(
+                    collection_playlist_id
+                ):
+                    collection_playlist_id = self.playlist_repo.create(
+                        {"name": "Rekordbox Collection", "is_folder": False}
+                    ).id
+
+            # Process each track, collecting the new ones for the collection playlist
+            new_track_ids: list[int] = []
             for i, track in enumerate(tracks):
                 if self.cancelled:
                     break
@@ -108,17 +146,18 @@ class ImportThread(QThread):
 
                 try:
                     # Import the track
-                    if self._import_track(track):
-                        # Add to collection playlist if created
-                        if collection_playlist_id:
-                            self.playlist_repo.add_track_to_playlist(
-                                track.id, collection_playlist_id
-                            )
+                    is_new = str(track.id) not in self.linked_tracks
+                    local_track_id = self._import_track(track)
+                    if local_track_id is not None:
+                        if is_new:
+                            new_track_ids.append(local_track_id)
                         self.imported_count += 1
                     else:
                         self.failed_count += 1
+                        self.failed_ids.append(str(track.id))
                 except Exception as e:
                     self.failed_count += 1
+                    self.failed_ids.append(str(track.id))
                     error_msg = f"Error importing {track.title}: {str(e)}"
                     self.error_messages.append(error_msg)
                     logger.error(error_msg)
@@ -126,6 +165,17 @@ class ImportThread(QThread):
                 # Small delay to prevent UI freezing
                 time.sleep(0.01)
 
+            # Add the new tracks to the collection playlist at once if requested
+            if collection_playlist_id:
+                self.playlist_repo.append_tracks(collection_playlist_id, new_track_ids)
+
+            # Failed tracks are stored to be retried next time, so they don't hold the watermark back.
+            # A cancelled import keeps the previous state and reads the unfinished range again.
+            if self.cancelled:
+                self.import_state.save(None, collection_playlist_id)
+            else:
+                self.import_state.save(watermark, collection_playlist_id, failed_ids=self.failed_ids)
+
             # Final update
             self.progress_update.emit(100, "Import complete")
             self.import_complete.emit(self.imported_count, self.failed_count, self.error_messages)
@@ -134,25 +184,25 @@ class ImportThread(QThread):
             logger.exception(f"Error in import thread: {e}")
             self.error_occurred.emit(f"Import error: {str(e)}")
 
-    def _import_track(self, track: RekordboxTrack) -> bool:
+    def _import_track(self, track: RekordboxTrack) -> int | None:
         """Import a single track from Rekordbox.
 
         Args:
             track: The Rekordbox track to import
 
         Returns:
-            True if successful, False otherwise
+            The local track ID if successful, None otherwise
         """
         # Skip tracks without a location
-        if not track.location:
+        if not track.folder_path:
             self.error_messages.append(f"Track {track.title} has no file location")
-            return False
+            return None
 
         # Check if the source file exists
-        source_path = Path(track.location)
+        source_path = Path(track.folder_path)
         if not source_path.exists():
-            self.error_messages.append(f"Source file not found: {track.location}")
-            return False
+            self.error_messages.append(f"Source file not found: {track.folder_path}")
+            return None
 
         # Determine destination path
         rel_path = source_path.name  # Just the filename
@@ -163,48 +213,36 @@ class ImportThread(QThread):
             try:
                 shutil.copy2(source_path, dest_path)
             except Exception as e:
-                self.error_messages.append(f"Error copying file {track.location}: {str(e)}")
-                return False
-
-        # Record the local path
-        local_path = str(dest_path)
-
-        # Check if track already exists with this Rekordbox ID
-        existing_track = self.track_repo.get_by_platform_id("rekordbox", track.id)
-
-        if existing_track:
-            # Update existing track
-            self.track_repo.update_track(
-                existing_track.id,
-                {
-                    "title": track.title,
-                    "artist": track.artist,
-                    "album": track.album,
-                    "genre": track.genre,
-                    "duration": track.duration,
-                    "local_path": local_path,
-                },
-            )
-            # Update Rekordbox metadata
-            self.track_repo.set_track_attribute(
-                existing_track.id, TrackAttribute.REKORDBOX_ID, track.id
-            )
-            track_id = existing_track.id
+                self.error_messages.append(f"Error copying file {track.folder_path}: {str(e)}")
+                return None
+
+        track_data = {
+            "title": track.title,
+            "artist": track.artist_name,
+            "duration_ms": track.duration_ms,
+            "bpm": track.bpm,
+            "local_path": str(dest_path),
+            "is_available_locally": True,
+        }
+
+        # Check if track was already imported with this Rekordbox ID
+        existing_track_id = self.linked_tracks.get(str(track.id))
+
+        if existing_track_id is not None:
+            # Update existing track with the current Rekordbox values
+            self.track_repo.update(existing_track_id, track_data, preserve_existing=False)
+            local_track_id = existing_track_id
         else:
             # Create new track
-            track_id = self.track_repo.create_track(
-                title=track.title,
-                artist=track.artist,
-                album=track.album,
-                genre=track.genre,
-                duration=track.duration,
-                local_path=local_path,
-            )
+            local_track_id = self.track_repo.create(track_data).id
+            self.linked_tracks[str(track.id)] = local_track_id
 
-            # Add Rekordbox metadata
-            self.track_repo.set_track_attribute(track_id, TrackAttribute.REKORDBOX_ID, track.id)
+        # Store the Rekordbox metadata
+        self.track_repo.add_platform_info(
+            local_track_id, "rekordbox", str(track.id), metadata=json.dumps(track.to_dict())
+        )
 
-        return True
+        return local_track_id
 
 
 class ImportRekordboxDialog(QDialog):
@@ -264,6 +302,12 @@ class ImportRekordboxDialog(QDialog):
         self.create_collection_checkbox.setChecked(True)
         options_layout.addWidget(self.create_collection_checkbox)
 
+        self.incremental_checkbox = QCheckBox("Only import tracks changed since the last import")
+        has_previous_import = self._has_previous_import()
+        self.incremental_checkbox.setChecked(has_previous_import)
+        self.incremental_checkbox.setEnabled(has_previous_import)
+        options_layout.addWidget(self.incremental_checkbox)
+
         layout.addWidget(options_group)
 
         # Progress section
@@ -290,6 +334,18 @@ class ImportRekordboxDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _has_previous_import(self) -> bool:
+        """Check whether this Rekordbox database was imported before.
+
+        Returns:
+            True if an import watermark is stored for the database
+        """
+        try:
+            database_key = self.rekordbox_client.database_key()
+        except (ValueError, AttributeError):
+            return False
+        return RekordboxImportState(self.settings_repo, database_key).load() is not None
+
     def _start_import(self):
         """Start the import process."""
         # Disable the import button
@@ -297,10 +353,11 @@ class ImportRekordboxDialog(QDialog):
 
         # Get options
         create_collection = self.create_collection_checkbox.isChecked()
+        incremental = self.incremental_checkbox.isChecked()
 
         # Create and start the import thread
         self.import_thread = ImportThread(
-            self.rekordbox_client, self.local_folder, create_collection, self
+            self.rekordbox_client, self.local_folder, create_collection, incremental, self
         )
 
         # Connect signals
@@ -1,6 +1,7 @@
 """Widget for selecting and managing the local database folder."""
 
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 from PyQt6.QtCore import QCoreApplication, Qt, pyqtSignal
@@ -20,7 +21,9 @@ from PyQt6.QtWidgets import (
 
 from selecta.core.data.repositories.settings_repository import SettingsRepository
 from selecta.core.platform.platform_factory import PlatformFactory
+from selecta.core.utils.audio_hash import update_content_hashes
 from selecta.core.utils.folder_scanner import LocalFolderScanner
+from selecta.core.utils.worker import ThreadManager
 
 
 class FolderSelectionWidget(QWidget):
@@ -258,17 +261,9 @@ class FolderSelectionWidget(QWidget):
             Number of audio files found
         """
         try:
-            audio_extensions = {".mp3", ".flac", ".wav", ".aac", ".m4a", ".ogg", ".aiff"}
-            folder = Path(folder_path)
-
-            # Use a generator expression to count matching files
-            count = sum(
-                1
-                for f in folder.glob("**/*")
-                if f.is_file() and f.suffix.lower() in audio_extensions
-            )
+            from selecta.core.utils.folder_scanner import walk_audio_files
 
-            return count
+            return sum(1 for _ in walk_audio_files(folder_path))
         except Exception as e:
             logger.exception(f"Error counting audio files: {e}")
             return 0
@@ -416,18 +411,22 @@ class FolderSelectionWidget(QWidget):
             in_db_count = len(scan_result["in_database"])
             untracked_count = len(scan_result["not_in_database"])
             missing_count = len(scan_result["missing_from_folder"])
+            moved_count = len(scan_result["moved"])
+            changed_count = len(scan_result["changed"])
 
-            total_physical = in_db_count + untracked_count
+            total_physical = in_db_count + untracked_count + moved_count
 
             message = (
                 f"Scan complete. Found {total_physical} audio files in folder.\n\n"
                 f"• {in_db_count} files are in the database\n"
                 f"• {untracked_count} files are not in the database\n"
+                f"• {moved_count} database entries have moved files\n"
+                f"• {changed_count} database entries have modified files\n"
                 f"• {missing_count} database entries have missing files\n\n"
             )
 
-            if untracked_count > 0:
-                message += "Would you like to import the untracked files now?"
+            if untracked_count > 0 or moved_count > 0 or changed_count > 0:
+                message += "Would you like to import the untracked files and update the moved and modified ones now?"
 
                 response = QMessageBox.question(
                     self,
@@ -438,7 +437,7 @@ class FolderSelectionWidget(QWidget):
                 )
 
                 if response == QMessageBox.StandardButton.Yes:
-                    self._scan_and_import(folder_path)
+                    self._scan_and_import(folder_path, scan_result)
                 else:
                     QMessageBox.information(
                         self, "Scan Complete", "Scan completed without importing files."
@@ -452,11 +451,12 @@ class FolderSelectionWidget(QWidget):
                 self, "Scan Error", f"An error occurred during scanning:\n\n{str(e)}"
             )
 
-    def _scan_and_import(self, folder_path: str):
+    def _scan_and_import(self, folder_path: str, scan_result: dict[str, Any] | None = None):
         """Scan the folder and import untracked files.
 
         Args:
             folder_path: Path to scan
+            scan_result: Result of a scan just before, applied instead of scanning again
         """
         try:
             # Create a progress dialog
@@ -476,11 +476,12 @@ class FolderSelectionWidget(QWidget):
             # Process events to keep UI responsive
             QCoreApplication.processEvents()
 
-            # Scan folder
-            scan_result = scanner.scan_folder()
+            # Scan folder, unless the scan result is already known
+            if scan_result is None:
+                scan_result = scanner.scan_folder()
             untracked_count = len(scan_result["not_in_database"])
 
-            if untracked_count == 0:
+            if untracked_count == 0 and not scan_result["moved"] and not scan_result["changed"]:
                 progress.close()
                 QMessageBox.information(
                     self, "Nothing to Import", "No untracked files found in the folder."
@@ -492,15 +493,32 @@ class FolderSelectionWidget(QWidget):
             progress.setLabelText(f"Importing {untracked_count} files...")
             QCoreApplication.processEvents()
 
+            def on_progress(done: int, total: int) -> None:
+                progress.setLabelText(f"Importing files ({done}/{total})...")
+                progress.setValue(50 + int(50 * done / max(total, 1)))
+
+            def should_stop() -> bool:
+                QCoreApplication.processEvents()
+                return progress.wasCanceled()
+
             # Import untracked files
-            imported_count, errors = scanner.import_untracked_files()
+            imported_count, errors = scanner.import_untracked_files(
+                scan_result=scan_result, progress_callback=on_progress, should_stop=should_stop
+            )
+            cancelled = progress.wasCanceled()
 
             # Update progress
             progress.setValue(100)
             progress.close()
 
             # Show results
-            if not errors:
+            if cancelled:
+                QMessageBox.information(
+                    self,
+                    "Import Cancelled",
+                    f"Import cancelled after importing {imported_count} of {untracked_count} files.",
+                )
+            elif not errors:
                 QMessageBox.information(
                     self,
                     "Import Complete",
@@ -518,6 +536,9 @@ class FolderSelectionWidget(QWidget):
                     f"First few errors:\n{error_details}",
                 )
 
+            # Hash the audio of the new files in the background, for duplicate and move detection
+            ThreadManager().run_task(update_content_hashes)
+
             # Update our file count in the display
             self._load_current_folder()
 
@@ -1,8 +1,7 @@
 # src/selecta/ui/widgets/search_bar.py
 from collections.abc import Callable
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtCore import QStringListModel, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QCompleter,
     QHBoxLayout,
@@ -11,6 +10,14 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from selecta.core.utils.search_index import PrefixIndex
+
+# Milliseconds the text must stay unchanged before search_changed is emitted
+SEARCH_DEBOUNCE_MS = 200
+
+# Maximum number of suggestions shown by the completer
+MAX_COMPLETIONS = 50
+
 
 class SearchBar(QWidget):
     """Search bar component with auto-completion support."""
@@ -24,6 +31,9 @@ class SearchBar(QWidget):
     # Signal emitted when a completer item is highlighted (arrow keys)
     completer_highlighted = pyqtSignal(str)
 
+    # Signal emitted when the text stopped changing for SEARCH_DEBOUNCE_MS, e.g. to filter as the user types
+    search_changed = pyqtSignal(str)
+
     def __init__(
         self,
         placeholder_text: str = "Search...",
@@ -98,7 +108,7 @@ class SearchBar(QWidget):
         # Initialize completer and model
         self.completer = None
         self.completer_model = None
-        self.completion_items = []
+        self.completion_index: PrefixIndex | None = None
         self.current_text = ""
 
         # Set initial completion items
@@ -107,22 +117,26 @@ class SearchBar(QWidget):
         # Setup completer key handling
         self.search_input.textChanged.connect(self._on_text_changed)
 
+        # Emit search_changed once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(lambda: self.search_changed.emit(self.get_search_text()))
+        self.search_input.textChanged.connect(self._search_timer.start)
+
     def set_completion_items(self, items: list[str] | None) -> None:
         """Set or update auto-completion items.
 
+        The items are indexed by the beginnings of their words, and the completer
+        shows the first MAX_COMPLETIONS items with a word beginning with the text.
+
         Args:
             items: List of strings for auto-completion, or None to disable
         """
         if items:
-            # Store the original items
-            self.completion_items = items.copy()
-
-            # Create a new model for the completer
-            self.completer_model = QStandardItemModel()
-
-            # Add items to the model
-            for item in items:
-                self.completer_model.appendRow(QStandardItem(item))
+            self.completion_index = PrefixIndex(items)
+            completions = self.completion_index.search(self.get_search_text(), MAX_COMPLETIONS)
+            self.completer_model = QStringListModel(completions)
 
             # Create completer with the model
             self.completer = QCompleter(self.completer_model, self)
@@ -136,7 +150,7 @@ class SearchBar(QWidget):
 
             self.search_input.setCompleter(self.completer)
         else:
-            self.completion_items = []
+            self.completion_index = None
             self.completer_model = None
             self.completer = None
             self.search_input.setCompleter(None)
@@ -177,6 +191,7 @@ class SearchBar(QWidget):
 
     def _on_search_confirmed(self) -> None:
         """Handle search confirmation (Enter key or button click)."""
+        self._search_timer.stop()
         search_text = self.get_search_text()
         self.search_confirmed.emit(search_text)
 
@@ -216,28 +231,14 @@ class SearchBar(QWidget):
         if self._suppress_text_changed:
             return
 
-        if not self.completer or not self.completer_model or not self.completion_items:
+        if not self.completer or not self.completer_model or self.completion_index is None:
             return
 
         # Save current text
         self.current_text = text
 
-        # Clear the current model
-        self.completer_model.clear()
-
-        # Filter items based on text
         if text:
-            text_lower = text.lower()
-            filtered_items = [item for item in self.completion_items if text_lower in item.lower()]
-
             # If no matches, show "No results"
-            if not filtered_items:
-                self.completer_model.appendRow(QStandardItem("No results"))
-            else:
-                # Add filtered items to model
-                for item in filtered_items:
-                    self.completer_model.appendRow(QStandardItem(item))
+            self.completer_model.setStringList(self.completion_index.search(text, MAX_COMPLETIONS) or ["No results"])
         else:
-            # If empty, show all items
-            for item in self.completion_items:
-                self.completer_model.appendRow(QStandardItem(item))
+            self.completer_model.setStringList([])
@@ -0,0 +1,96 @@
+"""Tests for paginated Discogs collection and wantlist downloads."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from selecta.core.platform.discogs.api_client import DiscogsApiClient
+from selecta.core.utils.cache_manager import CacheManager
+
+
+def _make_page(page: int, pages: int, per_page: int = 3) -> dict:
+    """Build a fake collection page with descending date_added values."""
+    start = (page - 1) * per_page
+    return {
+        "pagination": {"page": page, "pages": pages, "items": pages * per_page},
+        "releases": [
+            {
+                "id": start + i,
+                "date_added": datetime(2024, 1, 28 - (start + i), tzinfo=UTC).isoformat(),
+            }
+            for i in range(per_page)
+        ],
+    }
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """Discogs API client without request throttling."""
+    client = DiscogsApiClient(access_token="token")
+    monkeypatch.setattr(client, "MIN_REQUEST_INTERVAL", 0.0)
+    return client
+
+
+def test_iter_pages_yields_all_pages_in_order(api_client):
+    """All pages are fetched and their items yielded in page order."""
+    requested = []
+
+    def fetch_page(page: int) -> tuple[bool, dict]:
+        requested.append(page)
+        return True, _make_page(page, pages=5)
+
+    items = list(api_client._iter_pages(fetch_page, "releases"))
+
+    assert [item["id"] for item in items] == list(range(15))
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+
+
+def test_iter_pages_raises_on_failed_page(api_client):
+    """A failed page aborts the download instead of returning a partial list."""
+    def fetch_page(page: int) -> tuple[bool, dict]:
+        if page == 3:
+            return False, {"error": "boom"}
+        return True, _make_page(page, pages=4)
+
+    with pytest.raises(ValueError, match="page 3"):
+        list(api_client._iter_pages(fetch_page, "releases"))
+
+
+def test_iter_pages_since_stops_at_known_items(api_client):
+    """Only the pages up to the first known item are fetched."""
+    requested = []
+
+    def fetch_page(page: int) -> tuple[bool, dict]:
+        requested.append(page)
+        return True, _make_page(page, pages=5)
+
+    # Items 0-3 are newer than item 4's timestamp
+    since = datetime(2024, 1, 28 - 4, tzinfo=UTC)
+    items = list(api_client._iter_pages_since(fetch_page, "releases", since))
+
+    assert [item["id"] for item in items] == [0, 1, 2, 3]
+    assert requested == [1, 2]
+
+
+def test_expired_cache_entry_is_refreshed_instead_of_refetched():
+    """An expired list is passed to the incremental refresh, not downloaded again."""
+    cache = CacheManager(default_timeout=300.0)
+    cache.set("discogs_collection", ["old"])
+    cache._cache["discogs_collection"].timestamp -= 301.0
+    calls = []
+
+    def get_collection() -> list[str]:
+        calls.append("full")
+        return ["new", "old"]
+
+    def refresh_collection(known: list[str]) -> list[str]:
+        calls.append(("refresh", known))
+        return ["new", *known]
+
+    assert cache.get_or_refresh("discogs_collection", get_collection, refresh_collection) == ["new", "old"]
+    assert calls == [("refresh", ["old"])]
+
+    # The refreshed list is valid again, and nothing cached means a full download
+    assert cache.get_or_refresh("discogs_collection", get_collection, refresh_collection) == ["new", "old"]
+    assert cache.get_or_refresh("discogs_wantlist", get_collection, refresh_collection) == ["new", "old"]
+    assert calls == [("refresh", ["old"]), "full"]
@@ -0,0 +1,37 @@
+"""Fixtures for Rekordbox client tests backed by an in-memory master.db schema."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from selecta.core.platform.rekordbox.client import RekordboxClient
+from selecta.core.platform.rekordbox.queries import rb_tables
+from tests.platform.rekordbox.fake_masterdb import FakeRekordboxDatabase
+
+
+@pytest.fixture
+def rekordbox_session():
+    """Session on an empty in-memory master.db schema."""
+    engine = create_engine("sqlite://")
+
+    # Real master.db files leave most columns empty, so relax the NOT NULL constraints
+    with engine.begin() as connection:
+        for table in rb_tables.Base.metadata.sorted_tables:
+            ddl = str(CreateTable(table).compile(engine)).replace(" NOT NULL", "")
+            connection.exec_driver_sql(ddl)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def rekordbox_client(rekordbox_session, tmp_path):
+    """Rekordbox client reading the in-memory master.db."""
+    (tmp_path / "master.db").write_bytes(b"")
+    # Bypass the singleton so tests don't leak a client into each other
+    client = object.__new__(RekordboxClient)
+    client.db = FakeRekordboxDatabase(rekordbox_session, db_directory=tmp_path)
+    client._playlist_tracks_cache = {}
+    client._cache_signature = None
+    return client
+
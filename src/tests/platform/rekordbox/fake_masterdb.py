@@ -0,0 +1,99 @@
+"""In-memory stand-in for a Rekordbox master.db used by the Rekordbox client tests."""
+
+from contextlib import contextmanager
+
+from sqlalchemy.orm import Session
+
+from selecta.core.platform.rekordbox.queries import rb_tables
+
+
+class FakeRegistry:
+    """Records the change notifications pyrekordbox's agent registry would receive."""
+
+    def __init__(self):
+        self.moved = []
+
+    @contextmanager
+    def disabled(self):
+        """Suspend change tracking."""
+        yield
+
+    def on_move(self, instances):
+        """Record moved instances."""
+        self.moved.extend(instances)
+
+    def clear_buffer(self):
+        """Forget the recorded changes."""
+        self.moved.clear()
+
+
+class FakeRekordboxDatabase:
+    """Subset of the pyrekordbox database API used by RekordboxClient."""
+
+    def __init__(self, session: Session, db_directory=None):
+        self.session = session
+        self.db_directory = db_directory
+        self.registry = FakeRegistry()
+        self.commits = 0
+
+    def get_playlist(self, **kwargs):
+        """Get a playlist by ID, or a query of the matching playlists."""
+        query = self.session.query(rb_tables.DjmdPlaylist).filter_by(**kwargs)
+        return query.one_or_none() if "ID" in kwargs else query
+
+    def get_content(self, **kwargs):
+        """Get a content by ID, or a query of the matching contents."""
+        query = self.session.query(rb_tables.DjmdContent).filter_by(**kwargs)
+        return query.one_or_none() if "ID" in kwargs else query
+
+    def get_playlist_contents(self, playlist):
+        """Query the contents of a playlist in track order."""
+        playlist_id = getattr(playlist, "ID", playlist)
+        return (
+            self.session.query(rb_tables.DjmdContent)
+            .join(rb_tables.DjmdSongPlaylist, rb_tables.DjmdSongPlaylist.ContentID == rb_tables.DjmdContent.ID)
+            .filter(rb_tables.DjmdSongPlaylist.PlaylistID == str(playlist_id))
+            .order_by(rb_tables.DjmdSongPlaylist.TrackNo)
+        )
+
+    def add(self, instance):
+        """Add an instance to the session."""
+        self.session.add(instance)
+
+    def delete(self, instance):
+        """Delete an instance from the session."""
+        self.session.delete(instance)
+
+    def commit(self, autoinc=True):
+        """Commit the session, counting the commits."""
+        self.commits += 1
+        self.session.commit()
+
+    def close(self):
+        """Close the database."""
+        pass
+
+
+def add_content(session: Session, content_id: int, title: str, artist: str | None = None, **columns):
+    """Insert a DjmdContent row, creating its artist on demand."""
+    artist_id = None
+    if artist:
+        artist_id = str(content_id + 10_000)
+        session.add(rb_tables.DjmdArtist(ID=artist_id, Name=artist))
+    session.add(rb_tables.DjmdContent(ID=str(content_id), Title=title, ArtistID=artist_id, **columns))
+
+
+def add_playlist(session: Session, playlist_id: int, name: str, content_ids=(), parent_id="root", attribute=0):
+    """Insert a DjmdPlaylist row with its songs."""
+    session.add(
+        rb_tables.DjmdPlaylist(ID=str(playlist_id), Name=name, Attribute=attribute, ParentID=parent_id, Seq=playlist_id)
+    )
+    for track_no, content_id in enumerate(content_ids, start=1):
+        session.add(
+            rb_tables.DjmdSongPlaylist(
+                ID=f"{playlist_id}-{content_id}",
+                PlaylistID=str(playlist_id),
+                ContentID=str(content_id),
+                TrackNo=track_no,
+            )
+        )
@@ -0,0 +1,59 @@
+"""Tests for the bulk Rekordbox content reader."""
+
+from selecta.core.platform.rekordbox.queries import rb_tables
+from tests.platform.rekordbox.fake_masterdb import add_content
+
+
+def _populate(session, count=25):
+    """Insert tracks with artists, a genre and a key."""
+    session.add(rb_tables.DjmdGenre(ID="1", Name="Techno"))
+    session.add(rb_tables.DjmdKey(ID="1", ScaleName="8A"))
+    for content_id in range(1, count + 1):
+        add_content(
+            session,
+            content_id,
+            f"Track {content_id:02d}",
+            artist="Surgeon" if content_id % 5 == 0 else f"Artist {content_id}",
+            GenreID="1",
+            KeyID="1",
+            BPM=13200,
+            Length=360,
+        )
+    session.commit()
+
+
+def test_iter_tracks_streams_chunks_with_lookup_names(rekordbox_client, rekordbox_session):
+    """All tracks are read in chunks with their artist, genre and key names."""
+    _populate(rekordbox_session)
+
+    chunks = list(rekordbox_client.iter_tracks(chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    track = chunks[0][0]
+    assert (track.title, track.artist_name, track.genre, track.key) == ("Track 01", "Artist 1", "Techno", "8A")
+    assert track.bpm == 132.0
+    assert track.duration_ms == 360_000
+    assert rekordbox_client.count_tracks() == 25
+
+
+def test_search_tracks_matches_lookup_names_and_applies_limit(rekordbox_client, rekordbox_session):
+    """Searching matches the looked up names and returns at most the limit."""
+    _populate(rekordbox_session)
+
+    results = rekordbox_client.search_tracks("surgeon", limit=3)
+
+    assert len(results) == 3
+    assert {track.artist_name for track in results} == {"Surgeon"}
+
+
+def test_tracks_marked_deleted_are_left_out(rekordbox_client, rekordbox_session):
+    """Full reads, counts and searches skip tracks Rekordbox marked as locally deleted."""
+    _populate(rekordbox_session, count=3)
+    rekordbox_session.get(rb_tables.DjmdContent, "2").rb_local_deleted = 1
+    rekordbox_session.commit()
+
+    titles = [track.title for chunk in rekordbox_client.iter_tracks() for track in chunk]
+
+    assert titles == ["Track 01", "Track 03"]
+    assert rekordbox_client.count_tracks() == 2
+    assert [track.title for track in rekordbox_client.search_tracks("Track 02", limit=10)] == []
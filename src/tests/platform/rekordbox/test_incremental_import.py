@@ -0,0 +1,114 @@
+"""Tests for incremental Rekordbox imports."""
+
+from datetime import datetime
+
+from selecta.core.platform.rekordbox.incremental import RekordboxImportState, RekordboxWatermark
+from selecta.core.platform.rekordbox.queries import rb_tables
+from tests.platform.rekordbox.fake_masterdb import add_content
+
+
+class FakeSettingsRepo:
+    """In-memory stand-in for SettingsRepository."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get_setting_value(self, key, default=None):
+        """Get a stored value."""
+        return self.values.get(key, default)
+
+    def set_setting(self, key, value, data_type=None, description=None):
+        """Store a value."""
+        self.values[key] = value
+
+
+def test_content_changes_since_watermark(rekordbox_client, rekordbox_session):
+    """Tracks edited or added after the watermark are read, and deleted ones reported."""
+    for content_id in range(1, 6):
+        add_content(rekordbox_session, content_id, f"Track {content_id}", rb_local_usn=content_id)
+    rekordbox_session.commit()
+
+    since = rekordbox_client.get_content_watermark()
+    assert since.usn == 5
+
+    # Rekordbox edits track 2, adds track 6 and deletes track 4
+    rekordbox_session.get(rb_tables.DjmdContent, "2").rb_local_usn = 6
+    add_content(rekordbox_session, 6, "Track 6", rb_local_usn=7)
+    rekordbox_session.delete(rekordbox_session.get(rb_tables.DjmdContent, "4"))
+    rekordbox_session.commit()
+
+    changes = rekordbox_client.get_content_changes(since, known_ids=["1", "2", "3", "4", "5"])
+
+    assert sorted(track.id for track in changes.changed) == ["2", "6"]
+    assert changes.deleted_ids == ["4"]
+    assert changes.watermark.usn == 7
+
+
+def test_import_state_is_kept_per_database():
+    """Each Rekordbox database keeps its own watermark and collection playlist."""
+    repo = FakeSettingsRepo()
+    first = RekordboxImportState(repo, "/library/a")
+    second = RekordboxImportState(repo, "/library/b")
+
+    first.save(RekordboxWatermark(usn=42, updated_at=datetime(2024, 5, 1, 12, 0)), collection_playlist_id=7)
+
+    assert first.load() == RekordboxWatermark(usn=42, updated_at=datetime(2024, 5, 1, 12, 0))
+    assert first.collection_playlist_id == 7
+    assert second.load() is None
+
+    first.reset()
+    assert first.load() is None
+
+
+def test_cancelled_import_keeps_the_previous_watermark():
+    """Saving without a watermark records the collection playlist but keeps the stored watermark."""
+    repo = FakeSettingsRepo()
+    state = RekordboxImportState(repo, "/library/a")
+    state.save(RekordboxWatermark(usn=42))
+
+    state.save(None, collection_playlist_id=7)
+
+    assert state.load() == RekordboxWatermark(usn=42)
+    assert state.collection_playlist_id == 7
+
+
+def _import(client, state, linked, failing):
+    """Run an import the way the import dialog does, failing the given Rekordbox IDs."""
+    since = state.load()
+    if since is None:
+        watermark = client.get_content_watermark()
+        tracks = [track for chunk in client.iter_tracks() for track in chunk]
+    else:
+        changes = client.get_content_changes(since, linked, state.failed_ids)
+        watermark, tracks = changes.watermark, changes.changed
+
+    failed = [track.id for track in tracks if track.id in failing]
+    linked.update(track.id for track in tracks if track.id not in failing)
+    state.save(watermark, failed_ids=failed)
+    return sorted(track.id for track in tracks)
+
+
+def test_failing_track_is_retried_without_holding_back_the_watermark(rekordbox_client, rekordbox_session):
+    """A track failing on every run is read again each time while the watermark keeps advancing."""
+    for content_id in range(1, 4):
+        add_content(rekordbox_session, content_id, f"Track {content_id}", rb_local_usn=content_id)
+    rekordbox_session.commit()
+    state = RekordboxImportState(FakeSettingsRepo(), "/library/a")
+    linked: set[str] = set()
+
+    assert _import(rekordbox_client, state, linked, failing={"2"}) == ["1", "2", "3"]
+    assert state.load().usn == 3
+    assert state.failed_ids == ["2"]
+
+    rekordbox_session.get(rb_tables.DjmdContent, "3").rb_local_usn = 4
+    rekordbox_session.commit()
+    assert _import(rekordbox_client, state, linked, failing={"2"}) == ["2", "3"]
+    assert state.load().usn == 4
+    assert state.failed_ids == ["2"]
+
+    assert _import(rekordbox_client, state, linked, failing={"2"}) == ["2"]
+
+    # Once the track imports it is no longer retried
+    assert _import(rekordbox_client, state, linked, failing=set()) == ["2"]
+    assert state.failed_ids == []
+    assert _import(rekordbox_client, state, linked, failing=set()) == []
@@ -0,0 +1,52 @@
+"""Tests for lazy Rekordbox playlist loading."""
+
+import os
+
+from sqlalchemy import text
+
+from tests.platform.rekordbox.fake_masterdb import add_content, add_playlist
+
+
+def _populate(session):
+    """Insert a folder with playlists, a smart playlist and their tracks."""
+    for content_id in range(1, 6):
+        add_content(session, content_id, f"Track {content_id}", artist=f"Artist {content_id}")
+    add_playlist(session, 1, "Folder", attribute=1)
+    add_playlist(session, 2, "Warmup", content_ids=[1, 2, 3], parent_id="1")
+    add_playlist(session, 3, "Peak", content_ids=[4, 5])
+    add_playlist(session, 4, "Empty")
+    add_playlist(session, 5, "Smart", attribute=4)
+    session.commit()
+
+
+def test_get_all_playlists_returns_tree_with_counts(rekordbox_client, rekordbox_session):
+    """Playlists are loaded as a tree with track counts but without their tracks."""
+    _populate(rekordbox_session)
+
+    playlists = {playlist.name: playlist for playlist in rekordbox_client.get_all_playlists()}
+
+    assert set(playlists) == {"Folder", "Warmup", "Peak", "Empty"}
+    assert playlists["Folder"].is_folder
+    assert playlists["Warmup"].parent_id == "1"
+    assert [playlists[name].track_count for name in ("Warmup", "Peak", "Empty")] == [3, 2, 0]
+    assert all(not playlist.tracks for playlist in playlists.values())
+
+
+def test_playlist_tracks_are_cached_until_database_changes(rekordbox_client, rekordbox_session, tmp_path):
+    """Playlist tracks are served from the cache until master.db changes."""
+    _populate(rekordbox_session)
+
+    tracks = rekordbox_client.get_playlist_tracks("2")
+    assert [track.title for track in tracks] == ["Track 1", "Track 2", "Track 3"]
+    assert tracks[0].artist_name == "Artist 1"
+
+    # Changes behind the client's back are not visible while the files are unchanged
+    rekordbox_session.execute(text("DELETE FROM djmdSongPlaylist WHERE ContentID = '3'"))
+    assert len(rekordbox_client.get_playlist_tracks("2")) == 3
+
+    # Rekordbox writing to master.db invalidates the cache
+    master_db = tmp_path / "master.db"
+    master_db.write_bytes(b"changed")
+    stat = master_db.stat()
+    os.utime(master_db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(rekordbox_client.get_playlist_tracks("2")) == 2
@@ -0,0 +1,54 @@
+"""Tests for batched Rekordbox playlist writes."""
+
+from selecta.core.platform.rekordbox.queries import rb_tables
+from tests.platform.rekordbox.fake_masterdb import add_content, add_playlist
+
+
+def _playlist_songs(session, playlist_id):
+    """Get the content IDs of a playlist in track order."""
+    songs = (
+        session.query(rb_tables.DjmdSongPlaylist)
+        .filter_by(PlaylistID=playlist_id)
+        .order_by(rb_tables.DjmdSongPlaylist.TrackNo)
+    )
+    return [(song.TrackNo, song.ContentID) for song in songs]
+
+
+def _populate(session):
+    """Insert tracks and a playlist holding some of them."""
+    for content_id in range(1, 11):
+        add_content(session, content_id, f"Track {content_id}")
+    add_playlist(session, 1, "Set", content_ids=[1, 2, 3, 4, 5])
+    session.commit()
+
+
+def test_add_tracks_commits_once(rekordbox_client, rekordbox_session):
+    """Adding tracks to a playlist commits the database once."""
+    _populate(rekordbox_session)
+
+    assert rekordbox_client.add_tracks_to_playlist("1", ["6", "7", "8"])
+
+    assert rekordbox_client.db.commits == 1
+    assert _playlist_songs(rekordbox_session, "1")[-3:] == [(6, "6"), (7, "7"), (8, "8")]
+
+
+def test_remove_tracks_renumbers_remaining_songs(rekordbox_client, rekordbox_session):
+    """Removing tracks renumbers the remaining songs without gaps."""
+    _populate(rekordbox_session)
+
+    assert rekordbox_client.remove_tracks_from_playlist("1", ["2", "4"])
+
+    assert rekordbox_client.db.commits == 1
+    assert _playlist_songs(rekordbox_session, "1") == [(1, "1"), (2, "3"), (3, "5")]
+
+
+def test_write_playlist_changes_reports_unknown_ids(rekordbox_client, rekordbox_session):
+    """IDs not found in the database or playlist are reported, and the other changes are still written."""
+    _populate(rekordbox_session)
+
+    result = rekordbox_client.write_playlist_changes("1", add_track_ids=["9", "999"], remove_track_ids=["1", "10"])
+
+    assert (result.added, result.removed, result.renumbered) == (1, 1, 4)
+    assert sorted(result.missing_ids) == ["10", "999"]
+    assert _playlist_songs(rekordbox_session, "1") == [(1, "2"), (2, "3"), (3, "4"), (4, "5"), (5, "9")]
+    assert not rekordbox_client.add_tracks_to_playlist("1", ["999"])
@@ -0,0 +1,103 @@
+"""Tests for batch auto-linking of library tracks."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Track, TrackPlatformInfo
+from selecta.core.platform.auto_linker import PlatformAutoLinker, SearchResponseStore
+
+
+class SpotifyClient:
+    """Stand-in Spotify client serving canned search results."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.queries = []
+
+    def search_tracks(self, query, limit=10):
+        """Return the catalog items whose name appears in the query."""
+        self.queries.append(query)
+        return [item for item in self.catalog if item["name"].lower() in query][:limit]
+
+
+def _spotify_item(track_id, name, artist, duration_ms=300_000):
+    return {
+        "id": track_id,
+        "uri": f"spotify:track:{track_id}",
+        "name": name,
+        "artists": [{"name": artist}],
+        "duration_ms": duration_ms,
+    }
+
+
+@pytest.fixture
+def session():
+    """Session with three library tracks."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            Track(title="Strobe (Original Mix)", artist="deadmau5", duration_ms=301_000),
+            Track(title="Windowlicker", artist="Aphex Twin", duration_ms=370_000),
+            Track(title="Unknown Song", artist="Nobody"),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client():
+    """Spotify client with two catalog tracks."""
+    return SpotifyClient(
+        [
+            _spotify_item("sp1", "Strobe", "deadmau5"),
+            _spotify_item("sp2", "Windowlicker", "Aphex Twins", duration_ms=250_000),
+        ]
+    )
+
+
+def test_run_links_confident_matches_and_queues_the_rest(session, client, tmp_path):
+    """Confident matches are linked, weaker ones queued and the run resumes."""
+    linker = PlatformAutoLinker(client, session=session, store=SearchResponseStore(tmp_path / "searches.json"))
+
+    result = linker.run()
+
+    assert result.complete and result.processed == 3
+    assert [(track_id, candidate.platform_id) for track_id, candidate in result.linked] == [(1, "sp1")]
+    assert [item.track_id for item in result.review] == [2]
+    assert result.unmatched == [3]
+    info = session.query(TrackPlatformInfo).one()
+    assert (info.track_id, info.platform, info.platform_id) == (1, "spotify", "sp1")
+    assert [item.track_id for item in linker.state.review_items()] == [2]
+
+    # A second run resumes after the checkpoint and doesn't search again
+    client.queries.clear()
+    assert linker.run().processed == 0
+    assert client.queries == []
+
+    linker.accept_review(2, "sp2")
+    assert session.query(TrackPlatformInfo).count() == 2
+    assert linker.state.review_items() == []
+
+
+def test_dry_run_replays_recorded_searches_without_writing(session, client, tmp_path):
+    """A dry run only replays stored searches and writes nothing."""
+    store = SearchResponseStore(tmp_path / "searches.json")
+    PlatformAutoLinker(client, session=session, store=store).search("deadmau5 strobe")
+    store.save()
+    client.queries.clear()
+
+    linker = PlatformAutoLinker(
+        client, session=session, store=SearchResponseStore(tmp_path / "searches.json"), dry_run=True
+    )
+    result = linker.run()
+
+    assert client.queries == []
+    assert [candidate.platform_id for _, candidate in result.linked] == ["sp1"]
+    assert session.query(TrackPlatformInfo).count() == 0
+    assert linker.state.last_track_id == 0
@@ -0,0 +1,88 @@
+"""Tests for bulk track imports through PlatformLinkManager."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.change_events import PlatformLinkAdded, change_bus
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Album, Track, TrackPlatformInfo
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.platform.link_manager import PlatformLinkManager
+from selecta.core.platform.rekordbox.models import RekordboxTrack
+
+
+class RekordboxClient:
+    """Stand-in client; the link manager derives the platform name from the class name."""
+
+
+@pytest.fixture
+def session():
+    """Session on an empty in-memory library database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def link_manager(session):
+    """Rekordbox link manager on the test session."""
+    return PlatformLinkManager(RekordboxClient(), track_repo=TrackRepository(session), session=session)
+
+
+def _track(track_id: str, title: str, artist: str, album: str | None = None) -> RekordboxTrack:
+    """Create a Rekordbox track."""
+    return RekordboxTrack(id=track_id, title=title, artist_name=artist, album_name=album, bpm=124.0)
+
+
+def test_import_tracks_creates_tracks_links_and_shared_albums(link_manager, session):
+    """New tracks are created with their links, sharing albums, and invalid tracks are skipped."""
+    tracks = [_track("1", "One", "Artist", "Record"), _track("2", "Two", "Artist", "Record"), _track("3", "", "X")]
+
+    mapping = link_manager.import_tracks(tracks)
+
+    assert set(mapping) == {"1", "2"}
+    assert session.query(Track).count() == 2
+    assert session.query(Album).count() == 1
+    infos = session.query(TrackPlatformInfo).order_by(TrackPlatformInfo.platform_id).all()
+    assert [(info.platform, info.platform_id, info.track_id) for info in infos] == [
+        ("rekordbox", "1", mapping["1"]),
+        ("rekordbox", "2", mapping["2"]),
+    ]
+
+
+def test_import_tracks_reuses_linked_and_matching_tracks(link_manager, session):
+    """Tracks already linked or matching by title and artist are reused."""
+    existing = Track(title="Existing", artist="Someone")
+    session.add(existing)
+    session.commit()
+    first = link_manager.import_tracks([_track("1", "One", "Artist")])
+
+    published = []
+    change_bus.subscribe(published.extend)
+    try:
+        mapping = link_manager.import_tracks([_track("1", "One", "Artist"), _track("9", "EXISTING", "someone")])
+    finally:
+        change_bus.unsubscribe(published.extend)
+
+    assert mapping == {"1": first["1"], "9": existing.id}
+    links = [change for change in published if isinstance(change, PlatformLinkAdded)]
+    assert links == [PlatformLinkAdded(first["1"], "rekordbox"), PlatformLinkAdded(existing.id, "rekordbox")]
+    assert session.query(Track).count() == 2
+    assert session.query(TrackPlatformInfo).count() == 2
+
+
+def test_import_tracks_links_a_track_matched_twice_once(link_manager, session):
+    """Two incoming tracks matching the same library track share one link record."""
+    existing = Track(title="Existing", artist="Someone")
+    session.add(existing)
+    session.commit()
+
+    mapping = link_manager.import_tracks([_track("1", "Existing", "Someone"), _track("2", "EXISTING", "someone")])
+
+    assert mapping == {"1": existing.id, "2": existing.id}
+    assert session.query(Track).count() == 1
+    infos = session.query(TrackPlatformInfo).all()
+    assert [(info.track_id, info.platform_id) for info in infos] == [(existing.id, "2")]
@@ -0,0 +1,116 @@
+"""Tests for batched YouTube write operations and video detail lookups."""
+
+from unittest.mock import MagicMock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from selecta.core.platform.youtube.client import YouTubeClient
+from selecta.core.platform.youtube.quota import YouTubeQuotaTracker
+
+
+class FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, failures):
+        self._callback = callback
+        self._failures = failures
+        self._requests = []
+
+    def add(self, request, request_id):
+        """Queue a request."""
+        self._requests.append((request, request_id))
+
+    def execute(self):
+        """Call the callback for each request, failing the configured videos."""
+        for request, request_id in self._requests:
+            status = self._failures.pop(request["videoId"], None)
+            if status:
+                self._callback(request_id, None, HttpError(httplib2.Response({"status": status}), b""))
+            else:
+                self._callback(request_id, {"id": f"item_{request['videoId']}"}, None)
+
+
+@pytest.fixture
+def youtube_client(monkeypatch):
+    """YouTube client with a mocked API, no rate limiting and no sleeping."""
+    client = YouTubeClient.__new__(YouTubeClient)
+    client.client = MagicMock()
+    client._had_ssl_error = False
+    client._error_count = 0
+    client._max_retries = 3
+    client._last_request_time = 0
+    client._min_request_interval = 0
+    client._request_count = 0
+    client._max_requests_per_minute = 10_000
+    client.quota = YouTubeQuotaTracker(MagicMock(**{"get_setting_value.return_value": None}), daily_limit=100_000)
+    monkeypatch.setattr("selecta.core.platform.youtube.client.time.sleep", lambda _: None)
+    return client
+
+
+def _install_batches(youtube_client, failures):
+    batches = []
+
+    def new_batch_http_request(callback):
+        batch = FakeBatch(callback, failures)
+        batches.append(batch)
+        return batch
+
+    youtube_client.client.new_batch_http_request.side_effect = new_batch_http_request
+    youtube_client.client.playlistItems.return_value.insert.side_effect = lambda part, body: body["snippet"][
+        "resourceId"
+    ]
+    return batches
+
+
+def test_add_tracks_uses_batches_of_fifty(youtube_client):
+    """Playlist inserts are sent in batches of at most fifty requests."""
+    batches = _install_batches(youtube_client, failures={})
+    video_ids = [f"v{i}" for i in range(120)]
+
+    assert youtube_client.add_tracks_to_playlist("PL1", video_ids)
+    assert [len(batch._requests) for batch in batches] == [50, 50, 20]
+
+
+def test_batch_retries_only_transient_failures(youtube_client):
+    """Only requests that failed with a retryable status are sent again."""
+    batches = _install_batches(youtube_client, failures={"v3": 503, "v7": 409})
+    video_ids = [f"v{i}" for i in range(10)]
+
+    insert = youtube_client.client.playlistItems().insert
+    request_funcs = [
+        lambda vid=vid: insert(part="snippet", body={"snippet": {"resourceId": {"videoId": vid}}}) for vid in video_ids
+    ]
+
+    responses = youtube_client._execute_batch(request_funcs)
+
+    assert [response["id"] for response in responses] == [f"item_v{i}" for i in range(10)]
+    assert [len(batch._requests) for batch in batches] == [10, 2]
+
+
+def test_batch_raises_on_client_error(youtube_client):
+    """A non-retryable error in a batch fails the whole write."""
+    _install_batches(youtube_client, failures={"v1": 404})
+
+    with pytest.raises(ValueError):
+        youtube_client.add_tracks_to_playlist("PL1", ["v0", "v1"])
+
+
+def test_video_details_use_full_chunks(youtube_client):
+    """Video details are requested for fifty IDs per call."""
+    calls = []
+
+    def videos_list(part, id):
+        ids = id.split(",")
+        calls.append(len(ids))
+        request = MagicMock()
+        request.execute.return_value = {"items": [{"id": video_id} for video_id in ids]}
+        return request
+
+    youtube_client.client.videos.return_value.list.side_effect = videos_list
+
+    details = youtube_client._get_video_details([f"v{i}" for i in range(130)], part="snippet")
+
+    assert len(details) == 130
+    assert calls == [50, 50, 30]
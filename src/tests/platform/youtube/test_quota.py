@@ -0,0 +1,153 @@
+"""Tests for YouTube quota accounting and cost estimation."""
+
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.repositories.settings_repository import SettingsRepository
+from selecta.core.data.types import ChangeType, SyncChanges, TrackChange
+from selecta.core.platform.youtube import quota as quota_module
+from selecta.core.platform.youtube.quota import YouTubeQuotaTracker, estimate_export_cost, estimate_sync_cost
+
+
+class FakeSettingsRepo:
+    """In-memory stand-in for SettingsRepository."""
+
+    def __init__(self):
+        self.values = {}
+        self.saves = 0
+
+    def get_setting_value(self, key, default=None):
+        """Get a stored value."""
+        return self.values.get(key, default)
+
+    def get_current_setting_value(self, key, default=None):
+        """Get a stored value."""
+        return self.values.get(key, default)
+
+    def set_setting(self, key, value, data_type=None, description=None):
+        """Store a value."""
+        self.saves += 1
+        self.values[key] = value
+
+
+def _change(change_type: ChangeType, index: int) -> TrackChange:
+    """Create a track change of a type."""
+    return TrackChange(change_id=f"c{change_type.name}{index}", change_type=change_type, library_track_id=index)
+
+
+def test_tracker_records_units_per_method_and_persists():
+    """Recorded units are tallied per method and stored for later trackers."""
+    repo = FakeSettingsRepo()
+    tracker = YouTubeQuotaTracker(repo, daily_limit=1000)
+
+    tracker.record("youtube.search.list")
+    tracker.record("youtube.playlistItems.insert", calls=3)
+
+    assert tracker.used == 250
+    assert tracker.remaining == 750
+    assert tracker.usage_by_method() == {"search.list": 100, "playlistItems.insert": 150}
+    assert YouTubeQuotaTracker(repo, daily_limit=1000).used == 250
+
+
+def test_trackers_add_to_the_stored_usage_in_batches():
+    """Trackers sharing the stored usage add their units to it, saving once per batch of units."""
+    repo = FakeSettingsRepo()
+    first = YouTubeQuotaTracker(repo, daily_limit=10_000)
+    second = YouTubeQuotaTracker(repo, daily_limit=10_000)
+
+    for _ in range(99):
+        first.record("youtube.videos.list")
+    assert repo.saves == 0
+    first.record("youtube.videos.list")
+    assert repo.saves == 1
+
+    second.record("youtube.playlistItems.insert", calls=2)
+    second.record("youtube.search.list")
+    first.record("youtube.search.list")
+    second.flush()
+
+    stored = YouTubeQuotaTracker(repo, daily_limit=10_000)
+    assert stored.used == 400
+    assert stored.usage_by_method() == {"videos.list": 100, "playlistItems.insert": 100, "search.list": 200}
+    assert repo.saves == 4
+
+
+def test_pending_units_are_flushed_at_exit():
+    """Units below the save threshold are written when the process exits."""
+    repo = FakeSettingsRepo()
+    tracker = YouTubeQuotaTracker(repo, daily_limit=10_000)
+    tracker.record("youtube.playlistItems.insert")
+    assert repo.saves == 0
+
+    quota_module._flush_trackers()
+
+    assert YouTubeQuotaTracker(repo, daily_limit=10_000).used == 50
+
+
+def test_tracker_reads_usage_written_through_another_session(tmp_path):
+    """Each flush adds to the usage currently stored, not to a copy cached by the session."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'settings.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    first_repo = SettingsRepository(session_factory())
+    first = YouTubeQuotaTracker(first_repo, daily_limit=10_000)
+    second = YouTubeQuotaTracker(SettingsRepository(session_factory()), daily_limit=10_000)
+
+    first.record("youtube.search.list")
+    # Keep the setting loaded in the first session, as other users of the repository may
+    cached = first_repo.get_setting(YouTubeQuotaTracker.SETTINGS_KEY)
+    second.record("youtube.search.list")
+    first.record("youtube.search.list")
+
+    assert cached is not None
+    assert YouTubeQuotaTracker(SettingsRepository(session_factory()), daily_limit=10_000).used == 300
+
+
+def test_tracker_resets_on_new_quota_day(monkeypatch):
+    """The tally starts over on a new quota day."""
+    repo = FakeSettingsRepo()
+    tracker = YouTubeQuotaTracker(repo, daily_limit=1000)
+    tracker.mark_exhausted()
+    assert not tracker.can_afford(1)
+
+    monkeypatch.setattr(quota_module, "quota_day", lambda now=None: "2999-01-01")
+
+    assert tracker.remaining == 1000
+
+
+def test_estimate_sync_cost_counts_selected_writes_only():
+    """Only the selected library changes are counted as playlist writes."""
+    changes = SyncChanges(library_playlist_id=1, platform="youtube", platform_playlist_id="PL1")
+    changes.library_additions = [_change(ChangeType.LIBRARY_ADDITION, i) for i in range(4)]
+    changes.library_removals = [_change(ChangeType.LIBRARY_REMOVAL, i) for i in range(2)]
+    selected = {change.change_id: True for change in changes.library_additions[:3] + changes.library_removals}
+
+    estimate = estimate_sync_cost(quota_module.QuotaEstimate(remaining=250), changes, selected, playlist_size=120)
+
+    assert estimate.cost_by_method["playlistItems.insert"] == 150
+    assert estimate.cost_by_method["playlistItems.delete"] == 100
+    assert estimate.cost_by_method["playlistItems.list"] == 3
+    assert not estimate.fits
+
+
+def test_estimate_export_cost_for_new_playlist():
+    """Exporting to a new playlist costs the insert of the playlist and of every video."""
+    estimate = estimate_export_cost(quota_module.QuotaEstimate(remaining=10_000), track_count=200)
+
+    assert estimate.total == 50 + 200 * 50
+    assert not estimate.fits
+
+
+def test_tracker_falls_back_to_default_limit_without_database():
+    """Without a settings table the default quota and no usage are assumed."""
+    repo = MagicMock()
+    repo.get_setting_value.side_effect = RuntimeError("no such table")
+    repo.get_current_setting_value.side_effect = RuntimeError("no such table")
+
+    tracker = YouTubeQuotaTracker(repo)
+
+    assert tracker.daily_limit == quota_module.DEFAULT_DAILY_QUOTA
+    assert tracker.used == 0
@@ -0,0 +1,105 @@
+"""Tests for tag-independent audio content hashes."""
+
+import wave
+from types import SimpleNamespace
+
+from mutagen.id3 import ID3, TIT2
+from mutagen.ogg import OggPage
+
+from selecta.core.utils.audio_hash import audio_content_hash, hash_files
+from selecta.core.utils.duplicate_detector import exact_duplicate_pairs
+
+# Bytes standing in for MPEG audio frames
+FRAMES = bytes(range(256)) * 64
+
+
+def _tag(path, title):
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=title))
+    tags.save(path)
+
+
+def test_mp3_hash_ignores_tags(tmp_path):
+    """ID3 tags don't change the hash of an MP3 file."""
+    plain = tmp_path / "plain.mp3"
+    plain.write_bytes(FRAMES)
+    tagged = tmp_path / "tagged.mp3"
+    tagged.write_bytes(FRAMES + b"TAG" + bytes(125))
+    _tag(tagged, "Strobe")
+    other = tmp_path / "other.mp3"
+    other.write_bytes(FRAMES[::-1])
+
+    assert audio_content_hash(plain) == audio_content_hash(tagged)
+    assert audio_content_hash(plain) != audio_content_hash(other)
+
+
+def test_flac_hash_skips_metadata_blocks(tmp_path):
+    """FLAC metadata blocks are left out of the hash."""
+
+    def flac(path, comment):
+        streaminfo = b"\x00" + (34).to_bytes(3, "big") + bytes(34)
+        vorbis_comment = b"\x84" + len(comment).to_bytes(3, "big") + comment
+        path.write_bytes(b"fLaC" + streaminfo + vorbis_comment + FRAMES)
+
+    flac(tmp_path / "a.flac", b"title=Strobe")
+    flac(tmp_path / "b.flac", b"title=Strobe (Original Mix), artist=deadmau5")
+
+    assert audio_content_hash(tmp_path / "a.flac") == audio_content_hash(tmp_path / "b.flac")
+
+
+def test_wave_hash_covers_only_the_samples(tmp_path):
+    """Info chunks appended to a WAVE file don't change its hash."""
+    path = tmp_path / "a.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(FRAMES)
+    hash_before = audio_content_hash(path)
+
+    # Append an info chunk, as tag editors do
+    with open(path, "ab") as file:
+        file.write(b"LIST" + (12).to_bytes(4, "little") + b"INFOINAM" + (4).to_bytes(4, "little"))
+
+    assert audio_content_hash(path) == hash_before
+
+
+def test_ogg_hash_skips_header_packets_spanning_pages(tmp_path):
+    """A comment header spanning several pages is left out of the Ogg hash."""
+
+    def ogg(path, comment, audio):
+        headers = [b"\x01vorbis" + bytes(23), b"\x03vorbis" + comment, b"\x05vorbis" + bytes(64)]
+        header_pages = OggPage.from_packets(headers, default_size=1024)
+        # Pages on which no packet ends carry granule position -1
+        for page in header_pages:
+            page.position = 0 if page.complete or len(page.packets) > 1 else -1
+        audio_pages = OggPage.from_packets(
+            [audio[i : i + 1000] for i in range(0, len(audio), 1000)], sequence=len(header_pages)
+        )
+        for number, page in enumerate(audio_pages, 1):
+            page.position = number * 1000
+        path.write_bytes(b"".join(page.write() for page in header_pages + audio_pages))
+
+    ogg(tmp_path / "a.ogg", b"title=Strobe", FRAMES)
+    ogg(tmp_path / "b.ogg", b"title=" + b"x" * 5000, FRAMES)
+    ogg(tmp_path / "c.ogg", b"title=Strobe", FRAMES[::-1])
+
+    assert audio_content_hash(tmp_path / "a.ogg") == audio_content_hash(tmp_path / "b.ogg")
+    assert audio_content_hash(tmp_path / "a.ogg") != audio_content_hash(tmp_path / "c.ogg")
+
+
+def test_hash_files_reports_unreadable_files(tmp_path):
+    """Unreadable files get no hash."""
+    path = tmp_path / "a.mp3"
+    path.write_bytes(FRAMES)
+
+    hashes = hash_files([str(path), str(tmp_path / "missing.mp3")])
+
+    assert hashes == {str(path): audio_content_hash(path), str(tmp_path / "missing.mp3"): None}
+
+
+def test_exact_duplicate_pairs_group_by_content_hash():
+    """Tracks with the same content hash are paired."""
+    tracks = [SimpleNamespace(content_hash=content_hash) for content_hash in ["a", None, "b", "a", None, "a"]]
+
+    assert exact_duplicate_pairs(tracks) == [(0, 3), (0, 5), (3, 5)]
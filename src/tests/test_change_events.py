@@ -0,0 +1,156 @@
+"""Tests for the change events published by the repositories."""
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.change_events import (
+    PlatformLinkAdded,
+    PlaylistTracksChanged,
+    TrackUpdated,
+    change_bus,
+    coalesce_changes,
+    queue_change,
+)
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Album, Image, ImageSize, Playlist, Track
+from selecta.core.data.repositories.playlist_repository import PlaylistRepository
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.folder_scanner import LocalFolderScanner
+
+
+def _session():
+    """Create a session on an in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_events_are_published_after_commit_only():
+    """Events are published once committed and dropped on rollback."""
+    session = _session()
+    track = Track(title="Night Bus", artist="Burial")
+    playlist = Playlist(name="Late")
+    session.add_all([track, playlist])
+    session.commit()
+
+    published = []
+    change_bus.subscribe(published.extend)
+    try:
+        TrackRepository(session).set_track_quality(track.id, 4)
+        assert published == [TrackUpdated(track.id, {"quality": 4})]
+
+        playlists = PlaylistRepository(session)
+        playlists.add_track(playlist.id, track.id)
+        playlists.remove_track(playlist.id, track.id)
+        assert published[1:] == [
+            PlaylistTracksChanged(playlist.id, added=(track.id,)),
+            PlaylistTracksChanged(playlist.id, removed=(track.id,)),
+        ]
+
+        # Events of a rolled back transaction are dropped
+        queue_change(session, PlatformLinkAdded(track.id, "spotify"))
+        session.rollback()
+        session.commit()
+        assert len(published) == 3
+    finally:
+        change_bus.unsubscribe(published.extend)
+
+
+def test_append_tracks_adds_them_after_the_last_position_at_once():
+    """Appended tracks follow the existing entries and are announced in one event."""
+    session = _session()
+    tracks = [Track(title=f"Track {index}", artist="Artist") for index in range(3)]
+    playlist = Playlist(name="Collection")
+    session.add_all([*tracks, playlist])
+    session.commit()
+    playlists = PlaylistRepository(session)
+    playlists.add_track(playlist.id, tracks[0].id)
+
+    published = []
+    change_bus.subscribe(published.extend)
+    try:
+        assert playlists.append_tracks(playlist.id, [tracks[2].id, tracks[1].id]) == 2
+    finally:
+        change_bus.unsubscribe(published.extend)
+
+    assert [entry.track_id for entry in sorted(playlist.tracks, key=lambda entry: entry.position)] == [
+        tracks[0].id,
+        tracks[2].id,
+        tracks[1].id,
+    ]
+    assert sorted(entry.position for entry in playlist.tracks) == [0, 1, 2]
+    assert published == [PlaylistTracksChanged(playlist.id, added=(tracks[2].id, tracks[1].id))]
+
+
+def test_coalesce_changes_merges_per_track_and_playlist():
+    """Coalescing merges the events per track, playlist and link."""
+    changes = [
+        TrackUpdated(1, {"quality": 3}),
+        PlaylistTracksChanged(7, added=(1, 2)),
+        PlatformLinkAdded(1, "spotify"),
+        TrackUpdated(1, {"quality": 5, "bpm": 128.0}),
+        PlaylistTracksChanged(7, removed=(2, 3)),
+        PlatformLinkAdded(1, "spotify"),
+        PlaylistTracksChanged(8, added=(4,)),
+        PlaylistTracksChanged(8, removed=(4,)),
+    ]
+
+    assert coalesce_changes(changes) == [
+        TrackUpdated(1, {"quality": 5, "bpm": 128.0}),
+        PlaylistTracksChanged(7, added=(1,), removed=(3,)),
+        PlatformLinkAdded(1, "spotify"),
+    ]
+
+
+def test_bulk_writes_publish_their_changes(tmp_path):
+    """Bulk track writes and the folder import publish their changes too."""
+    session = _session()
+    collection = Playlist(name="Collection")
+    track = Track(title="Night Bus", artist="Burial", local_path=str(tmp_path / "a.mp3"))
+    session.add_all([collection, track])
+    session.commit()
+    scanner = LocalFolderScanner.__new__(LocalFolderScanner)
+    scanner.track_repo = TrackRepository(session)
+
+    published = []
+    change_bus.subscribe(published.extend)
+    try:
+        tracks = TrackRepository(session)
+        tracks.set_content_hashes({track.id: "hash"})
+        tracks.relocate_many([(track.id, str(tmp_path / "b.mp3"), None)])
+        scanner._insert_tracks(
+            [(str(tmp_path / "c.mp3"), {"title": "Archangel", "artist": "Burial"})], collection.id, []
+        )
+    finally:
+        change_bus.unsubscribe(published.extend)
+
+    new_track = session.query(Track).filter_by(title="Archangel").one()
+    assert published == [
+        TrackUpdated(track.id, {"content_hash": "hash"}),
+        TrackUpdated(track.id, {"local_path": str(tmp_path / "b.mp3"), "content_hash": "hash"}),
+        PlaylistTracksChanged(collection.id, added=(new_track.id,)),
+    ]
+
+
+def test_tracks_of_changed_rows_are_read_in_a_fixed_number_of_queries():
+    """Tracks fetched for rows added to a view come with their album and image IDs, without lazy loads."""
+    session = _session()
+    album = Album(title="Untrue", artist="Burial")
+    tracks = [Track(title=f"Track {index}", artist="Burial", album=album) for index in range(20)]
+    session.add_all(tracks)
+    session.flush()
+    session.add(Image(data=b"cover", size=ImageSize.THUMBNAIL, track_id=tracks[3].id))
+    session.commit()
+    track_ids = [track.id for track in tracks]
+    session.expunge_all()
+
+    statements = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    fetched = TrackRepository(session).get_by_ids(track_ids)
+    query_count = len(statements)
+
+    assert [track.id for track in fetched] == track_ids
+    assert [bool(track.images) for track in fetched] == [index == 3 for index in range(20)]
+    assert {track.album.title for track in fetched} == {"Untrue"}
+    assert len(statements) == query_count
+    assert not any("images.data" in statement for statement in statements)
@@ -0,0 +1,94 @@
+"""Tests for the cover import pipeline."""
+
+import io
+
+from mutagen.id3 import APIC, ID3
+from PIL import Image as PILImage
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Album, Image, ImageSize, Track
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.cover_import import import_covers
+from selecta.core.utils.tag_cache import TagCache
+
+
+def _cover(color):
+    """Encode a solid color cover as PNG."""
+    output = io.BytesIO()
+    PILImage.new("RGB", (800, 800), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _audio_file(path, cover=None):
+    """Write a stand-in MP3 file, with an embedded cover if given."""
+    path.write_bytes(bytes(1024))
+    if cover:
+        tags = ID3()
+        tags.add(APIC(encoding=3, mime="image/png", type=3, desc="", data=cover))
+        tags.save(path)
+    return str(path)
+
+
+def test_import_covers_deduplicates_identical_covers(tmp_path):
+    """Identical covers are resized and stored once for all their tracks."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    red, blue = _cover("red"), _cover("blue")
+    paths = [
+        _audio_file(tmp_path / "a1.mp3", red),
+        _audio_file(tmp_path / "a2.mp3", red),
+        _audio_file(tmp_path / "b.mp3", blue),
+        _audio_file(tmp_path / "none.mp3"),
+        str(tmp_path / "missing.mp3"),
+    ]
+    tracks = [Track(title=str(i), artist="artist", local_path=path) for i, path in enumerate(paths)]
+    session.add_all(tracks)
+    session.commit()
+    # The tag cache already knows the cover of one file
+    TagCache(session).get(paths[0])
+
+    progress = []
+    result = import_covers(TrackRepository(session), progress_callback=lambda done, total: progress.append(done))
+
+    assert (result.imported, result.unique_covers, result.without_art, result.failed) == (3, 2, 1, 1)
+    assert progress[-1] == len(paths)
+    images = session.query(Image).filter(Image.size == ImageSize.LARGE).all()
+    assert sorted(image.track_id for image in images) == sorted(track.id for track in tracks[:3])
+    assert {(image.width, image.height) for image in images} == {(640, 640)}
+
+    # Tracks with a cover now are left alone
+    assert import_covers(TrackRepository(session)).imported == 0
+
+
+def test_tracks_of_albums_with_an_image_are_not_pending():
+    """Tracks with their own image or an album image are skipped, like get_track_image falls back."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    covered, plain = Album(title="Covered", artist="artist"), Album(title="Plain", artist="artist")
+    tracks = [
+        Track(title="own", artist="artist", local_path="/music/a.mp3"),
+        Track(title="album", artist="artist", local_path="/music/b.mp3", album=covered),
+        Track(title="plain album", artist="artist", local_path="/music/c.mp3", album=plain),
+        Track(title="no album", artist="artist", local_path="/music/d.mp3"),
+        Track(title="remote", artist="artist"),
+    ]
+    session.add_all(tracks)
+    session.flush()
+    session.add_all(
+        [
+            Image(data=b"x", size=ImageSize.LARGE, track_id=tracks[0].id),
+            Image(data=b"x", size=ImageSize.THUMBNAIL, album_id=covered.id),
+        ]
+    )
+    session.commit()
+
+    assert TrackRepository(session).get_local_tracks_without_images() == [
+        (tracks[2].id, "/music/c.mp3"),
+        (tracks[3].id, "/music/d.mp3"),
+    ]
@@ -0,0 +1,174 @@
+"""Tests for duplicate detection with candidate blocking."""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import DuplicatePair, DuplicateSignature, Track
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.duplicate_blocking import (
+    BlockingRecord,
+    candidate_pairs,
+    min_component_similarity,
+    track_record,
+)
+from selecta.core.utils.duplicate_detector import find_duplicate_pairs
+from selecta.core.utils.duplicate_index import DuplicateIndex
+from selecta.core.utils.duplicate_scoring import PairScorer
+from selecta.core.utils.track_matching import match_score
+
+
+def _track(title, artist, duration_ms=None):
+    return SimpleNamespace(title=title, artist=artist, duration_ms=duration_ms)
+
+
+def _library(size=150, seed=7):
+    rng = random.Random(seed)
+    syllables = ["ka", "lo", "mi", "ra", "te", "su", "no", "vi", "da", "ze", "ri", "po"]
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+
+    artists = [word().title() for _ in range(20)]
+    tracks = [
+        _track(" ".join(word() for _ in range(rng.randint(1, 3))), rng.choice(artists), rng.randint(120, 400) * 1000)
+        for _ in range(size)
+    ]
+    for track in rng.sample(tracks, 20):
+        tracks.append(_track(f"{track.title.upper()} (Original Mix)", track.artist, track.duration_ms + 1000))
+    return tracks
+
+
+def _flatten(pairs):
+    return {(i, j) for i, matches in pairs.items() for j, _ in matches}
+
+
+def _exact(a, b):
+    return match_score(a.title_key, a.artist_key, a.duration_ms, b.title_key, b.artist_key, b.duration_ms)
+
+
+def test_min_component_similarity_follows_the_weights():
+    """The minimum component similarities follow the score weights."""
+    min_artist, min_title = min_component_similarity(0.85)
+    assert round(min_artist, 3) == 0.625
+    assert round(min_title, 3) == 0.7
+
+
+def test_candidate_pairs_skip_unrelated_artists():
+    """Tracks by unrelated artists are not paired."""
+    records = [
+        BlockingRecord("strobe", "deadmau5", 300_000),
+        BlockingRecord("strobe", "deadmaus", 301_000),
+        BlockingRecord("strobe", "aphex twin", 300_000),
+    ]
+
+    assert candidate_pairs(records, 0.85) == [(0, 1)]
+
+
+def test_blocking_finds_the_same_duplicates_as_brute_force():
+    """Blocking finds the duplicates of a small library that brute force finds."""
+    tracks = _library()
+
+    blocked = _flatten(find_duplicate_pairs(tracks, 0.85))
+
+    assert blocked == _flatten(find_duplicate_pairs(tracks, 0.85, blocking=False))
+    assert len(blocked) >= 20
+
+
+def test_upper_bounds_never_undercut_the_exact_score():
+    """The vectorized upper bounds are never below the exact score."""
+    records = [track_record(track) for track in _library()]
+    pairs = [(i, j) for i in range(len(records)) for j in range(i + 1, len(records))][:5000]
+    left, right = zip(*pairs, strict=True)
+
+    bounds = PairScorer(records).upper_bounds(np.array(left), np.array(right))
+
+    for (i, j), bound in zip(pairs, bounds, strict=True):
+        assert bound >= _exact(records[i], records[j]) - 1e-9
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_pair_scorer_matches_exact_scoring(processes, monkeypatch):
+    """The pair scorer keeps exactly the pairs reaching the threshold."""
+    monkeypatch.setattr("selecta.core.utils.duplicate_scoring.PROCESS_POOL_MIN_PAIRS", 1)
+    monkeypatch.setattr("selecta.core.utils.duplicate_scoring.EXACT_CHUNK_SIZE", 50)
+    records = [track_record(track) for track in _library()]
+    pairs = candidate_pairs(records, 0.8)
+    progress = []
+
+    result = PairScorer(records, processes=processes).score(pairs, 0.8, lambda done, total: progress.append(done))
+
+    expected = [(i, j) for i, j in pairs if _exact(records[i], records[j]) >= 0.8]
+    assert result.complete
+    assert [(i, j) for i, j, _ in result.matches] == expected
+    assert progress[-1] == len(pairs)
+
+
+def test_pair_scorer_stops_when_cancelled():
+    """A cancelled scoring run returns no matches."""
+    records = [track_record(track) for track in _library()]
+
+    result = PairScorer(records).score(candidate_pairs(records, 0.8), 0.8, should_stop=lambda: True)
+
+    assert not result.complete
+    assert result.matches == []
+
+
+def test_duplicate_index_only_scores_changed_tracks(monkeypatch):
+    """The duplicate index only rescores tracks whose signature changed."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    tracks = [
+        Track(title="Strobe", artist="deadmau5", duration_ms=600_000),
+        Track(title="Strobe (Original Mix)", artist="Deadmau5", duration_ms=601_000),
+        Track(title="Jóga", artist="Björk", duration_ms=305_000),
+        Track(title="Joga", artist="Bjork", duration_ms=305_000),
+    ]
+    session.add_all(tracks)
+    session.commit()
+    index = DuplicateIndex(session)
+
+    assert index.update(tracks)
+    assert {i: [j for j, _ in matches] for i, matches in index.lookup(tracks, 0.85).items()} == {0: [1], 2: [3]}
+
+    scored = []
+    monkeypatch.setattr(
+        "selecta.core.utils.duplicate_index.candidate_pairs",
+        lambda records, threshold, new: scored.extend(new) or candidate_pairs(records, threshold, new),
+    )
+    tracks[3].title = "Hyperballad"
+    session.commit()
+
+    assert index.update(tracks)
+    assert scored == [3]
+    assert set(index.lookup(tracks, 0.85)) == {0}
+
+    index.remove_tracks([tracks[1].id])
+    assert index.lookup(tracks, 0.85) == {}
+    assert session.query(DuplicateSignature).count() == 3
+
+
+def test_deleting_a_track_removes_its_index_rows():
+    """Deleting an indexed track also deletes its signature and pairs."""
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys = ON"))
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    tracks = [
+        Track(title="Strobe", artist="deadmau5", duration_ms=600_000),
+        Track(title="Strobe (Original Mix)", artist="Deadmau5", duration_ms=601_000),
+    ]
+    session.add_all(tracks)
+    session.commit()
+    DuplicateIndex(session).update(tracks)
+
+    assert TrackRepository(session).delete(tracks[1].id)
+
+    assert session.query(DuplicatePair).count() == 0
+    assert session.query(DuplicateSignature).count() == 1
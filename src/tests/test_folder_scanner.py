@@ -0,0 +1,266 @@
+"""Tests for the folder walk, the library file manifest and the bulk import."""
+
+import os
+import wave
+
+from mutagen.id3 import APIC, ID3
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Genre, PlaylistTrack, Track, TrackAttribute
+from selecta.core.data.repositories.library_file_repository import LibraryFileRepository
+from selecta.core.data.repositories.playlist_repository import PlaylistRepository
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils import folder_scanner, tag_cache
+from selecta.core.utils.folder_scanner import AUDIO_EXTENSIONS, LocalFolderScanner, diff_manifest, walk_audio_files
+from selecta.core.utils.tag_cache import TagCache, read_embedded_art
+
+
+def _scan(repo, root):
+    """Compare a folder with its manifest and record the result."""
+    files = list(walk_audio_files(root))
+    changes = diff_manifest(repo.get_manifest(str(root)), files)
+    upserts = {entry.path: entry.stat for entry in [*changes.new, *changes.changed]}
+    upserts.update((entry.path, entry.stat) for _, entry in changes.moved)
+    repo.apply_changes(upserts, [*changes.deleted, *(old_path for old_path, _ in changes.moved)])
+    return changes
+
+
+def test_walk_matches_extensions_case_insensitively(tmp_path):
+    """Audio files are found by extension regardless of case."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "one.MP3").write_bytes(b"x")
+    (tmp_path / "two.Flac").write_bytes(b"x")
+    (tmp_path / "cover.jpg").write_bytes(b"x")
+
+    paths = sorted(os.path.relpath(entry.path, tmp_path) for entry in walk_audio_files(tmp_path))
+
+    assert paths == [os.path.join("a", "one.MP3"), "two.Flac"]
+
+
+def test_rescan_reports_only_differences(tmp_path):
+    """A rescan reports only the files that changed since the last scan."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    repo = LibraryFileRepository(sessionmaker(bind=engine)())
+
+    root = tmp_path / "music"
+    root.mkdir()
+    for name in ["keep.mp3", "edit.mp3", "gone.mp3", "move.mp3"]:
+        (root / name).write_bytes(name.encode())
+    (tmp_path / "outside.mp3").write_bytes(b"x")
+    repo.apply_changes({str(tmp_path / "outside.mp3"): (1, 1, 1)}, [])
+
+    first = _scan(repo, root)
+    assert len(first.new) == 4 and not (first.changed or first.deleted or first.moved)
+
+    (root / "edit.mp3").write_bytes(b"edited")
+    (root / "gone.mp3").unlink()
+    (root / "sub").mkdir()
+    (root / "move.mp3").rename(root / "sub" / "moved.mp3")
+    (root / "added.mp3").write_bytes(b"added")
+
+    second = _scan(repo, root)
+    assert [entry.path for entry in second.new] == [str(root / "added.mp3")]
+    assert [entry.path for entry in second.changed] == [str(root / "edit.mp3")]
+    assert second.deleted == [str(root / "gone.mp3")]
+    assert [(old_path, entry.path) for old_path, entry in second.moved] == [
+        (str(root / "move.mp3"), str(root / "sub" / "moved.mp3"))
+    ]
+
+    third = _scan(repo, root)
+    assert not (third.new or third.changed or third.deleted or third.moved)
+    assert str(tmp_path / "outside.mp3") in repo.get_manifest(str(tmp_path))
+
+
+def _scanner(session, root):
+    """Build a scanner on a test session, without the default database."""
+    scanner = LocalFolderScanner.__new__(LocalFolderScanner)
+    scanner.folder_path = root
+    scanner.track_repo = TrackRepository(session)
+    scanner.playlist_repo = PlaylistRepository(session)
+    scanner.library_file_repo = LibraryFileRepository(session)
+    scanner.audio_extensions = AUDIO_EXTENSIONS
+    scanner.tag_cache = TagCache(session)
+    return scanner
+
+
+def test_import_writes_tracks_genres_and_collection_in_batches(tmp_path, monkeypatch):
+    """The import writes tracks, genres, BPM and Collection entries in batches."""
+    monkeypatch.setattr(tag_cache, "PROCESS_POOL_MIN_FILES", 0)
+    monkeypatch.setattr(folder_scanner, "IMPORT_BATCH_SIZE", 2)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    collection = PlaylistRepository(session).create({"name": "Collection"})
+
+    for name in ["one", "two", "three"]:
+        with wave.open(str(tmp_path / f"{name}.wav"), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(bytes(1600))
+    progress = []
+
+    imported, errors = _scanner(session, tmp_path).import_untracked_files(
+        collection.id, progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert (imported, errors) == (3, [])
+    assert progress[-1] == (3, 3)
+    positions = session.query(PlaylistTrack.position).filter_by(playlist_id=collection.id).all()
+    assert sorted(position for (position,) in positions) == [0, 1, 2]
+    assert {track.title for track in session.query(Track)} == {"one", "two", "three"}
+
+    scanner = _scanner(session, tmp_path)
+    scanner._insert_tracks(
+        [
+            (str(tmp_path / "a.mp3"), {"title": "A", "artist": "X", "genre": "Techno", "bpm": 128.0}),
+            (str(tmp_path / "b.mp3"), {"title": "B", "artist": "X", "genre": "Techno"}),
+        ],
+        collection.id,
+        errors,
+    )
+
+    assert session.query(Genre).count() == 1
+    assert [attribute.value for attribute in session.query(TrackAttribute)] == [128.0]
+    assert session.query(func.max(PlaylistTrack.position)).scalar() == 4
+
+
+def test_tag_cache_parses_unchanged_files_once(tmp_path, monkeypatch):
+    """Unchanged files are only parsed once."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    cache = TagCache(sessionmaker(bind=engine)())
+    path = tmp_path / "one.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(bytes(1600))
+    parsed = []
+    parse_file = tag_cache.parse_file
+
+    def counting_parse_file(*args, **kwargs):
+        """Count the files parsed."""
+        parsed.append(args)
+        return parse_file(*args, **kwargs)
+
+    monkeypatch.setattr(tag_cache, "parse_file", counting_parse_file)
+
+    first = cache.get(path)
+    assert cache.get(path) == first
+    assert dict(cache.get_many([path])) == {str(path): first}
+    assert first.tags["title"] == "one" and first.art_digest is None
+    assert len(parsed) == 1
+
+    os.utime(path, ns=(0, 10**9))
+    cache.get(path)
+    assert len(parsed) == 2
+
+
+def test_embedded_art_is_read_on_request(tmp_path):
+    """Embedded cover art is only read when asked for, and found when present."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    cache = TagCache(sessionmaker(bind=engine)())
+    cover = b"\x89PNG\r\n\x1a\n" + bytes(64)
+    path = tmp_path / "cover.mp3"
+    path.write_bytes(bytes(1024))
+    tags = ID3()
+    tags.add(APIC(encoding=3, mime="image/png", type=3, desc="", data=cover))
+    tags.save(path)
+    (tmp_path / "plain.mp3").write_bytes(bytes(1024))
+
+    assert read_embedded_art(path) == cover
+    assert read_embedded_art(tmp_path / "plain.mp3") is None
+    assert cache.get(path).art is None
+    assert cache.get(path, with_art=True).art == cover
+
+
+def test_art_is_not_read_from_files_cached_without_art(tmp_path, monkeypatch):
+    """Reading cover art skips files whose current cached tags have no art digest."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    cache = TagCache(sessionmaker(bind=engine)())
+    cover = b"\x89PNG\r\n\x1a\n" + bytes(64)
+    path = tmp_path / "cover.mp3"
+    path.write_bytes(bytes(1024))
+    tags = ID3()
+    tags.add(APIC(encoding=3, mime="image/png", type=3, desc="", data=cover))
+    tags.save(path)
+    plain = tmp_path / "plain.mp3"
+    plain.write_bytes(bytes(1024))
+    cache.get(path)
+    cache.get(plain)
+
+    read = []
+    monkeypatch.setattr(tag_cache, "read_embedded_art", lambda art_path: read.append(art_path) or cover)
+
+    assert cache.read_art(plain) is None
+    assert cache.read_art(path) == cover
+    assert read == [str(path)]
+
+
+def test_sync_changes_applies_moves_edits_and_new_files(tmp_path):
+    """An incremental sync relocates moved, updates modified and imports new files."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    PlaylistRepository(session).create({"name": "Collection"})
+    scanner = _scanner(session, tmp_path)
+
+    def write_wav(path, frames):
+        """Write a silent WAVE file."""
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(bytes(frames))
+
+    write_wav(tmp_path / "move.wav", 1600)
+    write_wav(tmp_path / "edit.wav", 1600)
+    assert scanner.sync_changes().imported == 2
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "move.wav").rename(tmp_path / "sub" / "moved.wav")
+    write_wav(tmp_path / "edit.wav", 3200)
+    write_wav(tmp_path / "new.wav", 1600)
+    result = scanner.sync_changes([str(tmp_path / "move.wav"), str(tmp_path / "sub"), str(tmp_path / "edit.wav")])
+
+    # new.wav isn't among the changed paths, so it is left for a later sync
+    assert (result.imported, result.updated, result.relocated, result.missing) == (0, 1, 1, 0)
+    tracks = {track.title: track for track in session.query(Track)}
+    assert tracks["move"].local_path == str(tmp_path / "sub" / "moved.wav")
+    assert tracks["edit"].duration_ms == 200
+
+    assert scanner.sync_changes().imported == 1
+
+
+def test_scan_result_is_only_recorded_once_applied(tmp_path):
+    """A rename survives a declined scan and is applied from the scan result."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    PlaylistRepository(session).create({"name": "Collection"})
+    scanner = _scanner(session, tmp_path)
+    with wave.open(str(tmp_path / "a.wav"), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(bytes(1600))
+    assert scanner.import_untracked_files() == (1, [])
+
+    (tmp_path / "a.wav").rename(tmp_path / "b.wav")
+    declined = scanner.scan_folder()
+    scan_result = scanner.scan_folder()
+
+    assert [(track_id, path.name) for track_id, path, _ in declined["moved"]] == [(1, "b.wav")]
+    assert scan_result["moved"] == declined["moved"]
+    assert scanner.import_untracked_files(scan_result=scan_result) == (0, [])
+    assert [track.local_path for track in session.query(Track)] == [str(tmp_path / "b.wav")]
+
+    rescan = scanner.scan_folder()
+    assert not (rescan["moved"] or rescan["not_in_database"] or rescan["missing_from_folder"])
+    assert not (rescan["changes"].new or rescan["changes"].moved or rescan["changes"].deleted)
@@ -0,0 +1,59 @@
+"""Tests for the live folder watcher."""
+
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from selecta.core.utils import folder_watcher
+from selecta.core.utils.folder_watcher import FolderWatcher
+
+
+class RecordingScanner:
+    """Stand-in scanner recording the paths it is asked to sync."""
+    def __init__(self):
+        self.synced = []
+
+    def sync_changes(self, paths, should_stop=None):
+        """Record a sync of some paths, or of the whole folder if None."""
+        self.synced.append(None if paths is None else sorted(paths))
+        return SimpleNamespace(changed=True, missing=0)
+
+
+def _wait_for(condition, timeout=10.0):
+    """Poll a condition until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_watcher_coalesces_a_burst_into_one_sync(tmp_path, monkeypatch):
+    """A burst of file events leads to one sync of the changed audio paths."""
+    monkeypatch.setattr(folder_watcher, "DEBOUNCE_SECONDS", 0.3)
+    scanner = RecordingScanner()
+    syncs = []
+    watcher = FolderWatcher(tmp_path, on_sync=syncs.append)
+    watcher._scanner = scanner
+    watcher.start()
+    try:
+        # The initial sync catches up with the whole folder
+        assert _wait_for(lambda: scanner.synced == [None])
+
+        (tmp_path / "album").mkdir()
+        for name in ["a.mp3", "b.FLAC", "cover.jpg"]:
+            (tmp_path / "album" / name).write_bytes(b"x")
+        (tmp_path / "c.mp3").write_bytes(b"x")
+
+        assert _wait_for(lambda: len(scanner.synced) == 2)
+        time.sleep(0.5)
+    finally:
+        watcher.stop()
+
+    # Files written before the new folder was watched are found by syncing the folder
+    album = tmp_path / "album"
+    assert {str(album), str(tmp_path / "c.mp3")} <= set(scanner.synced[1])
+    assert set(scanner.synced[1]) <= {str(album), str(album / "a.mp3"), str(album / "b.FLAC"), str(tmp_path / "c.mp3")}
+    assert len(scanner.synced) == 2 and len(syncs) == 2
@@ -0,0 +1,90 @@
+"""Tests for batched image queries and the pixmap cache."""
+
+from PyQt6.QtGui import QImage
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.change_events import TrackUpdated, change_bus
+from selecta.core.data.database import Base
+from selecta.core.data.models.db import Album, Image, ImageSize, Track
+from selecta.core.data.repositories.image_repository import ImageRepository
+from selecta.core.utils.pixmap_cache import PixmapCache
+
+
+def test_track_image_data_falls_back_like_single_lookups():
+    """Batched image lookups fall back to album images like single lookups."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    album = Album(title="album", artist="artist")
+    own, from_album, other_size, none = (Track(title=str(i), artist="artist") for i in range(4))
+    from_album.album = album
+    session.add_all([album, own, from_album, other_size, none])
+    session.flush()
+    session.add_all(
+        [
+            Image(data=b"own", size=ImageSize.THUMBNAIL, track_id=own.id),
+            Image(data=b"own large", size=ImageSize.LARGE, track_id=own.id),
+            Image(data=b"album", size=ImageSize.THUMBNAIL, album_id=album.id),
+            Image(data=b"medium", size=ImageSize.MEDIUM, track_id=other_size.id),
+        ]
+    )
+    session.commit()
+    repo = ImageRepository(session)
+    track_ids = [own.id, from_album.id, other_size.id, none.id]
+
+    data = repo.get_track_image_data(track_ids, ImageSize.THUMBNAIL)
+
+    assert data == {own.id: b"own", from_album.id: b"album", other_size.id: b"medium"}
+    for track_id in track_ids:
+        image = repo.get_track_image(track_id, ImageSize.THUMBNAIL)
+        assert data.get(track_id) == (image.data if image else None)
+    assert repo.get_album_image_data([album.id, album.id + 1], ImageSize.LARGE) == {album.id: b"album"}
+
+
+def test_pixmap_cache_evicts_least_recently_used_within_size_budget():
+    """The pixmap cache evicts the least recently used pixmaps of a size over budget."""
+    image = QImage(16, 16, QImage.Format.Format_ARGB32)
+    cost = PixmapCache.cost(image)
+    cache = PixmapCache({ImageSize.THUMBNAIL: 2 * cost, ImageSize.LARGE: cost})
+
+    cache.insert("track_1", ImageSize.THUMBNAIL, image)
+    cache.insert("track_2", ImageSize.THUMBNAIL, image)
+    cache.insert("track_1", ImageSize.LARGE, image)
+    assert cache.get("track_1", ImageSize.THUMBNAIL) is image
+    cache.insert("track_3", ImageSize.THUMBNAIL, image)
+
+    assert cache.get("track_2", ImageSize.THUMBNAIL) is None
+    assert cache.get("track_3", ImageSize.THUMBNAIL) is image
+    assert cache.get("track_1", ImageSize.LARGE) is image
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1)
+    assert stats["sizes"]["THUMBNAIL"] == {"pixmaps": 2, "bytes": 2 * cost, "budget": 2 * cost}
+
+
+def test_storing_images_announces_them_per_track():
+    """Stored and deleted track images are published as has_image changes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    first, second = Track(title="1", artist="artist"), Track(title="2", artist="artist")
+    session.add_all([first, second])
+    session.commit()
+    repo = ImageRepository(session)
+    resized = [(ImageSize.THUMBNAIL, b"thumb", "image/png", 64, 64), (ImageSize.LARGE, b"large", "image/png", 640, 640)]
+
+    published = []
+    change_bus.subscribe(published.extend)
+    try:
+        repo.add_track_image(first.id, b"cover", ImageSize.MEDIUM)
+        repo.add_track_images([(second.id, resized)])
+        repo.delete_track_images(first.id)
+    finally:
+        change_bus.unsubscribe(published.extend)
+
+    assert published == [
+        TrackUpdated(first.id, {"has_image": True}),
+        TrackUpdated(second.id, {"has_image": True}),
+        TrackUpdated(first.id, {"has_image": False}),
+    ]
@@ -0,0 +1,44 @@
+"""Tests for the orphaned track query."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.repositories.playlist_repository import PlaylistRepository
+from selecta.core.data.repositories.track_repository import TrackRepository
+
+
+@pytest.fixture
+def session():
+    """Session on an in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_orphaned_tracks_are_only_in_the_collection(session):
+    """Tracks in no playlist other than the collection are orphaned."""
+    playlist_repo = PlaylistRepository(session)
+    track_repo = TrackRepository(session)
+    collection = playlist_repo.create({"name": "Collection"})
+    playlist = playlist_repo.create({"name": "Techno"})
+    folder = playlist_repo.create({"name": "Archive", "is_folder": True})
+    tracks = [track_repo.create({"title": f"Track {i}", "artist": "Artist"}) for i in range(5)]
+    for track in tracks:
+        playlist_repo.add_track(collection.id, track.id)
+    playlist_repo.add_track(playlist.id, tracks[1].id)
+    playlist_repo.add_track(playlist.id, tracks[3].id)
+    # Folders don't hold tracks of their own, so they don't count as playlists
+    playlist_repo.add_track(folder.id, tracks[4].id)
+
+    orphans = playlist_repo.get_orphaned_tracks(collection.id)
+
+    assert [track.title for track in orphans] == ["Track 0", "Track 2", "Track 4"]
+    assert playlist_repo.count_orphaned_tracks(collection.id) == 3
+    assert [track.title for track in playlist_repo.get_orphaned_tracks(collection.id, limit=2, offset=1)] == [
+        "Track 2",
+        "Track 4",
+    ]
@@ -0,0 +1,35 @@
+"""Tests for track search keys and the prefix index."""
+
+from selecta.core.utils.search_index import PrefixIndex, matches_tokens, search_key, search_tokens
+
+
+def test_tokens_must_all_be_in_the_key():
+    """A search matches a key only if all its tokens are in it."""
+    key = search_key("Burial", "Night Bus")
+
+    assert matches_tokens(key, search_tokens("bus  BURIAL"))
+    assert matches_tokens(key, search_tokens("burial - night"))
+    assert not matches_tokens(key, search_tokens("burial day"))
+    assert matches_tokens(key, search_tokens("   "))
+
+
+def test_prefix_index_matches_word_beginnings():
+    """The prefix index matches queries against the beginnings of words."""
+    items = ["Burial - Night Bus", "Four Tet - Night Drive", "Floating Points - Nuits Sonores", "Bicep - Glue"]
+    index = PrefixIndex(items)
+
+    assert index.search("night") == items[:2]
+    assert index.search("NIGHT DR") == ["Four Tet - Night Drive"]
+    assert index.search("  glu") == ["Bicep - Glue"]
+    assert index.search("ight") == []
+    assert index.search("") == []
+    assert index.search("n", limit=2) == items[:2]
+
+
+def test_prefix_index_checks_queries_longer_than_the_stored_prefixes():
+    """Queries longer than the indexed prefixes are checked against the items."""
+    items = ["Artist - A very long title that goes on and on", "Artist - A very long title that goes on forever"]
+    index = PrefixIndex(items)
+
+    assert index.search("a very long title that goes on and") == items[:1]
+    assert index.search("a very long title that goes on") == items
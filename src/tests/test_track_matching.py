@@ -0,0 +1,62 @@
+"""Tests for normalized track matching keys."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from selecta.core.data.database import Base
+from selecta.core.data.repositories.track_repository import TrackRepository
+from selecta.core.utils.track_matching import normalize_artist, normalize_title
+
+
+@pytest.fixture
+def track_repo():
+    """Track repository on an in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield TrackRepository(session)
+    session.close()
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Strobe (Original Mix)", "strobe"),
+        ("Jóga", "joga"),
+        ("Song (feat. Someone) [Extended Mix]", "song extended mix"),
+        ("Da Funk (Official Video)", "da funk"),
+        ("Aftermath", "aftermath"),
+    ],
+)
+def test_normalize_title(title, expected):
+    """Mix, feature and video suffixes and accents are normalized away."""
+    assert normalize_title(title) == expected
+
+
+def test_normalize_artist_drops_featured_artists():
+    """Featured artists are dropped from the artist key."""
+    assert normalize_artist("Björk feat. Someone Else") == "bjork"
+
+
+def test_keys_follow_title_and_artist(track_repo):
+    """The match keys are recomputed when the title changes."""
+    track = track_repo.create({"title": "Jóga", "artist": "Björk"})
+    assert track.match_key == "bjork|joga"
+
+    track_repo.update(track.id, {"title": "Hyperballad (Original Mix)"}, preserve_existing=False)
+
+    assert track.title_key == "hyperballad"
+    assert track.match_key == "bjork|hyperballad"
+
+
+def test_lookups_use_the_normalized_keys(track_repo):
+    """Lookups and searches match on the normalized keys."""
+    first = track_repo.create({"title": "Strobe", "artist": "deadmau5"})
+    track_repo.create({"title": "Jóga", "artist": "Björk"})
+
+    assert track_repo.find_by_title_artist("STROBE (Original Mix)", "Deadmau5") == first
+    assert set(track_repo.get_by_match_keys(["deadmau5|strobe", "nobody|nothing"])) == {"deadmau5|strobe"}
+
+    tracks, total = track_repo.search("bjork")
+    assert total == 1 and tracks[0].title == "Jóga"
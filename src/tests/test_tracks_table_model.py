@@ -0,0 +1,116 @@
+"""Tests for the per-column row storage of the tracks table model."""
+
+import pytest
+
+pytestmark = pytest.mark.gui
+
+# The selecta.ui packages import Qt Multimedia, which needs the system audio libraries
+tracks_table_model = pytest.importorskip(
+    "selecta.ui.components.playlist.model.tracks_table_model", exc_type=ImportError
+)
+library_track_item = pytest.importorskip(
+    "selecta.ui.components.playlist.library.library_track_item", exc_type=ImportError
+)
+
+BATCH = 10
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Tracks table model fetching rows in small batches."""
+    monkeypatch.setattr(tracks_table_model, "FETCH_BATCH_SIZE", BATCH)
+    return tracks_table_model.TracksTableModel()
+
+
+def _track(track_id, title=None, quality=-1):
+    """Create a library track item."""
+    return library_track_item.LibraryTrackItem(
+        track_id=track_id, title=title or f"Track {track_id}", artist="Artist", quality=quality
+    )
+
+
+def _assert_consistent(model):
+    """Check that the per-column lists and the row index match the tracks."""
+    loaded = model.rowCount()
+    assert all(len(values) == loaded for values in model._display.values())
+    assert len(model._platforms) == len(model._quality) == loaded
+    assert len(model.search_keys) == len(model.tracks)
+    assert model._display["title"] == [track.title for track in model.tracks[:loaded]]
+
+    first_rows = {}
+    for row, track in enumerate(model.tracks):
+        first_rows.setdefault(track.track_id, row)
+    assert model._rows_by_id == first_rows
+
+
+def test_rows_are_fetched_in_batches(model):
+    """Only the first batch is built on set_tracks, the rest as the view fetches more."""
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.set_tracks([_track(track_id) for track_id in range(25)])
+    assert model.rowCount() == BATCH
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    model.fetchMore()
+
+    assert model.rowCount() == 25
+    assert not model.canFetchMore()
+    assert inserted == [(10, 19), (20, 24)]
+    _assert_consistent(model)
+
+
+def test_removing_and_inserting_keeps_columns_and_rows_by_id_in_step(model):
+    """Removals and insertions of fetched, unfetched and duplicate rows keep every list aligned."""
+    tracks = [_track(track_id) for track_id in range(25)]
+    tracks[22] = _track(3, title="Track 3 again")
+    model.set_tracks(tracks)
+
+    # Track 3 is listed in a fetched and an unfetched row, track 15 only in an unfetched one
+    assert model.remove_tracks([3, 15]) == 3
+    assert model.rowCount() == BATCH - 1
+    assert [track.track_id for track in model.tracks].count(3) == 0
+    _assert_consistent(model)
+
+    # Appended rows wait to be fetched while unfetched rows remain
+    model.insert_tracks([_track(100), _track(4)])
+    assert model.rowCount() == BATCH - 1
+    assert model._rows_by_id[4] == 3
+    _assert_consistent(model)
+
+    while model.canFetchMore():
+        model.fetchMore()
+    _assert_consistent(model)
+
+    # Once all rows are fetched, appended rows are shown right away
+    model.insert_tracks([_track(101)])
+    assert model.rowCount() == len(model.tracks)
+    assert model.data(model.index(model.rowCount() - 1, 0)) == "Track 101"
+    _assert_consistent(model)
+
+    assert model.remove_tracks([4]) == 2
+    _assert_consistent(model)
+
+
+def test_a_single_changed_field_repaints_only_its_cell(model):
+    """A change of one shown field emits dataChanged for its cell, several fields for the row."""
+    model.set_tracks([_track(track_id) for track_id in range(3)])
+    changed = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=(): changed.append(
+            (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+        )
+    )
+    quality_column = model.column_keys.index("quality")
+
+    assert model.apply_track_changes(1, {"quality": 4})
+    assert changed == [(1, quality_column, 1, quality_column)]
+    assert model.data(model.index(1, quality_column), tracks_table_model.Qt.ItemDataRole.UserRole) == 4
+
+    changed.clear()
+    assert model.apply_track_changes(2, {"title": "Renamed", "quality": 2})
+    assert changed == [(2, 0, 2, model.columnCount() - 1)]
+    assert model.data(model.index(2, 0)) == "Renamed"
+
+    assert not model.apply_track_changes(99, {"quality": 1})